@@ -0,0 +1,78 @@
+"""add named queues to job definitions and jobs
+
+Revision ID: 202602200900
+Revises: 202602191545
+Create Date: 2026-02-20 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "202602200900"
+down_revision: Union[str, None] = "202602191545"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_ML_DEFINITION_KEYS = (
+    "recompute-trained-tags",
+    "recompute-zeroshot-tags",
+    "train-keyword-models",
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_definitions",
+        sa.Column("queue", sa.Text(), nullable=False, server_default="default"),
+    )
+    op.add_column(
+        "jobs",
+        sa.Column("queue", sa.Text(), nullable=False, server_default="default"),
+    )
+
+    # Isolate model training/recompute work from light metadata jobs.
+    op.execute(
+        sa.text("UPDATE job_definitions SET queue = 'ml' WHERE key IN :keys").bindparams(
+            sa.bindparam("keys", value=list(_ML_DEFINITION_KEYS), expanding=True)
+        )
+    )
+    op.execute(
+        sa.text(
+            """
+            UPDATE jobs
+            SET queue = job_definitions.queue
+            FROM job_definitions
+            WHERE jobs.definition_id = job_definitions.id
+              AND jobs.status IN ('queued', 'running')
+              AND jobs.queue <> job_definitions.queue
+            """
+        )
+    )
+
+    op.create_index(
+        "idx_jobs_queue_claim",
+        "jobs",
+        ["queue", "priority", "scheduled_for"],
+        unique=False,
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+    # Running-job counts per tenant/queue feed fair scheduling at claim time.
+    op.create_index(
+        "idx_jobs_running_tenant_queue",
+        "jobs",
+        ["tenant_id", "queue"],
+        unique=False,
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_jobs_running_tenant_queue", table_name="jobs")
+    op.drop_index("idx_jobs_queue_claim", table_name="jobs")
+    op.drop_column("jobs", "queue")
+    op.drop_column("job_definitions", "queue")
@@ -0,0 +1,37 @@
+"""add workflow step graph and dependency counters
+
+Revision ID: 202602201130
+Revises: 202602200900
+Create Date: 2026-02-20 11:30:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "202602201130"
+down_revision: Union[str, None] = "202602200900"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Both columns stay NULL for runs started before this revision; the
+    # workflow queue backfills them the first time such a run advances.
+    op.add_column(
+        "workflow_runs",
+        sa.Column("step_dependents", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.add_column(
+        "workflow_step_runs",
+        sa.Column("unmet_dependency_count", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("workflow_step_runs", "unmet_dependency_count")
+    op.drop_column("workflow_runs", "step_dependents")
@@ -0,0 +1,77 @@
+"""add materialized keyword facet counts
+
+Revision ID: 202602201300
+Revises: 202602201130
+Create Date: 2026-02-20 13:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "202602201300"
+down_revision: Union[str, None] = "202602201130"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "keyword_facet_counts",
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("source", sa.String(length=32), nullable=False),
+        sa.Column("keyword_id", sa.Integer(), nullable=False),
+        sa.Column("asset_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "source", "keyword_id"),
+    )
+    op.create_table(
+        "keyword_facet_state",
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("active_tag_type", sa.String(length=50), nullable=False),
+        sa.Column("keyword_model_name", sa.String(length=100), nullable=True),
+        sa.Column("is_stale", sa.Boolean(), nullable=False, server_default=sa.text("false")),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("now()")),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id"),
+    )
+
+    # Queue-runnable reconcile; tenants read live counts until it first runs.
+    op.execute(
+        """
+        INSERT INTO job_definitions (key, description, arg_schema, timeout_seconds, max_attempts, is_active)
+        VALUES
+          (
+            'reconcile-keyword-facets',
+            'Rebuild materialized keyword facet counts',
+            jsonb_build_object(
+              'type', 'object',
+              'properties', jsonb_build_object(
+                'stale_only', jsonb_build_object('type', 'boolean')
+              ),
+              'additionalProperties', false
+            ),
+            1800,
+            2,
+            true
+          )
+        ON CONFLICT (key) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM job_definitions
+        WHERE key = 'reconcile-keyword-facets'
+        """
+    )
+    op.drop_table("keyword_facet_state")
+    op.drop_table("keyword_facet_counts")
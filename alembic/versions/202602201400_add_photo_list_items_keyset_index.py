@@ -0,0 +1,31 @@
+"""add keyset index for photo list items
+
+Revision ID: 202602201400
+Revises: 202602201300
+Create Date: 2026-02-20 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "202602201400"
+down_revision: Union[str, None] = "202602201300"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves ORDER BY added_at, id pages of /lists/{id}/items.
+    op.create_index(
+        "idx_photo_list_items_list_added",
+        "photo_list_items",
+        ["list_id", "added_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_photo_list_items_list_added", table_name="photo_list_items")
@@ -0,0 +1,51 @@
+"""add indexed asset source_folder column
+
+Revision ID: 202602201500
+Revises: 202602201400
+Create Date: 2026-02-20 15:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "202602201500"
+down_revision: Union[str, None] = "202602201400"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("assets", sa.Column("source_folder", sa.String(length=1024), nullable=True))
+    # Same parent-path expression the folder picker used to evaluate per request.
+    op.execute(
+        """
+        UPDATE assets
+        SET source_folder = COALESCE(NULLIF(regexp_replace(source_key, '/[^/]+$', ''), ''), '/')
+        WHERE source_key IS NOT NULL
+        """
+    )
+    op.create_index(
+        "idx_assets_tenant_provider_folder",
+        "assets",
+        ["tenant_id", "source_provider", "source_folder"],
+        unique=False,
+    )
+    # Substring search from the folder picker and prefix folder filters (ILIKE).
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_assets_source_folder_trgm
+        ON assets
+        USING gin (source_folder gin_trgm_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_assets_source_folder_trgm")
+    op.drop_index("idx_assets_tenant_provider_folder", table_name="assets")
+    op.drop_column("assets", "source_folder")
@@ -0,0 +1,101 @@
+"""Add pgvector nearest-neighbour index over detected face encodings.
+
+Revision ID: 202602201600
+Revises: 202602201500
+Create Date: 2026-02-20 16:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "202602201600"
+down_revision: Union[str, None] = "202602201500"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_detected_faces_tenant_person_id",
+        "detected_faces",
+        ["tenant_id", "person_id"],
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    # face_recognition (dlib) encodings are fixed at 128 dimensions.
+    op.execute("ALTER TABLE detected_faces ADD COLUMN IF NOT EXISTS face_encoding_vec vector(128)")
+    op.execute(
+        """
+        UPDATE detected_faces
+        SET face_encoding_vec = face_encoding::vector(128)
+        WHERE face_encoding IS NOT NULL
+          AND face_encoding_vec IS NULL
+          AND array_length(face_encoding, 1) = 128
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION sync_detected_faces_vector()
+        RETURNS trigger AS $body$
+        BEGIN
+            IF NEW.face_encoding IS NOT NULL AND array_length(NEW.face_encoding, 1) = 128 THEN
+                NEW.face_encoding_vec := NEW.face_encoding::vector(128);
+            ELSE
+                NEW.face_encoding_vec := NULL;
+            END IF;
+            RETURN NEW;
+        END;
+        $body$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS trg_sync_detected_faces_vector ON detected_faces")
+    op.execute(
+        """
+        CREATE TRIGGER trg_sync_detected_faces_vector
+        BEFORE INSERT OR UPDATE OF face_encoding
+        ON detected_faces
+        FOR EACH ROW
+        EXECUTE FUNCTION sync_detected_faces_vector()
+        """
+    )
+
+    # Only faces assigned to a person are match candidates.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            BEGIN
+                EXECUTE
+                    'CREATE INDEX IF NOT EXISTS idx_detected_faces_encoding_vec_hnsw
+                     ON detected_faces USING hnsw (face_encoding_vec vector_l2_ops)
+                     WHERE person_id IS NOT NULL';
+            EXCEPTION
+                WHEN undefined_object OR feature_not_supported OR invalid_parameter_value THEN
+                    EXECUTE
+                        'CREATE INDEX IF NOT EXISTS idx_detected_faces_encoding_vec_ivfflat
+                         ON detected_faces USING ivfflat (face_encoding_vec vector_l2_ops) WITH (lists = 100)
+                         WHERE person_id IS NOT NULL';
+            END;
+        END $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS idx_detected_faces_encoding_vec_hnsw")
+        op.execute("DROP INDEX IF EXISTS idx_detected_faces_encoding_vec_ivfflat")
+        op.execute("DROP TRIGGER IF EXISTS trg_sync_detected_faces_vector ON detected_faces")
+        op.execute("DROP FUNCTION IF EXISTS sync_detected_faces_vector()")
+        op.execute("ALTER TABLE detected_faces DROP COLUMN IF EXISTS face_encoding_vec")
+
+    op.drop_index("idx_detected_faces_tenant_person_id", table_name="detected_faces")
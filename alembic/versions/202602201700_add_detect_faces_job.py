@@ -0,0 +1,65 @@
+"""add detect-faces job definition and pending-faces index
+
+Revision ID: 202602201700
+Revises: 202602201600
+Create Date: 2026-02-20 17:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "202602201700"
+down_revision: Union[str, None] = "202602201600"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # detect-faces pages through a tenant's images that still need detection.
+    op.create_index(
+        "idx_image_metadata_tenant_faces_pending",
+        "image_metadata",
+        ["tenant_id", "id"],
+        postgresql_where=sa.text("faces_detected IS NOT TRUE"),
+    )
+
+    # CPU-bound process pool: keep it on the ML queue, away from light jobs.
+    op.execute(
+        """
+        INSERT INTO job_definitions (key, description, arg_schema, timeout_seconds, max_attempts, is_active, queue)
+        VALUES
+          (
+            'detect-faces',
+            'Detect faces on images not yet processed',
+            jsonb_build_object(
+              'type', 'object',
+              'properties', jsonb_build_object(
+                'limit', jsonb_build_object('type', 'integer', 'minimum', 1),
+                'batch_size', jsonb_build_object('type', 'integer', 'minimum', 1, 'default', 100),
+                'workers', jsonb_build_object('type', 'integer', 'minimum', 0, 'default', 0),
+                'max_dimension', jsonb_build_object('type', 'integer', 'minimum', 0, 'default', 800)
+              ),
+              'additionalProperties', false
+            ),
+            7200,
+            2,
+            true,
+            'ml'
+          )
+        ON CONFLICT (key) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM job_definitions
+        WHERE key = 'detect-faces'
+        """
+    )
+    op.drop_index("idx_image_metadata_tenant_faces_pending", table_name="image_metadata")
@@ -0,0 +1,57 @@
+"""allow keyword-scoped reconcile-keyword-facets jobs
+
+Revision ID: 202602201800
+Revises: 202602201700
+Create Date: 2026-02-20 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "202602201800"
+down_revision: Union[str, None] = "202602201700"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tag writes queue keyword-scoped recounts for the worker instead of
+    # recounting inside the writing request.
+    op.execute(
+        """
+        UPDATE job_definitions
+        SET arg_schema = jsonb_build_object(
+              'type', 'object',
+              'properties', jsonb_build_object(
+                'stale_only', jsonb_build_object('type', 'boolean'),
+                'keyword_ids', jsonb_build_object(
+                  'type', 'array',
+                  'items', jsonb_build_object('type', 'integer')
+                )
+              ),
+              'additionalProperties', false
+            ),
+            updated_at = now()
+        WHERE key = 'reconcile-keyword-facets'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        UPDATE job_definitions
+        SET arg_schema = jsonb_build_object(
+              'type', 'object',
+              'properties', jsonb_build_object(
+                'stale_only', jsonb_build_object('type', 'boolean')
+              ),
+              'additionalProperties', false
+            ),
+            updated_at = now()
+        WHERE key = 'reconcile-keyword-facets'
+        """
+    )
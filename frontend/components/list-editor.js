@@ -594,9 +594,9 @@ class ListEditor extends LitElement {
     }
 
     const pageSize = 500;
-    let skip = 0;
+    let cursor = '';
     while (true) {
-      const people = await fetchWithAuth(`/people?skip=${skip}&limit=${pageSize}`, {
+      const people = await fetchWithAuth(`/people?limit=${pageSize}${cursor}`, {
         tenantId: this.tenant,
       });
       if (!Array.isArray(people) || people.length === 0) {
@@ -611,7 +611,8 @@ class ListEditor extends LitElement {
       if (people.length < pageSize) {
         break;
       }
-      skip += people.length;
+      const last = people[people.length - 1];
+      cursor = `&after_name=${encodeURIComponent(last.name)}&after_id=${last.id}`;
     }
 
     return map;
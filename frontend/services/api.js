@@ -87,10 +87,14 @@ export async function fetchWithAuth(url, options = {}) {
     throw new Error(error.detail || 'Request failed');
   }
 
-  // Return blob for image downloads, otherwise return JSON
+  // Return blob for image downloads, the raw response when the caller needs
+  // headers (e.g. paging cursors), otherwise JSON
   if (responseType === 'blob') {
     return response.blob();
   }
+  if (responseType === 'response') {
+    return response;
+  }
 
   return response.json();
 }
@@ -535,14 +539,29 @@ export async function deleteList(tenantId, listId) {
   return result;
 }
 
+const LIST_ITEMS_PAGE_SIZE = 500;
+
 export async function getListItems(tenantId, listId, { idsOnly = false } = {}) {
-  const params = new URLSearchParams();
-  if (idsOnly) {
-    params.append('ids_only', 'true');
-  }
-  const url = `/lists/${listId}/items${params.toString() ? '?' + params.toString() : ''}`;
-  const data = await fetchWithAuth(url, { tenantId });
-  return data || [];
+  // Follow X-Next-Cursor so each request stays one bounded page.
+  const items = [];
+  let cursor = null;
+  do {
+    const params = new URLSearchParams({ limit: String(LIST_ITEMS_PAGE_SIZE) });
+    if (idsOnly) {
+      params.append('ids_only', 'true');
+    }
+    if (cursor) {
+      params.append('cursor', cursor);
+    }
+    const response = await fetchWithAuth(`/lists/${listId}/items?${params.toString()}`, {
+      tenantId,
+      responseType: 'response',
+    });
+    const page = await response.json();
+    items.push(...(page || []));
+    cursor = response.headers.get('X-Next-Cursor');
+  } while (cursor);
+  return items;
 }
 
 export async function deleteListItem(tenantId, itemId) {
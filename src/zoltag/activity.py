@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
+from datetime import datetime
+from threading import Condition, Thread
 from typing import Any, Optional
 from uuid import UUID
 
 import sqlalchemy as sa
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from zoltag.metadata import ActivityEvent
+from zoltag.settings import settings
 
 
 logger = logging.getLogger(__name__)
@@ -57,6 +62,112 @@ def _truncate(value: Optional[str], max_len: int) -> Optional[str]:
     return text[:max_len]
 
 
+class ActivityEventWriter:
+    """Bounded in-process buffer of activity events, written in batches.
+
+    A daemon thread flushes every ``batch_size`` events or every
+    ``flush_interval_seconds``, using one multi-row INSERT per engine. When the
+    buffer is full, new events are dropped instead of blocking the caller.
+    """
+
+    def __init__(self, *, max_buffer: int, batch_size: int, flush_interval_seconds: float):
+        self.max_buffer = max(1, int(max_buffer))
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval_seconds = max(0.01, float(flush_interval_seconds))
+        self.dropped_count = 0
+        self._buffer: deque[tuple[Engine, dict[str, Any]]] = deque()
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._stopping = False
+
+    def submit(self, engine: Engine, values: dict[str, Any]) -> bool:
+        """Buffer one event; returns False when it was shed."""
+        with self._condition:
+            if len(self._buffer) >= self.max_buffer:
+                self.dropped_count += 1
+                if self.dropped_count == 1 or self.dropped_count % 1000 == 0:
+                    logger.warning(
+                        "Activity event buffer full (%s); dropped %s event(s) so far",
+                        self.max_buffer,
+                        self.dropped_count,
+                    )
+                return False
+            self._buffer.append((engine, values))
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping = False
+                self._thread = Thread(target=self._run, name="zoltag-activity-writer", daemon=True)
+                self._thread.start()
+        return True
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """Write everything buffered so far; returns the number of rows written."""
+        written = 0
+        while True:
+            with self._condition:
+                batch = [self._buffer.popleft() for _ in range(min(len(self._buffer), self.batch_size))]
+            if not batch:
+                return written
+            written += self._write_batch(batch)
+
+    def stop(self, timeout_seconds: float = 5.0) -> None:
+        """Stop the writer thread after draining the buffer."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout_seconds)
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._stopping and len(self._buffer) < self.batch_size:
+                    self._condition.wait(self.flush_interval_seconds)
+                stopping = self._stopping
+            self.flush()
+            if stopping:
+                return
+
+    @staticmethod
+    def _write_batch(batch: list[tuple[Engine, dict[str, Any]]]) -> int:
+        rows_by_engine: dict[int, tuple[Engine, list[dict[str, Any]]]] = {}
+        for engine, values in batch:
+            rows_by_engine.setdefault(id(engine), (engine, []))[1].append(values)
+        written = 0
+        for engine, rows in rows_by_engine.values():
+            try:
+                with engine.begin() as conn:
+                    conn.execute(sa.insert(ActivityEvent), rows)
+                written += len(rows)
+            except Exception:
+                logger.warning("Failed to write %s activity event(s)", len(rows), exc_info=True)
+        return written
+
+
+_writer = ActivityEventWriter(
+    max_buffer=settings.activity_event_buffer_size,
+    batch_size=settings.activity_event_batch_size,
+    flush_interval_seconds=settings.activity_event_flush_ms / 1000.0,
+)
+
+
+def flush_activity_events() -> int:
+    """Synchronously write any buffered activity events."""
+    return _writer.flush()
+
+
+def stop_activity_event_writer(timeout_seconds: float = 5.0) -> None:
+    """Drain buffered activity events and stop the background writer."""
+    _writer.stop(timeout_seconds=timeout_seconds)
+
+
 def record_activity_event(
     db: Session,
     *,
@@ -68,9 +179,10 @@ def record_activity_event(
     user_agent: Optional[str] = None,
     details: Optional[dict[str, Any]] = None,
 ) -> None:
-    """Persist an activity event in an isolated transaction.
+    """Record an activity event without blocking the request.
 
-    Logging is non-blocking for primary request flows; failures are swallowed.
+    Events are buffered and written in batches by a background thread, never
+    in the caller's transaction. Failures and shed events are logged only.
     """
     normalized_event_type = str(event_type or "").strip().lower()
     if not normalized_event_type:
@@ -84,12 +196,18 @@ def record_activity_event(
         "client_ip": _truncate(client_ip, 64),
         "user_agent": _truncate(user_agent, 512),
         "details": details if isinstance(details, dict) else {},
+        "created_at": datetime.utcnow(),
     }
 
     try:
         bind = db.get_bind()
         engine = bind.engine if hasattr(bind, "engine") else bind
-        with engine.begin() as conn:
-            conn.execute(sa.insert(ActivityEvent).values(**values))
+        # SQLite connections are per-thread (in-memory databases in particular),
+        # so local/test setups write inline instead of from the writer thread.
+        if not settings.activity_events_async or engine.dialect.name == "sqlite":
+            with engine.begin() as conn:
+                conn.execute(sa.insert(ActivityEvent).values(**values))
+            return
+        _writer.submit(engine, values)
     except Exception:
         logger.warning("Failed to write activity event for type=%s", normalized_event_type, exc_info=True)
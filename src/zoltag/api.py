@@ -52,6 +52,14 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
+@app.on_event("startup")
+async def install_session_hooks():
+    """Keep per-tenant read caches in step with committed writes."""
+    from zoltag.database import init_session_hooks
+
+    init_session_hooks()
+
+
 @app.on_event("startup")
 async def warm_jwks_cache():
     """Pre-fetch JWKS on startup so the first real request isn't blocked."""
@@ -96,6 +104,44 @@ async def start_worker_mode():
         logger.exception("Failed to start worker mode thread")
 
 
+@app.on_event("shutdown")
+async def flush_activity_event_writer():
+    """Write buffered activity events before the process exits."""
+    try:
+        from zoltag.activity import stop_activity_event_writer
+
+        stop_activity_event_writer()
+    except Exception:
+        logger.exception("Failed to flush activity events")
+
+
+@app.on_event("shutdown")
+async def flush_text_index_refresh_queue():
+    """Rebuild queued asset text documents before the process exits."""
+    try:
+        from zoltag.text_index import stop_text_index_refresh_queue
+
+        stop_text_index_refresh_queue()
+    except Exception:
+        logger.exception("Failed to flush text index refresh queue")
+
+
+@app.on_event("shutdown")
+async def close_gemini_client():
+    """Release pooled Gemini HTTP connections."""
+    from zoltag.routers.nl_search import close_gemini_client as close_client
+
+    await close_client()
+
+
+@app.on_event("shutdown")
+async def close_async_db_engine():
+    """Release pooled async database connections."""
+    from zoltag.database import dispose_async_engine
+
+    await dispose_async_engine()
+
+
 @app.on_event("shutdown")
 async def stop_worker_mode():
     """Stop background queue worker when service shuts down."""
@@ -127,6 +173,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Cursor for the next page of GET /lists/{id}/items.
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Register all routers
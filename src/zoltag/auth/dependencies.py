@@ -449,7 +449,7 @@ def require_tenant_access(tenant_id: str) -> Callable:
         ):
             # User is guaranteed to have access to tenant_id
     """
-    async def check_access(
+    def check_access(
         user: UserProfile = Depends(get_current_user),
         db: Session = Depends(get_db)
     ) -> UserProfile:
@@ -482,7 +482,7 @@ def require_tenant_permission_from_header(permission_key: str) -> Callable:
     if not required_permission:
         raise ValueError("permission_key is required")
 
-    async def check_permission(
+    def check_permission(
         x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
         user: UserProfile = Depends(get_current_user),
         db: Session = Depends(get_db),
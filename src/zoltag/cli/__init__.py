@@ -11,13 +11,17 @@ from .commands import (
     inspect,
     thumbnails,
     text_index,
+    keyword_facets,
+    faces,
 )
 
 
 @click.group()
 def cli():
     """Zoltag CLI for local development and testing."""
-    pass
+    from zoltag.database import init_session_hooks
+
+    init_session_hooks()
 
 
 # Register commands (names must match existing CLI for backward compatibility)
@@ -33,6 +37,8 @@ cli.add_command(inspect.list_images_command, name='list-images')
 cli.add_command(inspect.show_config_command, name='show-config')
 cli.add_command(thumbnails.backfill_thumbnails_command, name='backfill-thumbnails')
 cli.add_command(text_index.rebuild_asset_text_index_command, name='rebuild-asset-text-index')
+cli.add_command(keyword_facets.reconcile_keyword_facets_command, name='reconcile-keyword-facets')
+cli.add_command(faces.detect_faces_command, name='detect-faces')
 
 
 if __name__ == '__main__':
@@ -10,6 +10,8 @@ from . import (
     inspect,
     thumbnails,
     text_index,
+    keyword_facets,
+    faces,
 )
 
 __all__ = [
@@ -22,4 +24,6 @@ __all__ = [
     'inspect',
     'thumbnails',
     'text_index',
+    'keyword_facets',
+    'faces',
 ]
@@ -0,0 +1,216 @@
+"""Batch face detection command."""
+
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+from typing import Optional
+from uuid import UUID
+
+import click
+from PIL import Image
+from sqlalchemy import insert
+
+from zoltag.cli.base import CliCommand
+from zoltag.image import FaceDetector
+from zoltag.metadata import Asset, DetectedFace, ImageMetadata
+from zoltag.settings import settings
+from zoltag.storage import download_blobs, gcs_bucket
+
+
+@click.command(name="detect-faces")
+@click.option("--tenant-id", required=True, help="Tenant ID for which to detect faces")
+@click.option("--limit", default=None, type=int, help="Maximum number of images to process (unlimited if not specified)")
+@click.option("--batch-size", default=100, type=int, help="Images per detection batch and database commit")
+@click.option(
+    "--workers",
+    default=0,
+    type=int,
+    help="Detection processes (0 = settings.face_detection_workers, capped at the CPU count)",
+)
+@click.option(
+    "--max-dimension",
+    default=800,
+    type=int,
+    help="Longest side images are decoded at before detection (0 = full thumbnail size)",
+)
+def detect_faces_command(
+    tenant_id: str,
+    limit: Optional[int],
+    batch_size: int,
+    workers: int,
+    max_dimension: int,
+):
+    """Detect faces on images that have not been processed yet.
+
+    Thumbnails are decoded downscaled (JPEG draft mode) instead of fetching
+    originals, and detection runs across a process pool. Each batch writes its
+    faces with one bulk insert and flips faces_detected with one UPDATE.
+    Images without a readable thumbnail are left pending for a later run."""
+    cmd = DetectFacesCommand(
+        tenant_id=tenant_id,
+        limit=limit,
+        batch_size=batch_size,
+        workers=workers,
+        max_dimension=max_dimension,
+    )
+    cmd.run()
+
+
+_detector: Optional[FaceDetector] = None
+
+
+def _init_worker() -> None:
+    global _detector
+    _detector = FaceDetector()
+
+
+def _detect_faces_in_thumbnail(task: tuple[int, bytes, Optional[int]]) -> tuple[int, Optional[list[dict]], Optional[tuple[int, int]]]:
+    """Pool worker: return (image_id, faces, thumbnail size), or no faces on decode failure."""
+    image_id, image_data, max_dimension = task
+    detector = _detector or FaceDetector()
+    try:
+        with Image.open(io.BytesIO(image_data)) as image:
+            size = image.size
+        return image_id, detector.detect_faces(image_data, max_dimension), size
+    except ImportError:
+        raise
+    except Exception:
+        return image_id, None, None
+
+
+def _scale_bounding_box(box: dict, thumbnail_size: tuple[int, int], image_size: tuple[Optional[int], Optional[int]]) -> dict:
+    """Map a thumbnail-space box onto the original image's pixel grid."""
+    thumb_width, thumb_height = thumbnail_size
+    width, height = image_size
+    scale_x = (width / thumb_width) if width and thumb_width else 1.0
+    scale_y = (height / thumb_height) if height and thumb_height else 1.0
+    return {
+        "top": int(round(box["top"] * scale_y)),
+        "right": int(round(box["right"] * scale_x)),
+        "bottom": int(round(box["bottom"] * scale_y)),
+        "left": int(round(box["left"] * scale_x)),
+    }
+
+
+class DetectFacesCommand(CliCommand):
+    """Command to run face detection over a tenant's pending images."""
+
+    def __init__(
+        self,
+        *,
+        tenant_id: str,
+        limit: Optional[int],
+        batch_size: int,
+        workers: int,
+        max_dimension: int,
+    ):
+        super().__init__()
+        self.tenant_id = tenant_id
+        self.limit = limit
+        self.batch_size = max(1, int(batch_size or 1))
+        if not workers or workers <= 0:
+            workers = min(max(1, int(settings.face_detection_workers)), os.cpu_count() or 1)
+        self.workers = int(workers)
+        self.max_dimension = max_dimension if max_dimension and max_dimension > 0 else None
+
+    def run(self):
+        """Execute face detection command."""
+        self.setup_db()
+        try:
+            self.load_tenant(self.tenant_id)
+            self._detect_faces()
+        finally:
+            self.cleanup_db()
+
+    def _detect_faces(self):
+        bucket = gcs_bucket(self.tenant.get_thumbnail_bucket(settings))
+        pool = None
+        if self.workers > 1:
+            # spawn: workers must not inherit the parent's DB/storage connections.
+            pool = multiprocessing.get_context("spawn").Pool(processes=self.workers, initializer=_init_worker)
+        else:
+            _init_worker()
+
+        processed = faces_found = skipped = 0
+        after_id = 0
+        try:
+            while self.limit is None or processed + skipped < self.limit:
+                batch_limit = self.batch_size
+                if self.limit is not None:
+                    batch_limit = min(batch_limit, self.limit - processed - skipped)
+                batch = self._pending_images(after_id, batch_limit)
+                if not batch:
+                    break
+                after_id = batch[-1].id
+
+                thumbnails = download_blobs(bucket, {row.id: row.thumbnail_key for row in batch if row.thumbnail_key})
+                tasks = [(row.id, thumbnails[row.id], self.max_dimension) for row in batch if row.id in thumbnails]
+                if pool is not None:
+                    chunksize = max(1, len(tasks) // (self.workers * 4))
+                    results = list(pool.imap_unordered(_detect_faces_in_thumbnail, tasks, chunksize=chunksize))
+                else:
+                    results = [_detect_faces_in_thumbnail(task) for task in tasks]
+
+                written_images, written_faces = self._write_results(batch, results)
+                self.db.commit()
+                processed += written_images
+                faces_found += written_faces
+                skipped += len(batch) - written_images
+                click.echo(f"  {processed} images processed, {faces_found} faces, {skipped} skipped")
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        click.echo(
+            f"✓ Face detection complete (tenant={self.tenant.id}, images={processed}, "
+            f"faces={faces_found}, skipped={skipped})"
+        )
+
+    def _pending_images(self, after_id: int, limit: int) -> list:
+        """Next page of images without faces_detected, keyset-paginated on id."""
+        return self.db.query(
+            ImageMetadata.id,
+            ImageMetadata.width,
+            ImageMetadata.height,
+            Asset.thumbnail_key,
+        ).outerjoin(
+            Asset, Asset.id == ImageMetadata.asset_id
+        ).filter(
+            self.tenant_filter(ImageMetadata),
+            ImageMetadata.faces_detected.isnot(True),
+            ImageMetadata.id > after_id,
+        ).order_by(ImageMetadata.id).limit(limit).all()
+
+    def _write_results(self, batch: list, results: list) -> tuple[int, int]:
+        """Bulk-insert detected faces and mark their images as processed."""
+        rows_by_id = {row.id: row for row in batch}
+        tenant_uuid = UUID(str(self.tenant.id))
+        face_rows = []
+        done_ids = []
+        for image_id, faces, thumbnail_size in results:
+            if faces is None:
+                continue
+            done_ids.append(image_id)
+            row = rows_by_id[image_id]
+            for face in faces:
+                box = _scale_bounding_box(face["bounding_box"], thumbnail_size, (row.width, row.height))
+                face_rows.append({
+                    "image_id": image_id,
+                    "tenant_id": tenant_uuid,
+                    "bbox_top": box["top"],
+                    "bbox_right": box["right"],
+                    "bbox_bottom": box["bottom"],
+                    "bbox_left": box["left"],
+                    "face_encoding": face["encoding"],
+                })
+
+        if face_rows:
+            self.db.execute(insert(DetectedFace), face_rows)
+        if done_ids:
+            self.db.query(ImageMetadata).filter(
+                ImageMetadata.id.in_(done_ids)
+            ).update({ImageMetadata.faces_detected: True}, synchronize_session=False)
+        return len(done_ids), len(face_rows)
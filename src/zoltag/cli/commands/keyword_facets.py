@@ -0,0 +1,65 @@
+"""Keyword facet count reconcile command."""
+
+from __future__ import annotations
+
+import click
+
+from zoltag.cli.base import CliCommand
+from zoltag.keyword_facets import rebuild_keyword_facets, refresh_keyword_facets
+from zoltag.metadata import KeywordFacetState
+
+
+@click.command(name="reconcile-keyword-facets")
+@click.option("--tenant-id", required=True, help="Tenant ID for which to rebuild keyword facet counts")
+@click.option(
+    "--stale-only/--no-stale-only",
+    default=False,
+    help="Skip the rebuild when counts exist and are not marked stale",
+)
+@click.option(
+    "--keyword-id",
+    "keyword_ids",
+    multiple=True,
+    type=int,
+    help="Recount only these keywords (repeatable); stale or unbuilt tenants get a full rebuild",
+)
+def reconcile_keyword_facets_command(tenant_id: str, stale_only: bool, keyword_ids: tuple[int, ...]):
+    """Rebuild materialized keyword facet counts from permatags and machine tags."""
+    cmd = ReconcileKeywordFacetsCommand(tenant_id=tenant_id, stale_only=stale_only, keyword_ids=keyword_ids)
+    cmd.run()
+
+
+class ReconcileKeywordFacetsCommand(CliCommand):
+    """Command to rebuild keyword facet counts for one tenant."""
+
+    def __init__(self, *, tenant_id: str, stale_only: bool, keyword_ids: tuple[int, ...] = ()):
+        super().__init__()
+        self.tenant_id = tenant_id
+        self.stale_only = stale_only
+        self.keyword_ids = tuple(keyword_ids or ())
+
+    def run(self):
+        self.setup_db()
+        try:
+            self.load_tenant(self.tenant_id)
+            self._reconcile()
+        finally:
+            self.cleanup_db()
+
+    def _reconcile(self):
+        if self.keyword_ids and refresh_keyword_facets(self.db, self.tenant.id, self.keyword_ids):
+            self.db.commit()
+            click.echo(
+                f"✓ Keyword facet counts refreshed (tenant={self.tenant.id}, keywords={len(self.keyword_ids)})"
+            )
+            return
+        if self.stale_only:
+            state = self.db.query(KeywordFacetState).filter(
+                self.tenant_filter(KeywordFacetState)
+            ).first()
+            if state is not None and not state.is_stale:
+                click.echo(f"Keyword facet counts are fresh (tenant={self.tenant.id}); nothing to do")
+                return
+        rows = rebuild_keyword_facets(self.db, self.tenant.id)
+        self.db.commit()
+        click.echo(f"✓ Keyword facet counts rebuilt (tenant={self.tenant.id}, rows={rows})")
@@ -1,11 +1,24 @@
 """Database configuration and session management."""
 
+import threading
+from typing import Any, Callable, TypeVar
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from zoltag.settings import settings
 
 
+T = TypeVar("T")
+
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
 def get_engine_kwargs() -> dict:
     """Return SQLAlchemy engine kwargs with safe defaults for long-running jobs."""
     kwargs = {
@@ -37,6 +50,18 @@ engine = build_engine()
 SessionLocal = sessionmaker(bind=engine)
 
 
+def init_session_hooks() -> None:
+    """Install the Session listeners that keep derived read models in step with commits.
+
+    Covers per-tenant read caches and keyword_facet_counts. Called once at
+    process start by the API and the CLI; safe to call again.
+    """
+    from zoltag import keyword_facets, tenant_cache
+
+    tenant_cache.install_session_hooks()
+    keyword_facets.install_session_hooks()
+
+
 def get_db():
     """Get database session for dependency injection."""
     db = SessionLocal()
@@ -44,3 +69,107 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_async_database_url(database_url: str) -> tuple[str, dict]:
+    """Map a sync database URL onto its async driver.
+
+    Returns the async URL and driver connect_args. libpq-only query options
+    (e.g. ``sslmode``) are translated or dropped because asyncpg rejects them.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend: {backend}")
+
+    connect_args: dict[str, Any] = {}
+    if backend == "postgresql":
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", None)
+        if sslmode and sslmode != "disable":
+            connect_args["ssl"] = sslmode
+        connect_args["timeout"] = settings.db_connect_timeout
+        url = url.set(query=query)
+
+    url = url.set(drivername=_ASYNC_DRIVERS[backend])
+    return url.render_as_string(hide_password=False), connect_args
+
+
+def build_async_engine():
+    """Build the AsyncEngine used by read-heavy endpoints (asyncpg / aiosqlite)."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    async_url, connect_args = get_async_database_url(settings.database_url)
+    kwargs: dict[str, Any] = {"connect_args": connect_args}
+    if async_url.startswith("sqlite"):
+        # aiosqlite connections are bound to the loop that opened them.
+        kwargs["poolclass"] = NullPool
+    else:
+        kwargs.update(
+            pool_pre_ping=settings.db_pool_pre_ping,
+            pool_recycle=settings.db_pool_recycle,
+            pool_timeout=settings.db_pool_timeout,
+            pool_size=settings.db_async_pool_size,
+            max_overflow=settings.db_async_max_overflow,
+        )
+    return create_async_engine(async_url, **kwargs)
+
+
+_async_engine = None
+_async_session_factory = None
+_async_engine_lock = threading.Lock()
+
+
+def async_db_enabled() -> bool:
+    """Whether read-heavy endpoints should use the async engine."""
+    return bool(settings.db_async_enabled)
+
+
+def get_async_session_factory():
+    """Return the lazily built ``async_sessionmaker`` for the async engine."""
+    global _async_engine, _async_session_factory
+    if _async_session_factory is None:
+        with _async_engine_lock:
+            if _async_session_factory is None:
+                from sqlalchemy.ext.asyncio import async_sessionmaker
+
+                _async_engine = build_async_engine()
+                _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _async_session_factory
+
+
+async def get_async_db():
+    """Get an AsyncSession for dependency injection."""
+    async with get_async_session_factory()() as session:
+        yield session
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections (application shutdown)."""
+    global _async_engine, _async_session_factory
+    async_engine, _async_engine, _async_session_factory = _async_engine, None, None
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+def _run_with_session(fn: Callable[..., T], *args, **kwargs) -> T:
+    db = SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+async def run_read_query(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run ``fn(session, *args, **kwargs)`` for a read-only endpoint.
+
+    With ``db_async_enabled`` the function runs on an AsyncSession via
+    ``run_sync``: database I/O is awaited on the event loop and uses the async
+    engine's own pool. Otherwise it runs in the threadpool with a regular
+    ``SessionLocal`` session.
+    """
+    if not async_db_enabled():
+        return await run_in_threadpool(_run_with_session, fn, *args, **kwargs)
+    async with get_async_session_factory()() as session:
+        return await session.run_sync(fn, *args, **kwargs)
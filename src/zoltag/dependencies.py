@@ -1,10 +1,14 @@
 """Shared dependencies for FastAPI endpoints."""
 
+import os
+import re
+import threading
+import time
+from pathlib import Path
 from typing import Optional
 
 from fastapi import Header, HTTPException, Depends, status
 from sqlalchemy.orm import Session
-from google.cloud import secretmanager
 
 from zoltag.database import get_db
 from zoltag.tenant import Tenant
@@ -21,7 +25,7 @@ def _resolve_tenant(db: Session, tenant_ref: str) -> Optional[TenantModel]:
     return db.query(TenantModel).filter(tenant_reference_filter(TenantModel, tenant_ref)).first()
 
 
-async def get_tenant(
+def get_tenant(
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
     user: UserProfile = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -96,17 +100,89 @@ async def get_tenant(
     return tenant
 
 
+_secret_cache: dict[str, tuple[float, str]] = {}
+_secret_client = None
+_secret_client_lock = threading.Lock()
+
+
+def _get_secret_client():
+    """Return the process-wide Secret Manager client, creating it on first use."""
+    global _secret_client
+    if _secret_client is None:
+        with _secret_client_lock:
+            if _secret_client is None:
+                from google.cloud import secretmanager
+
+                _secret_client = secretmanager.SecretManagerServiceClient()
+    return _secret_client
+
+
+def _use_local_secrets() -> bool:
+    return str(settings.secret_provider or "").strip().lower() == "local"
+
+
+def _local_secret_env_name(secret_id: str) -> str:
+    return "ZOLTAG_SECRET_" + re.sub(r"[^A-Za-z0-9]", "_", secret_id).upper()
+
+
+def _local_secret_path(secret_id: str) -> Path:
+    if not secret_id or "/" in secret_id or "\\" in secret_id or secret_id.startswith("."):
+        raise ValueError(f"Invalid secret id: {secret_id!r}")
+    return Path(settings.secret_local_dir or ".secrets") / secret_id
+
+
+def _read_local_secret(secret_id: str) -> str:
+    """Read a secret from ZOLTAG_SECRET_<ID> or a file in secret_local_dir."""
+    env_value = os.environ.get(_local_secret_env_name(secret_id))
+    if env_value is not None:
+        return env_value
+    path = _local_secret_path(secret_id)
+    if not path.is_file():
+        raise ValueError(f"Secret {secret_id} not found")
+    return path.read_text(encoding="utf-8")
+
+
+def invalidate_secret_cache(secret_id: Optional[str] = None) -> None:
+    """Drop one cached secret payload, or all of them."""
+    if secret_id is None:
+        _secret_cache.clear()
+        return
+    _secret_cache.pop(secret_id, None)
+
+
 def get_secret(secret_id: str) -> str:
-    """Get secret from Google Cloud Secret Manager."""
-    client = secretmanager.SecretManagerServiceClient()
-    name = f"projects/{settings.gcp_project_id}/secrets/{secret_id}/versions/latest"
-    response = client.access_secret_version(request={"name": name})
-    return response.payload.data.decode('UTF-8')
+    """Get secret from Google Cloud Secret Manager (or the local stand-in).
+
+    Payloads are cached for ``secret_cache_ttl_seconds``; failures are not cached.
+    """
+    ttl_seconds = max(0, int(settings.secret_cache_ttl_seconds or 0))
+    now = time.monotonic()
+    cached = _secret_cache.get(secret_id)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    if _use_local_secrets():
+        value = _read_local_secret(secret_id)
+    else:
+        name = f"projects/{settings.gcp_project_id}/secrets/{secret_id}/versions/latest"
+        response = _get_secret_client().access_secret_version(request={"name": name})
+        value = response.payload.data.decode('UTF-8')
+
+    if ttl_seconds:
+        _secret_cache[secret_id] = (now + ttl_seconds, value)
+    return value
 
 
 def store_secret(secret_id: str, value: str) -> None:
-    """Store secret in Google Cloud Secret Manager."""
-    client = secretmanager.SecretManagerServiceClient()
+    """Store secret in Google Cloud Secret Manager (or the local stand-in)."""
+    invalidate_secret_cache(secret_id)
+    if _use_local_secrets():
+        path = _local_secret_path(secret_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(value, encoding="utf-8")
+        return
+
+    client = _get_secret_client()
     parent = f"projects/{settings.gcp_project_id}"
 
     try:
@@ -134,7 +210,12 @@ def store_secret(secret_id: str, value: str) -> None:
 
 def delete_secret(secret_id: str) -> None:
     """Delete a secret from Google Cloud Secret Manager if it exists."""
-    client = secretmanager.SecretManagerServiceClient()
+    invalidate_secret_cache(secret_id)
+    if _use_local_secrets():
+        _local_secret_path(secret_id).unlink(missing_ok=True)
+        return
+
+    client = _get_secret_client()
     name = f"projects/{settings.gcp_project_id}/secrets/{secret_id}"
     try:
         client.delete_secret(request={"name": name})
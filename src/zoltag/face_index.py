@@ -0,0 +1,298 @@
+"""Per-tenant nearest-neighbour matching of detected face encodings.
+
+Matching a face used to mean comparing it with every known encoding. On
+PostgreSQL with pgvector, ``detected_faces.face_encoding_vec`` mirrors
+``face_encoding`` through a trigger and carries an HNSW index over the faces
+that are assigned to a person, so a match is an index-backed KNN query and
+newly written faces are indexed as they land. Elsewhere (SQLite, databases
+without the extension) the tenant's known encodings are loaded once into a
+matrix and searched in a single vectorized pass; the matrix is reused until a
+committed session touches the tenant's detected faces, or for at most
+``face_index_cache_ttl_seconds`` to bound writes made by other processes.
+
+The HNSW index is shared by all tenants and the tenant filter is applied to
+the candidates it yields, so the KNN query widens ``hnsw.ef_search`` and, on
+pgvector 0.8+, enables iterative index scans so that a tenant whose faces are
+far from the query in the global graph still gets its nearest matches.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from zoltag.metadata import DetectedFace
+from zoltag.settings import settings
+from zoltag.tenant_cache import TenantCache
+
+logger = logging.getLogger(__name__)
+
+# Euclidean distance below which two dlib encodings are the same person.
+DEFAULT_FACE_MATCH_TOLERANCE = 0.6
+# pgvector release that added hnsw.iterative_scan.
+_ITERATIVE_SCAN_VERSION = (0, 8, 0)
+# SQLSTATEs meaning the vector extension/column is missing, not a transient failure:
+# undefined_table, undefined_column, undefined_function, undefined_object.
+_MISSING_VECTOR_SQLSTATES = {"42P01", "42703", "42883", "42704"}
+
+
+@dataclass(frozen=True)
+class FaceMatch:
+    """A known face close to a query encoding."""
+
+    face_id: int
+    person_id: int
+    distance: float
+
+
+class FaceEncodingIndex:
+    """In-memory matrix of known face encodings for one tenant."""
+
+    def __init__(self, face_ids: Sequence[int], person_ids: Sequence[int], encodings: np.ndarray):
+        self.face_ids = np.asarray(face_ids, dtype=np.int64)
+        self.person_ids = np.asarray(person_ids, dtype=np.int64)
+        self.encodings = np.asarray(encodings, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return int(self.face_ids.size)
+
+    def search(self, encoding: Sequence[float], *, tolerance: float, limit: int) -> list[FaceMatch]:
+        """Return up to ``limit`` faces within ``tolerance``, nearest first."""
+        if not len(self) or limit <= 0:
+            return []
+        query = np.asarray(encoding, dtype=np.float32)
+        if query.shape != self.encodings.shape[1:]:
+            return []
+        distances = np.linalg.norm(self.encodings - query, axis=1)
+        candidates = np.flatnonzero(distances <= tolerance)
+        if candidates.size > limit:
+            candidates = candidates[np.argpartition(distances[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(distances[candidates], kind="stable")]
+        return [
+            FaceMatch(
+                face_id=int(self.face_ids[index]),
+                person_id=int(self.person_ids[index]),
+                distance=float(distances[index]),
+            )
+            for index in candidates
+        ]
+
+
+_face_index_cache = TenantCache(
+    "face_index",
+    models=(DetectedFace,),
+    ttl_setting="face_index_cache_ttl_seconds",
+)
+# Engine URL -> pgvector version tuple, or None when vectors are unavailable.
+_pgvector_capability_cache: dict[str, Optional[tuple[int, ...]]] = {}
+
+
+def invalidate_face_index(tenant_id: Optional[str] = None) -> None:
+    """Drop the cached face matrix for one tenant, or for all tenants when omitted."""
+    _face_index_cache.invalidate(tenant_id)
+
+
+def _load_face_index(db: Session, tenant_id) -> FaceEncodingIndex:
+    rows = db.query(
+        DetectedFace.id,
+        DetectedFace.person_id,
+        DetectedFace.face_encoding,
+    ).filter(
+        DetectedFace.tenant_id == tenant_id,
+        DetectedFace.person_id.isnot(None),
+        DetectedFace.face_encoding.isnot(None),
+    ).order_by(DetectedFace.id).all()
+
+    rows = [row for row in rows if row.face_encoding]
+    dims = Counter(len(row.face_encoding) for row in rows)
+    if len(dims) > 1:
+        # Mixed encoding shapes cannot share a matrix; keep the dominant one.
+        dim = dims.most_common(1)[0][0]
+        rows = [row for row in rows if len(row.face_encoding) == dim]
+    if not rows:
+        return FaceEncodingIndex([], [], np.zeros((0, 0), dtype=np.float32))
+    return FaceEncodingIndex(
+        [row.id for row in rows],
+        [row.person_id for row in rows],
+        np.array([row.face_encoding for row in rows], dtype=np.float32),
+    )
+
+
+def get_face_index(db: Session, tenant_id) -> FaceEncodingIndex:
+    """Return the tenant's in-memory face matrix, loading it on a miss."""
+    generation = _face_index_cache.generation(tenant_id)
+    cached = _face_index_cache.get(tenant_id)
+    if cached is not None:
+        return cached
+
+    index = _load_face_index(db, tenant_id)
+    _face_index_cache.store(tenant_id, index, generation)
+    return index
+
+
+def _pgvector_cache_key(db: Session) -> str:
+    return str(db.get_bind().engine.url)
+
+
+def _parse_version(value: Optional[str]) -> tuple[int, ...]:
+    parts = []
+    for part in str(value or "").split("."):
+        digits = "".join(ch for ch in part if ch.isdigit())
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
+
+def _is_missing_vector_support(exc: SQLAlchemyError) -> bool:
+    orig = getattr(exc, "orig", None) if isinstance(exc, DBAPIError) else None
+    sqlstate = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    return sqlstate in _MISSING_VECTOR_SQLSTATES
+
+
+def _face_vector_version(db: Session) -> Optional[tuple[int, ...]]:
+    """Return the pgvector version when face vectors can be queried, else None."""
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return None
+
+    cache_key = _pgvector_cache_key(db)
+    if cache_key in _pgvector_capability_cache:
+        return _pgvector_capability_cache[cache_key]
+
+    try:
+        with db.begin_nested():
+            row = db.execute(
+                text(
+                    """
+                    SELECT
+                        (SELECT extversion FROM pg_extension WHERE extname = 'vector') AS extension_version,
+                        EXISTS (
+                            SELECT 1
+                            FROM information_schema.columns
+                            WHERE table_schema = 'public'
+                              AND table_name = 'detected_faces'
+                              AND column_name = 'face_encoding_vec'
+                        ) AS has_face_encoding_vec
+                    """
+                )
+            ).mappings().first()
+    except SQLAlchemyError as exc:
+        # Transient failure: use the in-memory matrix now and probe again next time.
+        logger.debug("Could not check face encoding vector support: %s", exc)
+        return None
+    version = None
+    if row and row["extension_version"] and row["has_face_encoding_vec"]:
+        version = _parse_version(row["extension_version"])
+    _pgvector_capability_cache[cache_key] = version
+    return version
+
+
+def _to_pgvector_literal(values: np.ndarray) -> str:
+    return "[" + ",".join(f"{float(value):.10g}" for value in values.tolist()) + "]"
+
+
+def _find_face_matches_pgvector(
+    db: Session,
+    tenant_id,
+    query: np.ndarray,
+    *,
+    tolerance: float,
+    limit: int,
+    version: tuple[int, ...],
+) -> Optional[list[FaceMatch]]:
+    ef_search = max(int(settings.face_match_hnsw_ef_search), int(limit))
+    try:
+        # A savepoint keeps a failed KNN query (and its SET LOCALs) from
+        # aborting the caller's transaction.
+        with db.begin_nested():
+            db.execute(
+                text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+                {"ef_search": str(ef_search)},
+            )
+            if version >= _ITERATIVE_SCAN_VERSION:
+                db.execute(text("SELECT set_config('hnsw.iterative_scan', 'relaxed_order', true)"))
+            # relaxed_order may return candidates slightly out of order; the
+            # materialized CTE lets the outer query re-sort them exactly.
+            rows = db.execute(
+                text(
+                    """
+                    WITH candidates AS MATERIALIZED (
+                        SELECT
+                            id,
+                            person_id,
+                            face_encoding_vec <-> CAST(:query_vec AS vector) AS distance
+                        FROM detected_faces
+                        WHERE tenant_id = :tenant_id
+                          AND person_id IS NOT NULL
+                          AND face_encoding_vec IS NOT NULL
+                        ORDER BY face_encoding_vec <-> CAST(:query_vec AS vector)
+                        LIMIT :limit
+                    )
+                    SELECT id, person_id, distance
+                    FROM candidates
+                    ORDER BY distance, id
+                    """
+                ),
+                {
+                    "tenant_id": tenant_id,
+                    "query_vec": _to_pgvector_literal(query),
+                    "limit": int(limit),
+                },
+            ).mappings().all()
+    except SQLAlchemyError as exc:
+        if _is_missing_vector_support(exc):
+            _pgvector_capability_cache[_pgvector_cache_key(db)] = None
+        logger.debug("Face encoding KNN query failed; falling back to in-memory matching: %s", exc)
+        return None
+
+    return [
+        FaceMatch(face_id=int(row["id"]), person_id=int(row["person_id"]), distance=float(row["distance"]))
+        for row in rows
+        if row["distance"] is not None and float(row["distance"]) <= tolerance
+    ]
+
+
+def find_face_matches(
+    db: Session,
+    tenant_id,
+    encoding: Sequence[float],
+    *,
+    tolerance: float = DEFAULT_FACE_MATCH_TOLERANCE,
+    limit: int = 10,
+) -> list[FaceMatch]:
+    """Return the tenant's person-assigned faces within ``tolerance``, nearest first."""
+    if encoding is None or limit <= 0:
+        return []
+    query = np.asarray(encoding, dtype=np.float32)
+    if query.ndim != 1 or not query.size:
+        return []
+
+    version = _face_vector_version(db)
+    if version is not None:
+        matches = _find_face_matches_pgvector(db, tenant_id, query, tolerance=tolerance, limit=limit, version=version)
+        if matches is not None:
+            return matches
+    return get_face_index(db, tenant_id).search(query, tolerance=tolerance, limit=limit)
+
+
+def suggest_people_for_encoding(
+    db: Session,
+    tenant_id,
+    encoding: Sequence[float],
+    *,
+    tolerance: float = DEFAULT_FACE_MATCH_TOLERANCE,
+    limit: int = 10,
+) -> list[FaceMatch]:
+    """Return the closest matching face per person, nearest person first."""
+    best: dict[int, FaceMatch] = {}
+    for match in find_face_matches(db, tenant_id, encoding, tolerance=tolerance, limit=limit):
+        best.setdefault(match.person_id, match)
+    return list(best.values())
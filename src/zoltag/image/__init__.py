@@ -7,7 +7,7 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Tuple
+from typing import Iterable, Tuple
 
 import imagehash
 import numpy as np
@@ -194,11 +194,17 @@ def is_supported_media_file(filename: str, mime_type: str | None = None) -> bool
 
 
 class VideoProcessor:
-    """Extract thumbnail and metadata from video bytes."""
+    """Extract thumbnail and metadata from video bytes or a remote URL."""
 
-    def __init__(self, thumbnail_size: Tuple[int, int] = (256, 256), seek_seconds: float = 1.0):
+    def __init__(
+        self,
+        thumbnail_size: Tuple[int, int] = (256, 256),
+        seek_seconds: float = 1.0,
+        remote_timeout_seconds: float = 60.0,
+    ):
         self.thumbnail_size = thumbnail_size
         self.seek_seconds = max(0.0, float(seek_seconds or 0.0))
+        self.remote_timeout_seconds = max(1.0, float(remote_timeout_seconds or 60.0))
         self._image_processor = ImageProcessor(thumbnail_size=thumbnail_size)
 
     def create_placeholder_thumbnail(self) -> bytes:
@@ -221,32 +227,19 @@ class VideoProcessor:
 
     def extract_features(self, data: bytes, filename: str = "video") -> dict:
         """Extract metadata and a representative poster thumbnail."""
+        return self.extract_features_from_chunks([data], filename=filename)
+
+    def extract_features_from_chunks(self, chunks: Iterable[bytes], filename: str = "video") -> dict:
+        """Spool streamed video bytes to a tempfile and extract features from it."""
         suffix = Path(filename or "video.mp4").suffix or ".mp4"
         temp_path = None
         try:
             with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
-                temp_file.write(data)
+                for chunk in chunks:
+                    temp_file.write(chunk)
                 temp_path = temp_file.name
 
-            width, height, duration_ms, format_name = self._probe_video(temp_path)
-            frame_bytes = self._extract_frame(temp_path, seek_seconds=self.seek_seconds)
-            thumbnail_bytes = None
-            if frame_bytes:
-                try:
-                    frame_image = self._image_processor.load_image(frame_bytes)
-                    thumbnail_bytes = self._image_processor.create_thumbnail(frame_image)
-                except Exception:
-                    thumbnail_bytes = None
-            if thumbnail_bytes is None:
-                thumbnail_bytes = self.create_placeholder_thumbnail()
-
-            return {
-                "thumbnail": thumbnail_bytes,
-                "width": width,
-                "height": height,
-                "duration_ms": duration_ms,
-                "format": format_name or suffix.lstrip(".").upper() or None,
-            }
+            return self._extract_from_source(temp_path, suffix)
         finally:
             if temp_path and os.path.exists(temp_path):
                 try:
@@ -254,13 +247,54 @@ class VideoProcessor:
                 except Exception:
                     pass
 
-    def _probe_video(self, video_path: str) -> tuple[int | None, int | None, int | None, str | None]:
+    def extract_features_from_url(self, url: str, filename: str = "video") -> dict:
+        """Probe and seek a remote (signed/temporary) URL without downloading the file.
+
+        ffprobe/ffmpeg issue HTTP range requests, so only the container index and the
+        bytes around the seek point are transferred.
+        """
+        suffix = Path(filename or "video.mp4").suffix or ".mp4"
+        return self._extract_from_source(url, suffix, remote=True)
+
+    def _extract_from_source(self, source: str, suffix: str, remote: bool = False) -> dict:
+        width, height, duration_ms, format_name = self._probe_video(source, remote=remote)
+        frame_bytes = self._extract_frame(source, seek_seconds=self.seek_seconds, remote=remote)
+        thumbnail_bytes = None
+        if frame_bytes:
+            try:
+                frame_image = self._image_processor.load_image(frame_bytes)
+                thumbnail_bytes = self._image_processor.create_thumbnail(frame_image)
+            except Exception:
+                thumbnail_bytes = None
+        frame_extracted = thumbnail_bytes is not None
+        if thumbnail_bytes is None:
+            thumbnail_bytes = self.create_placeholder_thumbnail()
+
+        return {
+            "thumbnail": thumbnail_bytes,
+            "frame_extracted": frame_extracted,
+            "width": width,
+            "height": height,
+            "duration_ms": duration_ms,
+            "format": format_name or suffix.lstrip(".").upper() or None,
+        }
+
+    def _remote_input_args(self) -> list[str]:
+        # Network read timeout in microseconds; applies to http(s) inputs only.
+        return ["-rw_timeout", str(int(self.remote_timeout_seconds * 1_000_000))]
+
+    def _probe_video(
+        self,
+        video_path: str,
+        remote: bool = False,
+    ) -> tuple[int | None, int | None, int | None, str | None]:
         if shutil.which("ffprobe") is None:
             return None, None, None, None
         cmd = [
             "ffprobe",
             "-v",
             "error",
+            *(self._remote_input_args() if remote else []),
             "-show_entries",
             "format=duration,format_name:stream=width,height,duration",
             "-select_streams",
@@ -270,7 +304,13 @@ class VideoProcessor:
             video_path,
         ]
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=self.remote_timeout_seconds if remote else None,
+            )
         except Exception:
             return None, None, None, None
 
@@ -289,7 +329,12 @@ class VideoProcessor:
             format_name = str(fmt.get("format_name")).split(",")[0].upper()
         return width, height, duration_ms, format_name
 
-    def _extract_frame(self, video_path: str, seek_seconds: float = 1.0) -> bytes | None:
+    def _extract_frame(
+        self,
+        video_path: str,
+        seek_seconds: float = 1.0,
+        remote: bool = False,
+    ) -> bytes | None:
         if shutil.which("ffmpeg") is None:
             return None
         seek_value = max(0.0, float(seek_seconds or 0.0))
@@ -298,6 +343,7 @@ class VideoProcessor:
             "-hide_banner",
             "-loglevel",
             "error",
+            *(self._remote_input_args() if remote else []),
             "-ss",
             f"{seek_value:.3f}",
             "-i",
@@ -311,7 +357,12 @@ class VideoProcessor:
             "pipe:1",
         ]
         try:
-            result = subprocess.run(cmd, capture_output=True, check=True)
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                check=True,
+                timeout=self.remote_timeout_seconds if remote else None,
+            )
         except Exception:
             return None
         data = result.stdout or b""
@@ -347,38 +398,81 @@ class FaceDetector:
         # Lazy import to avoid loading model at import time
         pass
     
-    def detect_faces(self, image_data: bytes) -> list[dict]:
-        """Detect faces and return bounding boxes."""
+    def detect_faces(self, image_data: bytes, max_dimension: int | None = None) -> list[dict]:
+        """Detect faces and return bounding boxes.
+
+        With ``max_dimension`` the image is decoded downscaled (JPEG draft mode
+        scales during DCT decoding, so large files are never fully decoded);
+        boxes are mapped back to the input image's pixel grid either way.
+        """
         import face_recognition
-        
-        # Load image
-        image = face_recognition.load_image_file(io.BytesIO(image_data))
-        
+
+        image, scale = self.load_detection_image(image_data, max_dimension)
+
         # Detect faces
         face_locations = face_recognition.face_locations(image)
         face_encodings = face_recognition.face_encodings(image, face_locations)
-        
+
         results = []
         for location, encoding in zip(face_locations, face_encodings):
-            top, right, bottom, left = location
+            top, right, bottom, left = (int(round(value * scale)) for value in location)
             results.append({
                 "bounding_box": {"top": top, "right": right, "bottom": bottom, "left": left},
                 "encoding": encoding.tolist(),
             })
-        
+
         return results
-    
+
+    @staticmethod
+    def load_detection_image(image_data: bytes, max_dimension: int | None = None) -> tuple[np.ndarray, float]:
+        """Decode to an RGB array no larger than ``max_dimension``.
+
+        Returns the pixels and the factor mapping their coordinates back to the
+        full-size image.
+        """
+        with Image.open(io.BytesIO(image_data)) as image:
+            source_width = image.width
+            if max_dimension and max(image.size) > max_dimension:
+                image.draft("RGB", (max_dimension, max_dimension))
+                image = image.convert("RGB")
+                image.thumbnail((max_dimension, max_dimension), Image.Resampling.BILINEAR)
+            else:
+                image = image.convert("RGB")
+            pixels = np.array(image)
+        scale = source_width / pixels.shape[1] if pixels.shape[1] else 1.0
+        return pixels, scale
+
     def match_face(
         self,
         face_encoding: list[float],
         known_encodings: list[list[float]],
         tolerance: float = 0.6
     ) -> list[int]:
-        """Match a face encoding against known encodings."""
-        import face_recognition
-        
-        face_enc = np.array(face_encoding)
-        known_encs = [np.array(enc) for enc in known_encodings]
-        
-        matches = face_recognition.compare_faces(known_encs, face_enc, tolerance=tolerance)
-        return [i for i, match in enumerate(matches) if match]
+        """Match a face encoding against known encodings.
+
+        Same rule as ``face_recognition.compare_faces`` (euclidean distance
+        within ``tolerance``), evaluated in one vectorized pass.
+        """
+        if not known_encodings:
+            return []
+        face_enc = np.asarray(face_encoding, dtype=np.float64)
+        known_encs = np.asarray(known_encodings, dtype=np.float64)
+        distances = np.linalg.norm(known_encs - face_enc, axis=1)
+        return np.flatnonzero(distances <= tolerance).tolist()
+
+    def match_tenant_faces(
+        self,
+        db,
+        tenant_id,
+        face_encoding: list[float],
+        tolerance: float = 0.6,
+        limit: int = 10,
+    ):
+        """Match a face encoding against a tenant's person-assigned faces.
+
+        Uses the per-tenant nearest-neighbour index (see ``zoltag.face_index``)
+        instead of a linear compare; returns ``FaceMatch`` rows, nearest first.
+        """
+        from zoltag.face_index import find_face_matches
+
+        return find_face_matches(db, tenant_id, face_encoding, tolerance=tolerance, limit=limit)
@@ -0,0 +1,54 @@
+"""Per-tenant snapshot cache for ``/images/stats``.
+
+The stats endpoint aggregates over image_metadata, permatags and machine_tags
+and the UI polls it on every page view. Snapshots are reused for
+``image_stats_cache_ttl_seconds`` and dropped as soon as a committed session
+touched the tenant's images, ratings, tags, keywords or lists. Writes made by
+other processes (CLI ingestion/tagging jobs) are bounded by the TTL.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from zoltag.metadata import ImageMetadata, MachineTag, Permatag
+from zoltag.models.config import Keyword, KeywordCategory, PhotoList
+from zoltag.tenant_cache import TenantCache
+
+
+_image_stats_cache = TenantCache(
+    "image_stats",
+    models=(ImageMetadata, Permatag, MachineTag, Keyword, KeywordCategory, PhotoList),
+    ttl_setting="image_stats_cache_ttl_seconds",
+)
+
+
+def image_stats_generation(tenant_id: str) -> tuple[int, int]:
+    """Return the invalidation stamp to pass to ``store_image_stats``."""
+    return _image_stats_cache.generation(tenant_id)
+
+
+def get_cached_image_stats(tenant_id: str, include_ratings: bool) -> Optional[dict]:
+    """Return a live snapshot, reusing a with-ratings snapshot for plain requests."""
+    for candidate in ((True,) if include_ratings else (False, True)):
+        stats = _image_stats_cache.get(tenant_id, key=candidate)
+        if stats is not None:
+            if candidate and not include_ratings:
+                stats = {**stats, "rating_by_category": {}}
+            return stats
+    return None
+
+
+def store_image_stats(
+    tenant_id: str,
+    include_ratings: bool,
+    stats: dict,
+    generation: tuple[int, int],
+) -> None:
+    """Cache a computed snapshot unless the tenant was invalidated meanwhile."""
+    _image_stats_cache.store(tenant_id, stats, generation, key=bool(include_ratings))
+
+
+def invalidate_image_stats_cache(tenant_id: Optional[str] = None) -> None:
+    """Drop cached stats for one tenant, or for all tenants when omitted."""
+    _image_stats_cache.invalidate(tenant_id)
@@ -0,0 +1,132 @@
+"""Postgres LISTEN/NOTIFY wakeups for queue workers."""
+
+from __future__ import annotations
+
+import logging
+import select
+import time
+from threading import Event
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from zoltag.settings import settings
+
+
+logger = logging.getLogger(__name__)
+
+JOB_WAKEUP_CHANNEL = "zoltag_job_wakeup"
+
+_RECONNECT_BACKOFF_SECONDS = 30.0
+_MAX_SELECT_SLICE_SECONDS = 1.0
+
+
+def _is_postgres(bind: Any) -> bool:
+    return bool(bind is not None and getattr(getattr(bind, "dialect", None), "name", "") == "postgresql")
+
+
+def publish_job_wakeup(db: Session, *, reason: str = "") -> None:
+    """Notify listening workers that a job became runnable.
+
+    pg_notify is transactional: the signal is delivered when the caller's
+    transaction commits and dropped if it rolls back. No-op off Postgres.
+    """
+    if not _is_postgres(db.get_bind()):
+        return
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": JOB_WAKEUP_CHANNEL, "payload": str(reason or "")[:200]},
+    )
+
+
+class JobWakeupListener:
+    """Dedicated LISTEN connection used by a worker to sleep until jobs arrive.
+
+    The connection is opened outside the SQLAlchemy pool because it stays in
+    autocommit LISTEN mode for the lifetime of the worker. When Postgres is not
+    available the listener stays inactive and ``wait`` degrades to a plain sleep.
+    """
+
+    def __init__(self, engine: Any, *, channel: str = JOB_WAKEUP_CHANNEL):
+        self._engine = engine
+        self._channel = channel
+        self._connection: Any = None
+        self._last_connect_attempt_at = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._connection is not None
+
+    def start(self) -> bool:
+        """Open the LISTEN connection; returns False when unsupported or unavailable."""
+        self._last_connect_attempt_at = time.monotonic()
+        if not _is_postgres(self._engine):
+            return False
+        try:
+            dialect = self._engine.dialect
+            cargs, cparams = dialect.create_connect_args(self._engine.url)
+            cparams.setdefault("connect_timeout", settings.db_connect_timeout)
+            connection = dialect.connect(*cargs, **cparams)
+            connection.autocommit = True
+            cursor = connection.cursor()
+            cursor.execute(f'LISTEN "{self._channel}"')
+            cursor.close()
+        except Exception:
+            logger.warning("Job wakeup listener unavailable; falling back to polling", exc_info=True)
+            return False
+        self._connection = connection
+        logger.info("Listening for job wakeups on channel %s", self._channel)
+        return True
+
+    def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def wait(self, timeout: float, stop_event: Optional[Event] = None) -> bool:
+        """Block until a wakeup arrives, the timeout elapses, or stop is requested.
+
+        Returns True only when woken by a notification.
+        """
+        timeout = max(0.0, float(timeout or 0.0))
+        if self._connection is None:
+            if time.monotonic() - self._last_connect_attempt_at >= _RECONNECT_BACKOFF_SECONDS:
+                self.start()
+            if self._connection is None:
+                _sleep(timeout, stop_event)
+                return False
+
+        deadline = time.monotonic() + timeout
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                readable, _, _ = select.select(
+                    [self._connection], [], [], min(remaining, _MAX_SELECT_SLICE_SECONDS)
+                )
+                if not readable:
+                    continue
+                self._connection.poll()
+                if self._connection.notifies:
+                    del self._connection.notifies[:]
+                    return True
+            except Exception:
+                logger.warning("Job wakeup listener failed; reverting to polling", exc_info=True)
+                self.close()
+                _sleep(max(0.0, deadline - time.monotonic()), stop_event)
+                return False
+
+
+def _sleep(seconds: float, stop_event: Optional[Event]) -> None:
+    if stop_event is not None:
+        stop_event.wait(seconds)
+    elif seconds > 0:
+        time.sleep(seconds)
@@ -0,0 +1,576 @@
+"""Materialized per-tenant keyword facet counts.
+
+The keyword sidebar (``/keywords``) and ``/tag-stats`` count distinct assets
+per keyword across the whole tenant, which means UNION ALL + COUNT DISTINCT
+scans over machine_tags and permatags on every call. Those counts are kept in
+``keyword_facet_counts`` instead:
+
+- Permatag/MachineTag writes are collected from session flushes (and bulk
+  ``Query.delete()``/``update()`` calls). When the writing transaction
+  commits, the touched keywords are added to the tenant's queued
+  ``reconcile-keyword-facets`` job (one per tenant, merged across commits),
+  and the queue worker recounts them off the request path.
+- Writes touching more keywords than ``keyword_facet_incremental_limit``
+  (tagging jobs) mark the tenant stale and queue a full rebuild; readers fall
+  back to live queries until it runs.
+
+The Session hooks are installed by ``install_session_hooks`` (see
+``zoltag.database.init_session_hooks``).
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from itertools import chain
+from typing import Iterable, Optional
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy import distinct, event, func, inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, aliased
+
+from zoltag.job_notify import publish_job_wakeup
+from zoltag.metadata import (
+    DEFAULT_JOB_QUEUE,
+    ImageMetadata,
+    Job,
+    JobDefinition,
+    KeywordFacetCount,
+    KeywordFacetState,
+    KeywordModel,
+    MachineTag,
+    Permatag,
+    Tenant as TenantModel,
+)
+from zoltag.settings import settings
+from zoltag.tenant_scope import parse_tenant_id, tenant_column_filter_for_values
+
+
+logger = logging.getLogger(__name__)
+
+# /keywords facet sources (restricted to assets that have image rows).
+SOURCE_CURRENT = "keywords:current"
+SOURCE_PERMATAGS = "keywords:permatags"
+# /tag-stats sources.
+SOURCE_ZERO_SHOT = "tag_stats:zero_shot"
+SOURCE_KEYWORD_MODEL = "tag_stats:keyword_model"
+SOURCE_STATS_PERMATAGS = "tag_stats:permatags"
+
+ALL_SOURCES = (
+    SOURCE_CURRENT,
+    SOURCE_PERMATAGS,
+    SOURCE_ZERO_SHOT,
+    SOURCE_KEYWORD_MODEL,
+    SOURCE_STATS_PERMATAGS,
+)
+
+DEFAULT_ACTIVE_TAG_TYPE = "siglip"
+
+RECONCILE_JOB_KEY = "reconcile-keyword-facets"
+
+# Execution option for bulk tag writes whose caller reports the keywords it
+# actually changed through ``record_keyword_facet_changes``.
+CHANGES_RECORDED_OPTION = "keyword_facet_changes_recorded"
+
+_TRACKED_MODELS = (Permatag, MachineTag)
+_PENDING_CHANGES_KEY = "keyword_facet_changes"
+
+
+def _now_utc_naive() -> datetime:
+    return datetime.utcnow()
+
+
+def latest_keyword_model_name(db: Session, tenant_id: UUID | str) -> Optional[str]:
+    """Return the most recently trained keyword model name for a tenant."""
+    row = db.query(KeywordModel.model_name).filter(
+        tenant_column_filter_for_values(KeywordModel, str(tenant_id))
+    ).order_by(
+        func.coalesce(KeywordModel.updated_at, KeywordModel.created_at).desc()
+    ).first()
+    return row.model_name if row else None
+
+
+def _active_tag_type(db: Session, tenant_id: UUID) -> str:
+    tenant_settings = db.query(TenantModel.settings).filter(TenantModel.id == tenant_id).scalar()
+    return (tenant_settings or {}).get("active_machine_tag_type", DEFAULT_ACTIVE_TAG_TYPE)
+
+
+def _compute_counts(
+    db: Session,
+    tenant_id: UUID,
+    *,
+    active_tag_type: str,
+    keyword_model_name: Optional[str],
+    keyword_ids: Optional[Iterable[int]] = None,
+) -> dict[str, dict[int, int]]:
+    """Count distinct assets per keyword for every facet source.
+
+    Mirrors the live queries in ``routers.keywords``; ``keyword_ids`` limits the
+    scan to the keywords touched by a write.
+    """
+    tenant_ref = str(tenant_id)
+    keyword_filter = sorted(set(keyword_ids)) if keyword_ids is not None else None
+
+    def scoped(query, column):
+        if keyword_filter is not None:
+            query = query.filter(column.in_(keyword_filter))
+        return query
+
+    image_assets_subq = db.query(ImageMetadata.asset_id).filter(
+        tenant_column_filter_for_values(ImageMetadata, tenant_ref),
+        ImageMetadata.asset_id.is_not(None),
+    ).subquery()
+
+    counts: dict[str, dict[int, int]] = {source: {} for source in ALL_SOURCES}
+
+    permatag_rows = scoped(
+        db.query(
+            Permatag.keyword_id,
+            func.count(distinct(Permatag.asset_id)),
+        ).join(
+            image_assets_subq, image_assets_subq.c.asset_id == Permatag.asset_id
+        ).filter(
+            tenant_column_filter_for_values(Permatag, tenant_ref),
+            Permatag.signum == 1,
+        ),
+        Permatag.keyword_id,
+    ).group_by(Permatag.keyword_id)
+    counts[SOURCE_PERMATAGS] = {keyword_id: int(count or 0) for keyword_id, count in permatag_rows}
+
+    rejected = aliased(Permatag)
+    machine_base = scoped(
+        db.query(
+            MachineTag.keyword_id.label("keyword_id"),
+            MachineTag.asset_id.label("asset_id"),
+        ).join(
+            image_assets_subq, image_assets_subq.c.asset_id == MachineTag.asset_id
+        ).outerjoin(
+            rejected,
+            (rejected.asset_id == MachineTag.asset_id)
+            & (rejected.keyword_id == MachineTag.keyword_id)
+            & (rejected.signum == -1),
+        ).filter(
+            tenant_column_filter_for_values(MachineTag, tenant_ref),
+            MachineTag.tag_type == active_tag_type,
+            MachineTag.asset_id.is_not(None),
+            rejected.id.is_(None),
+        ),
+        MachineTag.keyword_id,
+    )
+    permatag_base = scoped(
+        db.query(
+            Permatag.keyword_id.label("keyword_id"),
+            Permatag.asset_id.label("asset_id"),
+        ).join(
+            image_assets_subq, image_assets_subq.c.asset_id == Permatag.asset_id
+        ).filter(
+            tenant_column_filter_for_values(Permatag, tenant_ref),
+            Permatag.asset_id.is_not(None),
+            Permatag.signum == 1,
+        ),
+        Permatag.keyword_id,
+    )
+    union_tags = machine_base.union_all(permatag_base).subquery()
+    current_rows = db.query(
+        union_tags.c.keyword_id,
+        func.count(distinct(union_tags.c.asset_id)),
+    ).group_by(union_tags.c.keyword_id)
+    counts[SOURCE_CURRENT] = {keyword_id: int(count or 0) for keyword_id, count in current_rows}
+
+    zero_shot_rows = scoped(
+        db.query(
+            MachineTag.keyword_id,
+            func.count(distinct(MachineTag.asset_id)),
+        ).filter(
+            tenant_column_filter_for_values(MachineTag, tenant_ref),
+            MachineTag.tag_type == "siglip",
+            MachineTag.asset_id.is_not(None),
+        ),
+        MachineTag.keyword_id,
+    ).group_by(MachineTag.keyword_id)
+    counts[SOURCE_ZERO_SHOT] = {keyword_id: int(count or 0) for keyword_id, count in zero_shot_rows}
+
+    if keyword_model_name:
+        keyword_model_rows = scoped(
+            db.query(
+                MachineTag.keyword_id,
+                func.count(distinct(MachineTag.asset_id)),
+            ).filter(
+                tenant_column_filter_for_values(MachineTag, tenant_ref),
+                MachineTag.tag_type == "trained",
+                MachineTag.model_name == keyword_model_name,
+                MachineTag.asset_id.is_not(None),
+            ),
+            MachineTag.keyword_id,
+        ).group_by(MachineTag.keyword_id)
+        counts[SOURCE_KEYWORD_MODEL] = {
+            keyword_id: int(count or 0) for keyword_id, count in keyword_model_rows
+        }
+
+    stats_permatag_rows = scoped(
+        db.query(
+            Permatag.keyword_id,
+            func.count(distinct(Permatag.asset_id)),
+        ).filter(
+            tenant_column_filter_for_values(Permatag, tenant_ref),
+            Permatag.asset_id.is_not(None),
+            Permatag.signum == 1,
+        ),
+        Permatag.keyword_id,
+    ).group_by(Permatag.keyword_id)
+    counts[SOURCE_STATS_PERMATAGS] = {
+        keyword_id: int(count or 0) for keyword_id, count in stats_permatag_rows
+    }
+
+    return counts
+
+
+def _get_state(db: Session, tenant_id: UUID) -> Optional[KeywordFacetState]:
+    return db.query(KeywordFacetState).filter(KeywordFacetState.tenant_id == tenant_id).first()
+
+
+def rebuild_keyword_facets(db: Session, tenant_id: UUID | str) -> int:
+    """Recount every keyword facet for a tenant and clear its stale flag.
+
+    Returns the number of non-zero count rows written. The caller commits.
+    """
+    parsed_tenant_id = parse_tenant_id(tenant_id)
+    if parsed_tenant_id is None:
+        raise ValueError(f"Invalid tenant id: {tenant_id}")
+
+    active_tag_type = _active_tag_type(db, parsed_tenant_id)
+    keyword_model_name = latest_keyword_model_name(db, parsed_tenant_id)
+    counts = _compute_counts(
+        db,
+        parsed_tenant_id,
+        active_tag_type=active_tag_type,
+        keyword_model_name=keyword_model_name,
+    )
+
+    now = _now_utc_naive()
+    db.query(KeywordFacetCount).filter(
+        KeywordFacetCount.tenant_id == parsed_tenant_id
+    ).delete(synchronize_session=False)
+    rows = [
+        {
+            "tenant_id": parsed_tenant_id,
+            "source": source,
+            "keyword_id": keyword_id,
+            "asset_count": count,
+            "updated_at": now,
+        }
+        for source, by_keyword in counts.items()
+        for keyword_id, count in by_keyword.items()
+        if count > 0
+    ]
+    if rows:
+        db.execute(sa.insert(KeywordFacetCount), rows)
+
+    state = _get_state(db, parsed_tenant_id)
+    if state is None:
+        state = KeywordFacetState(tenant_id=parsed_tenant_id)
+        db.add(state)
+    state.active_tag_type = active_tag_type
+    state.keyword_model_name = keyword_model_name
+    state.is_stale = False
+    state.refreshed_at = now
+    state.updated_at = now
+    db.flush()
+    return len(rows)
+
+
+def refresh_keyword_facets(db: Session, tenant_id: UUID | str, keyword_ids: Iterable[int]) -> bool:
+    """Recount the given keywords for a tenant with fresh materialized counts.
+
+    No-op (returns False) when the tenant has never been built or is stale;
+    the next rebuild covers those keywords anyway. The caller commits.
+    """
+    parsed_tenant_id = parse_tenant_id(tenant_id)
+    keyword_ids = sorted({int(keyword_id) for keyword_id in keyword_ids if keyword_id is not None})
+    if parsed_tenant_id is None or not keyword_ids:
+        return False
+
+    state = _get_state(db, parsed_tenant_id)
+    if state is None or state.is_stale:
+        return False
+
+    counts = _compute_counts(
+        db,
+        parsed_tenant_id,
+        active_tag_type=state.active_tag_type,
+        keyword_model_name=state.keyword_model_name,
+        keyword_ids=keyword_ids,
+    )
+    now = _now_utc_naive()
+    rows = [
+        {
+            "tenant_id": parsed_tenant_id,
+            "source": source,
+            "keyword_id": keyword_id,
+            "asset_count": counts[source].get(keyword_id, 0),
+            "updated_at": now,
+        }
+        for source in ALL_SOURCES
+        for keyword_id in keyword_ids
+    ]
+
+    bind = db.get_bind()
+    if bind is not None and bind.dialect.name == "postgresql":
+        # Upsert (zero counts included) so concurrent refreshes of the same
+        # keyword cannot collide on the primary key.
+        stmt = pg_insert(KeywordFacetCount).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                KeywordFacetCount.tenant_id,
+                KeywordFacetCount.source,
+                KeywordFacetCount.keyword_id,
+            ],
+            set_={
+                "asset_count": stmt.excluded.asset_count,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        db.execute(stmt)
+    else:
+        db.query(KeywordFacetCount).filter(
+            KeywordFacetCount.tenant_id == parsed_tenant_id,
+            KeywordFacetCount.keyword_id.in_(keyword_ids),
+        ).delete(synchronize_session=False)
+        nonzero_rows = [row for row in rows if row["asset_count"] > 0]
+        if nonzero_rows:
+            db.execute(sa.insert(KeywordFacetCount), nonzero_rows)
+
+    state.updated_at = now
+    db.flush()
+    return True
+
+
+def mark_keyword_facets_stale(db: Session, tenant_id: UUID | str) -> None:
+    """Flag a tenant's counts as unusable until the next rebuild. The caller commits."""
+    parsed_tenant_id = parse_tenant_id(tenant_id)
+    if parsed_tenant_id is None:
+        return
+    db.query(KeywordFacetState).filter(
+        KeywordFacetState.tenant_id == parsed_tenant_id
+    ).update(
+        {KeywordFacetState.is_stale: True, KeywordFacetState.updated_at: _now_utc_naive()},
+        synchronize_session=False,
+    )
+
+
+def enqueue_keyword_facet_refresh(
+    db: Session,
+    tenant_id: UUID | str,
+    keyword_ids: Optional[Iterable[int]] = None,
+) -> None:
+    """Queue a recount of ``keyword_ids`` (a full rebuild when None). The caller commits.
+
+    Changes merge into the tenant's already-queued event job, so a burst of
+    commits costs one recount. Once the merged keywords exceed
+    ``keyword_facet_incremental_limit`` the tenant is marked stale and the job
+    becomes a full rebuild. Without an active job definition the tenant is only
+    marked stale, which sends readers to live queries.
+    """
+    parsed_tenant_id = parse_tenant_id(tenant_id)
+    if parsed_tenant_id is None:
+        return
+    limit = max(0, int(settings.keyword_facet_incremental_limit))
+    requested = None if keyword_ids is None else {int(keyword_id) for keyword_id in keyword_ids}
+    if requested is not None and len(requested) > limit:
+        requested = None
+
+    definition = db.query(JobDefinition).filter(
+        JobDefinition.key == RECONCILE_JOB_KEY,
+        JobDefinition.is_active.is_(True),
+    ).first()
+    if definition is None:
+        logger.warning("Job definition %s is missing; marking keyword facets stale", RECONCILE_JOB_KEY)
+        mark_keyword_facets_stale(db, parsed_tenant_id)
+        return
+
+    queued = db.query(Job).filter(
+        Job.tenant_id == parsed_tenant_id,
+        Job.definition_id == definition.id,
+        Job.source == "event",
+        Job.status == "queued",
+    ).order_by(Job.queued_at.asc()).with_for_update().first()
+    if queued is not None:
+        queued_ids = (queued.payload or {}).get("keyword_ids")
+        if not queued_ids:
+            # Already a full rebuild.
+            return
+        if requested is not None:
+            requested |= {int(keyword_id) for keyword_id in queued_ids}
+            if len(requested) > limit:
+                requested = None
+
+    if requested is None:
+        mark_keyword_facets_stale(db, parsed_tenant_id)
+    payload = {"keyword_ids": sorted(requested)} if requested else {}
+    if queued is not None:
+        queued.payload = payload
+        return
+
+    now = _now_utc_naive()
+    db.add(Job(
+        tenant_id=parsed_tenant_id,
+        definition_id=definition.id,
+        source="event",
+        status="queued",
+        queue=str(definition.queue or DEFAULT_JOB_QUEUE),
+        priority=100,
+        payload=payload,
+        scheduled_for=now,
+        queued_at=now,
+        max_attempts=int(definition.max_attempts or 3),
+    ))
+    db.flush()
+    publish_job_wakeup(db, reason=str(parsed_tenant_id))
+
+
+def keyword_facets_state(db: Session, tenant_id: UUID | str) -> Optional[KeywordFacetState]:
+    """Return the tenant's facet state when its counts can be served, else None."""
+    parsed_tenant_id = parse_tenant_id(tenant_id)
+    if not settings.keyword_facets_enabled or parsed_tenant_id is None:
+        return None
+    state = _get_state(db, parsed_tenant_id)
+    if state is None or state.is_stale:
+        return None
+    return state
+
+
+def load_keyword_facet_counts(
+    db: Session,
+    tenant_id: UUID | str,
+    sources: Iterable[str],
+    *,
+    active_tag_type: Optional[str] = None,
+    keyword_model_name: Optional[str] = None,
+    keyword_ids: Optional[Iterable[int]] = None,
+) -> Optional[dict[str, dict[int, int]]]:
+    """Read materialized counts as ``{source: {keyword_id: count}}``.
+
+    Returns None when the caller should compute live counts instead: disabled,
+    never built, stale, or built for a different active tag type / keyword model.
+    ``keyword_ids`` restricts the read to those keywords.
+    """
+    sources = tuple(sources)
+    parsed_tenant_id = parse_tenant_id(tenant_id)
+    if parsed_tenant_id is None:
+        return None
+
+    state = keyword_facets_state(db, parsed_tenant_id)
+    if state is None:
+        return None
+    if SOURCE_CURRENT in sources and state.active_tag_type != active_tag_type:
+        return None
+    if SOURCE_KEYWORD_MODEL in sources and (state.keyword_model_name or None) != (keyword_model_name or None):
+        return None
+
+    counts: dict[str, dict[int, int]] = {source: {} for source in sources}
+    rows = db.query(
+        KeywordFacetCount.source,
+        KeywordFacetCount.keyword_id,
+        KeywordFacetCount.asset_count,
+    ).filter(
+        KeywordFacetCount.tenant_id == parsed_tenant_id,
+        KeywordFacetCount.source.in_(sources),
+        KeywordFacetCount.asset_count > 0,
+    )
+    if keyword_ids is not None:
+        rows = rows.filter(KeywordFacetCount.keyword_id.in_(list(keyword_ids)))
+    for source, keyword_id, asset_count in rows:
+        counts[source][keyword_id] = int(asset_count)
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Session hooks: collect touched (tenant, keyword) pairs and queue a recount
+# ---------------------------------------------------------------------------
+
+def _record_change(session: Session, tenant_id, keyword_id) -> None:
+    parsed_tenant_id = parse_tenant_id(tenant_id)
+    if parsed_tenant_id is None or keyword_id is None:
+        return
+    pending = session.info.setdefault(_PENDING_CHANGES_KEY, {})
+    pending.setdefault(parsed_tenant_id, set()).add(int(keyword_id))
+
+
+def record_keyword_facet_changes(session: Session, tenant_id: UUID | str, keyword_ids: Iterable[int]) -> None:
+    """Queue a recount of ``keyword_ids`` when ``session`` commits.
+
+    For bulk writes executed with ``CHANGES_RECORDED_OPTION``, so that only the
+    rows a statement really changed (e.g. from RETURNING) are recounted.
+    """
+    for keyword_id in keyword_ids:
+        _record_change(session, tenant_id, keyword_id)
+
+
+def _collect_flushed_tag_changes(session: Session, flush_context) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, _TRACKED_MODELS):
+            continue
+        _record_change(session, obj.tenant_id, obj.keyword_id)
+        # A reassigned keyword changes the count of the old keyword too.
+        for previous_keyword_id in inspect(obj).attrs.keyword_id.history.deleted or ():
+            _record_change(session, obj.tenant_id, previous_keyword_id)
+
+
+def _collect_bulk_tag_changes(orm_execute_state) -> None:
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    model = getattr(mapper, "class_", None)
+    if model not in _TRACKED_MODELS:
+        return
+    if orm_execute_state.execution_options.get(CHANGES_RECORDED_OPTION):
+        return
+    if orm_execute_state.is_insert:
+        # Bulk/upsert inserts carry their rows as execute parameters.
+        params = orm_execute_state.parameters
+        rows = [params] if isinstance(params, dict) else (params or [])
+        for row in rows:
+            _record_change(orm_execute_state.session, row.get("tenant_id"), row.get("keyword_id"))
+        return
+    # Bulk DML bypasses flush events; look up affected keywords up front.
+    query = sa.select(model.tenant_id, model.keyword_id).distinct()
+    whereclause = orm_execute_state.statement.whereclause
+    if whereclause is not None:
+        query = query.where(whereclause)
+    session = orm_execute_state.session
+    for tenant_id, keyword_id in session.execute(query):
+        _record_change(session, tenant_id, keyword_id)
+
+
+def _discard_tag_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES_KEY, None)
+
+
+def _enqueue_refresh_before_commit(session: Session) -> None:
+    # Flush first so tag writes still pending in the session are collected too.
+    if any(isinstance(obj, _TRACKED_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.flush()
+    changes = session.info.pop(_PENDING_CHANGES_KEY, None)
+    if not changes or not settings.keyword_facets_enabled:
+        return
+    # Queued in the writing transaction: the recount request commits or rolls
+    # back with the tag writes themselves.
+    for tenant_id, keyword_ids in changes.items():
+        enqueue_keyword_facet_refresh(session, tenant_id, keyword_ids)
+
+
+_HOOKS = (
+    ("after_flush", _collect_flushed_tag_changes),
+    ("do_orm_execute", _collect_bulk_tag_changes),
+    ("after_rollback", _discard_tag_changes),
+    ("before_commit", _enqueue_refresh_before_commit),
+)
+
+
+def install_session_hooks() -> None:
+    """Register the tag-change listeners on ``Session`` (idempotent)."""
+    for identifier, fn in _HOOKS:
+        if not event.contains(Session, identifier, fn):
+            event.listen(Session, identifier, fn)
@@ -160,6 +160,122 @@ def score_image_with_models(
     return scores
 
 
+def score_embeddings_with_models(
+    embeddings: List[List[float]],
+    keyword_models: Dict[str, KeywordModel],
+) -> List[Dict[str, float]]:
+    """Vectorized ``score_image_with_models`` for a batch of embeddings."""
+    if not keyword_models or not embeddings:
+        return [{} for _ in embeddings]
+
+    keywords = list(keyword_models.keys())
+    models = [keyword_models[keyword] for keyword in keywords]
+    try:
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        positives = np.asarray([model.positive_centroid for model in models], dtype=np.float32)
+        if matrix.ndim != 2 or positives.ndim != 2 or matrix.shape[1] != positives.shape[1]:
+            raise ValueError("embedding dimensions do not match")
+    except ValueError:
+        # Mixed embedding sizes (e.g. rows from an older model): score one by one.
+        return [score_image_with_models(embedding, keyword_models) for embedding in embeddings]
+
+    has_negative = np.array([bool(model.negative_centroid) for model in models])
+    negatives = np.zeros_like(positives)
+    for index, model in enumerate(models):
+        if model.negative_centroid:
+            negatives[index] = np.asarray(model.negative_centroid, dtype=np.float32)
+
+    pos_sim = _cosine_similarity_matrix(matrix, positives)
+    neg_sim = _cosine_similarity_matrix(matrix, negatives)
+    scores = np.where(has_negative[np.newaxis, :], (pos_sim - neg_sim + 1.0) / 2.0, (pos_sim + 1.0) / 2.0)
+    scores = np.clip(scores, 0.0, 1.0)
+
+    return [
+        {keyword: float(row[index]) for index, keyword in enumerate(keywords)}
+        for row in scores
+    ]
+
+
+def _trained_tags_from_scores(
+    model_scores: Dict[str, float],
+    keyword_to_category: Dict[str, str],
+    threshold: float,
+) -> List[dict]:
+    trained_tags = [
+        {
+            "keyword": keyword,
+            "category": keyword_to_category.get(keyword),
+            "confidence": round(score, 2)
+        }
+        for keyword, score in model_scores.items()
+        if score >= threshold
+    ]
+    trained_tags.sort(key=lambda x: x["confidence"], reverse=True)
+    return trained_tags
+
+
+def recompute_trained_tags_for_embeddings(
+    db: Session,
+    tenant_id: str,
+    embeddings_by_asset: Dict[object, List[float]],
+    keyword_models: Dict[str, KeywordModel],
+    keyword_to_category: Dict[str, str],
+    model_name: str,
+    model_version: str,
+    threshold: float,
+) -> Dict[object, List[dict]]:
+    """Score stored embeddings in one batch and replace their trained tags.
+
+    Batch counterpart of ``recompute_trained_tags_for_image`` keyed by asset id:
+    one scoring pass, one delete and one keyword lookup for all assets.
+    """
+    if not keyword_models or not embeddings_by_asset:
+        return {}
+
+    asset_ids = list(embeddings_by_asset.keys())
+    batch_scores = score_embeddings_with_models(
+        [embeddings_by_asset[asset_id] for asset_id in asset_ids],
+        keyword_models,
+    )
+    tags_by_asset = {
+        asset_id: _trained_tags_from_scores(model_scores, keyword_to_category, threshold)
+        for asset_id, model_scores in zip(asset_ids, batch_scores, strict=True)
+    }
+
+    db.query(MachineTag).filter(
+        tenant_column_filter_for_values(MachineTag, tenant_id),
+        MachineTag.asset_id.in_(asset_ids),
+        MachineTag.tag_type == 'trained',
+        MachineTag.model_name == model_name
+    ).delete(synchronize_session=False)
+
+    tag_names = sorted({tag["keyword"] for tags in tags_by_asset.values() for tag in tags})
+    keyword_id_map = dict(
+        db.query(Keyword.keyword, Keyword.id).filter(
+            tenant_column_filter_for_values(Keyword, tenant_id),
+            Keyword.keyword.in_(tag_names)
+        ).all()
+    ) if tag_names else {}
+
+    for asset_id, trained_tags in tags_by_asset.items():
+        for tag in trained_tags:
+            keyword_id = keyword_id_map.get(tag["keyword"])
+            if not keyword_id:
+                print(f"Warning: Keyword '{tag['keyword']}' not found for tenant {tenant_id}")
+                continue
+            db.add(MachineTag(
+                tenant_id=tenant_id,
+                asset_id=asset_id,
+                keyword_id=keyword_id,
+                confidence=tag["confidence"],
+                tag_type='trained',
+                model_name=model_name,
+                model_version=model_version
+            ))
+
+    return tags_by_asset
+
+
 def recompute_trained_tags_for_image(
     db: Session,
     tenant_id: str,
@@ -194,17 +310,7 @@ def recompute_trained_tags_for_image(
         )
         embedding = embedding_record.embedding
     model_scores = score_image_with_models(embedding, keyword_models)
-
-    trained_tags = [
-        {
-            "keyword": keyword,
-            "category": keyword_to_category.get(keyword),
-            "confidence": round(score, 2)
-        }
-        for keyword, score in model_scores.items()
-        if score >= threshold
-    ]
-    trained_tags.sort(key=lambda x: x["confidence"], reverse=True)
+    trained_tags = _trained_tags_from_scores(model_scores, keyword_to_category, threshold)
 
     db.query(MachineTag).filter(
         tenant_column_filter_for_values(MachineTag, tenant_id),
@@ -372,6 +478,13 @@ def _fetch_embeddings(
     return [row.embedding for row in rows]
 
 
+def _cosine_similarity_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Row-wise cosine similarity (N, D) x (K, D) -> (N, K); zero vectors score 0."""
+    denom = np.outer(np.linalg.norm(a, axis=1), np.linalg.norm(b, axis=1))
+    dots = a @ b.T
+    return np.divide(dots, denom, out=np.zeros_like(dots), where=denom != 0)
+
+
 def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
     if a.size == 0 or b.size == 0:
         return 0.0
@@ -1,13 +1,14 @@
 """Metadata storage and management."""
 
 from datetime import datetime
+import re
 import uuid
 from typing import Optional
 
-from sqlalchemy import Column, String, Integer, BigInteger, Float, DateTime, Boolean, Text, ForeignKey, Index, UniqueConstraint, CheckConstraint
+from sqlalchemy import Column, String, Integer, BigInteger, Float, DateTime, Boolean, Text, ForeignKey, Index, UniqueConstraint, CheckConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY, UUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.types import JSON
 
@@ -20,6 +21,11 @@ def compile_array_for_sqlite(element, compiler, **kw):
     return compiler.visit_JSON(element, **kw)
 
 
+def _array(item_type):
+    """ARRAY on PostgreSQL; JSON on SQLite so the test database round-trips lists."""
+    return ARRAY(item_type).with_variant(JSON(), "sqlite")
+
+
 Base = declarative_base()
 
 
@@ -130,7 +136,7 @@ class ImageMetadata(Base):
     
     # Visual features
     perceptual_hash = Column(String(64), index=True)  # For deduplication
-    color_histogram = Column(ARRAY(Float))
+    color_histogram = Column(_array(Float))
     
     # EXIF data
     exif_data = Column(JSONB)  # Stored as JSON for flexibility
@@ -167,6 +173,12 @@ class ImageMetadata(Base):
         Index("idx_tenant_capture", "tenant_id", "capture_timestamp"),
         Index("idx_tenant_location", "tenant_id", "gps_latitude", "gps_longitude"),
         Index("idx_image_metadata_tenant_rating", "tenant_id", "rating"),
+        Index(
+            "idx_image_metadata_tenant_faces_pending",
+            "tenant_id",
+            "id",
+            postgresql_where=text("faces_detected IS NOT TRUE"),
+        ),
         Index("uq_image_metadata_asset_id", "asset_id", unique=True),
     )
 
@@ -221,7 +233,7 @@ class DetectedFace(Base):
     bbox_left = Column(Integer)
 
     # Face encoding (for matching)
-    face_encoding = Column(ARRAY(Float))
+    face_encoding = Column(_array(Float))
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -232,6 +244,7 @@ class DetectedFace(Base):
     __table_args__ = (
         Index("idx_detected_faces_person_id", "person_id"),
         Index("idx_tenant_person", "tenant_id", "person_name"),
+        Index("idx_detected_faces_tenant_person_id", "tenant_id", "person_id"),
     )
 
 
@@ -254,7 +267,7 @@ class ImageEmbedding(Base):
     asset_id = Column(UUID(as_uuid=True), ForeignKey("assets.id", ondelete="SET NULL"), nullable=False)
     tenant_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     
-    embedding = Column(ARRAY(Float), nullable=False)  # Vector embedding
+    embedding = Column(_array(Float), nullable=False)  # Vector embedding
     model_name = Column(String(100))  # e.g., "clip-vit-base"
     model_version = Column(String(50))
     
@@ -279,8 +292,8 @@ class KeywordModel(Base):
     model_name = Column(String(100), nullable=False)
     model_version = Column(String(50))
 
-    positive_centroid = Column(ARRAY(Float), nullable=False)
-    negative_centroid = Column(ARRAY(Float), nullable=True)
+    positive_centroid = Column(_array(Float), nullable=False)
+    negative_centroid = Column(_array(Float), nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -366,6 +379,17 @@ class MachineTag(Base):
     )
 
 
+_SOURCE_KEY_LEAF = re.compile(r"/[^/]+$")
+
+
+def source_folder_for_key(source_key: Optional[str]) -> Optional[str]:
+    """Return the parent folder of a provider source key ("/" for root-level files)."""
+    if source_key is None:
+        return None
+    # Mirrors COALESCE(NULLIF(regexp_replace(source_key, '/[^/]+$', ''), ''), '/').
+    return _SOURCE_KEY_LEAF.sub("", source_key, count=1) or "/"
+
+
 class Asset(Base):
     """Canonical asset representing a photo/video and its primary thumbnail."""
 
@@ -378,6 +402,8 @@ class Asset(Base):
     source_provider = Column(String(64), nullable=False)
     source_key = Column(String(1024), nullable=False)
     source_rev = Column(String(255))
+    # Parent folder of source_key, kept in step by the validator below.
+    source_folder = Column(String(1024))
 
     thumbnail_key = Column(String(1024), nullable=False)
 
@@ -394,8 +420,14 @@ class Asset(Base):
     __table_args__ = (
         Index("idx_assets_source_key", "source_provider", "source_key"),
         Index("idx_assets_tenant_media_type", "tenant_id", "media_type"),
+        Index("idx_assets_tenant_provider_folder", "tenant_id", "source_provider", "source_folder"),
     )
 
+    @validates("source_key")
+    def _sync_source_folder(self, key, value):
+        self.source_folder = source_folder_for_key(value)
+        return value
+
 
 class AssetDerivative(Base):
     """Derivative file (crop/resize/export) stored in local/GCP."""
@@ -417,6 +449,9 @@ class AssetDerivative(Base):
     )
 
 
+DEFAULT_JOB_QUEUE = "default"
+
+
 class JobDefinition(Base):
     """Allowlisted CLI command definitions for queue execution."""
 
@@ -428,6 +463,7 @@ class JobDefinition(Base):
     arg_schema = Column(JSONB, nullable=False, default=dict)
     timeout_seconds = Column(Integer, nullable=False, default=3600)
     max_attempts = Column(Integer, nullable=False, default=3)
+    queue = Column(Text, nullable=False, default=DEFAULT_JOB_QUEUE, server_default=DEFAULT_JOB_QUEUE)
     is_active = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -484,6 +520,7 @@ class Job(Base):
     source = Column(Text, nullable=False, default="manual")
     source_ref = Column(Text)
     status = Column(Text, nullable=False, default="queued")
+    queue = Column(Text, nullable=False, default=DEFAULT_JOB_QUEUE, server_default=DEFAULT_JOB_QUEUE)
     priority = Column(Integer, nullable=False, default=100)
     payload = Column(JSONB, nullable=False, default=dict)
     dedupe_key = Column(Text, index=True)
@@ -504,6 +541,19 @@ class Job(Base):
 
     __table_args__ = (
         Index("idx_jobs_tenant_status_time", "tenant_id", "status", "queued_at"),
+        Index(
+            "idx_jobs_queue_claim",
+            "queue",
+            "priority",
+            "scheduled_for",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index(
+            "idx_jobs_running_tenant_queue",
+            "tenant_id",
+            "queue",
+            postgresql_where=text("status = 'running'"),
+        ),
         CheckConstraint("source in ('manual','event','schedule','system')", name="ck_jobs_source"),
         CheckConstraint(
             "status in ('queued','running','succeeded','failed','canceled','dead_letter')",
@@ -541,7 +591,7 @@ class AssetTextIndex(Base):
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True)
     search_text = Column(Text, nullable=False, default="")
     components = Column(JSONB, nullable=False, default=dict)
-    search_embedding = Column(ARRAY(Float), nullable=True)
+    search_embedding = Column(_array(Float), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
@@ -550,6 +600,36 @@ class AssetTextIndex(Base):
     )
 
 
+class KeywordFacetCount(Base):
+    """Materialized distinct-asset count per tenant keyword and facet source."""
+
+    __tablename__ = "keyword_facet_counts"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), primary_key=True)
+    source = Column(String(32), primary_key=True)  # 'current', 'permatags', 'zero_shot', ...
+    # Note: keyword_id FK not declared here (keywords table is in different declarative base)
+    keyword_id = Column(Integer, primary_key=True)
+    asset_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class KeywordFacetState(Base):
+    """Per-tenant bookkeeping for materialized keyword facet counts.
+
+    Records the machine tag type and keyword model the counts were built for,
+    and whether they went stale (bulk writes too wide for incremental refresh).
+    """
+
+    __tablename__ = "keyword_facet_state"
+
+    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), primary_key=True)
+    active_tag_type = Column(String(50), nullable=False)
+    keyword_model_name = Column(String(100), nullable=True)
+    is_stale = Column(Boolean, nullable=False, default=False)
+    refreshed_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
 class ActivityEvent(Base):
     """Application activity event for login/search/audit-style telemetry."""
 
@@ -615,7 +695,7 @@ class JobWorker(Base):
     worker_id = Column(Text, primary_key=True)
     hostname = Column(Text, nullable=False)
     version = Column(Text, nullable=False, default="")
-    queues = Column(ARRAY(Text), nullable=False, default=list)
+    queues = Column(_array(Text), nullable=False, default=list)
     last_seen_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     running_count = Column(Integer, nullable=False, default=0)
     metadata_json = Column("metadata", JSONB, nullable=False, default=dict)
@@ -665,6 +745,8 @@ class WorkflowRun(Base):
     finished_at = Column(DateTime)
     created_by = Column(UUID(as_uuid=True), ForeignKey("user_profiles.supabase_uid", ondelete="SET NULL"))
     last_error = Column(Text)
+    # step_key -> dependent step keys, fixed when the run starts.
+    step_dependents = Column(JSONB)
 
     definition = relationship("WorkflowDefinition")
     step_runs = relationship("WorkflowStepRun", back_populates="workflow_run", cascade="all, delete-orphan")
@@ -697,7 +779,9 @@ class WorkflowStepRun(Base):
     )
     status = Column(Text, nullable=False, default="pending")
     payload = Column(JSONB, nullable=False, default=dict)
-    depends_on = Column(ARRAY(Text), nullable=False, default=list)
+    depends_on = Column(_array(Text), nullable=False, default=list)
+    # Dependencies that have not succeeded yet; the step is ready at zero.
+    unmet_dependency_count = Column(Integer)
     child_job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="SET NULL"), unique=True)
     queued_at = Column(DateTime)
     started_at = Column(DateTime)
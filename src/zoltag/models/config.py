@@ -115,6 +115,7 @@ class PhotoListItem(Base):
 
     __table_args__ = (
         Index("idx_photo_list_items_list_asset", "list_id", "asset_id"),
+        Index("idx_photo_list_items_list_added", "list_id", "added_at", "id"),
     )
     
     def to_dict(self):
@@ -0,0 +1,53 @@
+"""Per-tenant cache of the natural-language search vocabulary and prompt prefix.
+
+``/search/nl`` sends the tenant's categories, keywords and people to the LLM
+with every query. The vocabulary and the prompt prefix built from it are reused
+until a committed session touches the tenant's keywords, categories or people
+(which bumps the tenant's version stamp), or for at most
+``nl_search_vocab_cache_ttl_seconds`` to bound writes made by other processes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from zoltag.metadata import Person
+from zoltag.models.config import Keyword, KeywordCategory
+from zoltag.tenant_cache import TenantCache
+
+
+@dataclass(frozen=True)
+class NLVocabEntry:
+    """A tenant's search vocabulary, its prompt prefix and a content version."""
+
+    vocab: dict[str, Any]
+    prompt_prefix: str
+    version: str
+
+
+_nl_vocab_cache = TenantCache(
+    "nl_vocab",
+    models=(Keyword, KeywordCategory, Person),
+    ttl_setting="nl_search_vocab_cache_ttl_seconds",
+)
+
+
+def nl_vocab_generation(tenant_id: str) -> tuple[int, int]:
+    """Return the version stamp to pass to ``store_nl_vocab``."""
+    return _nl_vocab_cache.generation(tenant_id)
+
+
+def get_cached_nl_vocab(tenant_id: str) -> Optional[NLVocabEntry]:
+    """Return the tenant's cached vocabulary while it is still fresh."""
+    return _nl_vocab_cache.get(tenant_id)
+
+
+def store_nl_vocab(tenant_id: str, entry: NLVocabEntry, generation: tuple[int, int]) -> None:
+    """Cache a built vocabulary unless the tenant's version moved meanwhile."""
+    _nl_vocab_cache.store(tenant_id, entry, generation)
+
+
+def invalidate_nl_vocab(tenant_id: Optional[str] = None) -> None:
+    """Bump the version stamp for one tenant, or for all tenants when omitted."""
+    _nl_vocab_cache.invalidate(tenant_id)
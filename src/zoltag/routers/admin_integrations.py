@@ -177,7 +177,7 @@ def _serialize_provider_record(record) -> dict:
 
 
 @router.get("/status")
-async def get_integrations_status(
+def get_integrations_status(
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("provider.view")),
     db: Session = Depends(get_db),
@@ -190,7 +190,7 @@ async def get_integrations_status(
 
 
 @router.get("/dropbox/status")
-async def get_dropbox_status(
+def get_dropbox_status(
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("provider.view")),
     db: Session = Depends(get_db),
@@ -203,7 +203,7 @@ async def get_dropbox_status(
 
 
 @router.get("/providers")
-async def list_integration_providers(
+def list_integration_providers(
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("provider.view")),
     db: Session = Depends(get_db),
@@ -222,7 +222,7 @@ async def list_integration_providers(
 
 
 @router.post("/providers")
-async def create_integration_provider(
+def create_integration_provider(
     payload: dict,
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("provider.manage")),
@@ -249,7 +249,7 @@ async def create_integration_provider(
 
 
 @router.patch("/providers/{provider_id}")
-async def update_integration_provider(
+def update_integration_provider(
     provider_id: str,
     payload: dict,
     tenant: Tenant = Depends(get_tenant),
@@ -302,7 +302,7 @@ async def update_integration_provider(
 
 
 @router.delete("/providers/{provider_id}")
-async def delete_integration_provider(
+def delete_integration_provider(
     provider_id: str,
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("provider.manage")),
@@ -322,7 +322,7 @@ async def delete_integration_provider(
 
 
 @router.post("/providers/{provider_id}/connect")
-async def start_provider_connect(
+def start_provider_connect(
     provider_id: str,
     request: Request,
     payload: dict | None = None,
@@ -381,7 +381,7 @@ async def start_provider_connect(
 
 
 @router.delete("/providers/{provider_id}/connection")
-async def disconnect_provider_connection(
+def disconnect_provider_connection(
     provider_id: str,
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("provider.manage")),
@@ -413,7 +413,7 @@ async def disconnect_provider_connection(
 
 
 @router.patch("/dropbox/config")
-async def update_dropbox_config(
+def update_dropbox_config(
     payload: dict,
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("provider.manage")),
@@ -459,7 +459,7 @@ async def update_dropbox_config(
 
 
 @router.post("/dropbox/connect")
-async def start_dropbox_connect(
+def start_dropbox_connect(
     request: Request,
     payload: dict | None = None,
     tenant: Tenant = Depends(get_tenant),
@@ -502,7 +502,7 @@ async def start_dropbox_connect(
 
 
 @router.post("/gdrive/connect")
-async def start_gdrive_connect(
+def start_gdrive_connect(
     request: Request,
     payload: dict | None = None,
     tenant: Tenant = Depends(get_tenant),
@@ -544,7 +544,7 @@ async def start_gdrive_connect(
 
 
 @router.delete("/dropbox/connection")
-async def disconnect_dropbox(
+def disconnect_dropbox(
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("provider.manage")),
     db: Session = Depends(get_db),
@@ -576,7 +576,7 @@ async def disconnect_dropbox(
 
 
 @router.delete("/gdrive/connection")
-async def disconnect_gdrive(
+def disconnect_gdrive(
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("provider.manage")),
     db: Session = Depends(get_db),
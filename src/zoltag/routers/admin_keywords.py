@@ -111,7 +111,7 @@ def _ensure_person_not_linked(db: Session, person: Person, keyword_id: int | Non
 # ============================================================================
 
 @router.get("/categories", response_model=list)
-async def list_keyword_categories(
+def list_keyword_categories(
     _viewer=Depends(require_tenant_permission_from_header("keywords.read")),
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -135,7 +135,7 @@ async def list_keyword_categories(
 
 
 @router.post("/categories", response_model=dict)
-async def create_keyword_category(
+def create_keyword_category(
     category_data: dict,
     _editor=Depends(require_tenant_permission_from_header("keywords.write")),
     tenant: Tenant = Depends(get_tenant),
@@ -178,7 +178,7 @@ async def create_keyword_category(
 
 
 @router.put("/categories/{category_id}", response_model=dict)
-async def update_keyword_category(
+def update_keyword_category(
     category_id: int,
     category_data: dict,
     _editor=Depends(require_tenant_permission_from_header("keywords.write")),
@@ -222,7 +222,7 @@ async def update_keyword_category(
 
 
 @router.delete("/categories/{category_id}", response_model=dict)
-async def delete_keyword_category(
+def delete_keyword_category(
     category_id: int,
     _editor=Depends(require_tenant_permission_from_header("keywords.write")),
     tenant: Tenant = Depends(get_tenant),
@@ -254,7 +254,7 @@ async def delete_keyword_category(
 # ============================================================================
 
 @router.get("/categories/{category_id}/keywords", response_model=list)
-async def list_keywords_in_category(
+def list_keywords_in_category(
     category_id: int,
     _viewer=Depends(require_tenant_permission_from_header("keywords.read")),
     tenant: Tenant = Depends(get_tenant),
@@ -276,7 +276,7 @@ async def list_keywords_in_category(
 
 
 @router.post("/categories/{category_id}/keywords", response_model=dict)
-async def create_keyword(
+def create_keyword(
     category_id: int,
     keyword_data: dict,
     _editor=Depends(require_tenant_permission_from_header("keywords.write")),
@@ -326,7 +326,7 @@ async def create_keyword(
 
 
 @router.put("/{keyword_id}", response_model=dict)
-async def update_keyword(
+def update_keyword(
     keyword_id: int,
     keyword_data: dict,
     _editor=Depends(require_tenant_permission_from_header("keywords.write")),
@@ -394,7 +394,7 @@ async def update_keyword(
 
 
 @router.delete("/{keyword_id}", response_model=dict)
-async def delete_keyword(
+def delete_keyword(
     keyword_id: int,
     _editor=Depends(require_tenant_permission_from_header("keywords.write")),
     tenant: Tenant = Depends(get_tenant),
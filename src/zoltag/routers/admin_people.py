@@ -23,7 +23,7 @@ def _resolve_tenant(db: Session, tenant_ref: str):
 
 
 @router.get("", response_model=list)
-async def list_people(
+def list_people(
     tenant_id: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
@@ -54,7 +54,7 @@ async def list_people(
 
 
 @router.post("", response_model=dict)
-async def create_person(
+def create_person(
     person_data: dict,
     db: Session = Depends(get_db)
 ):
@@ -89,7 +89,7 @@ async def create_person(
 
 
 @router.put("/{person_id}", response_model=dict)
-async def update_person(
+def update_person(
     person_id: int,
     person_data: dict,
     db: Session = Depends(get_db)
@@ -120,7 +120,7 @@ async def update_person(
 
 
 @router.delete("/{person_id}", response_model=dict)
-async def delete_person(
+def delete_person(
     person_id: int,
     db: Session = Depends(get_db)
 ):
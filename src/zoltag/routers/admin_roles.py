@@ -121,7 +121,7 @@ def _serialize_role(role: TenantRole, *, member_count: int = 0) -> dict:
 
 
 @router.get("/permissions/catalog")
-async def list_permission_catalog(
+def list_permission_catalog(
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.users.manage")),
     db: Session = Depends(get_db),
@@ -141,7 +141,7 @@ async def list_permission_catalog(
 
 
 @router.get("/roles")
-async def list_tenant_roles(
+def list_tenant_roles(
     include_inactive: bool = Query(default=False),
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.users.view")),
@@ -181,7 +181,7 @@ async def list_tenant_roles(
 
 
 @router.post("/roles")
-async def create_tenant_role(
+def create_tenant_role(
     body: dict = Body(default_factory=dict),
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.users.manage")),
@@ -234,7 +234,7 @@ async def create_tenant_role(
 
 
 @router.patch("/roles/{role_id}")
-async def update_tenant_role(
+def update_tenant_role(
     role_id: str,
     body: dict = Body(default_factory=dict),
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
@@ -304,7 +304,7 @@ async def update_tenant_role(
 
 
 @router.put("/roles/{role_id}/permissions")
-async def replace_tenant_role_permissions(
+def replace_tenant_role_permissions(
     role_id: str,
     body: dict = Body(default_factory=dict),
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
@@ -343,7 +343,7 @@ async def replace_tenant_role_permissions(
 
 
 @router.delete("/roles/{role_id}")
-async def delete_tenant_role(
+def delete_tenant_role(
     role_id: str,
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.users.manage")),
@@ -247,7 +247,7 @@ def _seed_default_tenant_roles(db: Session, tenant_id: str) -> None:
 
 
 @router.get("", response_model=list)
-async def list_tenants(
+def list_tenants(
     db: Session = Depends(get_db),
     details: bool = False,
     user: UserProfile = Depends(get_current_user),
@@ -326,7 +326,7 @@ async def list_tenants(
 
 
 @router.get("/{tenant_id}", response_model=dict)
-async def get_tenant(
+def get_tenant(
     tenant_id: str,
     db: Session = Depends(get_db),
     user: UserProfile = Depends(get_current_user),
@@ -355,7 +355,7 @@ async def get_tenant(
 
 
 @router.post("", response_model=dict)
-async def create_tenant(
+def create_tenant(
     tenant_data: dict,
     db: Session = Depends(get_db),
     user: UserProfile = Depends(get_current_user),
@@ -420,7 +420,7 @@ async def create_tenant(
 
 
 @router.put("/{tenant_id}", response_model=dict)
-async def update_tenant(
+def update_tenant(
     tenant_id: str,
     tenant_data: dict,
     db: Session = Depends(get_db),
@@ -506,7 +506,7 @@ async def update_tenant(
 
 
 @router.patch("/{tenant_id}/settings", response_model=dict)
-async def update_tenant_settings(
+def update_tenant_settings(
     tenant_id: str,
     settings_update: dict,
     db: Session = Depends(get_db),
@@ -552,7 +552,7 @@ async def update_tenant_settings(
 
 
 @router.delete("/{tenant_id}", response_model=dict)
-async def delete_tenant(
+def delete_tenant(
     tenant_id: str,
     db: Session = Depends(get_db),
     user: UserProfile = Depends(get_current_user),
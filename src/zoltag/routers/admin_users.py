@@ -308,7 +308,7 @@ def _serialize_activity_rows(db: Session, rows: list[ActivityEvent]) -> list[dic
 
 
 @router.get("/users/pending", response_model=List[UserProfileResponse])
-async def list_pending_users(
+def list_pending_users(
     admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db)
 ):
@@ -334,7 +334,7 @@ async def list_pending_users(
 
 
 @router.get("/users/approved", response_model=List[dict])
-async def list_approved_users(
+def list_approved_users(
     admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db)
 ):
@@ -391,7 +391,7 @@ async def list_approved_users(
 
 
 @router.get("/tenant-users", response_model=List[dict])
-async def list_tenant_users(
+def list_tenant_users(
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.users.view")),
     db: Session = Depends(get_db),
@@ -435,7 +435,7 @@ async def list_tenant_users(
 
 @router.post("/users/{supabase_uid}/approve", response_model=dict)
 @limiter.limit("10/minute")
-async def approve_user(
+def approve_user(
     request: Request,
     supabase_uid: str,
     body: ApproveUserRequest,
@@ -506,7 +506,7 @@ async def approve_user(
 
 
 @router.post("/users/{supabase_uid}/assign-tenant", response_model=dict)
-async def assign_user_to_tenant(
+def assign_user_to_tenant(
     supabase_uid: str,
     request: ApproveUserRequest,
     admin: UserProfile = Depends(require_super_admin),
@@ -582,7 +582,7 @@ async def assign_user_to_tenant(
 
 
 @router.patch("/users/{supabase_uid}/tenant-memberships/{tenant_id}", response_model=dict)
-async def update_user_tenant_membership(
+def update_user_tenant_membership(
     supabase_uid: str,
     tenant_id: str,
     request: UpdateTenantMembershipRequest,
@@ -637,7 +637,7 @@ async def update_user_tenant_membership(
 
 
 @router.delete("/users/{supabase_uid}/tenant-memberships/{tenant_id}", response_model=dict)
-async def remove_user_tenant_membership(
+def remove_user_tenant_membership(
     supabase_uid: str,
     tenant_id: str,
     _admin: UserProfile = Depends(require_super_admin),
@@ -672,7 +672,7 @@ async def remove_user_tenant_membership(
 
 
 @router.patch("/tenant-users/{supabase_uid}/role", response_model=dict)
-async def update_tenant_user_role(
+def update_tenant_user_role(
     supabase_uid: str,
     request: UpdateTenantMembershipRequest,
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
@@ -747,7 +747,7 @@ async def update_tenant_user_role(
 
 
 @router.delete("/tenant-users/{supabase_uid}", response_model=dict)
-async def remove_tenant_user(
+def remove_tenant_user(
     supabase_uid: str,
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
     admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.users.manage")),
@@ -798,7 +798,7 @@ async def remove_tenant_user(
 
 
 @router.post("/users/{supabase_uid}/reject", response_model=dict)
-async def reject_user(
+def reject_user(
     supabase_uid: str,
     admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db)
@@ -836,7 +836,7 @@ async def reject_user(
 
 
 @router.post("/users/{supabase_uid}/disable", response_model=dict)
-async def disable_user(
+def disable_user(
     supabase_uid: str,
     admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db)
@@ -882,7 +882,7 @@ async def disable_user(
 
 
 @router.post("/users/{supabase_uid}/enable", response_model=dict)
-async def enable_user(
+def enable_user(
     supabase_uid: str,
     admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db)
@@ -927,7 +927,7 @@ async def enable_user(
 
 
 @router.post("/users/{supabase_uid}/set-super-admin", response_model=dict)
-async def set_super_admin(
+def set_super_admin(
     supabase_uid: str,
     request: dict,
     admin: UserProfile = Depends(require_super_admin),
@@ -976,7 +976,7 @@ async def set_super_admin(
 
 @router.post("/invitations", response_model=dict, status_code=201)
 @limiter.limit("20/minute")
-async def create_invitation(
+def create_invitation(
     request: Request,
     body: CreateInvitationRequest,
     user: UserProfile = Depends(get_current_user),
@@ -1132,7 +1132,7 @@ async def create_invitation(
 
 
 @router.get("/invitations", response_model=List[InvitationResponse])
-async def list_invitations(
+def list_invitations(
     tenant_id: Optional[str] = Query(None),
     user: UserProfile = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1179,7 +1179,7 @@ async def list_invitations(
 
 
 @router.delete("/invitations/{invitation_id}", response_model=dict)
-async def cancel_invitation(
+def cancel_invitation(
     invitation_id: str,
     user: UserProfile = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1222,7 +1222,7 @@ async def cancel_invitation(
 
 
 @router.get("/activity", response_model=dict)
-async def list_activity_events(
+def list_activity_events(
     tenant_id: Optional[str] = Query(None),
     event_type: Optional[str] = Query(None),
     user_id: Optional[str] = Query(None),
@@ -1269,7 +1269,7 @@ async def list_activity_events(
 
 
 @router.get("/tenant-activity", response_model=dict)
-async def list_tenant_activity_events(
+def list_tenant_activity_events(
     x_tenant_id: str = Header(..., alias="X-Tenant-ID"),
     event_type: Optional[str] = Query(None),
     user_id: Optional[str] = Query(None),
@@ -36,7 +36,7 @@ from zoltag.auth.dependencies import (
     get_tenant_role_id_by_key,
     invalidate_tenant_permission_cache,
 )
-from zoltag.auth.jwt import get_supabase_uid_from_token
+from zoltag.auth.jwt import verify_supabase_jwt
 from zoltag.auth.models import UserProfile, UserTenant, Invitation
 from zoltag.auth.schemas import (
     LoginResponse,
@@ -58,13 +58,45 @@ def _legacy_role_from_key(role_key: Optional[str]) -> str:
     return normalized if normalized in _LEGACY_ROLE_KEYS else "user"
 
 
+async def get_registration_claims(authorization: Optional[str] = Header(None)) -> dict:
+    """Verify the Supabase JWT presented to /register and return its claims.
+
+    Token verification may fetch JWKS, so it runs as an async dependency and
+    the registration handler itself stays a sync (threadpool) endpoint.
+    """
+    if not authorization:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authorization header required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if not authorization.startswith("Bearer "):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authorization header format",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    token = authorization[7:]  # Remove "Bearer " prefix
+
+    try:
+        return await verify_supabase_jwt(token)
+    except JWTError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Invalid or expired token: {str(e)}",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
 @router.post("/register", response_model=dict, status_code=201)
 @limiter.limit("120/minute")
-async def register(
+def register(
     request: Request,
     body: RegisterRequest,
+    claims: dict = Depends(get_registration_claims),
     db: Session = Depends(get_db),
-    authorization: Optional[str] = Header(None)
 ):
     """Complete registration after Supabase signup.
 
@@ -80,8 +112,8 @@ async def register(
 
     Args:
         request: Registration data (display_name)
+        claims: Verified JWT claims from the Authorization header
         db: Database session
-        authorization: Bearer token from Authorization header
 
     Returns:
         dict: Status message and user ID
@@ -89,30 +121,7 @@ async def register(
     Raises:
         HTTPException 401: Invalid or missing JWT token
     """
-    if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header required",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    if not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    token = authorization[7:]  # Remove "Bearer " prefix
-
-    try:
-        supabase_uid = await get_supabase_uid_from_token(token)
-    except JWTError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Invalid or expired token: {str(e)}",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    supabase_uid = claims["sub"]  # 'sub' claim contains the UUID
 
     # Check if profile already exists
     existing = db.query(UserProfile).filter(
@@ -126,20 +135,9 @@ async def register(
             "user_id": str(supabase_uid)
         }
 
-    # For new registrations, we need to extract email from Supabase
-    # The JWT token includes the email claim
-    from zoltag.auth.jwt import verify_supabase_jwt
-    try:
-        decoded = await verify_supabase_jwt(token)
-    except JWTError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Failed to verify token: {str(e)}",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    email = decoded.get("email", "")
-    email_verified = decoded.get("email_confirmed_at") is not None
+    # For new registrations, the JWT token includes the email claim
+    email = claims.get("email", "")
+    email_verified = claims.get("email_confirmed_at") is not None
 
     if not email:
         raise HTTPException(
@@ -207,7 +205,7 @@ async def register(
 
 
 @router.get("/me", response_model=LoginResponse)
-async def get_current_user_info(
+def get_current_user_info(
     user: UserProfile = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -275,7 +273,7 @@ async def get_current_user_info(
 
 @router.post("/accept-invitation", response_model=LoginResponse)
 @limiter.limit("20/minute")
-async def accept_invitation(
+def accept_invitation(
     request: Request,
     body: AcceptInvitationRequest,
     user: UserProfile = Depends(get_authenticated_user_allow_pending),
@@ -361,11 +359,11 @@ async def accept_invitation(
     )
 
     # Return updated user info with new tenant
-    return await get_current_user_info(user, db)
+    return get_current_user_info(user, db)
 
 
 @router.post("/logout", status_code=200)
-async def logout(user: UserProfile = Depends(get_current_user)):
+def logout(user: UserProfile = Depends(get_current_user)):
     """Logout endpoint (server-side cleanup).
 
     This is a no-op on the server side. The frontend should:
@@ -15,7 +15,7 @@ router = APIRouter(
 # ============================================================================
 
 @router.get("/system")
-async def get_system_config():
+def get_system_config():
     """Get system configuration (environment, version, GCP settings, etc.)."""
     from zoltag.settings import settings
 
@@ -33,6 +33,6 @@ async def get_system_config():
 
 
 @router.get("/cli-commands")
-async def get_cli_commands():
+def get_cli_commands():
     """Return CLI command metadata for the UI."""
     return {"commands": list_cli_commands_metadata()}
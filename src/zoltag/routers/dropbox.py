@@ -5,6 +5,7 @@ import requests
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import RedirectResponse, HTMLResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from zoltag import oauth_state
 from zoltag.dependencies import get_db, get_secret, store_secret
@@ -55,7 +56,7 @@ def _resolve_redirect_origin(request: Request, explicit_origin: str | None = Non
 
 
 @router.get("/oauth/dropbox/authorize")
-async def dropbox_authorize(
+def dropbox_authorize(
     request: Request,
     tenant: str,
     flow: str = "popup",
@@ -118,7 +119,7 @@ async def dropbox_authorize(
 
 
 @router.get("/oauth/dropbox/callback")
-async def dropbox_callback(
+def dropbox_callback(
     request: Request,
     code: str,
     state: str,
@@ -229,7 +230,8 @@ async def dropbox_webhook(request: Request):
     signature = request.headers.get("X-Dropbox-Signature", "")
     body = await request.body()
 
-    app_secret = get_secret("dropbox-app-secret")
+    # Secret Manager lookup is a blocking network call.
+    app_secret = await run_in_threadpool(get_secret, "dropbox-app-secret")
     validator = DropboxWebhookValidator(app_secret)
 
     if not validator.validate_signature(body, signature):
@@ -1041,9 +1041,14 @@ def build_image_query_with_subqueries(
                     tenant_column_filter(ImageMetadata, tenant),
                     tenant_column_filter(Asset, tenant),
                     Asset.source_provider == "dropbox",
+                    # Files under "/a/" live in folder "/a" or one of its subfolders.
                     or_(*[
-                        Asset.source_key.ilike(f"{prefix}%")
+                        condition
                         for prefix in normalized_prefixes
+                        for condition in (
+                            Asset.source_folder.ilike(prefix.rstrip("/")),
+                            Asset.source_folder.ilike(f"{prefix}%"),
+                        )
                     ])
                 )
                 .subquery()
@@ -50,7 +50,7 @@ def _resolve_redirect_origin(request: Request, explicit_origin: str | None = Non
 
 
 @router.get("/oauth/gdrive/authorize")
-async def gdrive_authorize(
+def gdrive_authorize(
     request: Request,
     tenant: str,
     flow: str = "popup",
@@ -102,7 +102,7 @@ async def gdrive_authorize(
 
 
 @router.get("/oauth/gdrive/callback")
-async def gdrive_callback(
+def gdrive_callback(
     request: Request,
     code: str,
     state: str,
@@ -28,7 +28,7 @@ router = APIRouter()
 
 
 @router.get("/images/{image_id}/asset-variants", response_model=dict, operation_id="list_asset_variants")
-async def list_asset_variants(
+def list_asset_variants(
     image_id: int,
     include_object_metadata: bool = False,
     tenant: Tenant = Depends(get_tenant),
@@ -81,7 +81,7 @@ async def list_asset_variants(
 
 
 @router.post("/images/{image_id}/asset-variants", response_model=dict, operation_id="upload_asset_variant")
-async def upload_asset_variant(
+def upload_asset_variant(
     image_id: int,
     file: UploadFile = File(...),
     variant: Optional[str] = Form(default=None),
@@ -92,7 +92,7 @@ async def upload_asset_variant(
     """Upload and create a derivative variant record for an image asset."""
     _image, asset = _get_image_and_asset_or_409(db, tenant, image_id)
 
-    file_bytes = await file.read()
+    file_bytes = file.file.read()
     if not file_bytes:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
 
@@ -137,7 +137,7 @@ async def upload_asset_variant(
 
 
 @router.patch("/images/{image_id}/asset-variants/{variant_id}", response_model=dict, operation_id="update_asset_variant")
-async def update_asset_variant(
+def update_asset_variant(
     image_id: int,
     variant_id: UUID,
     payload: dict = Body(...),
@@ -194,7 +194,7 @@ async def update_asset_variant(
 
 
 @router.delete("/images/{image_id}/asset-variants/{variant_id}", response_model=dict, operation_id="delete_asset_variant")
-async def delete_asset_variant(
+def delete_asset_variant(
     image_id: int,
     variant_id: UUID,
     tenant: Tenant = Depends(get_tenant),
@@ -230,7 +230,7 @@ async def delete_asset_variant(
 
 
 @router.get("/images/{image_id}/asset-variants/{variant_id}/inspect", response_model=dict, operation_id="inspect_asset_variant")
-async def inspect_asset_variant(
+def inspect_asset_variant(
     image_id: int,
     variant_id: UUID,
     tenant: Tenant = Depends(get_tenant),
@@ -286,7 +286,7 @@ async def inspect_asset_variant(
 
 
 @router.get("/images/{image_id}/asset-variants/{variant_id}/content", operation_id="get_asset_variant_content")
-async def get_asset_variant_content(
+def get_asset_variant_content(
     image_id: int,
     variant_id: UUID,
     tenant: Tenant = Depends(get_tenant),
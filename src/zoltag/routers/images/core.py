@@ -1214,13 +1214,14 @@ def _fetch_similar_ids_with_pgvector(
 
 
 @router.get("/images", response_model=dict, operation_id="list_images")
-async def list_images(
+def list_images(
     request: Request,
     tenant: Tenant = Depends(get_tenant),
     current_user: UserProfile = Depends(get_current_user),
     limit: int = 100,
     offset: int = 0,
     anchor_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     keywords: Optional[str] = None,  # Comma-separated keywords (deprecated)
     operator: str = "OR",  # "AND" or "OR" (deprecated)
     category_filters: Optional[str] = None,  # JSON string with per-category filters
@@ -1253,12 +1254,17 @@ async def list_images(
     ml_similarity_random: bool = True,
     db: Session = Depends(get_db)
 ):
-    """List images for tenant with optional faceted search by keywords."""
+    """List images for tenant with optional faceted search by keywords.
+
+    SQL-ordered listings return ``next_cursor``; passing it back as ``cursor``
+    seeks past the last row instead of using OFFSET (and skips the total count).
+    """
     from ..filtering import (
         apply_category_filters,
         calculate_relevance_scores,
         build_image_query_with_subqueries
     )
+    from .query_builder import decode_cursor, encode_cursor
 
     ml_keyword_id = None
     if ml_keyword:
@@ -1357,20 +1363,30 @@ async def list_images(
         )
         return result
 
-    def resolve_anchor_offset(query, current_offset):
-        if anchor_id is None or limit is None:
-            return current_offset
-        order_by_clauses = getattr(query, "_order_by_clauses", None)
-        if not order_by_clauses:
-            return current_offset
-        subquery = query.with_entities(
-            ImageMetadata.id.label("image_id"),
-            func.row_number().over(order_by=order_by_clauses).label("rn")
-        ).subquery()
-        rn = db.query(subquery.c.rn).filter(subquery.c.image_id == anchor_id).scalar()
-        if rn is None:
-            return current_offset
-        return max(int(rn) - 1, 0)
+    next_cursor: Optional[str] = None
+    cursor_used = False
+
+    def fetch_keyset_page(builder, query, sort_keys, ordering: str):
+        """Page an SQL-ordered query with seek predicates (cursor or anchor) or OFFSET."""
+        nonlocal next_cursor, cursor_used
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor, ordering, len(sort_keys))
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc))
+            cursor_used = True
+        rows, next_values, _anchor_found = builder.fetch_keyset_page(
+            query,
+            sort_keys,
+            limit,
+            offset=offset,
+            after=after,
+            anchor_id=anchor_id,
+        )
+        if next_values is not None:
+            next_cursor = encode_cursor(ordering, next_values)
+        return rows
 
     def resolve_anchor_offset_for_sorted_ids(sorted_ids: List[int], current_offset: int) -> int:
         if anchor_id is None:
@@ -1656,10 +1672,9 @@ async def list_images(
             query = db.query(ImageMetadata).filter(
                 tenant_column_filter(ImageMetadata, tenant)
             )
-            total = int(query.order_by(None).count() or 0)
-            query = query.order_by(*order_by_clauses)
-            offset = resolve_anchor_offset(query, offset)
-            images = query.limit(limit).offset(offset).all() if limit else query.offset(offset).all()
+            builder = QueryBuilder(db, tenant, date_order, order_by_value)
+            total = None if cursor else int(query.order_by(None).count() or 0)
+            images = fetch_keyset_page(builder, query, builder.build_sort_keys(), builder.cursor_ordering())
     # Apply keyword filtering if provided (legacy support)
     elif keywords:
         from .query_builder import QueryBuilder
@@ -1720,7 +1735,6 @@ async def list_images(
                 query = builder.apply_subqueries(query, subqueries_list, exclude_subqueries_list)
 
                 total = builder.get_total_count(query)
-                offset = resolve_anchor_offset(query, offset)
                 results = builder.apply_pagination(query, offset, limit)
                 images = [img for img, _ in results]
 
@@ -1788,7 +1802,6 @@ async def list_images(
                 )
 
                 total = builder.get_total_count(query)
-                offset = resolve_anchor_offset(query, offset)
                 results = builder.apply_pagination(query, offset, limit)
                 images = [img for img, _ in results]
         else:
@@ -2142,45 +2155,29 @@ async def list_images(
                         ml_tag_type,
                         require_match=require_match,
                     )
-                    if order_by_value == "processed":
-                        order_by_date_clause = func.coalesce(ImageMetadata.last_processed, ImageMetadata.created_at)
-                    elif order_by_value == "created_at":
-                        order_by_date_clause = ImageMetadata.created_at
-                    else:
-                        order_by_date_clause = func.coalesce(ImageMetadata.capture_timestamp, ImageMetadata.modified_time)
-                    order_by_date_clause = order_by_date_clause.desc() if date_order == "desc" else order_by_date_clause.asc()
-                    id_order_clause = ImageMetadata.id.desc() if date_order == "desc" else ImageMetadata.id.asc()
-                    order_clauses = (
-                        ml_scores_subquery.c.ml_score.desc().nullslast(),
-                        order_by_date_clause,
-                        id_order_clause,
+                    sort_keys = builder.build_sort_keys(ml_scores_subquery)
+                    page_rows = fetch_keyset_page(
+                        builder,
+                        ml_query,
+                        sort_keys,
+                        builder.cursor_ordering(ml_keyword_id, ml_tag_type),
                     )
-                    ml_query = ml_query.order_by(*order_clauses)
-                    resolved_offset = resolve_anchor_offset(ml_query, offset)
-                    if limit:
-                        rows = ml_query.limit(limit + 1).offset(resolved_offset).all()
-                        has_more = len(rows) > limit
-                        page_rows = rows[:limit] if has_more else rows
-                        estimated_total = resolved_offset + len(page_rows) + (1 if has_more else 0)
-                    else:
-                        page_rows = ml_query.offset(resolved_offset).all()
-                        estimated_total = resolved_offset + len(page_rows)
-                    return ml_query, page_rows, resolved_offset, estimated_total
+                    has_more = next_cursor is not None
+                    estimated_total = None if cursor else offset + len(page_rows) + (1 if has_more else 0)
+                    return ml_query, page_rows, estimated_total
 
-                query, images, resolved_offset, total = fetch_ml_score_page(require_match=True)
+                query, images, total = fetch_ml_score_page(require_match=True)
                 if not images and query.limit(1).first() is None:
                     # No ML-tag matches at all: fall back to filtered rows ordered by ML score (nulls last).
                     query = base_query
                     query = builder.apply_subqueries(query, subqueries_list, exclude_subqueries_list)
                     query = query.options(load_only(*LIST_IMAGES_LOAD_ONLY_COLUMNS))
-                    query, images, resolved_offset, total = fetch_ml_score_page(require_match=False)
-                offset = resolved_offset
+                    query, images, total = fetch_ml_score_page(require_match=False)
         else:
-            total = builder.get_total_count(query)
-            order_by_clauses = builder.build_order_clauses()
-            query = query.order_by(*order_by_clauses)
-            offset = resolve_anchor_offset(query, offset)
-            images = query.limit(limit).offset(offset).all() if limit else query.offset(offset).all()
+            total = None if cursor else builder.get_total_count(query)
+            images = fetch_keyset_page(builder, query, builder.build_sort_keys(), builder.cursor_ordering())
+    if cursor and not cursor_used:
+        raise HTTPException(status_code=400, detail="cursor pagination is not supported for this query")
     # Get tags for all images
     image_ids = [img.id for img in images]
     asset_id_to_image_id = {img.asset_id: img.id for img in images if img.asset_id is not None}
@@ -2326,6 +2323,7 @@ async def list_images(
         "total": total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
         "text_query": text_query_value or None,
         "hybrid_vector_weight": vector_weight_value if text_query_value else None,
         "hybrid_lexical_weight": lexical_weight_value if text_query_value else None,
@@ -2355,7 +2353,7 @@ async def list_images(
 
 
 @router.get("/images/duplicates", response_model=dict, operation_id="list_duplicate_images")
-async def list_duplicate_images(
+def list_duplicate_images(
     tenant: Tenant = Depends(get_tenant),
     limit: int = 100,
     offset: int = 0,
@@ -2734,7 +2732,7 @@ def get_similar_images(
 
 
 @router.get("/images/{image_id}", response_model=dict, operation_id="get_image")
-async def get_image(
+def get_image(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -2855,7 +2853,7 @@ async def get_image(
 
 
 @router.get("/images/{image_id}/asset", response_model=dict, operation_id="get_image_asset")
-async def get_image_asset(
+def get_image_asset(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -2891,7 +2889,7 @@ async def get_image_asset(
 
 
 @router.get("/assets/{asset_id}", response_model=dict, operation_id="get_asset")
-async def get_asset(
+def get_asset(
     asset_id: UUID,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -2936,7 +2934,7 @@ async def get_asset(
 
 
 @router.delete("/images/{image_id}", response_model=dict, operation_id="delete_image")
-async def delete_image(
+def delete_image(
     image_id: int,
     _current_user: UserProfile = Depends(require_tenant_permission_from_header("tenant.settings.manage")),
     tenant: Tenant = Depends(get_tenant),
@@ -5,7 +5,6 @@ import mimetypes
 from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 from google.cloud import storage
 from dropbox import Dropbox
@@ -18,6 +17,7 @@ from zoltag.tenant import Tenant
 from zoltag.metadata import Asset, ImageMetadata, Permatag
 from zoltag.settings import settings
 from zoltag.storage import create_storage_provider
+from zoltag.sync_pipeline import extract_video_features
 from zoltag.dropbox_oauth import load_dropbox_oauth_credentials
 from zoltag.config.db_utils import load_keywords_map
 from zoltag.image import ImageProcessor, VideoProcessor, is_supported_video_file
@@ -40,28 +40,25 @@ router = APIRouter()
 
 
 @router.get("/images/dropbox-folders")
-async def list_dropbox_folders(
+def list_dropbox_folders(
     tenant: Tenant = Depends(get_tenant),
     q: Optional[str] = None,
     limit: Optional[int] = None,
     db: Session = Depends(get_db)
 ):
     """List Dropbox folder paths for a tenant, filtered by query."""
-    parent_expr = func.regexp_replace(Asset.source_key, "/[^/]+$", "")
-    folder_expr = func.coalesce(func.nullif(parent_expr, ""), "/")
+    # Served from the indexed Asset.source_folder column maintained at sync time.
     query = (
-        db.query(folder_expr.label("folder"))
-        .join(ImageMetadata, ImageMetadata.asset_id == Asset.id)
+        db.query(Asset.source_folder)
         .filter(
-            tenant_column_filter(ImageMetadata, tenant),
             tenant_column_filter(Asset, tenant),
             Asset.source_provider == "dropbox",
-            Asset.source_key.isnot(None),
+            Asset.source_folder.isnot(None),
         )
     )
     if q:
-        query = query.filter(folder_expr.ilike(f"%{q}%"))
-    query = query.distinct().order_by(folder_expr)
+        query = query.filter(Asset.source_folder.ilike(f"%{q}%"))
+    query = query.distinct().order_by(Asset.source_folder)
     if limit:
         query = query.limit(limit)
     rows = query.all()
@@ -70,7 +67,7 @@ async def list_dropbox_folders(
 
 
 @router.post("/images/{image_id}/refresh-metadata", response_model=dict, operation_id="refresh_image_metadata")
-async def refresh_image_metadata(
+def refresh_image_metadata(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -108,11 +105,6 @@ async def refresh_image_metadata(
     except Exception:
         entry = None
 
-    try:
-        image_bytes = provider.download_file(source_ref)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Error downloading {provider_name} image: {exc}")
-
     source_mime = (
         (entry.mime_type if entry else None)
         or getattr(getattr(storage_info, "asset", None), "mime_type", None)
@@ -123,10 +115,25 @@ async def refresh_image_metadata(
         or is_supported_video_file(image.filename or "", mime_type=source_mime)
     )
 
+    image_bytes = None
+    if not is_video:
+        try:
+            image_bytes = provider.download_file(source_ref)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Error downloading {provider_name} image: {exc}")
+
     try:
         if is_video:
             processor = VideoProcessor(thumbnail_size=(settings.thumbnail_size, settings.thumbnail_size))
-            features = processor.extract_features(image_bytes, filename=image.filename or "video")
+            features = extract_video_features(
+                provider=provider,
+                source_key=source_ref,
+                filename=image.filename or "video",
+                video_processor=processor,
+                max_download_bytes=None,
+            )
+            if features is None:
+                raise RuntimeError(f"Unable to read {provider_name} video")
             exif = {}
             capture_timestamp = None
             gps_latitude = None
@@ -234,7 +241,7 @@ async def refresh_image_metadata(
 
 
 @router.post("/images/{image_id}/dropbox-tags", response_model=dict, operation_id="propagate_dropbox_tags")
-async def propagate_dropbox_tags(
+def propagate_dropbox_tags(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
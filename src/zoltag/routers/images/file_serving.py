@@ -1,8 +1,10 @@
 """Image file serving endpoints: thumbnail and full-size image."""
 
 import io
+import logging
 import mimetypes
 from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
@@ -10,6 +12,7 @@ from google.cloud import storage
 from sqlalchemy.orm import Session
 from starlette.concurrency import run_in_threadpool
 
+from zoltag.database import run_read_query
 from zoltag.dependencies import get_db, get_secret, get_tenant
 from zoltag.integrations import TenantIntegrationRepository
 from zoltag.image import ImageProcessor
@@ -21,6 +24,7 @@ from zoltag.tenant import Tenant
 from zoltag.tenant_scope import tenant_column_filter
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 PLAYBACK_URL_TTL_SECONDS = 300
 
 
@@ -99,17 +103,37 @@ def _convert_heic_bytes_to_jpeg(file_bytes: bytes) -> bytes:
     return buffer.getvalue()
 
 
+def _chain_first_chunk(first_chunk: bytes, stream: Iterator[bytes]) -> Iterator[bytes]:
+    """Re-attach a pre-fetched first chunk so provider errors surface before headers are sent."""
+    if first_chunk:
+        yield first_chunk
+    yield from stream
+
+
+def _resolve_source_size(provider, source_ref: str) -> Optional[int]:
+    """Return the live source object size from the provider, or None when it cannot say.
+
+    Stored metadata is not a substitute: the stream is read from the provider,
+    so a stale size would break Content-Length and range offsets.
+    """
+    try:
+        size = provider.get_entry(source_ref).size
+    except Exception as exc:
+        logger.warning("Could not read size of %s from %s: %s", source_ref, provider.provider_name, exc)
+        return None
+    try:
+        return int(size) if size is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
 def _build_expiry_timestamp(ttl_seconds: int) -> str:
     expires = datetime.now(timezone.utc) + timedelta(seconds=max(60, int(ttl_seconds or 300)))
     return expires.isoformat().replace("+00:00", "Z")
 
 
-@router.get("/images/{image_id}/thumbnail", operation_id="get_thumbnail")
-async def get_thumbnail(
-    image_id: int,
-    db: Session = Depends(get_db)
-):
-    """Get image thumbnail from Cloud Storage with aggressive caching."""
+def _resolve_thumbnail_target(db: Session, image_id: int) -> tuple[str, str, str]:
+    """Resolve (bucket, thumbnail key, ETag) for an image; runs via run_read_query."""
     image = db.query(ImageMetadata).filter_by(
         id=image_id
     ).first()
@@ -157,22 +181,32 @@ async def get_thumbnail(
     if not storage_info.thumbnail_key:
         raise HTTPException(status_code=404, detail="Thumbnail not found")
 
-    try:
-        storage_client = storage.Client(project=settings.gcp_project_id)
-        bucket = storage_client.bucket(tenant.get_thumbnail_bucket(settings))
-        blob = bucket.blob(storage_info.thumbnail_key)
+    etag = f'"{image.id}-{image.modified_time.timestamp() if image.modified_time else 0}"'
+    return tenant.get_thumbnail_bucket(settings), storage_info.thumbnail_key, etag
+
+
+def _download_thumbnail(bucket_name: str, thumbnail_key: str) -> bytes:
+    storage_client = storage.Client(project=settings.gcp_project_id)
+    blob = storage_client.bucket(bucket_name).blob(thumbnail_key)
+    if not blob.exists():
+        raise HTTPException(status_code=404, detail="Thumbnail not found in storage")
+    return blob.download_as_bytes()
 
-        if not blob.exists():
-            raise HTTPException(status_code=404, detail="Thumbnail not found in storage")
 
-        thumbnail_data = blob.download_as_bytes()
+@router.get("/images/{image_id}/thumbnail", operation_id="get_thumbnail")
+async def get_thumbnail(image_id: int):
+    """Get image thumbnail from Cloud Storage with aggressive caching."""
+    bucket_name, thumbnail_key, etag = await run_read_query(_resolve_thumbnail_target, image_id)
+
+    try:
+        thumbnail_data = await run_in_threadpool(_download_thumbnail, bucket_name, thumbnail_key)
 
         return StreamingResponse(
             iter([thumbnail_data]),
             media_type="image/jpeg",
             headers={
                 "Cache-Control": "public, max-age=3600",  # Cache for 1 hour
-                "ETag": f'"{image.id}-{image.modified_time.timestamp() if image.modified_time else 0}"'
+                "ETag": etag,
             }
         )
     except HTTPException:
@@ -182,7 +216,7 @@ async def get_thumbnail(
 
 
 @router.get("/images/{image_id}/full", operation_id="get_full_image")
-async def get_full_image(
+def get_full_image(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -209,40 +243,41 @@ async def get_full_image(
         raise HTTPException(status_code=404, detail=f"Image not available in {provider_name}")
 
     try:
-        provider = await run_in_threadpool(
-            create_storage_provider,
-            provider_name,
-            tenant=tenant,
-            get_secret=get_secret,
-        )
+        provider = create_storage_provider(provider_name, tenant=tenant, get_secret=get_secret)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to initialize {provider_name} provider: {exc}")
 
-    try:
-        # Provider SDK download is blocking IO; run in threadpool so the event loop
-        # can continue serving other requests while high-res content is fetched.
-        file_bytes = await run_in_threadpool(provider.download_file, source_ref)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Error fetching {provider_name} image: {exc}")
-
     filename = image.filename or "image"
     content_type, _ = mimetypes.guess_type(filename or source_ref)
     content_type = content_type or "application/octet-stream"
 
-    # Convert HEIC to JPEG for browser compatibility
+    # Convert HEIC to JPEG for browser compatibility (needs the whole file to decode).
     if filename.lower().endswith((".heic", ".heif")):
         try:
-            # PIL decode/encode is CPU-bound; run in threadpool.
-            file_bytes = await run_in_threadpool(_convert_heic_bytes_to_jpeg, file_bytes)
+            file_bytes = provider.download_file(source_ref)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Error fetching {provider_name} image: {exc}")
+        try:
+            file_bytes = _convert_heic_bytes_to_jpeg(file_bytes)
             filename = filename.rsplit(".", 1)[0] + ".jpg"
             content_type = "image/jpeg"
         except Exception as exc:
             print(f"HEIC conversion failed for {image.filename}: {exc}")
+        body = iter([file_bytes])
+    else:
+        try:
+            # Fetch the first chunk eagerly so provider failures still map to a 500;
+            # Starlette iterates the rest of the sync stream in its threadpool.
+            stream = provider.open_stream(source_ref)
+            first_chunk = next(stream, b"")
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Error fetching {provider_name} image: {exc}")
+        body = _chain_first_chunk(first_chunk, stream)
 
     return StreamingResponse(
-        iter([file_bytes]),
+        body,
         media_type=content_type,
         headers={
             "Cache-Control": "no-store",
@@ -252,7 +287,7 @@ async def get_full_image(
 
 
 @router.get("/images/{image_id}/playback", operation_id="get_image_playback")
-async def get_image_playback(
+def get_image_playback(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -317,7 +352,7 @@ async def get_image_playback(
 
 
 @router.get("/images/{image_id}/playback/stream", operation_id="stream_image_playback")
-async def stream_image_playback(
+def stream_image_playback(
     image_id: int,
     request: Request,
     tenant: Tenant = Depends(get_tenant),
@@ -351,12 +386,15 @@ async def stream_image_playback(
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to initialize {provider_name} provider: {exc}")
 
-    try:
-        file_bytes = provider.download_file(source_ref)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Error fetching {provider_name} video: {exc}")
+    total_size = _resolve_source_size(provider, source_ref)
+    file_bytes = None
+    if total_size is None:
+        try:
+            file_bytes = provider.download_file(source_ref)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Error fetching {provider_name} video: {exc}")
+        total_size = len(file_bytes)
 
-    total_size = len(file_bytes)
     filename = image.filename or "video"
     content_type = str(getattr(getattr(storage_info, "asset", None), "mime_type", "") or "").strip()
     if not content_type:
@@ -367,7 +405,7 @@ async def stream_image_playback(
         )
 
     status_code = 200
-    payload = file_bytes
+    start, end = 0, total_size - 1
     headers = {
         "Cache-Control": "no-store",
         "Accept-Ranges": "bytes",
@@ -384,13 +422,24 @@ async def stream_image_playback(
                 detail="Requested range is not satisfiable",
                 headers={"Content-Range": f"bytes */{total_size}"},
             )
-        payload = file_bytes[start:end + 1]
         status_code = 206
         headers["Content-Range"] = f"bytes {start}-{end}/{total_size}"
-        headers["Content-Length"] = str(len(payload))
+        headers["Content-Length"] = str(end - start + 1)
+
+    if file_bytes is not None:
+        body = iter([file_bytes[start:end + 1]])
+    elif total_size < 1:
+        body = iter([b""])
+    else:
+        try:
+            stream = provider.open_stream(source_ref, start=start, end=end)
+            first_chunk = next(stream, b"")
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Error fetching {provider_name} video: {exc}")
+        body = _chain_first_chunk(first_chunk, stream)
 
     return StreamingResponse(
-        iter([payload]),
+        body,
         status_code=status_code,
         media_type=content_type,
         headers=headers,
@@ -1,23 +1,23 @@
 """ML training endpoints: list training images, get training stats."""
 
-import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import func, distinct, case
 from sqlalchemy.orm import Session
-from google.cloud import storage
 
 from zoltag.asset_helpers import AssetReadinessError, load_assets_for_images, resolve_image_storage
-from zoltag.database import SessionLocal
+from zoltag.database import run_read_query
 from zoltag.dependencies import get_db, get_tenant, get_tenant_setting
 from zoltag.tenant import Tenant
 from zoltag.metadata import ImageMetadata, MachineTag, Permatag, KeywordModel, ImageEmbedding
 from zoltag.models.config import Keyword, KeywordCategory
 from zoltag.settings import settings
+from zoltag.storage import download_blobs, gcs_bucket
 from zoltag.config.db_config import ConfigManager
 from zoltag.tagging import get_tagger
 from zoltag.learning import (
+    ensure_image_embedding,
     load_keyword_models,
-    recompute_trained_tags_for_image,
+    recompute_trained_tags_for_embeddings,
 )
 from zoltag.tenant_scope import tenant_column_filter, tenant_column_filter_for_values
 
@@ -47,7 +47,7 @@ def _resolve_storage_or_409(
 
 
 @router.get("/ml-training/images", response_model=dict, operation_id="list_ml_training_images")
-async def list_ml_training_images(
+def list_ml_training_images(
     tenant: Tenant = Depends(get_tenant),
     limit: int = 50,
     offset: int = 0,
@@ -156,9 +156,6 @@ async def list_ml_training_images(
     config_mgr = ConfigManager(db, tenant.id)
     all_keywords = config_mgr.get_all_keywords()
     keyword_to_category = {kw['keyword']: kw['category'] for kw in all_keywords}
-    by_category = {}
-    for kw in all_keywords:
-        by_category.setdefault(kw['category'], []).append(kw)
 
     # Prefer the latest trained model name from the DB. Avoid loading the model
     # unless refresh=true to keep listing lightweight in production.
@@ -177,23 +174,37 @@ async def list_ml_training_images(
         except Exception as exc:
             raise HTTPException(status_code=503, detail=f"ML model unavailable: {exc}")
 
-    storage_client = storage.Client(project=settings.gcp_project_id)
-    thumbnail_bucket = storage_client.bucket(tenant.get_thumbnail_bucket(settings))
     trained_by_model = {
         asset_id_to_image_id[tag.asset_id]
         for tag in cached_trained
         if tag.model_name == model_name and tag.asset_id in asset_id_to_image_id
     }
-
-    images_list = []
-    for image in images:
-        storage_info = _resolve_storage_or_409(
+    storage_by_image = {
+        image.id: _resolve_storage_or_409(
             image=image,
             tenant=tenant,
             db=db,
             require_thumbnail=refresh,
             assets_by_id=assets_by_id,
         )
+        for image in images
+    }
+
+    if refresh and keyword_models:
+        trained_by_image.update(_refresh_trained_tags(
+            db,
+            tenant,
+            [image for image in images if image.id not in trained_by_model],
+            storage_by_image,
+            keyword_models=keyword_models,
+            keyword_to_category=keyword_to_category,
+            model_name=model_name,
+            model_version=model_version,
+        ))
+
+    images_list = []
+    for image in images:
+        storage_info = storage_by_image[image.id]
         positive_permatags = sorted(
             [keywords_map.get(tag.keyword_id, {}).get("keyword", "unknown")
              for tag in permatags_by_image.get(image.id, []) if tag.signum == 1]
@@ -203,27 +214,7 @@ async def list_ml_training_images(
             key=lambda x: x["confidence"],
             reverse=True
         )
-
         trained_tags = trained_by_image.get(image.id, [])
-        if refresh and keyword_models and storage_info.thumbnail_key and image.id not in trained_by_model:
-            blob = thumbnail_bucket.blob(storage_info.thumbnail_key)
-            if blob.exists():
-                image_data = blob.download_as_bytes()
-                trained_tags = recompute_trained_tags_for_image(
-                    db=db,
-                    tenant_id=tenant.id,
-                    image_id=image.id,
-                    asset_id=image.asset_id,
-                    image_data=image_data,
-                    keywords_by_category=by_category,
-                    keyword_models=keyword_models,
-                    keyword_to_category=keyword_to_category,
-                    model_name=model_name,
-                    model_version=model_version,
-                    model_type=settings.tagging_model,
-                    threshold=settings.trained_tag_threshold,
-                )
-                trained_by_image[image.id] = trained_tags
 
         images_list.append({
             "id": image.id,
@@ -248,78 +239,141 @@ async def list_ml_training_images(
     }
 
 
-def _compute_ml_training_stats(tenant_id: str) -> dict:
-    """Synchronous ML training stats computation - runs in a thread via run_in_executor."""
-    db = SessionLocal()
-    try:
-        active_tag_type = get_tenant_setting(db, tenant_id, 'active_machine_tag_type', default='siglip')
-
-        # Single pass over image_metadata and embeddings
-        image_count = db.query(func.count(ImageMetadata.id)).filter(
-            tenant_column_filter_for_values(ImageMetadata, tenant_id)
-        ).scalar() or 0
-
-        embedding_count = db.query(func.count(ImageEmbedding.id)).filter(
-            tenant_column_filter_for_values(ImageEmbedding, tenant_id)
-        ).scalar() or 0
-
-        # Two targeted queries on machine_tags - kept separate to use (tenant_id, asset_id, tag_type) index
-        zs_row = db.query(
-            func.count(distinct(MachineTag.asset_id)),
-            func.min(MachineTag.created_at),
-            func.max(MachineTag.created_at),
-        ).filter(
-            tenant_column_filter_for_values(MachineTag, tenant_id),
-            MachineTag.tag_type == active_tag_type,
-            MachineTag.asset_id.is_not(None),
-        ).one()
-
-        tr_row = db.query(
-            func.count(MachineTag.id),
-            func.count(distinct(MachineTag.asset_id)),
-            func.min(MachineTag.created_at),
-            func.max(MachineTag.created_at),
-        ).filter(
-            tenant_column_filter_for_values(MachineTag, tenant_id),
-            MachineTag.tag_type == 'trained',
-            MachineTag.asset_id.is_not(None),
-        ).one()
-
-        zero_shot_image_count = int(zs_row[0] or 0)
-        zero_shot_tag_oldest = zs_row[1]
-        zero_shot_tag_newest = zs_row[2]
-        trained_count = int(tr_row[0] or 0)
-        trained_image_count = int(tr_row[1] or 0)
-        trained_oldest = tr_row[2]
-        trained_newest = tr_row[3]
-
-        # Single pass over keyword_models
-        km_row = db.query(
-            func.count(KeywordModel.id),
-            func.max(func.coalesce(KeywordModel.updated_at, KeywordModel.created_at)),
-        ).filter(
-            tenant_column_filter_for_values(KeywordModel, tenant_id)
-        ).one()
-
-        model_count = int(km_row[0] or 0)
-        last_trained = km_row[1]
-
-        return {
-            "tenant_id": tenant_id,
-            "image_count": int(image_count),
-            "embedding_count": int(embedding_count),
-            "zero_shot_image_count": zero_shot_image_count,
-            "zero_shot_tag_oldest": zero_shot_tag_oldest.isoformat() if zero_shot_tag_oldest else None,
-            "zero_shot_tag_newest": zero_shot_tag_newest.isoformat() if zero_shot_tag_newest else None,
-            "trained_image_count": trained_image_count,
-            "keyword_model_count": model_count,
-            "keyword_model_last_trained": last_trained.isoformat() if last_trained else None,
-            "trained_tag_count": trained_count,
-            "trained_tag_oldest": trained_oldest.isoformat() if trained_oldest else None,
-            "trained_tag_newest": trained_newest.isoformat() if trained_newest else None
-        }
-    finally:
-        db.close()
+def _refresh_trained_tags(
+    db: Session,
+    tenant: Tenant,
+    images: list,
+    storage_by_image: dict,
+    *,
+    keyword_models: dict,
+    keyword_to_category: dict,
+    model_name: str,
+    model_version: str,
+) -> dict:
+    """Recompute trained tags for a page of images, keyed by image id.
+
+    Stored ImageEmbedding rows are scored in one vectorized batch; only images
+    without an embedding fall back to a thumbnail download and the image encoder.
+    """
+    targets = [image for image in images if image.asset_id is not None]
+    if not targets:
+        return {}
+
+    embeddings_by_asset = {
+        asset_id: embedding
+        for asset_id, embedding in db.query(ImageEmbedding.asset_id, ImageEmbedding.embedding).filter(
+            tenant_column_filter(ImageEmbedding, tenant),
+            ImageEmbedding.asset_id.in_([image.asset_id for image in targets]),
+        ).all()
+    }
+
+    missing = {
+        image.id: storage_by_image[image.id].thumbnail_key
+        for image in targets
+        if image.asset_id not in embeddings_by_asset and storage_by_image[image.id].thumbnail_key
+    }
+    if missing:
+        thumbnails = download_blobs(gcs_bucket(tenant.get_thumbnail_bucket(settings)), missing)
+        for image in targets:
+            image_data = thumbnails.get(image.id)
+            if image_data is None:
+                continue
+            record = ensure_image_embedding(
+                db,
+                tenant.id,
+                image.id,
+                image_data,
+                model_name,
+                model_version,
+                asset_id=image.asset_id,
+            )
+            embeddings_by_asset[image.asset_id] = record.embedding
+
+    tags_by_asset = recompute_trained_tags_for_embeddings(
+        db=db,
+        tenant_id=tenant.id,
+        embeddings_by_asset=embeddings_by_asset,
+        keyword_models=keyword_models,
+        keyword_to_category=keyword_to_category,
+        model_name=model_name,
+        model_version=model_version,
+        threshold=settings.trained_tag_threshold,
+    )
+    return {
+        image.id: tags_by_asset[image.asset_id]
+        for image in targets
+        if image.asset_id in tags_by_asset
+    }
+
+
+def _compute_ml_training_stats(db: Session, tenant_id: str) -> dict:
+    """Compute ML training summary stats; runs via run_read_query."""
+    active_tag_type = get_tenant_setting(db, tenant_id, 'active_machine_tag_type', default='siglip')
+
+    # Single pass over image_metadata and embeddings
+    image_count = db.query(func.count(ImageMetadata.id)).filter(
+        tenant_column_filter_for_values(ImageMetadata, tenant_id)
+    ).scalar() or 0
+
+    embedding_count = db.query(func.count(ImageEmbedding.id)).filter(
+        tenant_column_filter_for_values(ImageEmbedding, tenant_id)
+    ).scalar() or 0
+
+    # Two targeted queries on machine_tags - kept separate to use (tenant_id, asset_id, tag_type) index
+    zs_row = db.query(
+        func.count(distinct(MachineTag.asset_id)),
+        func.min(MachineTag.created_at),
+        func.max(MachineTag.created_at),
+    ).filter(
+        tenant_column_filter_for_values(MachineTag, tenant_id),
+        MachineTag.tag_type == active_tag_type,
+        MachineTag.asset_id.is_not(None),
+    ).one()
+
+    tr_row = db.query(
+        func.count(MachineTag.id),
+        func.count(distinct(MachineTag.asset_id)),
+        func.min(MachineTag.created_at),
+        func.max(MachineTag.created_at),
+    ).filter(
+        tenant_column_filter_for_values(MachineTag, tenant_id),
+        MachineTag.tag_type == 'trained',
+        MachineTag.asset_id.is_not(None),
+    ).one()
+
+    zero_shot_image_count = int(zs_row[0] or 0)
+    zero_shot_tag_oldest = zs_row[1]
+    zero_shot_tag_newest = zs_row[2]
+    trained_count = int(tr_row[0] or 0)
+    trained_image_count = int(tr_row[1] or 0)
+    trained_oldest = tr_row[2]
+    trained_newest = tr_row[3]
+
+    # Single pass over keyword_models
+    km_row = db.query(
+        func.count(KeywordModel.id),
+        func.max(func.coalesce(KeywordModel.updated_at, KeywordModel.created_at)),
+    ).filter(
+        tenant_column_filter_for_values(KeywordModel, tenant_id)
+    ).one()
+
+    model_count = int(km_row[0] or 0)
+    last_trained = km_row[1]
+
+    return {
+        "tenant_id": tenant_id,
+        "image_count": int(image_count),
+        "embedding_count": int(embedding_count),
+        "zero_shot_image_count": zero_shot_image_count,
+        "zero_shot_tag_oldest": zero_shot_tag_oldest.isoformat() if zero_shot_tag_oldest else None,
+        "zero_shot_tag_newest": zero_shot_tag_newest.isoformat() if zero_shot_tag_newest else None,
+        "trained_image_count": trained_image_count,
+        "keyword_model_count": model_count,
+        "keyword_model_last_trained": last_trained.isoformat() if last_trained else None,
+        "trained_tag_count": trained_count,
+        "trained_tag_oldest": trained_oldest.isoformat() if trained_oldest else None,
+        "trained_tag_newest": trained_newest.isoformat() if trained_newest else None
+    }
 
 
 @router.get("/ml-training/stats", response_model=dict, operation_id="get_ml_training_stats")
@@ -327,7 +381,4 @@ async def get_ml_training_stats(
     tenant: Tenant = Depends(get_tenant),
 ):
     """Return ML training summary stats for a tenant."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None, _compute_ml_training_stats, tenant.id
-    )
+    return await run_read_query(_compute_ml_training_stats, tenant.id)
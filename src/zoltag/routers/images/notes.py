@@ -11,7 +11,7 @@ from zoltag.metadata import AssetNote, ImageMetadata
 from zoltag.tenant_scope import tenant_column_filter
 from zoltag.auth.dependencies import require_tenant_permission_from_header
 from zoltag.auth.models import UserProfile
-from zoltag.text_index import rebuild_asset_text_index
+from zoltag.text_index import enqueue_asset_text_index_refresh
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -29,7 +29,7 @@ def _resolve_asset_id(image_id: int, tenant: Tenant, db: Session):
 
 
 @router.get("/images/{image_id}/notes/{note_type}", response_model=dict, operation_id="get_asset_note")
-async def get_asset_note(
+def get_asset_note(
     image_id: int,
     note_type: str,
     tenant: Tenant = Depends(get_tenant),
@@ -47,7 +47,7 @@ async def get_asset_note(
 
 
 @router.put("/images/{image_id}/notes/{note_type}", response_model=dict, operation_id="upsert_asset_note")
-async def upsert_asset_note(
+def upsert_asset_note(
     image_id: int,
     note_type: str,
     body: str = Body(..., embed=True),
@@ -74,13 +74,5 @@ async def upsert_asset_note(
         db.add(note)
     db.commit()
     db.refresh(note)
-    try:
-        rebuild_asset_text_index(
-            db,
-            tenant_id=tenant.id,
-            asset_id=asset_id,
-            include_embeddings=False,
-        )
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Failed to refresh asset_text_index for asset %s: %s", asset_id, exc)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=[asset_id])
     return {"id": str(note.id), "asset_id": str(asset_id), "note_type": note.note_type, "body": note.body}
@@ -1,13 +1,14 @@
 """Image people tagging endpoints: tag/untag people on images."""
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Query
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
 from zoltag.dependencies import get_db, get_tenant
+from zoltag.face_index import DEFAULT_FACE_MATCH_TOLERANCE, suggest_people_for_encoding
 from zoltag.tenant import Tenant
-from zoltag.metadata import ImageMetadata, MachineTag, Person
+from zoltag.metadata import DetectedFace, ImageMetadata, MachineTag, Person
 from zoltag.models.config import Keyword
 from zoltag.routers.people import get_or_create_person_keyword
 from zoltag.tenant_scope import assign_tenant_scope, tenant_column_filter
@@ -42,12 +43,26 @@ class ImagePeopleTagsResponse(BaseModel):
     people_tags: List[PersonTagResponse]
 
 
+class PersonSuggestionResponse(BaseModel):
+    """A person whose known faces match a face detected on an image."""
+    person_id: int
+    person_name: str
+    face_id: int
+    distance: float
+
+
+class ImagePeopleSuggestionsResponse(BaseModel):
+    """Response model for face-match people suggestions on an image."""
+    image_id: int
+    suggestions: List[PersonSuggestionResponse]
+
+
 # ============================================================================
 # People Tagging Endpoints
 # ============================================================================
 
 @router.post("/images/{image_id}/people", response_model=PersonTagResponse)
-async def tag_person_on_image(
+def tag_person_on_image(
     image_id: int,
     request: TagPersonRequest,
     tenant: Tenant = Depends(get_tenant),
@@ -128,7 +143,7 @@ async def tag_person_on_image(
 
 
 @router.delete("/images/{image_id}/people/{person_id}")
-async def remove_person_tag(
+def remove_person_tag(
     image_id: int,
     person_id: int,
     tenant: Tenant = Depends(get_tenant),
@@ -190,7 +205,7 @@ async def remove_person_tag(
 
 
 @router.get("/images/{image_id}/people", response_model=ImagePeopleTagsResponse)
-async def get_image_people_tags(
+def get_image_people_tags(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -233,8 +248,84 @@ async def get_image_people_tags(
     )
 
 
+@router.get("/images/{image_id}/people/suggestions", response_model=ImagePeopleSuggestionsResponse)
+def get_image_people_suggestions(
+    image_id: int,
+    tolerance: float = Query(DEFAULT_FACE_MATCH_TOLERANCE, gt=0.0, le=1.0),
+    limit: int = Query(5, ge=1, le=50),
+    tenant: Tenant = Depends(get_tenant),
+    db: Session = Depends(get_db)
+):
+    """Suggest people for the faces detected on an image.
+
+    Each detected face is matched against the tenant's person-assigned faces
+    through the face encoding index; people already tagged are skipped.
+    """
+    image = db.query(ImageMetadata).filter(
+        ImageMetadata.id == image_id,
+        tenant_column_filter(ImageMetadata, tenant)
+    ).first()
+
+    if not image:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    faces = db.query(DetectedFace).filter(
+        DetectedFace.image_id == image.id,
+        tenant_column_filter(DetectedFace, tenant),
+        DetectedFace.face_encoding.isnot(None),
+    ).order_by(DetectedFace.id).all()
+
+    tagged_person_ids = {
+        person_id for (person_id,) in db.query(Keyword.person_id).join(
+            MachineTag, MachineTag.keyword_id == Keyword.id
+        ).filter(
+            MachineTag.asset_id == image.asset_id,
+            MachineTag.tag_type == 'manual_person',
+            tenant_column_filter(MachineTag, tenant),
+            Keyword.person_id.isnot(None),
+        ).all()
+    }
+
+    best_by_person = {}
+    for face in faces:
+        if face.person_id is not None:
+            continue
+        for match in suggest_people_for_encoding(
+            db, tenant.id, face.face_encoding, tolerance=tolerance, limit=limit
+        ):
+            if match.person_id in tagged_person_ids:
+                continue
+            current = best_by_person.get(match.person_id)
+            if current is None or match.distance < current[1].distance:
+                best_by_person[match.person_id] = (face.id, match)
+
+    names = {}
+    if best_by_person:
+        names = dict(db.query(Person.id, Person.name).filter(
+            Person.id.in_(best_by_person.keys()),
+            tenant_column_filter(Person, tenant)
+        ).all())
+
+    suggestions = [
+        PersonSuggestionResponse(
+            person_id=person_id,
+            person_name=names[person_id],
+            face_id=face_id,
+            distance=round(match.distance, 4),
+        )
+        for person_id, (face_id, match) in best_by_person.items()
+        if person_id in names
+    ]
+    suggestions.sort(key=lambda suggestion: (suggestion.distance, suggestion.person_id))
+
+    return ImagePeopleSuggestionsResponse(
+        image_id=image_id,
+        suggestions=suggestions[:limit]
+    )
+
+
 @router.put("/images/{image_id}/people/{person_id}", response_model=PersonTagResponse)
-async def update_person_tag_confidence(
+def update_person_tag_confidence(
     image_id: int,
     person_id: int,
     request: TagPersonRequest = Body(...),
@@ -2,8 +2,10 @@
 
 from datetime import datetime
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Body, Request
+from fastapi import APIRouter, Depends, HTTPException, Body
 from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 import logging
 
@@ -16,31 +18,74 @@ from zoltag.config.db_config import ConfigManager
 from zoltag.config.db_utils import load_keywords_map
 from zoltag.auth.dependencies import require_tenant_permission_from_header
 from zoltag.auth.models import UserProfile
-from zoltag.text_index import rebuild_asset_text_index
-from zoltag.tenant_scope import assign_tenant_scope, tenant_column_filter
+from zoltag.keyword_facets import CHANGES_RECORDED_OPTION, record_keyword_facet_changes
+from zoltag.text_index import enqueue_asset_text_index_refresh
+from zoltag.tenant_scope import assign_tenant_scope, tenant_column_filter, tenant_id_value
 
 # Sub-router with no prefix/tags (inherits from parent)
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-def _refresh_asset_text_index_for_asset(db: Session, tenant: Tenant, asset_id) -> None:
-    if not asset_id:
-        return
-    try:
-        rebuild_asset_text_index(
-            db,
-            tenant_id=tenant.id,
-            asset_id=str(asset_id),
-            include_embeddings=False,
-        )
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Failed to refresh asset_text_index for asset %s: %s", asset_id, exc)
+def _existing_permatag_signums(db: Session, tenant: Tenant, rows: List[dict]) -> dict:
+    """Return {(asset_id, keyword_id): signum} for the permatags ``rows`` would overwrite."""
+    if not rows:
+        return {}
+    return {
+        (asset_id, keyword_id): signum
+        for asset_id, keyword_id, signum in db.query(Permatag.asset_id, Permatag.keyword_id, Permatag.signum).filter(
+            Permatag.asset_id.in_({row["asset_id"] for row in rows}),
+            Permatag.keyword_id.in_({row["keyword_id"] for row in rows}),
+            tenant_column_filter(Permatag, tenant)
+        ).all()
+    }
 
 
-def _refresh_asset_text_index_for_assets(db: Session, tenant: Tenant, asset_ids) -> None:
-    for asset_id in set(asset_ids or []):
-        _refresh_asset_text_index_for_asset(db, tenant, asset_id)
+def _upsert_permatags(db: Session, rows: List[dict], *, overwrite: bool, existing_signums: dict) -> list:
+    """Write permatag rows in one set-based statement keyed on (asset_id, keyword_id).
+
+    Existing pairs get the new signum/created_at/created_by when ``overwrite`` is
+    set and are left untouched otherwise. Returns the (asset_id, keyword_id,
+    signum) rows written. Only keywords whose permatag is new or changes signum
+    against ``existing_signums`` are queued for a facet recount.
+    """
+    if not rows:
+        return []
+    # SQLite (local/test databases) shares PostgreSQL's ON CONFLICT syntax.
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(Permatag)
+    conflict_columns = [Permatag.asset_id, Permatag.keyword_id]
+    if overwrite:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={
+                "signum": stmt.excluded.signum,
+                "created_at": stmt.excluded.created_at,
+                "created_by": stmt.excluded.created_by,
+            },
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+    stmt = stmt.returning(Permatag.tenant_id, Permatag.asset_id, Permatag.keyword_id, Permatag.signum)
+    written = db.execute(stmt, rows, execution_options={CHANGES_RECORDED_OPTION: True}).all()
+    changed_by_tenant = {}
+    for row in written:
+        if existing_signums.get((row.asset_id, row.keyword_id)) != row.signum:
+            changed_by_tenant.setdefault(row.tenant_id, set()).add(row.keyword_id)
+    for tenant_id, keyword_ids in changed_by_tenant.items():
+        record_keyword_facet_changes(db, tenant_id, keyword_ids)
+    return written
+
+
+def _permatag_row(tenant: Tenant, asset_id, keyword_id: int, signum: int, created_by, created_at: datetime) -> dict:
+    return {
+        "asset_id": asset_id,
+        "tenant_id": tenant_id_value(tenant) or tenant.id,
+        "keyword_id": keyword_id,
+        "signum": signum,
+        "created_at": created_at,
+        "created_by": created_by,
+    }
 
 
 def get_keyword_info(db: Session, keyword_id: int) -> dict:
@@ -59,7 +104,7 @@ def get_keyword_info(db: Session, keyword_id: int) -> dict:
 
 
 @router.get("/images/{image_id}/permatags", response_model=dict, operation_id="get_permatags")
-async def get_permatags(
+def get_permatags(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -99,15 +144,14 @@ async def get_permatags(
 
 
 @router.post("/images/{image_id}/permatags", response_model=dict, operation_id="add_permatag")
-async def add_permatag(
+def add_permatag(
     image_id: int,
-    request: Request,
+    body: dict = Body(...),
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(require_tenant_permission_from_header("image.tag"))
 ):
     """Add or update a permatag for an image."""
-    body = await request.json()
     keyword_name = body.get("keyword")
     signum = body.get("signum", 1)
 
@@ -161,7 +205,7 @@ async def add_permatag(
 
     db.commit()
     db.refresh(permatag)
-    _refresh_asset_text_index_for_asset(db, tenant, image.asset_id)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=[image.asset_id])
 
     # Get keyword info for response
     kw_info = get_keyword_info(db, permatag.keyword_id)
@@ -176,7 +220,7 @@ async def add_permatag(
 
 
 @router.post("/images/permatags/bulk", response_model=dict, operation_id="bulk_permatags")
-async def bulk_permatags(
+def bulk_permatags(
     payload: dict = Body(...),
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -232,24 +276,14 @@ async def bulk_permatags(
     ).all()
     keyword_name_to_id = {kw.keyword: kw.id for kw in keywords}
 
-    # Get existing permatags
-    keyword_ids = list(keyword_name_to_id.values())
-    existing_rows = db.query(Permatag).filter(
-        Permatag.asset_id.in_(list(image_id_to_asset_id.values())),
-        Permatag.keyword_id.in_(keyword_ids),
-        tenant_column_filter(Permatag, tenant)
-    ).all()
-    existing_map = {(row.asset_id, row.keyword_id): row for row in existing_rows}
-
-    created = 0
-    updated = 0
-    skipped = 0
     now = datetime.utcnow()
-
+    created_by = current_user.supabase_uid if current_user else None
+    skipped = 0
+    # Last operation wins when the same image/keyword pair appears twice.
+    rows_by_key = {}
     for op in normalized_ops:
         image_id = op["image_id"]
         keyword_name = op["keyword_name"]
-        image_asset_id = image_id_to_asset_id.get(image_id)
 
         if image_id not in valid_image_ids:
             errors.append({"image_id": image_id, "keyword": keyword_name, "error": "image not found"})
@@ -262,31 +296,22 @@ async def bulk_permatags(
             skipped += 1
             continue
 
-        key = (image_asset_id, keyword_id)
-        existing = existing_map.get(key)
-        if existing:
-            existing.signum = op["signum"]
-            existing.created_at = now
-            if current_user:
-                existing.created_by = current_user.supabase_uid
-            if image_asset_id is not None:
-                existing.asset_id = image_asset_id
-            updated += 1
-        else:
-            permatag = assign_tenant_scope(Permatag(
-                asset_id=image_asset_id,
-                keyword_id=keyword_id,
-                signum=op["signum"],
-                created_by=current_user.supabase_uid
-            ), tenant)
-            db.add(permatag)
-            created += 1
+        image_asset_id = image_id_to_asset_id.get(image_id)
+        rows_by_key[(image_asset_id, keyword_id)] = _permatag_row(
+            tenant, image_asset_id, keyword_id, op["signum"], created_by, now
+        )
+
+    rows = list(rows_by_key.values())
+    existing_signums = _existing_permatag_signums(db, tenant, rows)
+    updated = sum(1 for key in rows_by_key if key in existing_signums)
+    created = len(rows_by_key) - updated
+    _upsert_permatags(db, rows, overwrite=True, existing_signums=existing_signums)
 
     db.commit()
-    _refresh_asset_text_index_for_assets(
+    enqueue_asset_text_index_refresh(
         db,
-        tenant,
-        [image_id_to_asset_id.get(op["image_id"]) for op in normalized_ops],
+        tenant_id=tenant.id,
+        asset_ids=[image_id_to_asset_id.get(op["image_id"]) for op in normalized_ops],
     )
 
     return {
@@ -298,7 +323,7 @@ async def bulk_permatags(
 
 
 @router.delete("/images/{image_id}/permatags/{permatag_id}", response_model=dict, operation_id="delete_permatag")
-async def delete_permatag(
+def delete_permatag(
     image_id: int,
     permatag_id: int,
     tenant: Tenant = Depends(get_tenant),
@@ -326,13 +351,13 @@ async def delete_permatag(
 
     db.delete(permatag)
     db.commit()
-    _refresh_asset_text_index_for_asset(db, tenant, image.asset_id)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=[image.asset_id])
 
     return {"success": True}
 
 
 @router.post("/images/{image_id}/permatags/accept-all", response_model=dict, operation_id="accept_all_tags")
-async def accept_all_tags(
+def accept_all_tags(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -349,54 +374,32 @@ async def accept_all_tags(
 
     # Get current machine tags
     active_tag_type = get_tenant_setting(db, tenant.id, 'active_machine_tag_type', default='siglip')
-    current_tags = db.query(MachineTag).filter(
-        MachineTag.asset_id == image.asset_id,
-        tenant_column_filter(MachineTag, tenant),
-        MachineTag.tag_type == active_tag_type
-    ).all()
+    current_keyword_ids = {
+        row[0] for row in db.query(MachineTag.keyword_id).filter(
+            MachineTag.asset_id == image.asset_id,
+            tenant_column_filter(MachineTag, tenant),
+            MachineTag.tag_type == active_tag_type
+        ).distinct().all()
+    }
 
     # Get all keyword IDs from database
-    db_keywords = db.query(Keyword).filter(
-        tenant_column_filter(Keyword, tenant)
-    ).all()
-
-    # Build set of current tag keyword IDs
-    current_keyword_ids = {tag.keyword_id for tag in current_tags}
-
-    # Create set of all keyword IDs from database
-    all_keyword_ids = {kw.id for kw in db_keywords}
-
-    # Delete existing permatags ONLY for keywords in the controlled vocabulary
-    # This preserves manually added permatags for keywords not in the vocabulary
-    db.query(Permatag).filter(
-        Permatag.asset_id == image.asset_id,
-        Permatag.keyword_id.in_(list(all_keyword_ids)),
-        tenant_column_filter(Permatag, tenant)
-    ).delete(synchronize_session=False)
-
-    # Create positive permatags for all current tags
-    for tag in current_tags:
-        permatag = assign_tenant_scope(Permatag(
-            asset_id=image.asset_id,
-            keyword_id=tag.keyword_id,
-            signum=1,
-            created_by=current_user.supabase_uid
-        ), tenant)
-        db.add(permatag)
+    all_keyword_ids = {
+        row[0] for row in db.query(Keyword.id).filter(tenant_column_filter(Keyword, tenant)).all()
+    }
 
-    # Create negative permatags for all keywords NOT in current tags
-    for keyword_id in all_keyword_ids:
-        if keyword_id not in current_keyword_ids:
-            permatag = assign_tenant_scope(Permatag(
-                asset_id=image.asset_id,
-                keyword_id=keyword_id,
-                signum=-1,
-                created_by=current_user.supabase_uid
-            ), tenant)
-            db.add(permatag)
+    # Overwrite permatags for current tags (positive) and every other vocabulary
+    # keyword (negative) in one statement. Manually added permatags for keywords
+    # outside the vocabulary are left alone.
+    now = datetime.utcnow()
+    created_by = current_user.supabase_uid if current_user else None
+    rows = [
+        _permatag_row(tenant, image.asset_id, keyword_id, 1 if keyword_id in current_keyword_ids else -1, created_by, now)
+        for keyword_id in sorted(all_keyword_ids | current_keyword_ids)
+    ]
+    _upsert_permatags(db, rows, overwrite=True, existing_signums=_existing_permatag_signums(db, tenant, rows))
 
     db.commit()
-    _refresh_asset_text_index_for_asset(db, tenant, image.asset_id)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=[image.asset_id])
 
     # Return counts
     positive_count = len(current_keyword_ids)
@@ -410,7 +413,7 @@ async def accept_all_tags(
 
 
 @router.post("/images/{image_id}/permatags/freeze", response_model=dict, operation_id="freeze_permatags")
-async def freeze_permatags(
+def freeze_permatags(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -425,46 +428,40 @@ async def freeze_permatags(
         raise HTTPException(status_code=404, detail="Image not found")
 
     # Get all keyword IDs from database
-    db_keywords = db.query(Keyword).filter(
-        tenant_column_filter(Keyword, tenant)
-    ).all()
-    all_keyword_ids = {kw.id for kw in db_keywords}
+    all_keyword_ids = {
+        row[0] for row in db.query(Keyword.id).filter(tenant_column_filter(Keyword, tenant)).all()
+    }
 
     active_tag_type = get_tenant_setting(db, tenant.id, 'active_machine_tag_type', default='siglip')
-    machine_tags = db.query(MachineTag).filter(
-        MachineTag.asset_id == image.asset_id,
-        tenant_column_filter(MachineTag, tenant),
-        MachineTag.tag_type == active_tag_type
-    ).all()
-    machine_tag_ids = {tag.keyword_id for tag in machine_tags}
+    machine_tag_ids = {
+        row[0] for row in db.query(MachineTag.keyword_id).filter(
+            MachineTag.asset_id == image.asset_id,
+            tenant_column_filter(MachineTag, tenant),
+            MachineTag.tag_type == active_tag_type
+        ).distinct().all()
+    }
 
-    existing_permatags = db.query(Permatag).filter(
-        Permatag.asset_id == image.asset_id,
-        Permatag.keyword_id.in_(list(all_keyword_ids)),
-        tenant_column_filter(Permatag, tenant)
-    ).all()
-    existing_keyword_ids = {p.keyword_id for p in existing_permatags}
+    existing_keyword_ids = {
+        row[0] for row in db.query(Permatag.keyword_id).filter(
+            Permatag.asset_id == image.asset_id,
+            Permatag.keyword_id.in_(list(all_keyword_ids)),
+            tenant_column_filter(Permatag, tenant)
+        ).all()
+    }
 
-    positive_count = 0
-    negative_count = 0
-    for keyword_id in all_keyword_ids:
-        if keyword_id in existing_keyword_ids:
-            continue
-        signum = 1 if keyword_id in machine_tag_ids else -1
-        permatag = assign_tenant_scope(Permatag(
-            asset_id=image.asset_id,
-            keyword_id=keyword_id,
-            signum=signum,
-            created_by=current_user.supabase_uid
-        ), tenant)
-        db.add(permatag)
-        if signum == 1:
-            positive_count += 1
-        else:
-            negative_count += 1
+    now = datetime.utcnow()
+    created_by = current_user.supabase_uid if current_user else None
+    rows = [
+        _permatag_row(tenant, image.asset_id, keyword_id, 1 if keyword_id in machine_tag_ids else -1, created_by, now)
+        for keyword_id in sorted(all_keyword_ids - existing_keyword_ids)
+    ]
+    # DO NOTHING keeps permatags that were added concurrently.
+    written = _upsert_permatags(db, rows, overwrite=False, existing_signums={})
+    positive_count = sum(1 for row in written if row.signum == 1)
+    negative_count = len(written) - positive_count
 
     db.commit()
-    _refresh_asset_text_index_for_asset(db, tenant, image.asset_id)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=[image.asset_id])
 
     return {
         "success": True,
@@ -7,12 +7,17 @@ Provides a unified interface for:
 - Applying subquery filters
 - Building order clauses
 - ML score ordering
-- Pagination
+- Pagination (offset and keyset cursors)
 - Total count calculation
 """
 
-from typing import Optional, List, Union, Tuple
-from sqlalchemy import func, select
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, List, Union, Tuple
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session, Query
 from sqlalchemy.sql import Selectable
 
@@ -23,6 +28,85 @@ from zoltag.dependencies import get_tenant_setting
 from zoltag.tenant_scope import tenant_column_filter
 
 
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a keyset ordering, with explicit direction and NULL placement."""
+
+    expr: Any
+    descending: bool
+    nulls_last: bool
+
+    def order_clause(self):
+        clause = self.expr.desc() if self.descending else self.expr.asc()
+        return clause.nullslast() if self.nulls_last else clause.nullsfirst()
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(ordering: str, values: List[Any]) -> str:
+    """Encode the sort-key values of the last row on a page as an opaque cursor."""
+    payload = {"o": ordering, "k": [_encode_cursor_value(value) for value in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, ordering: str, key_count: int) -> List[Any]:
+    """Decode a cursor produced by ``encode_cursor`` for the same ordering.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another ordering.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = [_decode_cursor_value(value) for value in payload["k"]]
+        cursor_ordering = payload["o"]
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if cursor_ordering != ordering or len(values) != key_count:
+        raise ValueError("Cursor does not match the requested ordering")
+    return values
+
+
+def build_seek_predicate(sort_keys: List[SortKey], values: List[Any], inclusive: bool = False):
+    """Build the WHERE clause selecting rows after ``values`` in ``sort_keys`` order.
+
+    Expands the lexicographic row comparison key by key so that mixed
+    directions and NULL placement behave exactly like the ORDER BY. With
+    ``inclusive`` the row matching ``values`` itself is kept (anchor jumps).
+    """
+    def after(key: SortKey, value: Any):
+        if value is None:
+            # Nothing sorts after NULL when NULLs are last; everything non-NULL does when first.
+            return None if key.nulls_last else key.expr.is_not(None)
+        beyond = key.expr < value if key.descending else key.expr > value
+        return or_(beyond, key.expr.is_(None)) if key.nulls_last else beyond
+
+    def equal(key: SortKey, value: Any):
+        return key.expr.is_(None) if value is None else key.expr == value
+
+    branches = []
+    prefix = []
+    for index, (key, value) in enumerate(zip(sort_keys, values, strict=True)):
+        condition = after(key, value)
+        if condition is not None:
+            branches.append(and_(*prefix, condition))
+        prefix.append(equal(key, value))
+        if inclusive and index == len(sort_keys) - 1:
+            branches.append(and_(*prefix))
+    return or_(*branches) if branches else False
+
+
 class QueryBuilder:
     """Encapsulates common query construction patterns for list_images endpoint.
 
@@ -87,22 +171,21 @@ class QueryBuilder:
             query = query.filter(~ImageMetadata.id.in_(select(subquery.c.id)))
         return query
 
-    def build_order_clauses(self, ml_keyword_id: Optional[int] = None) -> Tuple:
-        """Build order by clauses based on date_order and order_by settings.
+    def build_sort_keys(self, ml_scores_subquery: Optional[Selectable] = None) -> List[SortKey]:
+        """Build the keyset ordering for the current order_by/date_order settings.
 
-        This consolidates the order clause construction logic that was duplicated
-        4 times in list_images:
-        - Lines 117-120 (initial setup)
-        - Line 261 (keyword OR path)
-        - Line 333 (keyword AND path)
-        - Line 367 (no filters path)
+        Every ordering ends with the image id so keys are unique and cursors
+        are stable. Date keys keep Postgres' default NULL placement (first
+        when descending, last when ascending); rating and ML score put NULLs last.
 
         Args:
-            ml_keyword_id: Optional keyword ID for ML score ordering (unused in this method)
+            ml_scores_subquery: Subquery from ``apply_ml_score_ordering``; when
+                given, rows are ordered by ML score first.
 
         Returns:
-            Tuple of SQLAlchemy order clauses to apply to query
+            List of SortKey in ORDER BY order
         """
+        descending = self.date_order == "desc"
         if self.order_by == "processed":
             order_by_date = func.coalesce(
                 ImageMetadata.last_processed,
@@ -117,28 +200,82 @@ class QueryBuilder:
                 ImageMetadata.modified_time
             )
 
-        # Apply date sort direction
-        if self.date_order == "desc":
-            order_by_date = order_by_date.desc()
-        else:
-            order_by_date = order_by_date.asc()
+        date_key = SortKey(order_by_date, descending, nulls_last=not descending)
+        id_key = SortKey(ImageMetadata.id, descending, nulls_last=True)
 
-        # Build ID clause
-        id_order = (
-            ImageMetadata.id.desc()
-            if self.date_order == "desc"
-            else ImageMetadata.id.asc()
-        )
-
-        # Return tuple of order clauses based on order_by strategy
+        if ml_scores_subquery is not None:
+            return [SortKey(ml_scores_subquery.c.ml_score, True, nulls_last=True), date_key, id_key]
         if self.order_by == "image_id":
-            return (id_order,)
+            return [id_key]
         if self.order_by == "rating":
-            rating_order = ImageMetadata.rating.desc() if self.date_order == "desc" else ImageMetadata.rating.asc()
-            rating_order = rating_order.nullslast()
-            return (rating_order, order_by_date, id_order)
+            return [SortKey(ImageMetadata.rating, descending, nulls_last=True), date_key, id_key]
         # Default: date then id
-        return (order_by_date, id_order)
+        return [date_key, id_key]
+
+    def build_order_clauses(self, ml_keyword_id: Optional[int] = None) -> Tuple:
+        """Build order by clauses based on date_order and order_by settings.
+
+        Args:
+            ml_keyword_id: Optional keyword ID for ML score ordering (unused in this method)
+
+        Returns:
+            Tuple of SQLAlchemy order clauses to apply to query
+        """
+        return tuple(key.order_clause() for key in self.build_sort_keys())
+
+    def cursor_ordering(self, ml_keyword_id: Optional[int] = None, ml_tag_type: Optional[str] = None) -> str:
+        """Identify the ordering a cursor belongs to, so it is not replayed against another."""
+        ordering = f"{self.order_by or 'photo_creation'}:{self.date_order}"
+        if ml_keyword_id is not None:
+            ordering += f":ml={ml_keyword_id}:{ml_tag_type or ''}"
+        return ordering
+
+    def fetch_keyset_page(
+        self,
+        query: Query,
+        sort_keys: List[SortKey],
+        limit: Optional[int],
+        offset: int = 0,
+        after: Optional[List[Any]] = None,
+        anchor_id: Optional[int] = None,
+    ) -> Tuple[List, Optional[List[Any]], bool]:
+        """Fetch one page using seek predicates instead of OFFSET.
+
+        Args:
+            query: Filtered ImageMetadata query (any existing ORDER BY is replaced)
+            sort_keys: Ordering from ``build_sort_keys``
+            limit: Page size (None returns all remaining rows)
+            offset: Legacy OFFSET, only used when neither ``after`` nor an anchor applies
+            after: Decoded cursor values; the page starts after that row
+            anchor_id: Start the page at this image instead (when it matches the filters)
+
+        Returns:
+            Tuple of (rows, next_cursor_values, anchor_found). ``next_cursor_values``
+            is None on the last page.
+        """
+        anchor_found = False
+        if anchor_id is not None:
+            anchor_values = query.order_by(None).filter(
+                ImageMetadata.id == anchor_id
+            ).with_entities(*[key.expr for key in sort_keys]).first()
+            if anchor_values is not None:
+                anchor_found = True
+                query = query.filter(build_seek_predicate(sort_keys, list(anchor_values), inclusive=True))
+        if not anchor_found and after is not None:
+            query = query.filter(build_seek_predicate(sort_keys, after))
+
+        query = query.order_by(None).order_by(
+            *[key.order_clause() for key in sort_keys]
+        ).add_columns(*[key.expr for key in sort_keys])
+        if not anchor_found and after is None and offset:
+            query = query.offset(offset)
+        rows = query.limit(limit + 1).all() if limit else query.all()
+        has_more = bool(limit) and len(rows) > limit
+        if has_more:
+            rows = rows[:limit]
+        key_count = len(sort_keys)
+        next_values = list(rows[-1][-key_count:]) if has_more and rows else None
+        return [row[0] for row in rows], next_values, anchor_found
 
     def apply_ml_score_ordering(
         self,
@@ -14,7 +14,7 @@ router = APIRouter()
 
 
 @router.patch("/images/{image_id}/rating", response_model=dict, operation_id="update_image_rating")
-async def update_image_rating(
+def update_image_rating(
     image_id: int,
     rating: int = Body(..., embed=True),
     tenant: Tenant = Depends(get_tenant),
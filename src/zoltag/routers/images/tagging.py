@@ -61,7 +61,7 @@ def _resolve_storage_or_409(
 
 
 @router.post("/images/upload", response_model=dict, operation_id="upload_images")
-async def upload_images(
+def upload_images(
     files: List[UploadFile] = File(...),
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -83,7 +83,7 @@ async def upload_images(
                 continue
 
             # Read file data
-            image_data = await file.read()
+            image_data = file.file.read()
 
             # Extract lightweight preview thumbnail for results display
             features = processor.extract_features(image_data)
@@ -153,7 +153,7 @@ async def upload_images(
 
 
 @router.post("/images/upload-and-ingest", response_model=dict, operation_id="upload_and_ingest_image")
-async def upload_and_ingest_image(
+def upload_and_ingest_image(
     file: UploadFile = File(...),
     dedup_policy: str = Query("keep_both", description="Dedup policy: keep_both or skip_duplicate"),
     tenant: Tenant = Depends(get_tenant),
@@ -176,7 +176,7 @@ async def upload_and_ingest_image(
     if not processor.is_supported(filename):
         raise HTTPException(status_code=400, detail="Unsupported file format.")
 
-    file_bytes = await file.read()
+    file_bytes = file.file.read()
     if not file_bytes:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
     if len(file_bytes) > PHASE1_MAX_UPLOAD_BYTES:
@@ -352,7 +352,7 @@ async def upload_and_ingest_image(
 
 
 @router.get("/images/{image_id}/analyze", response_model=dict, operation_id="analyze_image_keywords")
-async def analyze_image_keywords(
+def analyze_image_keywords(
     image_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -431,7 +431,7 @@ async def analyze_image_keywords(
 
 
 @router.post("/images/{image_id}/retag", response_model=dict, operation_id="retag_single_image")
-async def retag_single_image(
+def retag_single_image(
     image_id: int,
     model: str = Query(None),
     tenant: Tenant = Depends(get_tenant),
@@ -542,7 +542,7 @@ async def retag_single_image(
 
 
 @router.post("/retag", response_model=dict, operation_id="retag_all_images")
-async def retag_all_images(
+def retag_all_images(
     model: str = Query(None),
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
@@ -20,7 +21,9 @@ from zoltag.cli.introspection import (
 )
 from zoltag.database import get_db
 from zoltag.dependencies import get_tenant
+from zoltag.job_notify import publish_job_wakeup
 from zoltag.metadata import (
+    DEFAULT_JOB_QUEUE,
     Job,
     JobAttempt,
     JobDefinition,
@@ -35,15 +38,16 @@ from zoltag.tenant_scope import tenant_column_filter
 from zoltag.workflow_queue import (
     cancel_workflow_run,
     handle_workflow_job_state_change,
+    lock_workflow_run_for_job,
     mark_workflow_step_running,
     parse_workflow_source_ref,
-    reconcile_running_workflows,
     start_workflow_run,
     validate_workflow_steps,
 )
 
 router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
 
+_QUEUE_NAME_PATTERN = re.compile(r"[a-z0-9][a-z0-9._-]{0,63}")
 _VALID_JOB_STATUSES = {"queued", "running", "succeeded", "failed", "canceled", "dead_letter"}
 _VALID_JOB_SOURCES = {"manual", "event", "schedule", "system"}
 _VALID_ATTEMPT_STATUSES = {"running", "succeeded", "failed", "timeout", "canceled"}
@@ -87,6 +91,7 @@ def _serialize_job(job: Job) -> dict:
         "source": job.source,
         "source_ref": job.source_ref,
         "status": job.status,
+        "queue": job.queue,
         "priority": job.priority,
         "payload": job.payload or {},
         "dedupe_key": job.dedupe_key,
@@ -132,6 +137,7 @@ def _serialize_definition(definition: JobDefinition) -> dict:
         "cli_command": cli_command,
         "timeout_seconds": definition.timeout_seconds,
         "max_attempts": definition.max_attempts,
+        "queue": definition.queue,
         "is_active": definition.is_active,
         "created_at": definition.created_at,
         "updated_at": definition.updated_at,
@@ -236,6 +242,18 @@ def _parse_iso_datetime(value) -> datetime | None:
     return parsed
 
 
+def _normalize_queue_name(value, *, default: str = DEFAULT_JOB_QUEUE) -> str:
+    queue = str(value or "").strip().lower()
+    if not queue:
+        return default
+    if not _QUEUE_NAME_PATTERN.fullmatch(queue):
+        raise HTTPException(
+            status_code=400,
+            detail="queue must be 1-64 characters of a-z, 0-9, '.', '_' or '-'",
+        )
+    return queue
+
+
 def _to_int(value, *, default: int, minimum: int | None = None, maximum: int | None = None, field_name: str = "value") -> int:
     if value is None:
         result = default
@@ -294,6 +312,16 @@ def _job_or_404(db: Session, tenant: Tenant, job_id: str) -> Job:
     return job
 
 
+def _lock_job_for_state_change(db: Session, job: Job) -> Job:
+    """Lock the job's workflow run, then the job row, and re-read the job.
+
+    Same run -> job order as the worker's finalize path and reconciliation.
+    """
+    lock_workflow_run_for_job(db, source_ref=job.source_ref)
+    db.refresh(job, with_for_update=True)
+    return job
+
+
 def _workflow_run_or_404(db: Session, tenant: Tenant, run_id: str) -> WorkflowRun:
     parsed_run_id = _parse_uuid_or_400(run_id)
     run = (
@@ -315,7 +343,7 @@ def _workflow_run_or_404(db: Session, tenant: Tenant, run_id: str) -> WorkflowRu
 
 
 @router.get("/definitions")
-async def list_job_definitions(
+def list_job_definitions(
     include_inactive: bool = Query(default=False),
     _super_admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db),
@@ -329,7 +357,7 @@ async def list_job_definitions(
 
 
 @router.get("/catalog")
-async def list_job_catalog(
+def list_job_catalog(
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.jobs.enqueue")),
     db: Session = Depends(get_db),
@@ -349,7 +377,7 @@ async def list_job_catalog(
 
 
 @router.post("/definitions")
-async def create_job_definition(
+def create_job_definition(
     body: dict = Body(default_factory=dict),
     _super_admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db),
@@ -363,6 +391,7 @@ async def create_job_definition(
     arg_schema = build_payload_schema_for_command(key) or {}
     timeout_seconds = _to_int((body or {}).get("timeout_seconds"), default=3600, minimum=1, maximum=86400, field_name="timeout_seconds")
     max_attempts = _to_int((body or {}).get("max_attempts"), default=3, minimum=1, maximum=100, field_name="max_attempts")
+    queue = _normalize_queue_name((body or {}).get("queue"))
     is_active = bool((body or {}).get("is_active", True))
 
     row = JobDefinition(
@@ -371,6 +400,7 @@ async def create_job_definition(
         arg_schema=arg_schema,
         timeout_seconds=timeout_seconds,
         max_attempts=max_attempts,
+        queue=queue,
         is_active=is_active,
     )
     db.add(row)
@@ -384,7 +414,7 @@ async def create_job_definition(
 
 
 @router.patch("/definitions/{definition_id}")
-async def update_job_definition(
+def update_job_definition(
     definition_id: str,
     body: dict = Body(default_factory=dict),
     _super_admin: UserProfile = Depends(require_super_admin),
@@ -409,6 +439,8 @@ async def update_job_definition(
         row.timeout_seconds = _to_int((body or {}).get("timeout_seconds"), default=row.timeout_seconds, minimum=1, maximum=86400, field_name="timeout_seconds")
     if "max_attempts" in (body or {}):
         row.max_attempts = _to_int((body or {}).get("max_attempts"), default=row.max_attempts, minimum=1, maximum=100, field_name="max_attempts")
+    if "queue" in (body or {}):
+        row.queue = _normalize_queue_name((body or {}).get("queue"))
     if "is_active" in (body or {}):
         row.is_active = bool((body or {}).get("is_active"))
     row.updated_at = _now_utc()
@@ -422,7 +454,7 @@ async def update_job_definition(
 
 
 @router.delete("/definitions/{definition_id}")
-async def delete_job_definition(
+def delete_job_definition(
     definition_id: str,
     _super_admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db),
@@ -470,7 +502,7 @@ async def delete_job_definition(
 
 
 @router.post("")
-async def enqueue_job(
+def enqueue_job(
     body: dict = Body(default_factory=dict),
     tenant: Tenant = Depends(get_tenant),
     admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.jobs.enqueue")),
@@ -509,12 +541,14 @@ async def enqueue_job(
     scheduled_for = _parse_iso_datetime((body or {}).get("scheduled_for")) or _now_utc()
     dedupe_key = str((body or {}).get("dedupe_key") or "").strip() or None
     correlation_id = str((body or {}).get("correlation_id") or "").strip() or None
+    queue = _normalize_queue_name((body or {}).get("queue"), default=str(definition.queue or DEFAULT_JOB_QUEUE))
 
     job = Job(
         tenant_id=UUID(str(tenant.id)),
         definition_id=definition.id,
         source="manual",
         status="queued",
+        queue=queue,
         priority=priority,
         payload=payload,
         dedupe_key=dedupe_key,
@@ -526,6 +560,8 @@ async def enqueue_job(
     )
     db.add(job)
     try:
+        db.flush()
+        publish_job_wakeup(db, reason=str(tenant.id))
         db.commit()
     except IntegrityError:
         db.rollback()
@@ -536,7 +572,7 @@ async def enqueue_job(
 
 
 @router.get("/triggers")
-async def list_job_triggers(
+def list_job_triggers(
     include_disabled: bool = Query(default=False),
     _super_admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db),
@@ -552,7 +588,7 @@ async def list_job_triggers(
 
 
 @router.post("/triggers")
-async def create_job_trigger(
+def create_job_trigger(
     body: dict = Body(default_factory=dict),
     admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db),
@@ -629,7 +665,7 @@ async def create_job_trigger(
 
 
 @router.patch("/triggers/{trigger_id}")
-async def update_job_trigger(
+def update_job_trigger(
     trigger_id: str,
     body: dict = Body(default_factory=dict),
     _admin: UserProfile = Depends(require_super_admin),
@@ -708,7 +744,7 @@ async def update_job_trigger(
 
 
 @router.delete("/triggers/{trigger_id}")
-async def delete_job_trigger(
+def delete_job_trigger(
     trigger_id: str,
     _admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db),
@@ -727,7 +763,7 @@ async def delete_job_trigger(
 
 
 @router.get("/workflows")
-async def list_workflow_definitions(
+def list_workflow_definitions(
     include_inactive: bool = Query(default=False),
     _super_admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db),
@@ -741,7 +777,7 @@ async def list_workflow_definitions(
 
 
 @router.post("/workflows")
-async def create_workflow_definition(
+def create_workflow_definition(
     body: dict = Body(default_factory=dict),
     _super_admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db),
@@ -785,7 +821,7 @@ async def create_workflow_definition(
 
 
 @router.patch("/workflows/{workflow_id}")
-async def update_workflow_definition(
+def update_workflow_definition(
     workflow_id: str,
     body: dict = Body(default_factory=dict),
     _super_admin: UserProfile = Depends(require_super_admin),
@@ -836,7 +872,7 @@ async def update_workflow_definition(
 
 
 @router.delete("/workflows/{workflow_id}")
-async def delete_workflow_definition(
+def delete_workflow_definition(
     workflow_id: str,
     _super_admin: UserProfile = Depends(require_super_admin),
     db: Session = Depends(get_db),
@@ -865,7 +901,7 @@ async def delete_workflow_definition(
 
 
 @router.get("/workflows/catalog")
-async def list_workflow_catalog(
+def list_workflow_catalog(
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.jobs.enqueue")),
     db: Session = Depends(get_db),
@@ -882,7 +918,7 @@ async def list_workflow_catalog(
 
 
 @router.post("/workflows/runs")
-async def enqueue_workflow_run(
+def enqueue_workflow_run(
     body: dict = Body(default_factory=dict),
     tenant: Tenant = Depends(get_tenant),
     admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.jobs.enqueue")),
@@ -932,7 +968,7 @@ async def enqueue_workflow_run(
 
 
 @router.get("/workflows/runs")
-async def list_workflow_runs(
+def list_workflow_runs(
     status: str | None = Query(default=None),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
@@ -942,12 +978,6 @@ async def list_workflow_runs(
     db: Session = Depends(get_db),
 ):
     """List workflow runs for tenant."""
-    try:
-        reconcile_running_workflows(db, limit_runs=200)
-        db.commit()
-    except Exception:
-        db.rollback()
-
     status_value = str(status or "").strip().lower() or None
     if status_value and status_value not in _VALID_WORKFLOW_STATUSES:
         raise HTTPException(status_code=400, detail="Invalid workflow status filter")
@@ -975,25 +1005,19 @@ async def list_workflow_runs(
 
 
 @router.get("/workflows/runs/{run_id}")
-async def get_workflow_run(
+def get_workflow_run(
     run_id: str,
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.jobs.view")),
     db: Session = Depends(get_db),
 ):
     """Fetch one workflow run with step state."""
-    try:
-        reconcile_running_workflows(db, limit_runs=200)
-        db.commit()
-    except Exception:
-        db.rollback()
-
     run = _workflow_run_or_404(db, tenant, run_id)
     return _serialize_workflow_run(run, include_steps=True)
 
 
 @router.post("/workflows/runs/{run_id}/cancel")
-async def cancel_workflow_run_endpoint(
+def cancel_workflow_run_endpoint(
     run_id: str,
     body: dict = Body(default_factory=dict),
     tenant: Tenant = Depends(get_tenant),
@@ -1019,7 +1043,7 @@ async def cancel_workflow_run_endpoint(
 
 
 @router.delete("/workflows/runs/{run_id}")
-async def delete_workflow_run(
+def delete_workflow_run(
     run_id: str,
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.jobs.manage")),
@@ -1041,7 +1065,7 @@ async def delete_workflow_run(
 
 
 @router.post("/{job_id}/cancel")
-async def cancel_job(
+def cancel_job(
     job_id: str,
     body: dict = Body(default_factory=dict),
     tenant: Tenant = Depends(get_tenant),
@@ -1049,7 +1073,7 @@ async def cancel_job(
     db: Session = Depends(get_db),
 ):
     """Cancel a queued/running job."""
-    job = _job_or_404(db, tenant, job_id)
+    job = _lock_job_for_state_change(db, _job_or_404(db, tenant, job_id))
     if job.status in {"succeeded", "failed", "dead_letter", "canceled"}:
         return {
             "job": _serialize_job(job),
@@ -1082,7 +1106,7 @@ async def cancel_job(
 
 
 @router.delete("/{job_id}")
-async def delete_job(
+def delete_job(
     job_id: str,
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.jobs.manage")),
@@ -1108,7 +1132,7 @@ async def delete_job(
 
 
 @router.post("/{job_id}/retry")
-async def retry_job(
+def retry_job(
     job_id: str,
     body: dict = Body(default_factory=dict),
     tenant: Tenant = Depends(get_tenant),
@@ -1146,6 +1170,7 @@ async def retry_job(
         source="manual",
         source_ref=f"retry:{source_job.id}",
         status="queued",
+        queue=str(source_job.queue or definition.queue or DEFAULT_JOB_QUEUE),
         priority=priority,
         payload=payload,
         dedupe_key=dedupe_key,
@@ -1157,6 +1182,8 @@ async def retry_job(
     )
     db.add(retry_job)
     try:
+        db.flush()
+        publish_job_wakeup(db, reason=str(source_job.tenant_id))
         db.commit()
     except IntegrityError:
         db.rollback()
@@ -1170,7 +1197,7 @@ async def retry_job(
 
 
 @router.post("/worker/claim")
-async def worker_claim_jobs(
+def worker_claim_jobs(
     body: dict = Body(default_factory=dict),
     tenant: Tenant = Depends(get_tenant),
     _super_admin: UserProfile = Depends(require_super_admin),
@@ -1195,13 +1222,16 @@ async def worker_claim_jobs(
         raise HTTPException(status_code=400, detail="metadata must be an object")
 
     now = _now_utc()
-    claimed_jobs = db.query(Job).options(joinedload(Job.definition)).filter(
+    claim_query = db.query(Job).options(joinedload(Job.definition)).filter(
         tenant_column_filter(Job, tenant),
         Job.status == "queued",
         Job.scheduled_for <= now,
-    ).order_by(
+    )
+    if queues:
+        claim_query = claim_query.filter(Job.queue.in_(queues))
+    claimed_jobs = claim_query.order_by(
         Job.priority.asc(),
-        Job.queued_at.asc(),
+        Job.scheduled_for.asc(),
         Job.id.asc(),
     ).with_for_update(skip_locked=True).limit(batch_size).all()
 
@@ -1243,7 +1273,7 @@ async def worker_claim_jobs(
 
 
 @router.post("/worker/{job_id}/heartbeat")
-async def worker_heartbeat(
+def worker_heartbeat(
     job_id: str,
     body: dict = Body(default_factory=dict),
     tenant: Tenant = Depends(get_tenant),
@@ -1283,7 +1313,7 @@ async def worker_heartbeat(
 
 
 @router.post("/worker/{job_id}/complete")
-async def worker_complete_job(
+def worker_complete_job(
     job_id: str,
     body: dict = Body(default_factory=dict),
     tenant: Tenant = Depends(get_tenant),
@@ -1298,7 +1328,7 @@ async def worker_complete_job(
     stdout_tail = str((body or {}).get("stdout_tail") or "")[:20000] or None
     stderr_tail = str((body or {}).get("stderr_tail") or "")[:20000] or None
 
-    job = _job_or_404(db, tenant, job_id)
+    job = _lock_job_for_state_change(db, _job_or_404(db, tenant, job_id))
     if job.status != "running":
         raise HTTPException(status_code=409, detail="Job is not running")
     if (job.claimed_by_worker or "").strip() != worker_id:
@@ -1339,7 +1369,7 @@ async def worker_complete_job(
 
 
 @router.post("/worker/{job_id}/fail")
-async def worker_fail_job(
+def worker_fail_job(
     job_id: str,
     body: dict = Body(default_factory=dict),
     tenant: Tenant = Depends(get_tenant),
@@ -1361,7 +1391,7 @@ async def worker_fail_job(
     stderr_tail = str((body or {}).get("stderr_tail") or "")[:20000] or None
     error_text = str((body or {}).get("error_text") or "").strip() or "Job execution failed"
 
-    job = _job_or_404(db, tenant, job_id)
+    job = _lock_job_for_state_change(db, _job_or_404(db, tenant, job_id))
     if job.status != "running":
         raise HTTPException(status_code=409, detail="Job is not running")
     if (job.claimed_by_worker or "").strip() != worker_id:
@@ -1420,9 +1450,10 @@ async def worker_fail_job(
 
 
 @router.get("")
-async def list_jobs(
+def list_jobs(
     status: str | None = Query(default=None),
     source: str | None = Query(default=None),
+    queue: str | None = Query(default=None),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
     created_after: datetime | None = Query(default=None),
@@ -1446,6 +1477,8 @@ async def list_jobs(
         query = query.filter(Job.status == status_value)
     if source_value:
         query = query.filter(Job.source == source_value)
+    if queue and queue.strip():
+        query = query.filter(Job.queue == queue.strip().lower())
     if created_after:
         query = query.filter(Job.queued_at >= created_after)
     if created_before:
@@ -1464,7 +1497,7 @@ async def list_jobs(
 
 
 @router.get("/summary")
-async def get_jobs_summary(
+def get_jobs_summary(
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.jobs.view")),
     db: Session = Depends(get_db),
@@ -1504,7 +1537,7 @@ async def get_jobs_summary(
 
 
 @router.get("/{job_id}")
-async def get_job(
+def get_job(
     job_id: str,
     tenant: Tenant = Depends(get_tenant),
     _admin: UserProfile = Depends(require_tenant_permission_from_header("tenant.jobs.view")),
@@ -1516,7 +1549,7 @@ async def get_job(
 
 
 @router.get("/{job_id}/attempts")
-async def get_job_attempts(
+def get_job_attempts(
     job_id: str,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
@@ -5,13 +5,23 @@ from sqlalchemy import func, distinct
 from sqlalchemy.orm import Session
 from typing import Optional
 
-from zoltag.dependencies import get_db, get_tenant, get_tenant_setting
+from zoltag.database import run_read_query
+from zoltag.dependencies import get_tenant, get_tenant_setting
 from zoltag.auth.dependencies import get_current_user
 from zoltag.auth.models import UserProfile
 from zoltag.list_visibility import can_view_list, is_tenant_admin_user
 from zoltag.config.db_config import ConfigManager
+from zoltag.keyword_facets import (
+    SOURCE_CURRENT,
+    SOURCE_KEYWORD_MODEL,
+    SOURCE_PERMATAGS,
+    SOURCE_STATS_PERMATAGS,
+    SOURCE_ZERO_SHOT,
+    latest_keyword_model_name,
+    load_keyword_facet_counts,
+)
 from zoltag.tenant import Tenant
-from zoltag.metadata import ImageMetadata, Permatag, KeywordModel, MachineTag
+from zoltag.metadata import ImageMetadata, Permatag, MachineTag
 from zoltag.models.config import PhotoList, PhotoListItem, Keyword, KeywordCategory
 from zoltag.tenant_scope import tenant_column_filter
 
@@ -25,7 +35,6 @@ router = APIRouter(
 async def get_available_keywords(
     tenant: Tenant = Depends(get_tenant),
     current_user: UserProfile = Depends(get_current_user),
-    db: Session = Depends(get_db),
     list_id: Optional[int] = None,
     rating: Optional[int] = None,
     rating_operator: str = "eq",
@@ -38,6 +47,33 @@ async def get_available_keywords(
 
     Counts reflect active filters (list, rating) so dropdown matches actual results.
     """
+    return await run_read_query(
+        _load_available_keywords,
+        tenant,
+        current_user,
+        list_id=list_id,
+        rating=rating,
+        rating_operator=rating_operator,
+        hide_zero_rating=hide_zero_rating,
+        reviewed=reviewed,
+        source=source,
+        include_people=include_people,
+    )
+
+
+def _load_available_keywords(
+    db: Session,
+    tenant: Tenant,
+    current_user: UserProfile,
+    *,
+    list_id: Optional[int],
+    rating: Optional[int],
+    rating_operator: str,
+    hide_zero_rating: bool,
+    reviewed: Optional[bool],
+    source: Optional[str],
+    include_people: bool,
+) -> dict:
     config_mgr = ConfigManager(db, tenant.id)
     all_keywords = config_mgr.get_all_keywords(include_people=include_people)
 
@@ -81,11 +117,79 @@ async def get_available_keywords(
         else:
             image_assets_query = image_assets_query.filter(ImageMetadata.asset_id.notin_(reviewed_subq))
 
-    image_assets_subq = image_assets_query.subquery()
-
     source_mode = (source or "current").lower()
     active_tag_type = get_tenant_setting(db, tenant.id, 'active_machine_tag_type', default='siglip')
 
+    counts_dict = None
+    unfiltered = list_id is None and rating is None and not hide_zero_rating and reviewed is None
+    if unfiltered:
+        counts_dict = _load_materialized_keyword_counts(
+            db,
+            tenant,
+            SOURCE_PERMATAGS if source_mode == "permatags" else SOURCE_CURRENT,
+            active_tag_type,
+        )
+    if counts_dict is None:
+        counts_dict = _count_keywords_live(db, tenant, image_assets_query, source_mode, active_tag_type)
+
+    # Group by category with counts
+    by_category = {}
+    for kw in all_keywords:
+        cat = kw['category']
+        keyword = kw['keyword']
+        if cat not in by_category:
+            by_category[cat] = []
+        by_category[cat].append({
+            'keyword': keyword,
+            'count': counts_dict.get(keyword, 0)
+        })
+
+    return {
+        "tenant_id": tenant.id,
+        "keywords_by_category": by_category,
+        "all_keywords": [kw['keyword'] for kw in all_keywords]
+    }
+
+
+def _load_materialized_keyword_counts(
+    db: Session,
+    tenant: Tenant,
+    facet_source: str,
+    active_tag_type: str,
+) -> Optional[dict]:
+    """Return {keyword: count} from keyword_facet_counts, or None to count live."""
+    materialized = load_keyword_facet_counts(
+        db,
+        tenant.id,
+        [facet_source],
+        active_tag_type=active_tag_type,
+    )
+    if materialized is None:
+        return None
+    counts_by_id = materialized[facet_source]
+    if not counts_by_id:
+        return {}
+    keyword_rows = db.query(Keyword.id, Keyword.keyword).join(
+        KeywordCategory, Keyword.category_id == KeywordCategory.id
+    ).filter(
+        tenant_column_filter(Keyword, tenant)
+    ).all()
+    return {
+        keyword: counts_by_id[keyword_id]
+        for keyword_id, keyword in keyword_rows
+        if keyword_id in counts_by_id
+    }
+
+
+def _count_keywords_live(
+    db: Session,
+    tenant: Tenant,
+    image_assets_query,
+    source_mode: str,
+    active_tag_type: str,
+) -> dict:
+    image_assets_subq = image_assets_query.subquery()
+
     counts_query = None
     if source_mode == "permatags":
         counts_query = db.query(
@@ -150,32 +254,18 @@ async def get_available_keywords(
     if counts_query is not None:
         for keyword, category, count in counts_query.all():
             counts_dict[keyword] = count
-
-    # Group by category with counts
-    by_category = {}
-    for kw in all_keywords:
-        cat = kw['category']
-        keyword = kw['keyword']
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append({
-            'keyword': keyword,
-            'count': counts_dict.get(keyword, 0)
-        })
-
-    return {
-        "tenant_id": tenant.id,
-        "keywords_by_category": by_category,
-        "all_keywords": [kw['keyword'] for kw in all_keywords]
-    }
+    return counts_dict
 
 
 @router.get("/tag-stats")
 async def get_tag_stats(
     tenant: Tenant = Depends(get_tenant),
-    db: Session = Depends(get_db)
 ):
     """Get tag counts by category for different tag sources."""
+    return await run_read_query(_load_tag_stats, tenant)
+
+
+def _load_tag_stats(db: Session, tenant: Tenant) -> dict:
     # Fetch keywords from database with IDs for FK mapping
     keywords_data = db.query(
         Keyword.id,
@@ -196,50 +286,19 @@ async def get_tag_stats(
         for row in keywords_data
     }
 
-    # Get zero-shot (SigLIP) tags from machine_tags
-    zero_shot_rows = db.query(
-        MachineTag.keyword_id,
-        func.count(distinct(MachineTag.asset_id)).label("count")
-    ).filter(
-        tenant_column_filter(MachineTag, tenant),
-        MachineTag.tag_type == 'siglip',
-        MachineTag.asset_id.is_not(None),
-    ).group_by(
-        MachineTag.keyword_id
-    ).all()
-
-    # Get latest keyword model name
-    model_row = db.query(KeywordModel.model_name).filter(
-        tenant_column_filter(KeywordModel, tenant)
-    ).order_by(
-        func.coalesce(KeywordModel.updated_at, KeywordModel.created_at).desc()
-    ).first()
-
-    # Get trained keyword model tags from machine_tags
-    keyword_model_rows = []
-    if model_row:
-        keyword_model_rows = db.query(
-            MachineTag.keyword_id,
-            func.count(distinct(MachineTag.asset_id)).label("count")
-        ).filter(
-            tenant_column_filter(MachineTag, tenant),
-            MachineTag.tag_type == 'trained',
-            MachineTag.model_name == model_row.model_name,
-            MachineTag.asset_id.is_not(None),
-        ).group_by(
-            MachineTag.keyword_id
-        ).all()
-
-    permatag_rows = db.query(
-        Permatag.keyword_id,
-        func.count(distinct(Permatag.asset_id)).label("count")
-    ).filter(
-        tenant_column_filter(Permatag, tenant),
-        Permatag.asset_id.is_not(None),
-        Permatag.signum == 1
-    ).group_by(
-        Permatag.keyword_id
-    ).all()
+    model_name = latest_keyword_model_name(db, tenant.id)
+    materialized = load_keyword_facet_counts(
+        db,
+        tenant.id,
+        [SOURCE_ZERO_SHOT, SOURCE_KEYWORD_MODEL, SOURCE_STATS_PERMATAGS],
+        keyword_model_name=model_name,
+    )
+    if materialized is not None:
+        zero_shot_rows = list(materialized[SOURCE_ZERO_SHOT].items())
+        keyword_model_rows = list(materialized[SOURCE_KEYWORD_MODEL].items())
+        permatag_rows = list(materialized[SOURCE_STATS_PERMATAGS].items())
+    else:
+        zero_shot_rows, keyword_model_rows, permatag_rows = _count_tag_stats_live(db, tenant, model_name)
 
     def to_by_category(rows):
         by_category = {}
@@ -276,3 +335,45 @@ async def get_tag_stats(
             "permatags": permatags_to_by_category_all()
         }
     }
+
+
+def _count_tag_stats_live(db: Session, tenant: Tenant, model_name: Optional[str]):
+    # Get zero-shot (SigLIP) tags from machine_tags
+    zero_shot_rows = db.query(
+        MachineTag.keyword_id,
+        func.count(distinct(MachineTag.asset_id)).label("count")
+    ).filter(
+        tenant_column_filter(MachineTag, tenant),
+        MachineTag.tag_type == 'siglip',
+        MachineTag.asset_id.is_not(None),
+    ).group_by(
+        MachineTag.keyword_id
+    ).all()
+
+    # Get trained keyword model tags from machine_tags
+    keyword_model_rows = []
+    if model_name:
+        keyword_model_rows = db.query(
+            MachineTag.keyword_id,
+            func.count(distinct(MachineTag.asset_id)).label("count")
+        ).filter(
+            tenant_column_filter(MachineTag, tenant),
+            MachineTag.tag_type == 'trained',
+            MachineTag.model_name == model_name,
+            MachineTag.asset_id.is_not(None),
+        ).group_by(
+            MachineTag.keyword_id
+        ).all()
+
+    permatag_rows = db.query(
+        Permatag.keyword_id,
+        func.count(distinct(Permatag.asset_id)).label("count")
+    ).filter(
+        tenant_column_filter(Permatag, tenant),
+        Permatag.asset_id.is_not(None),
+        Permatag.signum == 1
+    ).group_by(
+        Permatag.keyword_id
+    ).all()
+
+    return zero_shot_rows, keyword_model_rows, permatag_rows
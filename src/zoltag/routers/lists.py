@@ -1,14 +1,18 @@
 """Router for photo list operations."""
 
+import json
 import logging
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Body, Query
+from fastapi import APIRouter, Depends, HTTPException, Body, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from sqlalchemy import func, and_
 from sqlalchemy.orm import Session
 
 from zoltag.asset_helpers import AssetReadinessError, load_assets_for_images, resolve_image_storage
+from zoltag.database import SessionLocal
 from zoltag.dependencies import get_db, get_tenant, get_tenant_setting
 from zoltag.list_visibility import (
     can_edit_list,
@@ -28,7 +32,8 @@ from zoltag.settings import settings
 from zoltag.auth.dependencies import get_current_user
 from zoltag.auth.models import UserProfile
 from zoltag.routers.images._shared import _build_source_url
-from zoltag.text_index import rebuild_asset_text_index
+from zoltag.routers.images.query_builder import SortKey, build_seek_predicate, decode_cursor, encode_cursor
+from zoltag.text_index import enqueue_asset_text_index_refresh
 from zoltag.tenant_scope import assign_tenant_scope, tenant_column_filter, tenant_column_filter_for_values
 
 router = APIRouter(
@@ -38,20 +43,6 @@ router = APIRouter(
 logger = logging.getLogger(__name__)
 
 
-def _refresh_asset_text_index_for_asset(db: Session, tenant: Tenant, asset_id) -> None:
-    if not asset_id:
-        return
-    try:
-        rebuild_asset_text_index(
-            db,
-            tenant_id=tenant.id,
-            asset_id=str(asset_id),
-            include_embeddings=False,
-        )
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Failed to refresh asset_text_index for asset %s: %s", asset_id, exc)
-
-
 def _resolve_storage_or_409(*, image: ImageMetadata, tenant: Tenant, db: Session, assets_by_id=None):
     try:
         return resolve_image_storage(
@@ -163,7 +154,7 @@ def _get_accessible_list_or_404(
 
 
 @router.get("/recent", response_model=dict)
-async def get_recent_list(
+def get_recent_list(
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user),
@@ -199,7 +190,7 @@ async def get_recent_list(
 
 
 @router.get("/{list_id:int}", response_model=dict)
-async def get_list(
+def get_list(
     list_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -233,7 +224,7 @@ async def get_list(
 
 
 @router.delete("/items/{item_id}", response_model=dict)
-async def delete_list_item(
+def delete_list_item(
     item_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -255,12 +246,12 @@ async def delete_list_item(
     removed_asset_id = item.asset_id
     db.delete(item)
     db.commit()
-    _refresh_asset_text_index_for_asset(db, tenant, removed_asset_id)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=[removed_asset_id])
     return {"deleted": True, "item_id": item_id}
 
 
 @router.post("", response_model=dict)
-async def create_list(
+def create_list(
     title: str = Body(...),
     notebox: Optional[str] = Body(None),
     visibility: Optional[str] = Body("shared"),
@@ -286,7 +277,7 @@ async def create_list(
 
 
 @router.get("", response_model=list)
-async def list_lists(
+def list_lists(
     visibility_scope: str = Query(default="default"),
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -336,7 +327,7 @@ async def list_lists(
 
 
 @router.patch("/{list_id:int}", response_model=dict)
-async def edit_list(
+def edit_list(
     list_id: int,
     title: Optional[str] = Body(None),
     notebox: Optional[str] = Body(None),
@@ -369,8 +360,7 @@ async def edit_list(
         for row in db.query(PhotoListItem.asset_id).filter(PhotoListItem.list_id == lst.id).all()
         if row[0] is not None
     ]
-    for item_asset_id in list_asset_ids:
-        _refresh_asset_text_index_for_asset(db, tenant, item_asset_id)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=list_asset_ids)
 
     # Get creator display name
     created_by_name = None
@@ -390,7 +380,7 @@ async def edit_list(
 
 
 @router.delete("/{list_id:int}", response_model=dict)
-async def delete_list(
+def delete_list(
     list_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -414,20 +404,42 @@ async def delete_list(
     ]
     db.delete(lst)
     db.commit()
-    for item_asset_id in list_asset_ids:
-        _refresh_asset_text_index_for_asset(db, tenant, item_asset_id)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=list_asset_ids)
     return {"deleted": True}
 
 
+_LIST_ITEMS_CURSOR_ORDERING = "added_at:asc,id:asc"
+_LIST_ITEMS_SORT_KEYS = [
+    SortKey(PhotoListItem.added_at, descending=False, nulls_last=True),
+    SortKey(PhotoListItem.id, descending=False, nulls_last=True),
+]
+# Rows fetched (and serialized) per short-lived session while streaming NDJSON.
+LIST_ITEMS_STREAM_BATCH_SIZE = 200
+# JSON page size when the caller passes no limit.
+LIST_ITEMS_DEFAULT_PAGE_SIZE = 200
+
+
 @router.get("/{list_id:int}/items", response_model=list)
-async def get_list_items(
+def get_list_items(
     list_id: int,
+    response: Response,
     ids_only: bool = False,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+    unpaged: bool = False,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user),
 ):
-    """Get all items in a list, ordered by added_at ascending."""
+    """Get items in a list, ordered by added_at ascending (then item id).
+
+    JSON responses are pages of ``limit`` items (``LIST_ITEMS_DEFAULT_PAGE_SIZE``
+    when omitted); the ``X-Next-Cursor`` header carries the cursor for the
+    following page and is absent on the last one. ``unpaged=true`` returns every
+    item in one response; prefer ``format=ndjson`` for that, which streams one
+    item per line in bounded batches (all items unless ``limit`` is given).
+    """
     is_tenant_admin = is_tenant_admin_user(db, tenant, current_user)
     _get_accessible_list_or_404(
         db=db,
@@ -436,8 +448,40 @@ async def get_list_items(
         current_user=current_user,
         is_tenant_admin=is_tenant_admin,
     )
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, _LIST_ITEMS_CURSOR_ORDERING, len(_LIST_ITEMS_SORT_KEYS))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    if format == "ndjson":
+        return StreamingResponse(
+            _stream_list_items(tenant, list_id, ids_only=ids_only, after=after, limit=limit),
+            media_type="application/x-ndjson",
+        )
+
+    if limit is None and not unpaged:
+        limit = LIST_ITEMS_DEFAULT_PAGE_SIZE
+
+    rows, next_values = _fetch_list_items_page(db, tenant, list_id, ids_only=ids_only, after=after, limit=limit)
+    if next_values is not None:
+        response.headers["X-Next-Cursor"] = encode_cursor(_LIST_ITEMS_CURSOR_ORDERING, next_values)
+    return _serialize_list_item_rows(db, tenant, rows, ids_only=ids_only)
+
+
+def _fetch_list_items_page(
+    db: Session,
+    tenant: Tenant,
+    list_id: int,
+    *,
+    ids_only: bool,
+    after: Optional[list] = None,
+    limit: Optional[int] = None,
+):
+    """Return (rows, next_cursor_values) for one keyset page of list items."""
     if ids_only:
-        items = (
+        query = (
             db.query(
                 PhotoListItem.id,
                 ImageMetadata.id.label("photo_id"),
@@ -453,28 +497,73 @@ async def get_list_items(
                 ),
             )
             .filter(PhotoListItem.list_id == list_id, tenant_column_filter(PhotoList, tenant))
-            .order_by(PhotoListItem.added_at.asc())
-            .all()
         )
+    else:
+        query = (
+            db.query(PhotoListItem, ImageMetadata)
+            .join(
+                ImageMetadata,
+                and_(
+                    PhotoListItem.asset_id == ImageMetadata.asset_id,
+                    tenant_column_filter(ImageMetadata, tenant),
+                ),
+            )
+            .filter(
+                PhotoListItem.list_id == list_id
+            )
+        )
+    if after is not None:
+        query = query.filter(build_seek_predicate(_LIST_ITEMS_SORT_KEYS, after))
+    query = query.order_by(*[key.order_clause() for key in _LIST_ITEMS_SORT_KEYS])
+    if limit is None:
+        return query.all(), None
+
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    last_item = last if ids_only else last[0]
+    return rows, [last_item.added_at, last_item.id]
+
+
+def _stream_list_items(
+    tenant: Tenant,
+    list_id: int,
+    *,
+    ids_only: bool,
+    after: Optional[list],
+    limit: Optional[int],
+):
+    """Yield NDJSON lines, fetching each batch in its own short-lived session."""
+    remaining = limit
+    while remaining is None or remaining > 0:
+        batch_size = LIST_ITEMS_STREAM_BATCH_SIZE if remaining is None else min(LIST_ITEMS_STREAM_BATCH_SIZE, remaining)
+        db = SessionLocal()
+        try:
+            rows, next_values = _fetch_list_items_page(
+                db, tenant, list_id, ids_only=ids_only, after=after, limit=batch_size
+            )
+            payload = _serialize_list_item_rows(db, tenant, rows, ids_only=ids_only)
+        finally:
+            db.close()
+        for item in payload:
+            yield json.dumps(jsonable_encoder(item), separators=(",", ":")) + "\n"
+        if next_values is None:
+            return
+        if remaining is not None:
+            remaining -= len(rows)
+        after = next_values
+
+
+def _serialize_list_item_rows(db: Session, tenant: Tenant, rows, *, ids_only: bool) -> list:
+    """Serialize one page of list items with batched tag/variant/keyword lookups."""
+    if ids_only:
         return [
             {"id": item_id, "photo_id": photo_id, "asset_id": str(asset_id) if asset_id else None, "added_at": added_at}
-            for item_id, photo_id, asset_id, added_at in items
+            for item_id, photo_id, asset_id, added_at in rows
         ]
-    items = (
-        db.query(PhotoListItem, ImageMetadata)
-        .join(
-            ImageMetadata,
-            and_(
-                PhotoListItem.asset_id == ImageMetadata.asset_id,
-                tenant_column_filter(ImageMetadata, tenant),
-            ),
-        )
-        .filter(
-            PhotoListItem.list_id == list_id
-        )
-        .order_by(PhotoListItem.added_at.asc())
-        .all()
-    )
+    items = rows
     assets_by_id = load_assets_for_images(db, [img for _, img in items])
     image_ids = [img.id for _, img in items]
     asset_id_to_image_id = {img.asset_id: img.id for _, img in items if img.asset_id is not None}
@@ -604,7 +693,7 @@ async def get_list_items(
 
 
 @router.post("/{list_id:int}/add-photo", response_model=dict)
-async def add_photo_to_specific_list(
+def add_photo_to_specific_list(
     list_id: int,
     req: AddPhotoRequest,
     tenant: Tenant = Depends(get_tenant),
@@ -653,7 +742,7 @@ async def add_photo_to_specific_list(
     db.add(item)
     db.commit()
     db.refresh(item)
-    _refresh_asset_text_index_for_asset(db, tenant, asset_id)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=[asset_id])
     return {
         "list_id": list_id,
         "item_id": item.id,
@@ -664,7 +753,7 @@ async def add_photo_to_specific_list(
 
 
 @router.post("/add-photo", response_model=dict)
-async def add_photo_to_list(
+def add_photo_to_list(
     req: AddPhotoRequest,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
@@ -717,7 +806,7 @@ async def add_photo_to_list(
     db.add(item)
     db.commit()
     db.refresh(item)
-    _refresh_asset_text_index_for_asset(db, tenant, asset_id)
+    enqueue_asset_text_index_refresh(db, tenant_id=tenant.id, asset_ids=[asset_id])
     return {
         "list_id": recent.id,
         "item_id": item.id,
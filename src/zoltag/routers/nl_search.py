@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
 import json
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from zoltag.activity import EVENT_SEARCH_NL, extract_client_ip, record_activity_event
 from zoltag.auth.dependencies import get_current_user
 from zoltag.auth.models import UserProfile
-from zoltag.dependencies import get_db, get_tenant
+from zoltag.database import SessionLocal, run_read_query
+from zoltag.dependencies import get_tenant
 from zoltag.metadata import Person
 from zoltag.models.config import Keyword, KeywordCategory
+from zoltag.nl_vocab_cache import NLVocabEntry, get_cached_nl_vocab, nl_vocab_generation, store_nl_vocab
 from zoltag.settings import settings
 from zoltag.tenant import Tenant
 from zoltag.tenant_scope import tenant_column_filter
@@ -23,6 +32,16 @@ from zoltag.tenant_scope import tenant_column_filter
 
 router = APIRouter(prefix="/api/v1/search", tags=["search"])
 
+# Shared client so Gemini calls reuse pooled keep-alive/TLS connections. Bound to
+# the event loop that created it.
+_gemini_client: Optional[httpx.AsyncClient] = None
+_gemini_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Per-tenant LRU of sanitized translations, keyed by normalized query text and
+# the vocabulary version so keyword/person edits never serve stale filters.
+_translation_cache: Dict[str, "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]"] = {}
+_translation_cache_lock = threading.Lock()
+
 
 class NLSearchRequest(BaseModel):
     query: str = Field(..., min_length=1, max_length=500)
@@ -132,15 +151,7 @@ def _build_vocab(db: Session, tenant: Tenant) -> Dict[str, Any]:
     }
 
 
-def _build_prompt(request: NLSearchRequest, vocab: Dict[str, Any]) -> str:
-    clarifying = ""
-    if request.clarification:
-        options = ", ".join(request.clarification_options or [])
-        clarifying = (
-            f"\nUser clarification: {request.clarification}."
-            + (f" Options were: {options}." if options else "")
-        )
-
+def _build_prompt_prefix(vocab: Dict[str, Any]) -> str:
     instructions = (
         "You are a search assistant for Zoltag. "
         "Convert the user's natural language query into JSON filters.\n"
@@ -168,17 +179,117 @@ def _build_prompt(request: NLSearchRequest, vocab: Dict[str, Any]) -> str:
 
     return (
         f"{instructions}\n"
-        f"User query: {request.query}{clarifying}\n"
-        f"DATA:\n{data_block}"
+        f"DATA:\n{data_block}\n"
+    )
+
+
+def _build_prompt(request: NLSearchRequest, vocab: Dict[str, Any], prefix: Optional[str] = None) -> str:
+    clarifying = ""
+    if request.clarification:
+        options = ", ".join(request.clarification_options or [])
+        clarifying = (
+            f"\nUser clarification: {request.clarification}."
+            + (f" Options were: {options}." if options else "")
+        )
+
+    # The tenant-specific part comes first so it is a stable, cacheable prefix.
+    if prefix is None:
+        prefix = _build_prompt_prefix(vocab)
+    return f"{prefix}User query: {request.query}{clarifying}"
+
+
+def _load_vocab(db: Session, tenant: Tenant) -> NLVocabEntry:
+    """Return the tenant's vocabulary and prompt prefix, building them on a cache miss."""
+    cached = get_cached_nl_vocab(tenant.id)
+    if cached is not None:
+        return cached
+    generation = nl_vocab_generation(tenant.id)
+    vocab = _build_vocab(db, tenant)
+    prefix = _build_prompt_prefix(vocab)
+    entry = NLVocabEntry(
+        vocab=vocab,
+        prompt_prefix=prefix,
+        version=hashlib.sha1(prefix.encode("utf-8")).hexdigest()[:16],
     )
+    store_nl_vocab(tenant.id, entry, generation)
+    return entry
+
+
+def _translation_cache_key(request: NLSearchRequest, vocab_version: str) -> Tuple:
+    return (
+        vocab_version,
+        settings.gemini_model,
+        _normalize(request.query),
+        _normalize(request.clarification),
+        tuple(_normalize(option) for option in request.clarification_options or []),
+    )
+
+
+def _get_cached_translation(tenant_id: str, key: Tuple) -> Optional[Dict[str, Any]]:
+    now = time.monotonic()
+    with _translation_cache_lock:
+        entries = _translation_cache.get(str(tenant_id))
+        cached = entries.get(key) if entries else None
+        if cached is None:
+            return None
+        if cached[0] <= now:
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return copy.deepcopy(cached[1])
+
+
+def _store_translation(tenant_id: str, key: Tuple, sanitized: Dict[str, Any]) -> None:
+    ttl = max(0, int(settings.nl_search_result_cache_ttl_seconds))
+    max_entries = max(0, int(settings.nl_search_result_cache_size))
+    if ttl <= 0 or max_entries <= 0:
+        return
+    with _translation_cache_lock:
+        entries = _translation_cache.setdefault(str(tenant_id), OrderedDict())
+        entries[key] = (time.monotonic() + ttl, copy.deepcopy(sanitized))
+        entries.move_to_end(key)
+        while len(entries) > max_entries:
+            entries.popitem(last=False)
+
+
+def clear_translation_cache(tenant_id: Optional[str] = None) -> None:
+    """Drop cached query translations for one tenant, or for all tenants."""
+    with _translation_cache_lock:
+        if tenant_id is None:
+            _translation_cache.clear()
+        else:
+            _translation_cache.pop(str(tenant_id), None)
 
 
 def _get_gemini_endpoint(model_name: str) -> str:
     mode = (settings.gemini_api_mode or "generativelanguage").lower()
     if mode == "vertex":
         # Vertex AI API key (express mode) endpoint
-        return f"https://aiplatform.googleapis.com/v1/publishers/google/models/{model_name}:generateContent"
-    return f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent"
+        base_url = settings.gemini_api_base_url or "https://aiplatform.googleapis.com"
+        return f"{base_url.rstrip('/')}/v1/publishers/google/models/{model_name}:generateContent"
+    base_url = settings.gemini_api_base_url or "https://generativelanguage.googleapis.com"
+    return f"{base_url.rstrip('/')}/v1beta/models/{model_name}:generateContent"
+
+
+def _get_gemini_client() -> httpx.AsyncClient:
+    global _gemini_client, _gemini_client_loop
+    loop = asyncio.get_running_loop()
+    if _gemini_client is None or _gemini_client.is_closed or _gemini_client_loop is not loop:
+        max_connections = max(1, int(settings.gemini_max_connections))
+        _gemini_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        _gemini_client_loop = loop
+    return _gemini_client
+
+
+async def close_gemini_client() -> None:
+    """Close the pooled Gemini client (called on app shutdown)."""
+    global _gemini_client, _gemini_client_loop
+    client, _gemini_client, _gemini_client_loop = _gemini_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
 
 
 def _build_generation_config() -> Dict[str, Any]:
@@ -351,22 +462,8 @@ def _apply_quality_defaults(response: Dict[str, Any], query: str) -> Dict[str, A
     return response
 
 
-@router.post("/nl")
-async def nl_search(
-    http_request: Request,
-    request: NLSearchRequest,
-    current_user: UserProfile = Depends(get_current_user),
-    tenant: Tenant = Depends(get_tenant),
-    db: Session = Depends(get_db),
-):
-    api_key = settings.gemini_api_key
-    model_name = settings.gemini_model
-    if not api_key:
-        raise HTTPException(status_code=500, detail="Gemini API key not configured.")
-
-    vocab = _build_vocab(db, tenant)
-    prompt = _build_prompt(request, vocab)
-
+async def _translate_query(api_key: str, model_name: str, prompt: str, vocab: Dict[str, Any]) -> Dict[str, Any]:
+    """Ask Gemini to translate the prompt and return the sanitized filters."""
     payload = {
         "contents": [
             {"role": "user", "parts": [{"text": prompt}]},
@@ -381,8 +478,7 @@ async def nl_search(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, headers=headers, json=payload)
+        response = await _get_gemini_client().post(url, headers=headers, json=payload)
     except httpx.HTTPError as exc:
         raise HTTPException(status_code=502, detail=f"Gemini request failed: {exc}") from exc
 
@@ -405,25 +501,71 @@ async def nl_search(
     except json.JSONDecodeError as exc:
         raise HTTPException(status_code=502, detail="Gemini response was not valid JSON.") from exc
 
-    sanitized = _sanitize_response(parsed, vocab)
+    return _sanitize_response(parsed, vocab)
+
+
+@router.post("/nl")
+async def nl_search(
+    http_request: Request,
+    request: NLSearchRequest,
+    current_user: UserProfile = Depends(get_current_user),
+    tenant: Tenant = Depends(get_tenant),
+):
+    api_key = settings.gemini_api_key
+    model_name = settings.gemini_model
+    if not api_key:
+        raise HTTPException(status_code=500, detail="Gemini API key not configured.")
+
+    vocab_entry = get_cached_nl_vocab(tenant.id)
+    if vocab_entry is None:
+        vocab_entry = await run_read_query(_load_vocab, tenant)
+    cache_key = _translation_cache_key(request, vocab_entry.version)
+    sanitized = _get_cached_translation(tenant.id, cache_key)
+    cached = sanitized is not None
+    if not cached:
+        prompt = _build_prompt(request, vocab_entry.vocab, vocab_entry.prompt_prefix)
+        sanitized = await _translate_query(api_key, model_name, prompt, vocab_entry.vocab)
+        _store_translation(tenant.id, cache_key, sanitized)
     response = _apply_quality_defaults(sanitized, request.query)
-    record_activity_event(
-        db,
-        event_type=EVENT_SEARCH_NL,
+    await run_in_threadpool(
+        _record_nl_search,
+        http_request,
+        request,
+        response,
         actor_supabase_uid=current_user.supabase_uid,
         tenant_id=tenant.id,
-        request_path=str(http_request.url.path),
-        client_ip=extract_client_ip(
-            x_forwarded_for=http_request.headers.get("X-Forwarded-For"),
-            x_real_ip=http_request.headers.get("X-Real-IP"),
-        ),
-        user_agent=http_request.headers.get("User-Agent"),
-        details={
-            "query": request.query[:300],
-            "query_length": len(request.query or ""),
-            "needs_clarification": bool(response.get("needs_clarification")),
-            "category_filter_count": len((response.get("filters") or {}).get("category_filters") or []),
-            "sort": response.get("sort"),
-        },
+        cached=cached,
     )
     return response
+
+
+def _record_nl_search(
+    http_request: Request,
+    request: NLSearchRequest,
+    response: Dict[str, Any],
+    *,
+    actor_supabase_uid,
+    tenant_id,
+    cached: bool,
+) -> None:
+    with SessionLocal() as db:
+        record_activity_event(
+            db,
+            event_type=EVENT_SEARCH_NL,
+            actor_supabase_uid=actor_supabase_uid,
+            tenant_id=tenant_id,
+            request_path=str(http_request.url.path),
+            client_ip=extract_client_ip(
+                x_forwarded_for=http_request.headers.get("X-Forwarded-For"),
+                x_real_ip=http_request.headers.get("X-Real-IP"),
+            ),
+            user_agent=http_request.headers.get("User-Agent"),
+            details={
+                "query": request.query[:300],
+                "query_length": len(request.query or ""),
+                "needs_clarification": bool(response.get("needs_clarification")),
+                "category_filter_count": len((response.get("filters") or {}).get("category_filters") or []),
+                "sort": response.get("sort"),
+                "cached": cached,
+            },
+        )
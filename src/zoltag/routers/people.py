@@ -2,15 +2,21 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import distinct, func, case
+from sqlalchemy import and_, distinct, func, case, or_
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
 from zoltag.dependencies import get_db, get_tenant
 from zoltag.tenant import Tenant
-from zoltag.metadata import Person, Permatag
+from zoltag.keyword_facets import SOURCE_STATS_PERMATAGS, keyword_facets_state, load_keyword_facet_counts
+from zoltag.metadata import KeywordFacetCount, Person, Permatag
 from zoltag.models.config import Keyword, KeywordCategory
-from zoltag.tenant_scope import assign_tenant_scope, tenant_column_filter, tenant_column_filter_for_values
+from zoltag.tenant_scope import (
+    assign_tenant_scope,
+    tenant_column_filter,
+    tenant_column_filter_for_values,
+    tenant_id_value,
+)
 
 router = APIRouter(prefix="/api/v1/people", tags=["people"])
 
@@ -44,8 +50,14 @@ def _get_person_keyword(db: Session, tenant: Tenant | str, person_id: int) -> Op
 def _count_person_tagged_images(db: Session, tenant: Tenant | str, keyword_id: int) -> int:
     """Count distinct assets tagged for this person within tenant scope.
 
-    Counts only positive permatags attached to the person's keyword.
+    Counts only positive permatags attached to the person's keyword. Served from
+    the materialized keyword facet rollup when it is current for the tenant.
     """
+    tenant_id = tenant.id if isinstance(tenant, Tenant) else tenant
+    counts = load_keyword_facet_counts(db, tenant_id, [SOURCE_STATS_PERMATAGS], keyword_ids=[keyword_id])
+    if counts is not None:
+        return int(counts[SOURCE_STATS_PERMATAGS].get(keyword_id, 0))
+
     count = db.query(func.count(distinct(Permatag.asset_id))).filter(
         _tenant_filter(Permatag, tenant),
         Permatag.keyword_id == keyword_id,
@@ -101,7 +113,7 @@ class PersonStatsResponse(BaseModel):
 # ============================================================================
 
 @router.post("", response_model=PersonResponse)
-async def create_person(
+def create_person(
     request: PersonCreateRequest,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -174,70 +186,102 @@ async def create_person(
 
 
 @router.get("", response_model=List[PersonResponse])
-async def list_people(
+def list_people(
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    after_name: Optional[str] = None,
+    after_id: Optional[int] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
     limit: int = Query(50, ge=1, le=500)
 ):
-    """List all people for a tenant."""
-
-    query = db.query(Person).filter(tenant_column_filter(Person, tenant))
-    people = query.order_by(Person.name).offset(skip).limit(limit).all()
-    if not people:
-        return []
-
-    person_ids = [person.id for person in people]
+    """List people for a tenant ordered by name, then id.
 
-    # Resolve each person's canonical keyword in one pass:
-    # prefer tag_type='person', else lowest keyword id for legacy rows.
-    keyword_rows = db.query(
-        Keyword.id,
-        Keyword.person_id,
+    Page with ``after_name``/``after_id`` set to the last person of the previous
+    page. ``skip`` is kept for older clients.
+    """
+    # Each person's canonical keyword: prefer tag_type='person', else lowest
+    # keyword id for legacy rows.
+    canonical_keyword = db.query(
+        Keyword.person_id.label("person_id"),
+        Keyword.id.label("keyword_id"),
+        func.row_number().over(
+            partition_by=Keyword.person_id,
+            order_by=(case((Keyword.tag_type == "person", 0), else_=1), Keyword.id.asc()),
+        ).label("rank"),
     ).filter(
         tenant_column_filter(Keyword, tenant),
-        Keyword.person_id.in_(person_ids),
-    ).order_by(
-        Keyword.person_id.asc(),
-        case((Keyword.tag_type == "person", 0), else_=1),
-        Keyword.id.asc(),
-    ).all()
-
-    keyword_id_by_person: dict[int, int] = {}
-    for keyword_id, person_id in keyword_rows:
-        if person_id is None or person_id in keyword_id_by_person:
-            continue
-        keyword_id_by_person[person_id] = keyword_id
-
-    keyword_ids = list(keyword_id_by_person.values())
-    tag_count_by_keyword: dict[int, int] = {}
-    if keyword_ids:
-        tag_count_rows = db.query(
-            Permatag.keyword_id,
-            func.count(distinct(Permatag.asset_id)).label("tag_count"),
-        ).filter(
-            tenant_column_filter(Permatag, tenant),
-            Permatag.keyword_id.in_(keyword_ids),
-            Permatag.signum == 1,
-        ).group_by(
-            Permatag.keyword_id,
-        ).all()
-        tag_count_by_keyword = {
-            keyword_id: int(tag_count or 0)
-            for keyword_id, tag_count in tag_count_rows
+        Keyword.person_id.isnot(None),
+    ).subquery()
+
+    # Tag counts come from the keyword facet rollup kept current on permatag
+    # writes; until it is built (or while stale) they are counted for the page.
+    use_rollup = keyword_facets_state(db, tenant.id) is not None
+    columns = [Person, canonical_keyword.c.keyword_id]
+    if use_rollup:
+        columns.append(KeywordFacetCount.asset_count)
+    query = db.query(*columns).outerjoin(
+        canonical_keyword,
+        and_(canonical_keyword.c.person_id == Person.id, canonical_keyword.c.rank == 1),
+    )
+    if use_rollup:
+        query = query.outerjoin(
+            KeywordFacetCount,
+            and_(
+                KeywordFacetCount.tenant_id == (tenant_id_value(tenant) or tenant.id),
+                KeywordFacetCount.source == SOURCE_STATS_PERMATAGS,
+                KeywordFacetCount.keyword_id == canonical_keyword.c.keyword_id,
+            ),
+        )
+    query = query.filter(tenant_column_filter(Person, tenant))
+    if after_name is not None:
+        if after_id is None:
+            query = query.filter(Person.name > after_name)
+        else:
+            query = query.filter(or_(
+                Person.name > after_name,
+                and_(Person.name == after_name, Person.id > after_id),
+            ))
+    query = query.order_by(Person.name.asc(), Person.id.asc())
+    if skip:
+        query = query.offset(skip)
+    rows = query.limit(limit).all()
+    if not rows:
+        return []
+
+    if use_rollup:
+        tag_count_by_person = {row[0].id: int(row[2] or 0) for row in rows}
+    else:
+        keyword_ids = [row[1] for row in rows if row[1] is not None]
+        tag_count_by_keyword: dict[int, int] = {}
+        if keyword_ids:
+            tag_count_rows = db.query(
+                Permatag.keyword_id,
+                func.count(distinct(Permatag.asset_id)).label("tag_count"),
+            ).filter(
+                tenant_column_filter(Permatag, tenant),
+                Permatag.keyword_id.in_(keyword_ids),
+                Permatag.signum == 1,
+            ).group_by(
+                Permatag.keyword_id,
+            ).all()
+            tag_count_by_keyword = {
+                keyword_id: int(tag_count or 0)
+                for keyword_id, tag_count in tag_count_rows
+            }
+        tag_count_by_person = {
+            row[0].id: tag_count_by_keyword.get(row[1], 0) if row[1] is not None else 0
+            for row in rows
         }
 
     results = []
-    for person in people:
-        keyword_id = keyword_id_by_person.get(person.id)
-        tag_count = int(tag_count_by_keyword.get(keyword_id, 0)) if keyword_id else 0
-
+    for row in rows:
+        person, keyword_id = row[0], row[1]
         results.append(PersonResponse(
             id=person.id,
             name=person.name,
             instagram_url=person.instagram_url,
             keyword_id=keyword_id,
-            tag_count=tag_count,
+            tag_count=tag_count_by_person.get(person.id, 0),
             created_at=person.created_at.isoformat() if person.created_at else "",
             updated_at=person.updated_at.isoformat() if person.updated_at else ""
         ))
@@ -246,7 +290,7 @@ async def list_people(
 
 
 @router.get("/{person_id}", response_model=PersonResponse)
-async def get_person(
+def get_person(
     person_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -282,7 +326,7 @@ async def get_person(
 
 
 @router.put("/{person_id}", response_model=PersonResponse)
-async def update_person(
+def update_person(
     person_id: int,
     request: PersonUpdateRequest,
     tenant: Tenant = Depends(get_tenant),
@@ -336,7 +380,7 @@ async def update_person(
 
 
 @router.delete("/{person_id}")
-async def delete_person(
+def delete_person(
     person_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -374,7 +418,7 @@ async def delete_person(
 # ============================================================================
 
 @router.get("/{person_id}/stats", response_model=PersonStatsResponse)
-async def get_person_stats(
+def get_person_stats(
     person_id: int,
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db)
@@ -32,7 +32,7 @@ def _normalize_provider(provider: str) -> str:
 
 
 @router.post("/sync", response_model=dict)
-async def trigger_sync(
+def trigger_sync(
     tenant: Tenant = Depends(get_tenant),
     db: Session = Depends(get_db),
     model: str = Query("siglip", description="'clip' or 'siglip'"),
@@ -35,6 +35,37 @@ class Settings(BaseSettings):
     db_pool_recycle: int = 1800
     db_pool_pre_ping: bool = True
     db_connect_timeout: int = 10
+    # Optional AsyncEngine (asyncpg) for read-heavy endpoints; separate pool.
+    db_async_enabled: bool = False
+    db_async_pool_size: int = 20
+    db_async_max_overflow: int = 40
+
+    # Activity events (buffered, batch-written off the request path)
+    activity_events_async: bool = True
+    activity_event_buffer_size: int = 10000
+    activity_event_batch_size: int = 200
+    activity_event_flush_ms: int = 500
+
+    # Materialized keyword facet counts (/keywords, /tag-stats)
+    keyword_facets_enabled: bool = True
+    # Writes touching more keywords than this mark the tenant stale for reconcile.
+    keyword_facet_incremental_limit: int = 200
+    # /images/stats snapshot lifetime; commits touching a tenant drop it early. 0 disables.
+    image_stats_cache_ttl_seconds: int = 30
+
+    # Asset text index refresh after tag/list/note edits (debounced, off the request path)
+    text_index_refresh_async: bool = True
+    text_index_refresh_batch_size: int = 100
+    text_index_refresh_debounce_ms: int = 750
+
+    # Face matching fallback (no pgvector): per-tenant known-face matrix lifetime. 0 disables.
+    face_index_cache_ttl_seconds: int = 600
+    # HNSW candidate list for pgvector face matching. The index spans every tenant,
+    # so the tenant filter applies after the scan; pgvector >= 0.8 also keeps
+    # scanning (iterative scan) until enough of the tenant's faces are found.
+    face_match_hnsw_ef_search: int = 200
+    # Detection processes for detect-faces when --workers is 0; capped at the CPU count.
+    face_detection_workers: int = 2
     
     # Google Cloud
     gcp_project_id: str = "photocat-483622"
@@ -49,6 +80,11 @@ class Settings(BaseSettings):
     secret_manager_prefix: str = "zoltag"
     dropbox_app_key_secret: str = "dropbox-app-key"
     dropbox_app_secret_secret: str = "dropbox-app-secret"
+    # 'gcp' (Secret Manager) or 'local' (ZOLTAG_SECRET_<ID> env vars / files in secret_local_dir)
+    secret_provider: str = "gcp"
+    secret_local_dir: str = ".secrets"
+    # How long fetched secret payloads are reused; 0 disables caching.
+    secret_cache_ttl_seconds: int = 300
     
     # Cloud Tasks
     task_queue_name: str = "image-processing"
@@ -93,6 +129,13 @@ class Settings(BaseSettings):
     gemini_api_key: Optional[str] = None
     gemini_model: str = "gemini-2.5-flash"
     gemini_api_mode: str = "generativelanguage"  # "generativelanguage" or "vertex"
+    gemini_api_base_url: Optional[str] = None  # Overrides the mode's default host (e.g. a local stub)
+    gemini_max_connections: int = 20
+    # Per-tenant vocabulary/prompt prefix lifetime; keyword/person commits drop it early. 0 disables.
+    nl_search_vocab_cache_ttl_seconds: int = 300
+    # Per-tenant LRU of translated queries (keyed by normalized text + vocabulary version). 0 disables.
+    nl_search_result_cache_size: int = 256
+    nl_search_result_cache_ttl_seconds: int = 3600
 
     @property
     def thumbnail_bucket(self) -> str:
@@ -1,6 +1,7 @@
 """Storage provider abstractions."""
 
 from .providers import (
+    DEFAULT_STREAM_CHUNK_SIZE,
     StorageProvider,
     ProviderEntry,
     ProviderMediaMetadata,
@@ -9,8 +10,10 @@ from .providers import (
     ManagedStorageProvider,
     create_storage_provider,
 )
+from .blobs import download_blobs, gcs_bucket
 
 __all__ = [
+    "DEFAULT_STREAM_CHUNK_SIZE",
     "StorageProvider",
     "ProviderEntry",
     "ProviderMediaMetadata",
@@ -18,4 +21,6 @@ __all__ = [
     "GoogleDriveStorageProvider",
     "ManagedStorageProvider",
     "create_storage_provider",
+    "download_blobs",
+    "gcs_bucket",
 ]
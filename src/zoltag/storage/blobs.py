@@ -0,0 +1,41 @@
+"""Concurrent downloads from a GCS bucket."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Hashable, Mapping
+
+from google.api_core.exceptions import NotFound
+from google.cloud import storage
+
+from zoltag.settings import settings
+
+
+def gcs_bucket(bucket_name: str):
+    """Return a handle on ``bucket_name`` in the configured GCP project."""
+    return storage.Client(project=settings.gcp_project_id).bucket(bucket_name)
+
+
+def download_blobs(bucket, keys_by_id: Mapping[Hashable, str]) -> dict:
+    """Fetch blobs concurrently (bounded by settings.max_workers), keyed like ``keys_by_id``.
+
+    Missing blobs are skipped.
+    """
+    if not keys_by_id:
+        return {}
+
+    def fetch(key):
+        try:
+            return bucket.blob(key).download_as_bytes()
+        except NotFound:
+            return None
+
+    ids = list(keys_by_id.keys())
+    max_workers = max(1, min(settings.max_workers, len(ids)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        payloads = executor.map(fetch, [keys_by_id[item_id] for item_id in ids])
+        return {
+            item_id: data
+            for item_id, data in zip(ids, payloads, strict=True)
+            if data is not None
+        }
@@ -6,13 +6,16 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 import mimetypes
-from typing import Any, Callable, Dict, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence
 
 import httpx
 
 from zoltag.settings import settings
 
 
+DEFAULT_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
 @dataclass
 class ProviderEntry:
     """Normalized storage file metadata used by ingestion/sync paths."""
@@ -62,6 +65,27 @@ class StorageProvider(ABC):
     def get_thumbnail(self, source_key: str, size: str = "w640h480") -> Optional[bytes]:
         """Fetch a thumbnail if available; return None when unsupported."""
 
+    def open_stream(
+        self,
+        source_key: str,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Yield file bytes in chunks, optionally limited to an inclusive byte range.
+
+        The base implementation buffers ``download_file`` so providers without a
+        native streaming API keep working; concrete providers override it.
+        """
+        _validate_byte_range(start, end)
+        data = self.download_file(source_key)
+        yield from _slice_chunks(_iter_buffer(data, chunk_size), start, end)
+
+    def read_range(self, source_key: str, start: int, end: Optional[int] = None) -> bytes:
+        """Read an inclusive byte range (``end=None`` reads to end of file)."""
+        return b"".join(self.open_stream(source_key, start=start, end=end))
+
     def get_playback_url(self, source_key: str, expires_seconds: int = 300) -> Optional[str]:
         """Return a temporary browser-playable URL for media when supported."""
         _ = source_key
@@ -234,6 +258,30 @@ class DropboxStorageProvider(StorageProvider):
             return self._client.download_file(source_key)
         raise RuntimeError("Dropbox client does not support file download")
 
+    def open_stream(
+        self,
+        source_key: str,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        _validate_byte_range(start, end)
+        if start > 0 or end is not None:
+            # files_download has no range support in the SDK; temporary links honor Range.
+            link = self.get_playback_url(source_key)
+            if link:
+                yield from _iter_http_stream(link, start=start, end=end, chunk_size=chunk_size)
+                return
+        if hasattr(self._client, "files_download"):
+            _, response = self._client.files_download(source_key)
+            try:
+                yield from _slice_chunks(response.iter_content(chunk_size=chunk_size), start, end)
+            finally:
+                response.close()
+            return
+        yield from super().open_stream(source_key, start=start, end=end, chunk_size=chunk_size)
+
     def get_thumbnail(self, source_key: str, size: str = "w640h480") -> Optional[bytes]:
         if hasattr(self._client, "get_thumbnail"):
             return self._client.get_thumbnail(source_key, size=size)
@@ -393,6 +441,27 @@ class GoogleDriveStorageProvider(StorageProvider):
         )
         return response.content
 
+    def open_stream(
+        self,
+        source_key: str,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        _validate_byte_range(start, end)
+        yield from _iter_http_stream(
+            f"{self._drive_base_url}/files/{source_key}",
+            params={
+                "alt": "media",
+                "supportsAllDrives": "true",
+            },
+            headers={"Authorization": f"Bearer {self._get_access_token()}"},
+            start=start,
+            end=end,
+            chunk_size=chunk_size,
+        )
+
     def get_thumbnail(self, source_key: str, size: str = "w640h480") -> Optional[bytes]:
         _ = size
         # Drive does not expose a stable equivalent to Dropbox thumbnail size controls.
@@ -579,6 +648,34 @@ class ManagedStorageProvider(StorageProvider):
         blob = self._bucket.blob(source_key)
         return blob.download_as_bytes()
 
+    def open_stream(
+        self,
+        source_key: str,
+        *,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        _validate_byte_range(start, end)
+        remaining = None if end is None else end - start + 1
+        blob = self._bucket.blob(source_key)
+        with blob.open("rb", chunk_size=chunk_size) as reader:
+            if start:
+                reader.seek(start)
+            while remaining is None or remaining > 0:
+                read_size = chunk_size if remaining is None else min(chunk_size, remaining)
+                chunk = reader.read(read_size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def read_range(self, source_key: str, start: int, end: Optional[int] = None) -> bytes:
+        _validate_byte_range(start, end)
+        blob = self._bucket.blob(source_key)
+        return blob.download_as_bytes(start=start, end=end)
+
     def get_thumbnail(self, source_key: str, size: str = "w640h480") -> Optional[bytes]:
         _ = source_key
         _ = size
@@ -656,6 +753,65 @@ def create_storage_provider(
 
     raise ValueError(f"Unsupported storage provider: {provider_name}")
 
+def _validate_byte_range(start: int, end: Optional[int]) -> None:
+    if start < 0:
+        raise ValueError("Range start must be non-negative")
+    if end is not None and end < start:
+        raise ValueError("Range end must not precede range start")
+
+
+def _iter_buffer(data: bytes, chunk_size: int) -> Iterator[bytes]:
+    step = max(1, int(chunk_size or DEFAULT_STREAM_CHUNK_SIZE))
+    for offset in range(0, len(data), step):
+        yield data[offset:offset + step]
+
+
+def _slice_chunks(chunks: Iterable[bytes], start: int, end: Optional[int]) -> Iterator[bytes]:
+    """Trim a full-file chunk stream down to the inclusive ``[start, end]`` window."""
+    position = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        chunk_start = position
+        position += len(chunk)
+        if position <= start:
+            continue
+        if end is not None and chunk_start > end:
+            break
+        lower = max(start - chunk_start, 0)
+        upper = len(chunk) if end is None else min(len(chunk), end - chunk_start + 1)
+        yield chunk[lower:upper]
+        if end is not None and position > end:
+            break
+
+
+def _iter_http_stream(
+    url: str,
+    *,
+    params: Optional[Dict[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    timeout: int = 120,
+) -> Iterator[bytes]:
+    """Stream an HTTP GET body, requesting a byte range when one is given."""
+    request_headers = dict(headers or {})
+    ranged = start > 0 or end is not None
+    if ranged:
+        request_headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
+        with client.stream("GET", url, params=params, headers=request_headers) as response:
+            if response.status_code >= 400:
+                response.read()
+                raise RuntimeError(f"Stream request failed with {response.status_code}: {response.text}")
+            chunks = response.iter_bytes(chunk_size=chunk_size)
+            if ranged and response.status_code != 206:
+                # Server ignored the Range header and returned the whole body.
+                chunks = _slice_chunks(chunks, start, end)
+            yield from chunks
+
+
 def _parse_iso_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value or not isinstance(value, str):
         return None
@@ -110,6 +110,58 @@ def _infer_format_from_name(name: str) -> Optional[str]:
     return ext or None
 
 
+def extract_video_features(
+    *,
+    provider: StorageProvider,
+    source_key: str,
+    filename: str,
+    video_processor: VideoProcessor,
+    size: Optional[int] = None,
+    max_download_bytes: Optional[int] = MAX_VIDEO_THUMBNAIL_DOWNLOAD_BYTES,
+    log: Optional[Callable[[str], None]] = None,
+) -> Optional[dict]:
+    """Extract video poster/metadata, preferring a ranged URL probe over a full download.
+
+    The result carries ``remote_probe=True`` when the URL path succeeded. Returns
+    None when no frame was extracted and the download fallback was skipped or failed.
+    """
+    try:
+        playback_url = provider.get_playback_url(source_key)
+    except Exception as exc:
+        _log(log, f"[Sync] Video playback URL lookup failed: {exc}")
+        playback_url = None
+
+    if playback_url:
+        try:
+            video_features = video_processor.extract_features_from_url(playback_url, filename=filename)
+            if video_features.get("frame_extracted"):
+                video_features["remote_probe"] = True
+                return video_features
+            _log(log, "[Sync] Remote video probe returned no frame; falling back to download.")
+        except Exception as exc:
+            _log(log, f"[Sync] Remote video probe failed: {exc}")
+
+    entry_size = _to_int(size)
+    if max_download_bytes is not None and entry_size is not None and entry_size > max_download_bytes:
+        _log(
+            log,
+            f"[Sync] Skipping full video download for thumbnail (size={entry_size} bytes, limit={max_download_bytes}).",
+        )
+        return None
+
+    try:
+        # Stream to the tempfile instead of holding the whole original in memory.
+        video_features = video_processor.extract_features_from_chunks(
+            provider.open_stream(source_key),
+            filename=filename,
+        )
+    except Exception as exc:
+        _log(log, f"[Sync] Video frame extraction failed: {exc}")
+        return None
+    video_features["remote_probe"] = False
+    return video_features
+
+
 def _entry_from_dropbox_raw(entry: Any) -> ProviderEntry:
     source_key = getattr(entry, "path_display", None) or getattr(entry, "path_lower", None)
     if not source_key:
@@ -199,25 +251,21 @@ def process_storage_entry(
         }
 
         if features["thumbnail"] is None:
-            entry_size = _to_int(entry.size)
-            should_download = entry_size is None or entry_size <= MAX_VIDEO_THUMBNAIL_DOWNLOAD_BYTES
-            if should_download:
-                try:
-                    video_data = provider.download_file(entry.source_key)
-                    used_full_download = True
-                    video_features = video_processor.extract_features(video_data, filename=entry.name)
-                    features["thumbnail"] = video_features.get("thumbnail")
-                    features["width"] = features.get("width") or video_features.get("width")
-                    features["height"] = features.get("height") or video_features.get("height")
-                    features["format"] = features.get("format") or video_features.get("format")
-                    duration_ms = duration_ms or video_features.get("duration_ms")
-                except Exception as exc:
-                    _log(log, f"[Sync] Video frame extraction failed: {exc}")
-            else:
-                _log(
-                    log,
-                    f"[Sync] Skipping full video download for thumbnail (size={entry_size} bytes, limit={MAX_VIDEO_THUMBNAIL_DOWNLOAD_BYTES}).",
-                )
+            video_features = extract_video_features(
+                provider=provider,
+                source_key=entry.source_key,
+                filename=entry.name,
+                video_processor=video_processor,
+                size=entry.size,
+                log=log,
+            )
+            if video_features is not None:
+                used_full_download = not video_features.get("remote_probe", False)
+                features["thumbnail"] = video_features.get("thumbnail")
+                features["width"] = features.get("width") or video_features.get("width")
+                features["height"] = features.get("height") or video_features.get("height")
+                features["format"] = features.get("format") or video_features.get("format")
+                duration_ms = duration_ms or video_features.get("duration_ms")
 
         if features["thumbnail"] is None:
             features["thumbnail"] = video_processor.create_placeholder_thumbnail()
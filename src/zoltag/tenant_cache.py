@@ -0,0 +1,166 @@
+"""Per-tenant TTL caches dropped when committed writes touch their sources.
+
+Several read paths keep per-tenant results in process memory: ``/images/stats``
+snapshots, the natural-language search vocabulary and known-face matrices.
+Each is a :class:`TenantCache` declaring the models it is derived from. One set
+of Session hooks records which tenants a session wrote to, per model, and on
+commit invalidates those tenants in every cache tracking one of the written
+models; rolled-back writes invalidate nothing. Writes made by other processes
+are bounded by each cache's TTL setting.
+
+Call :func:`install_session_hooks` once at process start (see
+``zoltag.database.init_session_hooks``).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from itertools import chain
+from typing import Any, Hashable, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from zoltag.settings import settings
+
+
+_PENDING_WRITES_KEY = "tenant_cache_dirty"
+# Sentinel for writes whose tenant is unknown (bulk DML): drop every tenant.
+ALL_TENANTS = "*"
+
+_registry: list["TenantCache"] = []
+_registry_lock = threading.Lock()
+
+
+class TenantCache:
+    """TTL cache of per-tenant values guarded by invalidation generations.
+
+    Readers take :meth:`generation` before computing a value and pass it to
+    :meth:`store`, so a result computed across an invalidation is not cached.
+    ``key`` distinguishes several values per tenant (e.g. request variants);
+    invalidating a tenant drops all of them.
+    """
+
+    def __init__(self, name: str, *, models: Iterable[type], ttl_setting: str):
+        self.name = name
+        self.models = tuple(models)
+        self.ttl_setting = ttl_setting
+        self._entries: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self._generations: dict[str, int] = {}
+        self._global_generation = 0
+        self._lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def _generation(self, tenant_key: str) -> tuple[int, int]:
+        return (self._global_generation, self._generations.get(tenant_key, 0))
+
+    def generation(self, tenant_id) -> tuple[int, int]:
+        """Return the invalidation stamp to pass to :meth:`store`."""
+        with self._lock:
+            return self._generation(str(tenant_id))
+
+    def get(self, tenant_id, key: Hashable = None) -> Optional[Any]:
+        """Return the cached value while it is still fresh."""
+        with self._lock:
+            cached = self._entries.get((str(tenant_id), key))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def store(self, tenant_id, value: Any, generation: tuple[int, int], key: Hashable = None) -> None:
+        """Cache a computed value unless the tenant was invalidated meanwhile."""
+        ttl = max(0, int(getattr(settings, self.ttl_setting)))
+        if ttl <= 0:
+            return
+        tenant_key = str(tenant_id)
+        with self._lock:
+            if self._generation(tenant_key) != generation:
+                return
+            self._entries[(tenant_key, key)] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, tenant_id=None) -> None:
+        """Drop cached values for one tenant, or for all tenants when omitted."""
+        with self._lock:
+            if tenant_id is None:
+                self._global_generation += 1
+                self._entries.clear()
+                return
+            tenant_key = str(tenant_id)
+            self._generations[tenant_key] = self._generations.get(tenant_key, 0) + 1
+            for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == tenant_key]:
+                self._entries.pop(entry_key, None)
+
+
+def _caches() -> list[TenantCache]:
+    with _registry_lock:
+        return list(_registry)
+
+
+def _is_tracked(model: Optional[type]) -> bool:
+    return model is not None and any(issubclass(model, cache.models) for cache in _caches())
+
+
+def _mark_dirty(session: Session, model: type, tenant_id) -> None:
+    if tenant_id is None:
+        return
+    session.info.setdefault(_PENDING_WRITES_KEY, {}).setdefault(model, set()).add(str(tenant_id))
+
+
+def _collect_flushed_tenants(session: Session, flush_context) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        model = type(obj)
+        if _is_tracked(model):
+            _mark_dirty(session, model, getattr(obj, "tenant_id", None))
+
+
+def _collect_bulk_writes(orm_execute_state) -> None:
+    if not (orm_execute_state.is_delete or orm_execute_state.is_update or orm_execute_state.is_insert):
+        return
+    model = getattr(orm_execute_state.bind_mapper, "class_", None)
+    if not _is_tracked(model):
+        return
+    params = orm_execute_state.parameters
+    rows = [params] if isinstance(params, dict) else (params or [])
+    # Only multi-row INSERT parameters name their tenants; any other bulk DML
+    # may touch every tenant.
+    if orm_execute_state.is_insert and rows and all(row.get("tenant_id") for row in rows):
+        for row in rows:
+            _mark_dirty(orm_execute_state.session, model, row["tenant_id"])
+        return
+    _mark_dirty(orm_execute_state.session, model, ALL_TENANTS)
+
+
+def _discard_dirty_tenants(session: Session) -> None:
+    session.info.pop(_PENDING_WRITES_KEY, None)
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    written = session.info.pop(_PENDING_WRITES_KEY, None)
+    if not written:
+        return
+    for cache in _caches():
+        tenants = set().union(*(
+            tenants for model, tenants in written.items() if issubclass(model, cache.models)
+        ))
+        if ALL_TENANTS in tenants:
+            cache.invalidate()
+            continue
+        for tenant_id in tenants:
+            cache.invalidate(tenant_id)
+
+
+_HOOKS = (
+    ("after_flush", _collect_flushed_tenants),
+    ("do_orm_execute", _collect_bulk_writes),
+    ("after_rollback", _discard_dirty_tenants),
+    ("after_commit", _invalidate_after_commit),
+)
+
+
+def install_session_hooks() -> None:
+    """Register the cache invalidation listeners on ``Session`` (idempotent)."""
+    for identifier, fn in _HOOKS:
+        if not event.contains(Session, identifier, fn):
+            event.listen(Session, identifier, fn)
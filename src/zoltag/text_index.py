@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from threading import Condition, Thread
 from typing import Iterable, Optional
 from uuid import UUID
 
@@ -11,6 +14,7 @@ import numpy as np
 import sqlalchemy as sa
 from sqlalchemy import and_, or_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from zoltag.list_visibility import LIST_VISIBILITY_SHARED
@@ -21,6 +25,9 @@ from zoltag.tagging import get_tagger
 from zoltag.tenant_scope import parse_tenant_id, tenant_column_filter_for_values
 
 
+logger = logging.getLogger(__name__)
+
+
 def _now_utc_naive() -> datetime:
     return datetime.now(timezone.utc).replace(tzinfo=None)
 
@@ -297,6 +304,7 @@ def rebuild_asset_text_index(
     *,
     tenant_id: UUID | str,
     asset_id: UUID | str | None = None,
+    asset_ids: Iterable[UUID | str] | None = None,
     limit: int | None = None,
     offset: int = 0,
     include_embeddings: bool = True,
@@ -307,7 +315,9 @@ def rebuild_asset_text_index(
     safe_limit = None if limit is None else max(1, int(limit))
     refresh_mode = bool(refresh)
 
-    if asset_id is not None:
+    if asset_ids is not None:
+        asset_ids = list(dict.fromkeys(_normalize_uuid(value, field_name="asset_id") for value in asset_ids))
+    elif asset_id is not None:
         asset_ids = [_normalize_uuid(asset_id, field_name="asset_id")]
     else:
         query = db.query(ImageMetadata.asset_id).filter(
@@ -379,3 +389,172 @@ def rebuild_asset_text_index(
         "refresh": refresh_mode,
         "errors": errors,
     }
+
+
+class TextIndexRefreshQueue:
+    """Deduplicating, debounced queue of asset text documents to rebuild.
+
+    Request handlers enqueue asset ids after committing tag/list/note edits; a
+    daemon thread waits ``debounce_seconds`` after the first pending entry so
+    bursts of edits to the same assets collapse into one rebuild, then rebuilds
+    in batches of ``batch_size`` using its own sessions.
+    """
+
+    def __init__(self, *, batch_size: int, debounce_seconds: float):
+        self.batch_size = max(1, int(batch_size))
+        self.debounce_seconds = max(0.0, float(debounce_seconds))
+        # Insertion-ordered set of (engine, tenant_id, asset_id).
+        self._pending: dict[tuple[Engine, UUID, UUID], None] = {}
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._stopping = False
+
+    def submit(self, engine: Engine, tenant_id: UUID, asset_ids: Iterable[UUID]) -> int:
+        """Queue assets for a rebuild; returns how many were not already pending."""
+        added = 0
+        with self._condition:
+            for asset_id in asset_ids:
+                key = (engine, tenant_id, asset_id)
+                if key not in self._pending:
+                    self._pending[key] = None
+                    added += 1
+            if added:
+                self._condition.notify()
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping = False
+                self._thread = Thread(target=self._run, name="zoltag-text-index-refresh", daemon=True)
+                self._thread.start()
+        return added
+
+    def discard(self, engine: Engine, tenant_id: UUID, asset_ids: Iterable[UUID]) -> None:
+        """Drop pending entries that the caller is about to rebuild itself."""
+        with self._condition:
+            for asset_id in asset_ids:
+                self._pending.pop((engine, tenant_id, asset_id), None)
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Rebuild everything queued so far; returns the number of documents rebuilt."""
+        processed = 0
+        while True:
+            with self._condition:
+                batch = []
+                for key in list(self._pending)[: self.batch_size]:
+                    del self._pending[key]
+                    batch.append(key)
+            if not batch:
+                return processed
+            processed += self._rebuild_batch(batch)
+
+    def stop(self, timeout_seconds: float = 5.0) -> None:
+        """Stop the drainer thread after rebuilding whatever is still queued."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout_seconds)
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                deadline = time.monotonic() + self.debounce_seconds
+                while not self._stopping and len(self._pending) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                stopping = self._stopping
+            self.flush()
+            if stopping:
+                return
+
+    @staticmethod
+    def _rebuild_batch(batch: list[tuple[Engine, UUID, UUID]]) -> int:
+        grouped: dict[tuple[int, UUID], tuple[Engine, list[UUID]]] = {}
+        for engine, tenant_id, asset_id in batch:
+            grouped.setdefault((id(engine), tenant_id), (engine, []))[1].append(asset_id)
+        processed = 0
+        for (_, tenant_id), (engine, asset_ids) in grouped.items():
+            db = Session(bind=engine)
+            try:
+                result = rebuild_asset_text_index(
+                    db,
+                    tenant_id=tenant_id,
+                    asset_ids=asset_ids,
+                    include_embeddings=False,
+                )
+                processed += result["processed"]
+                if result["failed"]:
+                    logger.warning(
+                        "Failed to refresh asset_text_index for %s asset(s): %s",
+                        result["failed"],
+                        "; ".join(result["errors"][:5]),
+                    )
+            except Exception:
+                logger.warning("Failed to refresh asset_text_index for %s asset(s)", len(asset_ids), exc_info=True)
+            finally:
+                db.close()
+        return processed
+
+
+_refresh_queue = TextIndexRefreshQueue(
+    batch_size=settings.text_index_refresh_batch_size,
+    debounce_seconds=settings.text_index_refresh_debounce_ms / 1000.0,
+)
+
+
+def flush_text_index_refresh_queue() -> int:
+    """Synchronously rebuild every queued asset text document."""
+    return _refresh_queue.flush()
+
+
+def stop_text_index_refresh_queue(timeout_seconds: float = 5.0) -> None:
+    """Drain queued text index refreshes and stop the background drainer."""
+    _refresh_queue.stop(timeout_seconds=timeout_seconds)
+
+
+def enqueue_asset_text_index_refresh(
+    db: Session,
+    *,
+    tenant_id: UUID | str,
+    asset_ids: Iterable[UUID | str | None],
+    wait: bool = False,
+) -> None:
+    """Schedule text document rebuilds for assets whose tags, lists or notes changed.
+
+    Call after committing the edit. With ``wait=True`` the documents are rebuilt
+    in the caller's session before returning (read-your-writes); otherwise the
+    background drainer picks them up. Failures are logged only.
+    """
+    try:
+        tenant_uuid = _normalize_uuid(tenant_id, field_name="tenant_id")
+        normalized = list(dict.fromkeys(
+            _normalize_uuid(value, field_name="asset_id") for value in asset_ids if value
+        ))
+        if not normalized:
+            return
+        bind = db.get_bind()
+        engine = bind.engine if hasattr(bind, "engine") else bind
+        # SQLite connections are per-thread (in-memory databases in particular),
+        # so local/test setups rebuild inline instead of from the drainer thread.
+        if wait or not settings.text_index_refresh_async or engine.dialect.name == "sqlite":
+            _refresh_queue.discard(engine, tenant_uuid, normalized)
+            result = rebuild_asset_text_index(
+                db,
+                tenant_id=tenant_uuid,
+                asset_ids=normalized,
+                include_embeddings=False,
+            )
+            for error in result["errors"]:
+                logger.warning("Failed to refresh asset_text_index for asset %s", error)
+            return
+        _refresh_queue.submit(engine, tenant_uuid, normalized)
+    except Exception:
+        logger.warning("Failed to schedule asset_text_index refresh", exc_info=True)
@@ -14,12 +14,17 @@ from datetime import datetime, timedelta, timezone
 from threading import Event, Lock, Thread
 from typing import Any, Callable, Optional
 
+from sqlalchemy import func, or_, text
+from sqlalchemy.engine import Connection
+
 from zoltag.cli.introspection import build_queue_command_argv
-from zoltag.database import SessionLocal
-from zoltag.metadata import Job, JobAttempt, JobDefinition, JobWorker
+from zoltag.database import SessionLocal, engine
+from zoltag.job_notify import JobWakeupListener
+from zoltag.metadata import DEFAULT_JOB_QUEUE, Job, JobAttempt, JobDefinition, JobWorker
 from zoltag.auth.models import UserProfile
 from zoltag.workflow_queue import (
     handle_workflow_job_state_change,
+    lock_workflow_run_for_job,
     mark_workflow_step_running,
     reconcile_running_workflows,
 )
@@ -35,9 +40,12 @@ _MAX_LOG_TAIL_CHARS = 20000
 _DEFAULT_POLL_SECONDS = 5.0
 _DEFAULT_LEASE_SECONDS = 300
 _DEFAULT_IDLE_HEARTBEAT_SECONDS = 30.0
-_DEFAULT_LOG_FLUSH_SECONDS = 2.0
-_DEFAULT_CANCEL_CHECK_SECONDS = 1.0
-_DEFAULT_WORKFLOW_RECONCILE_SECONDS = 10.0
+_DEFAULT_ATTEMPT_HEARTBEAT_SECONDS = 1.0
+_DEFAULT_WORKFLOW_RECONCILE_SECONDS = 120.0
+_DEFAULT_NOTIFY_FALLBACK_POLL_SECONDS = 30.0
+_DEFAULT_CONCURRENCY = 1
+_CLAIM_CANDIDATE_WINDOW = 50
+_MAX_CLAIM_PASSES = 3
 
 _worker_thread: Optional[Thread] = None
 _worker_stop_event: Optional[Event] = None
@@ -52,6 +60,8 @@ class ClaimedJob:
     timeout_seconds: int
     max_attempts: int
     attempt_no: int
+    queue: str = ""
+    source_ref: Optional[str] = None
 
 
 @dataclass
@@ -166,67 +176,283 @@ def _upsert_worker_heartbeat(
     row.last_seen_at = now
 
 
-def _claim_next_job(
+def _parse_queue_map(raw: Any, convert: Callable[[str], Any]) -> dict[str, Any]:
+    """Parse comma separated ``queue=value`` pairs."""
+    values: dict[str, Any] = {}
+    for item in str(raw or "").split(","):
+        name, sep, value = item.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            continue
+        try:
+            values[name] = convert(value.strip())
+        except ValueError:
+            logger.warning("Ignoring invalid queue setting %r", item)
+    return values
+
+
+def _parse_queue_limits(raw: Any) -> dict[str, int]:
+    return {name: max(0, value) for name, value in _parse_queue_map(raw, int).items()}
+
+
+def _parse_queue_weights(raw: Any) -> dict[str, float]:
+    return {name: value for name, value in _parse_queue_map(raw, float).items() if value > 0}
+
+
+@dataclass
+class _ClaimCandidate:
+    id: uuid.UUID
+    tenant_id: str
+    queue: str
+    priority: int
+
+
+def _pick_fair_candidates(
+    candidates: list[_ClaimCandidate],
+    *,
+    limit: int,
+    running_by_tenant: dict[str, int],
+    running_by_queue: dict[str, int],
+    queue_weights: dict[str, float],
+    remaining_by_queue: dict[str, int],
+) -> list[_ClaimCandidate]:
+    """Choose up to ``limit`` candidates using weighted fair sharing.
+
+    Candidates arrive in claim order. Priority still wins outright; within a
+    priority level the next pick goes to the tenant with the fewest running
+    jobs, then to the queue with the lowest running count relative to its
+    weight, so one backlog cannot starve everyone queued behind it.
+    """
+    tenant_load = dict(running_by_tenant)
+    queue_load = dict(running_by_queue)
+    remaining = dict(remaining_by_queue)
+    pool = list(candidates)
+    picked: list[_ClaimCandidate] = []
+    while pool and len(picked) < limit:
+        best_index: Optional[int] = None
+        best_key: Optional[tuple] = None
+        for index, candidate in enumerate(pool):
+            if remaining.get(candidate.queue, 1) <= 0:
+                continue
+            weight = queue_weights.get(candidate.queue, 1.0)
+            key = (
+                candidate.priority,
+                tenant_load.get(candidate.tenant_id, 0),
+                queue_load.get(candidate.queue, 0) / weight,
+                index,
+            )
+            if best_key is None or key < best_key:
+                best_index, best_key = index, key
+        if best_index is None:
+            break
+        candidate = pool.pop(best_index)
+        picked.append(candidate)
+        tenant_load[candidate.tenant_id] = tenant_load.get(candidate.tenant_id, 0) + 1
+        queue_load[candidate.queue] = queue_load.get(candidate.queue, 0) + 1
+        if candidate.queue in remaining:
+            remaining[candidate.queue] -= 1
+    return picked
+
+
+class _SlotTracker:
+    """Thread-safe bookkeeping for jobs running in this worker's slots."""
+
+    def __init__(self, max_slots: int, queue_limits: Optional[dict[str, int]] = None):
+        self.max_slots = max(1, int(max_slots))
+        self.queue_limits = dict(queue_limits or {})
+        self.slot_freed = Event()
+        self._lock = Lock()
+        self._running: dict[str, str] = {}
+        self._threads: dict[str, Thread] = {}
+
+    def running_count(self) -> int:
+        with self._lock:
+            return len(self._running)
+
+    def free_slots(self) -> int:
+        with self._lock:
+            return max(0, self.max_slots - len(self._running))
+
+    def running_by_queue(self) -> dict[str, int]:
+        with self._lock:
+            counts: dict[str, int] = {}
+            for queue in self._running.values():
+                counts[queue] = counts.get(queue, 0) + 1
+            return counts
+
+    def start(self, job: ClaimedJob, target: Callable[[], None]) -> None:
+        def _run() -> None:
+            try:
+                target()
+            finally:
+                self._release(job.id)
+
+        thread = Thread(target=_run, name=f"zoltag-job-slot-{job.id[:8]}", daemon=True)
+        with self._lock:
+            self._running[job.id] = job.queue
+            self._threads[job.id] = thread
+        thread.start()
+
+    def _release(self, job_id: str) -> None:
+        with self._lock:
+            self._running.pop(job_id, None)
+            self._threads.pop(job_id, None)
+        self.slot_freed.set()
+
+    def join_all(self, timeout_seconds: Optional[float] = None) -> None:
+        with self._lock:
+            threads = list(self._threads.values())
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        for thread in threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            thread.join(timeout=remaining)
+
+
+def _claim_jobs(
     *,
     worker_id: str,
     hostname: str,
     version: str,
     lease_seconds: int,
     queues: list[str],
-) -> Optional[ClaimedJob]:
+    limit: int = 1,
+    queue_limits: Optional[dict[str, int]] = None,
+    queue_weights: Optional[dict[str, float]] = None,
+    running_by_queue: Optional[dict[str, int]] = None,
+) -> list[ClaimedJob]:
+    """Claim up to ``limit`` runnable jobs in one transaction.
+
+    Only jobs in ``queues`` are considered (all queues when empty). Per-queue
+    limits are enforced against ``running_by_queue`` (jobs already running in
+    this worker); picks across tenants and queues are fair-shared by
+    ``_pick_fair_candidates``.
+    """
+    limit = max(1, int(limit))
+    queue_limits = queue_limits or {}
+    queue_weights = queue_weights or {}
+    running_by_queue = dict(running_by_queue or {})
+    remaining_by_queue = {
+        queue: max(0, cap - running_by_queue.get(queue, 0))
+        for queue, cap in queue_limits.items()
+    }
+
     db = SessionLocal()
     try:
         now = _now_utc()
-        query = (
-            db.query(Job)
-            .filter(
+        lease_expires_at = now + timedelta(seconds=lease_seconds)
+        claimed: list[ClaimedJob] = []
+        orphaned: dict[uuid.UUID, Optional[str]] = {}
+        # Candidates are read without locks, fair-picked, then locked with
+        # SKIP LOCKED; a pass that loses races to other workers retries.
+        for _ in range(_MAX_CLAIM_PASSES):
+            wanted = limit - len(claimed)
+            if wanted <= 0:
+                break
+            saturated = sorted(queue for queue, remaining in remaining_by_queue.items() if remaining <= 0)
+            candidate_query = db.query(Job.id, Job.tenant_id, Job.queue, Job.priority).filter(
                 Job.status == "queued",
                 Job.scheduled_for <= now,
             )
-            .order_by(
-                Job.priority.asc(),
-                Job.queued_at.asc(),
-                Job.id.asc(),
-            )
-        )
-        if db.bind and db.bind.dialect.name == "postgresql":
-            query = query.with_for_update(skip_locked=True)
-        else:
-            query = query.with_for_update()
+            if queues:
+                candidate_query = candidate_query.filter(Job.queue.in_(queues))
+            if saturated:
+                candidate_query = candidate_query.filter(Job.queue.notin_(saturated))
+            candidates = [
+                _ClaimCandidate(
+                    id=row.id,
+                    tenant_id=str(row.tenant_id),
+                    queue=str(row.queue or DEFAULT_JOB_QUEUE),
+                    priority=int(row.priority or 0),
+                )
+                for row in candidate_query.order_by(
+                    Job.priority.asc(),
+                    Job.scheduled_for.asc(),
+                    Job.id.asc(),
+                ).limit(max(_CLAIM_CANDIDATE_WINDOW, wanted * 4)).all()
+            ]
+            if not candidates:
+                break
 
-        job = query.first()
-        if job is None:
-            _upsert_worker_heartbeat(
-                db,
-                worker_id=worker_id,
-                hostname=hostname,
-                version=version,
-                queues=queues,
-                running_count=0,
-                metadata_json={},
+            running_by_tenant: dict[str, int] = {}
+            fleet_running_by_queue: dict[str, int] = {}
+            for tenant_id, queue, count in (
+                db.query(Job.tenant_id, Job.queue, func.count(Job.id))
+                .filter(Job.status == "running")
+                .group_by(Job.tenant_id, Job.queue)
+                .all()
+            ):
+                running_by_tenant[str(tenant_id)] = running_by_tenant.get(str(tenant_id), 0) + int(count)
+                fleet_running_by_queue[str(queue)] = fleet_running_by_queue.get(str(queue), 0) + int(count)
+
+            picked = _pick_fair_candidates(
+                candidates,
+                limit=wanted,
+                running_by_tenant=running_by_tenant,
+                running_by_queue=fleet_running_by_queue,
+                queue_weights=queue_weights,
+                remaining_by_queue=remaining_by_queue,
             )
-            db.commit()
-            return None
+            if not picked:
+                break
 
-        attempt_no = int(job.attempt_count or 0) + 1
-        lease_expires_at = now + timedelta(seconds=lease_seconds)
-        job.status = "running"
-        if not job.started_at:
-            job.started_at = now
-        job.lease_expires_at = lease_expires_at
-        job.claimed_by_worker = worker_id
-        job.attempt_count = attempt_no
-        mark_workflow_step_running(db, job=job, started_at=job.started_at or now)
-        db.add(
-            JobAttempt(
-                job_id=job.id,
-                attempt_no=attempt_no,
-                worker_id=worker_id,
-                pid=os.getpid(),
-                started_at=now,
-                status="running",
+            lock_query = (
+                db.query(Job, JobDefinition)
+                .outerjoin(JobDefinition, JobDefinition.id == Job.definition_id)
+                .filter(
+                    Job.id.in_([candidate.id for candidate in picked]),
+                    Job.status == "queued",
+                )
             )
-        )
+            if db.bind and db.bind.dialect.name == "postgresql":
+                lock_query = lock_query.with_for_update(skip_locked=True, of=Job)
+            else:
+                lock_query = lock_query.with_for_update()
+            locked = {job.id: (job, definition) for job, definition in lock_query.all()}
+
+            for candidate in picked:
+                if candidate.id not in locked:
+                    continue
+                job, definition = locked[candidate.id]
+                if definition is None:
+                    orphaned[job.id] = job.source_ref
+                    continue
+                if candidate.queue in remaining_by_queue:
+                    remaining_by_queue[candidate.queue] -= 1
+
+                attempt_no = int(job.attempt_count or 0) + 1
+                job.status = "running"
+                if not job.started_at:
+                    job.started_at = now
+                job.lease_expires_at = lease_expires_at
+                job.claimed_by_worker = worker_id
+                job.attempt_count = attempt_no
+                mark_workflow_step_running(db, job=job, started_at=job.started_at or now)
+                db.add(
+                    JobAttempt(
+                        job_id=job.id,
+                        attempt_no=attempt_no,
+                        worker_id=worker_id,
+                        pid=os.getpid(),
+                        started_at=now,
+                        status="running",
+                    )
+                )
+                claimed.append(
+                    ClaimedJob(
+                        id=str(job.id),
+                        tenant_id=str(job.tenant_id),
+                        definition_key=str(definition.key or ""),
+                        payload=job.payload or {},
+                        timeout_seconds=int(definition.timeout_seconds or 3600),
+                        max_attempts=int(job.max_attempts or 1),
+                        attempt_no=attempt_no,
+                        queue=candidate.queue,
+                        source_ref=job.source_ref,
+                    )
+                )
+            db.flush()
+            if len(locked) == len(picked):
+                break
 
         _upsert_worker_heartbeat(
             db,
@@ -234,39 +460,58 @@ def _claim_next_job(
             hostname=hostname,
             version=version,
             queues=queues,
-            running_count=1,
-            metadata_json={"last_job_id": str(job.id)},
+            running_count=sum(running_by_queue.values()) + len(claimed),
+            metadata_json={"last_job_id": claimed[-1].id} if claimed else {},
         )
         db.commit()
-
-        definition = (
-            db.query(JobDefinition)
-            .filter(JobDefinition.id == job.definition_id)
-            .first()
-        )
-        if definition is None:
-            raise NonRetryableJobError(
-                f"Missing job definition for definition_id={job.definition_id}"
-            )
-
-        return ClaimedJob(
-            id=str(job.id),
-            tenant_id=str(job.tenant_id),
-            definition_key=str(definition.key or ""),
-            payload=job.payload or {},
-            timeout_seconds=int(definition.timeout_seconds or 3600),
-            max_attempts=int(job.max_attempts or 1),
-            attempt_no=attempt_no,
-        )
     finally:
         db.close()
 
+    if orphaned:
+        _dead_letter_jobs_without_definition(orphaned)
+    return claimed
+
+
+def _dead_letter_jobs_without_definition(orphaned: dict[uuid.UUID, Optional[str]]) -> None:
+    """Fail queued jobs whose definition is gone; no retry can run them."""
+    for job_id, source_ref in orphaned.items():
+        db = SessionLocal()
+        try:
+            # Run lock first, as in _finalize_job.
+            lock_workflow_run_for_job(db, source_ref=source_ref)
+            job = (
+                db.query(Job)
+                .filter(Job.id == job_id, Job.status == "queued")
+                .with_for_update()
+                .first()
+            )
+            if job is None:
+                db.rollback()
+                continue
+            job.status = "dead_letter"
+            job.finished_at = _now_utc()
+            job.lease_expires_at = None
+            job.claimed_by_worker = None
+            job.last_error = f"Missing job definition for definition_id={job.definition_id}"
+            handle_workflow_job_state_change(db, job=job)
+            db.commit()
+            logger.error("Job %s moved to dead_letter: %s", job_id, job.last_error)
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to dead-letter job %s without definition", job_id)
+        finally:
+            db.close()
+
 
 def _execute_claimed_job(
     job: ClaimedJob,
-    on_progress_logs: Optional[Callable[[Optional[str], Optional[str]], None]] = None,
-    should_cancel: Optional[Callable[[], bool]] = None,
+    on_heartbeat: Optional[Callable[[Optional[str], Optional[str]], bool]] = None,
 ) -> ExecutionResult:
+    """Run the job's command, calling ``on_heartbeat`` periodically.
+
+    ``on_heartbeat`` receives the log tails when they changed since the last
+    beat (``None`` otherwise) and returns True when the job should be canceled.
+    """
     process: Optional[subprocess.Popen[str]] = None
     try:
         argv = _build_command_argv(job)
@@ -310,13 +555,12 @@ def _execute_claimed_job(
         stderr_thread.start()
 
         timeout_seconds = max(1, int(job.timeout_seconds or 3600))
-        flush_seconds = max(
-            0.5,
-            float(os.getenv("JOB_ATTEMPT_LOG_FLUSH_SECONDS") or _DEFAULT_LOG_FLUSH_SECONDS),
+        heartbeat_seconds = max(
+            0.2,
+            float(os.getenv("JOB_ATTEMPT_HEARTBEAT_SECONDS") or _DEFAULT_ATTEMPT_HEARTBEAT_SECONDS),
         )
         started_at = time.monotonic()
-        last_flush_at = 0.0
-        last_cancel_check_at = 0.0
+        last_heartbeat_at = 0.0
         did_timeout = False
         did_cancel = False
         last_sent_tails: tuple[Optional[str], Optional[str]] = (None, None)
@@ -332,23 +576,15 @@ def _execute_claimed_job(
                 process.kill()
                 break
 
-            cancel_check_seconds = max(
-                0.2,
-                float(os.getenv("JOB_ATTEMPT_CANCEL_CHECK_SECONDS") or _DEFAULT_CANCEL_CHECK_SECONDS),
-            )
-            if callable(should_cancel) and (now - last_cancel_check_at) >= cancel_check_seconds:
-                if should_cancel():
+            if callable(on_heartbeat) and (now - last_heartbeat_at) >= heartbeat_seconds:
+                tails = _snapshot_tails()
+                changed = tails != last_sent_tails
+                last_sent_tails = tails
+                last_heartbeat_at = now
+                if on_heartbeat(*(tails if changed else (None, None))):
                     did_cancel = True
                     process.kill()
                     break
-                last_cancel_check_at = now
-
-            if now - last_flush_at >= flush_seconds:
-                tails = _snapshot_tails()
-                if callable(on_progress_logs) and tails != last_sent_tails:
-                    on_progress_logs(*tails)
-                    last_sent_tails = tails
-                last_flush_at = now
 
             if process.poll() is not None:
                 break
@@ -364,8 +600,6 @@ def _execute_claimed_job(
         stderr_thread.join(timeout=2.0)
 
         stdout_tail, stderr_tail = _snapshot_tails()
-        if callable(on_progress_logs) and (stdout_tail, stderr_tail) != last_sent_tails:
-            on_progress_logs(stdout_tail, stderr_tail)
 
         if did_cancel:
             return ExecutionResult(
@@ -440,63 +674,129 @@ def _execute_claimed_job(
                 pass
 
 
-def _update_running_attempt_logs(
-    *,
-    claimed_job: ClaimedJob,
-    worker_id: str,
-    stdout_tail: Optional[str],
-    stderr_tail: Optional[str],
-) -> None:
-    if not stdout_tail and not stderr_tail:
-        return
+_POSTGRES_HEARTBEAT_SQL = text(
+    """
+    WITH renewed AS (
+        UPDATE jobs
+        SET lease_expires_at = :lease_expires_at
+        WHERE id = :job_id AND claimed_by_worker = :worker_id AND status = 'running'
+          AND (lease_expires_at IS NULL OR lease_expires_at < :renew_before)
+        RETURNING id
+    ), logged AS (
+        UPDATE job_attempts
+        SET stdout_tail = COALESCE(:stdout_tail, job_attempts.stdout_tail),
+            stderr_tail = COALESCE(:stderr_tail, job_attempts.stderr_tail)
+        FROM jobs
+        WHERE job_attempts.job_id = :job_id
+          AND job_attempts.attempt_no = :attempt_no
+          AND jobs.id = job_attempts.job_id
+          AND jobs.claimed_by_worker = :worker_id
+          AND jobs.status = 'running'
+          AND (:stdout_tail IS NOT NULL OR :stderr_tail IS NOT NULL)
+        RETURNING job_attempts.id
+    )
+    SELECT status FROM jobs WHERE id = :job_id
+    """
+)
 
-    db = SessionLocal()
-    try:
-        job_uuid = uuid.UUID(claimed_job.id)
-        job = db.query(Job).filter(Job.id == job_uuid).first()
-        if job is None:
-            db.rollback()
-            return
-        if str(job.claimed_by_worker or "").strip() != worker_id or str(job.status or "") != "running":
-            db.rollback()
-            return
 
-        attempt = (
-            db.query(JobAttempt)
-            .filter(
-                JobAttempt.job_id == job_uuid,
-                JobAttempt.attempt_no == claimed_job.attempt_no,
-            )
-            .first()
-        )
-        if attempt is None:
-            db.rollback()
-            return
+class _RunningJobHeartbeat:
+    """Connection held for one running job.
 
-        attempt.stdout_tail = stdout_tail
-        attempt.stderr_tail = stderr_tail
-        db.commit()
-    except Exception:
-        db.rollback()
-        logger.exception("Failed to persist running logs for job %s", claimed_job.id)
-    finally:
-        db.close()
+    Each beat flushes changed log tails, renews the lease once a third of it
+    has elapsed and reads the job status in a single round trip (one statement
+    on Postgres), instead of a fresh session per concern. The same connection
+    finalizes the job.
+    """
 
+    def __init__(self, claimed_job: ClaimedJob, *, worker_id: str, lease_seconds: int):
+        self._job = claimed_job
+        self._job_uuid = uuid.UUID(claimed_job.id)
+        self._worker_id = worker_id
+        self._lease_seconds = lease_seconds
+        self.connection: Optional[Connection] = None
 
-def _is_job_cancel_requested(*, claimed_job_id: str) -> bool:
-    db = SessionLocal()
-    try:
-        job_uuid = uuid.UUID(claimed_job_id)
-        row = db.query(Job.status).filter(Job.id == job_uuid).first()
-        if row is None:
+    def _connect(self) -> Connection:
+        if self.connection is None:
+            self.connection = engine.connect()
+        return self.connection
+
+    def beat(self, stdout_tail: Optional[str], stderr_tail: Optional[str]) -> bool:
+        """Persist progress; returns True when the job was canceled or removed."""
+        now = _now_utc()
+        params = {
+            "job_id": self._job_uuid,
+            "worker_id": self._worker_id,
+            "attempt_no": self._job.attempt_no,
+            "lease_expires_at": now + timedelta(seconds=self._lease_seconds),
+            "renew_before": now + timedelta(seconds=self._lease_seconds * 2 / 3),
+            "stdout_tail": stdout_tail,
+            "stderr_tail": stderr_tail,
+        }
+        try:
+            connection = self._connect()
+            with connection.begin():
+                if connection.dialect.name == "postgresql":
+                    status = connection.execute(_POSTGRES_HEARTBEAT_SQL, params).scalar()
+                else:
+                    status = self._beat_portable(connection, params)
+        except Exception:
+            logger.exception("Heartbeat failed for job %s", self._job.id)
+            self.close()
+            return False
+        if status is None:
             return True
-        status = str(getattr(row, "status", row[0]) or "").strip().lower()
-        return status == "canceled"
-    except Exception:
-        logger.exception("Failed checking cancel status for job %s", claimed_job_id)
-        return False
-    finally:
-        db.close()
+        return str(status).strip().lower() == "canceled"
+
+    @staticmethod
+    def _beat_portable(connection: Connection, params: dict[str, Any]) -> Optional[str]:
+        jobs = Job.__table__
+        attempts = JobAttempt.__table__
+        owned = (
+            jobs.c.id == params["job_id"],
+            jobs.c.claimed_by_worker == params["worker_id"],
+            jobs.c.status == "running",
+        )
+        connection.execute(
+            jobs.update()
+            .where(
+                *owned,
+                or_(
+                    jobs.c.lease_expires_at.is_(None),
+                    jobs.c.lease_expires_at < params["renew_before"],
+                ),
+            )
+            .values(lease_expires_at=params["lease_expires_at"])
+        )
+        log_values = {
+            key: params[key]
+            for key in ("stdout_tail", "stderr_tail")
+            if params[key] is not None
+        }
+        is_owned = connection.execute(
+            jobs.select().with_only_columns(jobs.c.id).where(*owned)
+        ).first() is not None
+        if is_owned and log_values:
+            connection.execute(
+                attempts.update()
+                .where(
+                    attempts.c.job_id == params["job_id"],
+                    attempts.c.attempt_no == params["attempt_no"],
+                )
+                .values(**log_values)
+            )
+        return connection.execute(
+            jobs.select().with_only_columns(jobs.c.status).where(jobs.c.id == params["job_id"])
+        ).scalar()
+
+    def close(self) -> None:
+        connection, self.connection = self.connection, None
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Exception:
+            pass
 
 
 def _finalize_job(
@@ -507,10 +807,15 @@ def _finalize_job(
     hostname: str,
     version: str,
     queues: list[str],
+    running_count: int = 0,
+    connection: Optional[Connection] = None,
 ) -> None:
-    db = SessionLocal()
+    db = SessionLocal(bind=connection) if connection is not None else SessionLocal()
     try:
         job_uuid = uuid.UUID(claimed_job.id)
+        # Workflow advancement happens in this transaction; take the run lock
+        # first to keep lock order consistent with reconciliation.
+        lock_workflow_run_for_job(db, source_ref=claimed_job.source_ref)
         query = db.query(Job).filter(Job.id == job_uuid)
         if db.bind and db.bind.dialect.name == "postgresql":
             query = query.with_for_update(skip_locked=False)
@@ -621,7 +926,7 @@ def _finalize_job(
             hostname=hostname,
             version=version,
             queues=queues,
-            running_count=0,
+            running_count=running_count,
             metadata_json={"last_job_id": claimed_job.id},
         )
         db.commit()
@@ -650,27 +955,81 @@ def _reconcile_workflows_once(*, limit_runs: int = 25) -> None:
         db.close()
 
 
+def _run_claimed_job(
+    claimed_job: ClaimedJob,
+    *,
+    worker_id: str,
+    hostname: str,
+    version: str,
+    queues: list[str],
+    lease_seconds: int,
+    slots: _SlotTracker,
+) -> None:
+    logger.info(
+        "Claimed job %s tenant=%s definition=%s attempt=%s",
+        claimed_job.id,
+        claimed_job.tenant_id,
+        claimed_job.definition_key,
+        claimed_job.attempt_no,
+    )
+    heartbeat = _RunningJobHeartbeat(claimed_job, worker_id=worker_id, lease_seconds=lease_seconds)
+    try:
+        result = _execute_claimed_job(claimed_job, on_heartbeat=heartbeat.beat)
+        _finalize_job(
+            claimed_job=claimed_job,
+            result=result,
+            worker_id=worker_id,
+            hostname=hostname,
+            version=version,
+            queues=queues,
+            running_count=max(0, slots.running_count() - 1),
+            connection=heartbeat.connection,
+        )
+    finally:
+        heartbeat.close()
+
+
 def run_loop(
     *,
     stop_event: Optional[Event] = None,
     once: bool = False,
     poll_seconds: float = _DEFAULT_POLL_SECONDS,
     lease_seconds: int = _DEFAULT_LEASE_SECONDS,
+    concurrency: Optional[int] = None,
 ) -> None:
     stop = stop_event or Event()
     worker_id = str(os.getenv("JOB_WORKER_ID") or _build_worker_id())
     hostname = socket.gethostname()
     version = str(os.getenv("K_REVISION") or os.getenv("GIT_SHA") or "").strip()
     queues = [value.strip() for value in str(os.getenv("JOB_WORKER_QUEUES") or "").split(",") if value.strip()]
+    if concurrency is None:
+        concurrency = int(os.getenv("JOB_WORKER_CONCURRENCY") or _DEFAULT_CONCURRENCY)
+    slots = _SlotTracker(concurrency, _parse_queue_limits(os.getenv("JOB_WORKER_QUEUE_LIMITS")))
+    queue_weights = _parse_queue_weights(os.getenv("JOB_WORKER_QUEUE_WEIGHTS"))
     idle_heartbeat_interval = float(os.getenv("JOB_WORKER_IDLE_HEARTBEAT_SECONDS") or _DEFAULT_IDLE_HEARTBEAT_SECONDS)
     workflow_reconcile_interval = float(
         os.getenv("JOB_WORKFLOW_RECONCILE_SECONDS") or _DEFAULT_WORKFLOW_RECONCILE_SECONDS
     )
     workflow_reconcile_limit = int(os.getenv("JOB_WORKFLOW_RECONCILE_LIMIT") or 25)
+    # With LISTEN/NOTIFY active, enqueues wake the worker immediately and the
+    # poll only catches delayed (scheduled_for) jobs and missed notifications.
+    notify_fallback_poll_seconds = float(
+        os.getenv("JOB_WORKER_NOTIFY_FALLBACK_SECONDS") or _DEFAULT_NOTIFY_FALLBACK_POLL_SECONDS
+    )
+    listener: Optional[JobWakeupListener] = None
+    if _to_bool(os.getenv("JOB_WORKER_LISTEN", "true")):
+        listener = JobWakeupListener(engine)
+        listener.start()
     last_idle_heartbeat_at = 0.0
     last_workflow_reconcile_at = 0.0
 
-    logger.info("Job worker started: worker_id=%s lease_seconds=%s", worker_id, lease_seconds)
+    logger.info(
+        "Job worker started: worker_id=%s lease_seconds=%s slots=%s listen=%s",
+        worker_id,
+        lease_seconds,
+        slots.max_slots,
+        bool(listener and listener.active),
+    )
 
     while not stop.is_set():
         now_monotonic = time.monotonic()
@@ -678,13 +1037,23 @@ def run_loop(
             last_workflow_reconcile_at = now_monotonic
             _reconcile_workflows_once(limit_runs=workflow_reconcile_limit)
 
+        free_slots = slots.free_slots()
+        if free_slots <= 0:
+            slots.slot_freed.wait(min(1.0, max(0.1, poll_seconds)))
+            slots.slot_freed.clear()
+            continue
+
         try:
-            claimed_job = _claim_next_job(
+            claimed_jobs = _claim_jobs(
                 worker_id=worker_id,
                 hostname=hostname,
                 version=version,
                 lease_seconds=lease_seconds,
                 queues=queues,
+                limit=free_slots,
+                queue_limits=slots.queue_limits,
+                queue_weights=queue_weights,
+                running_by_queue=slots.running_by_queue(),
             )
         except Exception:
             logger.exception("Worker claim loop failed")
@@ -693,44 +1062,41 @@ def run_loop(
             stop.wait(max(1.0, poll_seconds))
             continue
 
-        if claimed_job is None:
+        if not claimed_jobs:
             now_ts = time.monotonic()
             if now_ts - last_idle_heartbeat_at >= idle_heartbeat_interval:
                 last_idle_heartbeat_at = now_ts
                 logger.debug("Worker idle: no queued jobs")
             if once:
                 break
-            stop.wait(max(0.1, poll_seconds))
+            if listener is None:
+                stop.wait(max(0.1, poll_seconds))
+                continue
+            idle_wait = notify_fallback_poll_seconds if listener.active else poll_seconds
+            until_reconcile = workflow_reconcile_interval - (time.monotonic() - last_workflow_reconcile_at)
+            listener.wait(max(0.1, min(idle_wait, until_reconcile)), stop)
             continue
 
-        logger.info(
-            "Claimed job %s tenant=%s definition=%s attempt=%s",
-            claimed_job.id,
-            claimed_job.tenant_id,
-            claimed_job.definition_key,
-            claimed_job.attempt_no,
-        )
-        result = _execute_claimed_job(
-            claimed_job,
-            on_progress_logs=lambda stdout_tail, stderr_tail: _update_running_attempt_logs(
-                claimed_job=claimed_job,
-                worker_id=worker_id,
-                stdout_tail=stdout_tail,
-                stderr_tail=stderr_tail,
-            ),
-            should_cancel=lambda: _is_job_cancel_requested(claimed_job_id=claimed_job.id),
-        )
-        _finalize_job(
-            claimed_job=claimed_job,
-            result=result,
-            worker_id=worker_id,
-            hostname=hostname,
-            version=version,
-            queues=queues,
-        )
+        for claimed_job in claimed_jobs:
+            slots.start(
+                claimed_job,
+                lambda claimed_job=claimed_job: _run_claimed_job(
+                    claimed_job,
+                    worker_id=worker_id,
+                    hostname=hostname,
+                    version=version,
+                    queues=queues,
+                    lease_seconds=lease_seconds,
+                    slots=slots,
+                ),
+            )
         if once:
             break
 
+    # Let in-flight jobs finish and finalize before the worker exits.
+    slots.join_all()
+    if listener is not None:
+        listener.close()
     logger.info("Job worker stopping: worker_id=%s", worker_id)
 
 
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime, timezone
 from uuid import UUID
 
+from sqlalchemy import exists, func
 from sqlalchemy.orm import Session
 
 from zoltag.cli.introspection import normalize_queue_payload
+from zoltag.job_notify import publish_job_wakeup
 from zoltag.metadata import (
+    DEFAULT_JOB_QUEUE,
     Job,
     JobDefinition,
     WorkflowDefinition,
@@ -22,6 +26,8 @@ WORKFLOW_SOURCE_PREFIX = "workflow"
 _RUN_TERMINAL = {"succeeded", "failed", "canceled"}
 _STEP_TERMINAL = {"succeeded", "failed", "canceled", "skipped"}
 _STEP_OPEN = {"pending", "queued", "running"}
+_STEP_ACTIVE = {"queued", "running"}
+_JOB_TERMINAL = {"succeeded", "failed", "canceled", "dead_letter"}
 
 
 def _now_utc() -> datetime:
@@ -88,6 +94,32 @@ def _normalize_step_definition(step: dict) -> dict:
     }
 
 
+def build_step_graph(steps: list[dict]) -> tuple[dict[str, list[str]], dict[str, int]]:
+    """Return the dependents adjacency list and in-degree for each step."""
+    dependents: dict[str, list[str]] = {step["step_key"]: [] for step in steps}
+    in_degree: dict[str, int] = {}
+    for step in steps:
+        in_degree[step["step_key"]] = len(step["depends_on"])
+        for dep in step["depends_on"]:
+            dependents.setdefault(dep, []).append(step["step_key"])
+    return dependents, in_degree
+
+
+def topological_step_order(dependents: dict[str, list[str]], in_degree: dict[str, int]) -> list[str]:
+    """Kahn's algorithm; the result is shorter than the step count on a cycle."""
+    remaining = dict(in_degree)
+    ready = deque(sorted(key for key, degree in remaining.items() if degree == 0))
+    order: list[str] = []
+    while ready:
+        node = ready.popleft()
+        order.append(node)
+        for child in dependents.get(node, ()):
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                ready.append(child)
+    return order
+
+
 def validate_workflow_steps(
     db: Session,
     steps: list[dict],
@@ -108,19 +140,8 @@ def validate_workflow_steps(
             if dep not in key_set:
                 raise ValueError(f"Step {step['step_key']} depends on unknown step: {dep}")
 
-    # Cycle detection
-    incoming = {step["step_key"]: set(step["depends_on"]) for step in normalized}
-    ready = [key for key, deps in incoming.items() if not deps]
-    seen_count = 0
-    while ready:
-        node = ready.pop()
-        seen_count += 1
-        for key, deps in incoming.items():
-            if node in deps:
-                deps.remove(node)
-                if not deps:
-                    ready.append(key)
-    if seen_count != len(normalized):
+    dependents, in_degree = build_step_graph(normalized)
+    if len(topological_step_order(dependents, in_degree)) != len(normalized):
         raise ValueError("Workflow steps contain a dependency cycle")
 
     definition_keys = sorted({step["definition_key"] for step in normalized})
@@ -154,6 +175,18 @@ def _lock_workflow_run(db: Session, run_id: UUID) -> WorkflowRun | None:
     )
 
 
+def lock_workflow_run_for_job(db: Session, *, source_ref: str | None) -> None:
+    """Lock the workflow run owning a step job, if any.
+
+    Callers finalizing a step job take this lock before locking the job row so
+    every path acquires run -> job locks in the same order as reconciliation
+    and fail-fast cancellation.
+    """
+    parsed = parse_workflow_source_ref(source_ref)
+    if parsed:
+        _lock_workflow_run(db, parsed[0])
+
+
 def _load_step_runs(db: Session, run_id: UUID) -> list[WorkflowStepRun]:
     return (
         db.query(WorkflowStepRun)
@@ -190,8 +223,15 @@ def _cancel_open_steps_for_run(db: Session, run: WorkflowRun, *, reason: str | N
 
 def _reconcile_run_status(db: Session, run: WorkflowRun) -> None:
     now = _now_utc()
-    steps = _load_step_runs(db, run.id)
-    statuses = [str(step.status or "") for step in steps]
+    statuses = [
+        str(status or "")
+        for (status,) in (
+            db.query(WorkflowStepRun.status)
+            .filter(WorkflowStepRun.workflow_run_id == run.id)
+            .group_by(WorkflowStepRun.status)
+            .all()
+        )
+    ]
     if not statuses:
         run.status = "failed"
         run.finished_at = now
@@ -233,106 +273,174 @@ def _reconcile_run_status(db: Session, run: WorkflowRun) -> None:
         run.finished_at = now
 
 
-def _enqueue_ready_steps(db: Session, run: WorkflowRun) -> None:
-    if run.status in _RUN_TERMINAL:
-        return
+def _skip_blocked_descendants(
+    db: Session,
+    run: WorkflowRun,
+    dependents: dict[str, list[str]],
+    step_keys: list[str],
+    *,
+    now: datetime,
+) -> None:
+    """Skip pending steps downstream of steps that did not succeed."""
+    frontier = deque(step_keys)
+    visited: set[str] = set()
+    while frontier:
+        children = [key for key in dependents.get(frontier.popleft(), ()) if key not in visited]
+        if not children:
+            continue
+        visited.update(children)
+        for child in (
+            db.query(WorkflowStepRun)
+            .filter(
+                WorkflowStepRun.workflow_run_id == run.id,
+                WorkflowStepRun.step_key.in_(children),
+                WorkflowStepRun.status == "pending",
+            )
+            .all()
+        ):
+            child.status = "skipped"
+            child.finished_at = now
+            if not child.last_error:
+                child.last_error = "Skipped because dependency did not succeed"
+            frontier.append(str(child.step_key))
 
-    step_runs = _load_step_runs(db, run.id)
-    by_key = {str(step.step_key): step for step in step_runs}
-    now = _now_utc()
 
-    # Mark steps as skipped when they depend on terminal non-success steps.
+def _step_dependents(db: Session, run: WorkflowRun) -> dict[str, list[str]]:
+    """Return the run's step adjacency, backfilling runs started before it existed."""
+    if run.step_dependents is not None:
+        return run.step_dependents
+
+    step_runs = _load_step_runs(db, run.id)
+    dependents: dict[str, list[str]] = {str(step.step_key): [] for step in step_runs}
+    status_by_key = {str(step.step_key): str(step.status or "") for step in step_runs}
     for step in step_runs:
-        if str(step.status or "") != "pending":
-            continue
         deps = list(step.depends_on or [])
-        blocked = False
         for dep in deps:
-            dep_step = by_key.get(dep)
-            dep_status = str(getattr(dep_step, "status", "") or "")
-            if dep_status in {"failed", "canceled", "skipped"}:
-                blocked = True
-                break
-        if blocked:
-            step.status = "skipped"
-            step.finished_at = now
-            if not step.last_error:
-                step.last_error = "Skipped because dependency did not succeed"
-
-    running_or_queued = sum(1 for step in step_runs if str(step.status or "") in {"queued", "running"})
-    max_parallel = max(1, int(run.max_parallel_steps or 1))
-    capacity = max_parallel - running_or_queued
-    if capacity <= 0:
+            dependents.setdefault(dep, []).append(str(step.step_key))
+        if step.unmet_dependency_count is None:
+            step.unmet_dependency_count = sum(1 for dep in deps if status_by_key.get(dep) != "succeeded")
+    run.step_dependents = dependents
+    blocked = [key for key, status in status_by_key.items() if status in {"failed", "canceled", "skipped"}]
+    if blocked:
+        _skip_blocked_descendants(db, run, dependents, blocked, now=_now_utc())
+    return dependents
+
+
+def _propagate_step_outcome(db: Session, run: WorkflowRun, step: WorkflowStepRun, previous_status: str) -> None:
+    """Update downstream steps after ``step`` reached a terminal status.
+
+    Costs O(out-degree) on success: each dependent's unmet counter drops by
+    one. Non-success statuses skip everything pending downstream.
+    """
+    if previous_status in _STEP_TERMINAL or str(step.status or "") not in _STEP_TERMINAL:
+        return
+    dependents = _step_dependents(db, run)
+    children = dependents.get(str(step.step_key)) or []
+    if not children:
+        return
+    if step.status == "succeeded":
+        for child in (
+            db.query(WorkflowStepRun)
+            .filter(
+                WorkflowStepRun.workflow_run_id == run.id,
+                WorkflowStepRun.step_key.in_(children),
+            )
+            .all()
+        ):
+            child.unmet_dependency_count = max(0, int(child.unmet_dependency_count or 0) - 1)
         return
+    _skip_blocked_descendants(db, run, dependents, [str(step.step_key)], now=_now_utc())
 
-    definition_ids = sorted({step.definition_id for step in step_runs if step.definition_id})
-    definitions = {
-        row.id: row
-        for row in db.query(JobDefinition).filter(JobDefinition.id.in_(definition_ids)).all()
-    }
-    for step in step_runs:
-        if capacity <= 0:
-            break
-        if str(step.status or "") != "pending":
-            continue
-        dependencies = list(step.depends_on or [])
-        deps_satisfied = all(
-            str(by_key.get(dep).status or "") == "succeeded"
-            for dep in dependencies
-            if by_key.get(dep) is not None
+
+def _enqueue_ready_steps(db: Session, run: WorkflowRun) -> None:
+    if run.status in _RUN_TERMINAL:
+        return
+
+    _step_dependents(db, run)
+    now = _now_utc()
+    active_count = int(
+        db.query(func.count(WorkflowStepRun.id))
+        .filter(
+            WorkflowStepRun.workflow_run_id == run.id,
+            WorkflowStepRun.status.in_(list(_STEP_ACTIVE)),
         )
-        if not deps_satisfied:
-            continue
+        .scalar()
+        or 0
+    )
+    capacity = max(1, int(run.max_parallel_steps or 1)) - active_count
+    enqueued = 0
+    while capacity > 0:
+        ready_steps = (
+            db.query(WorkflowStepRun)
+            .filter(
+                WorkflowStepRun.workflow_run_id == run.id,
+                WorkflowStepRun.status == "pending",
+                WorkflowStepRun.unmet_dependency_count == 0,
+            )
+            .order_by(WorkflowStepRun.step_key.asc())
+            .limit(capacity)
+            .all()
+        )
+        if not ready_steps:
+            break
 
-        definition = definitions.get(step.definition_id)
-        if definition is None or not bool(definition.is_active):
-            step.status = "failed"
-            step.finished_at = now
-            step.last_error = f"Definition unavailable: {step.definition_id}"
-            run.last_error = step.last_error
-            if str(run.failure_policy or "fail_fast") == "fail_fast":
-                run.status = "failed"
-                run.finished_at = now
-                _cancel_open_steps_for_run(db, run, reason=step.last_error)
-                return
-            continue
+        definition_ids = sorted({step.definition_id for step in ready_steps if step.definition_id})
+        definitions = {
+            row.id: row
+            for row in db.query(JobDefinition).filter(JobDefinition.id.in_(definition_ids)).all()
+        }
+        for step in ready_steps:
+            definition = definitions.get(step.definition_id)
+            if definition is None or not bool(definition.is_active):
+                step.status = "failed"
+                step.finished_at = now
+                step.last_error = f"Definition unavailable: {step.definition_id}"
+            else:
+                try:
+                    normalized_payload = normalize_queue_payload(str(definition.key), step.payload or {})
+                except ValueError as exc:
+                    step.status = "failed"
+                    step.finished_at = now
+                    step.last_error = str(exc)
+                else:
+                    job = Job(
+                        tenant_id=run.tenant_id,
+                        definition_id=definition.id,
+                        source="system",
+                        source_ref=make_workflow_source_ref(run.id, str(step.step_key)),
+                        status="queued",
+                        queue=str(definition.queue or DEFAULT_JOB_QUEUE),
+                        priority=int(run.priority or 100),
+                        payload=normalized_payload,
+                        dedupe_key=f"workflow-step:{run.id}:{step.step_key}",
+                        correlation_id=f"workflow:{run.id}",
+                        scheduled_for=now,
+                        queued_at=now,
+                        max_attempts=int(definition.max_attempts or 3),
+                        created_by=run.created_by,
+                    )
+                    db.add(job)
+                    db.flush()
+
+                    step.status = "queued"
+                    step.queued_at = now
+                    step.child_job_id = job.id
+                    capacity -= 1
+                    enqueued += 1
+                    continue
 
-        try:
-            normalized_payload = normalize_queue_payload(str(definition.key), step.payload or {})
-        except ValueError as exc:
-            step.status = "failed"
-            step.finished_at = now
-            step.last_error = str(exc)
             run.last_error = step.last_error
             if str(run.failure_policy or "fail_fast") == "fail_fast":
                 run.status = "failed"
                 run.finished_at = now
                 _cancel_open_steps_for_run(db, run, reason=step.last_error)
-                return
-            continue
-
-        job = Job(
-            tenant_id=run.tenant_id,
-            definition_id=definition.id,
-            source="system",
-            source_ref=make_workflow_source_ref(run.id, str(step.step_key)),
-            status="queued",
-            priority=int(run.priority or 100),
-            payload=normalized_payload,
-            dedupe_key=f"workflow-step:{run.id}:{step.step_key}",
-            correlation_id=f"workflow:{run.id}",
-            scheduled_for=now,
-            queued_at=now,
-            max_attempts=int(definition.max_attempts or 3),
-            created_by=run.created_by,
-        )
-        db.add(job)
+                capacity = 0
+                break
+            _propagate_step_outcome(db, run, step, "pending")
         db.flush()
 
-        step.status = "queued"
-        step.queued_at = now
-        step.child_job_id = job.id
-        capacity -= 1
+    if enqueued:
+        publish_job_wakeup(db, reason=str(run.tenant_id))
 
 
 def start_workflow_run(
@@ -345,6 +453,7 @@ def start_workflow_run(
     payload: dict | None = None,
 ) -> WorkflowRun:
     steps = validate_workflow_steps(db, list(workflow.steps or []), require_active_definitions=True)
+    dependents, in_degree = build_step_graph(steps)
     now = _now_utc()
     run = WorkflowRun(
         tenant_id=tenant_id,
@@ -357,6 +466,7 @@ def start_workflow_run(
         queued_at=now,
         started_at=now,
         created_by=created_by,
+        step_dependents=dependents,
     )
     db.add(run)
     db.flush()
@@ -379,6 +489,7 @@ def start_workflow_run(
                 status="pending",
                 payload=step.get("payload") or {},
                 depends_on=step.get("depends_on") or [],
+                unmet_dependency_count=in_degree[step["step_key"]],
             )
         )
 
@@ -434,6 +545,7 @@ def handle_workflow_job_state_change(db: Session, *, job: Job) -> None:
 
     job_status = str(job.status or "").lower()
     now = _now_utc()
+    previous_status = str(step.status or "")
     if job_status == "running":
         if str(step.status or "") not in _STEP_TERMINAL:
             step.status = "running"
@@ -469,6 +581,7 @@ def handle_workflow_job_state_change(db: Session, *, job: Job) -> None:
     else:
         return
 
+    _propagate_step_outcome(db, run, step, previous_status)
     if run.status in _RUN_TERMINAL:
         _reconcile_run_status(db, run)
         return
@@ -484,23 +597,49 @@ def handle_workflow_job_state_change(db: Session, *, job: Job) -> None:
     _reconcile_run_status(db, run)
 
 
-def reconcile_running_workflows(db: Session, *, limit_runs: int = 50) -> int:
-    """Reconcile running workflows against current child job state.
+def _stalled_workflow_run_ids(db: Session, *, limit_runs: int) -> list[UUID]:
+    """Running runs whose step state disagrees with their child jobs.
 
-    This recovers workflows if a worker crashed between child job completion and
-    workflow callback handling.
+    Step completion advances runs inline, so only runs that missed a callback
+    need attention: an active step whose job already finished, or a run with
+    no active step left to move it forward.
     """
-    run_ids = [
+    out_of_sync = (
+        db.query(WorkflowStepRun.workflow_run_id)
+        .join(Job, Job.id == WorkflowStepRun.child_job_id)
+        .filter(
+            WorkflowStepRun.status.in_(list(_STEP_ACTIVE)),
+            Job.status.in_(list(_JOB_TERMINAL)),
+        )
+    )
+    has_active_step = exists().where(
+        WorkflowStepRun.workflow_run_id == WorkflowRun.id,
+        WorkflowStepRun.status.in_(list(_STEP_ACTIVE)),
+    )
+    return [
         row_id
         for (row_id,) in (
             db.query(WorkflowRun.id)
-            .filter(WorkflowRun.status == "running")
+            .filter(
+                WorkflowRun.status == "running",
+                WorkflowRun.id.in_(out_of_sync) | ~has_active_step,
+            )
             .order_by(WorkflowRun.queued_at.asc(), WorkflowRun.id.asc())
             .limit(max(1, int(limit_runs or 50)))
             .all()
         )
     ]
 
+
+def reconcile_running_workflows(db: Session, *, limit_runs: int = 50) -> int:
+    """Reconcile stalled workflows against current child job state.
+
+    Runs advance when their step jobs finish (``handle_workflow_job_state_change``);
+    this is the safety net for a worker crashing between child job completion
+    and that callback.
+    """
+    run_ids = _stalled_workflow_run_ids(db, limit_runs=limit_runs)
+
     processed = 0
     for run_id in run_ids:
         run = _lock_workflow_run(db, run_id)
@@ -524,6 +663,7 @@ def reconcile_running_workflows(db: Session, *, limit_runs: int = 50) -> int:
             if job is None:
                 continue
             job_status = str(job.status or "").lower()
+            previous_status = str(step.status or "")
             if job_status == "queued":
                 if str(step.status or "") not in _STEP_TERMINAL:
                     step.status = "queued"
@@ -550,6 +690,7 @@ def reconcile_running_workflows(db: Session, *, limit_runs: int = 50) -> int:
                 step.last_error = str(job.last_error or "").strip() or "Canceled"
                 if str(run.last_error or "").strip() == "":
                     run.last_error = step.last_error
+            _propagate_step_outcome(db, run, step, previous_status)
 
         _enqueue_ready_steps(db, run)
         _reconcile_run_status(db, run)
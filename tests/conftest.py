@@ -11,6 +11,14 @@ from zoltag.tenant import Tenant, TenantContext
 from zoltag.config import TenantConfig
 
 
+@pytest.fixture(scope="session", autouse=True)
+def session_hooks():
+    """Install the commit hooks the API and CLI register at startup."""
+    from zoltag.database import init_session_hooks
+
+    init_session_hooks()
+
+
 @pytest.fixture
 def test_db():
     """Create test database."""
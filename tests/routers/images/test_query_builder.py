@@ -1,13 +1,14 @@
 """Unit tests for QueryBuilder class."""
 
 import uuid
+from datetime import datetime, timedelta
 
 import pytest
 from sqlalchemy.orm import Session
 
 from zoltag.metadata import Asset, ImageMetadata, MachineTag
 from zoltag.models.config import Keyword, KeywordCategory
-from zoltag.routers.images.query_builder import QueryBuilder
+from zoltag.routers.images.query_builder import QueryBuilder, decode_cursor, encode_cursor
 from zoltag.tenant import Tenant
 
 
@@ -266,3 +267,66 @@ class TestIntegration:
 
         results = builder.apply_pagination(query, 0, 2)
         assert len(results) == 2
+
+
+class TestKeysetPagination:
+    @pytest.fixture
+    def dated_images(self, test_db: Session, test_tenant: Tenant, sample_images):
+        base = datetime(2024, 1, 1)
+        for image in sample_images:
+            # Duplicate timestamps and a few NULL dates exercise tie-breaks and NULL placement.
+            image.capture_timestamp = None if image.id in (3, 7) else base + timedelta(days=image.id // 2)
+        test_db.commit()
+        return sample_images
+
+    def _walk(self, builder: QueryBuilder, test_db: Session, tenant_id, page_size: int):
+        sort_keys = builder.build_sort_keys()
+        ordering = builder.cursor_ordering()
+        seen = []
+        after = None
+        while True:
+            query = test_db.query(ImageMetadata).filter(ImageMetadata.tenant_id == tenant_id)
+            rows, next_values, _ = builder.fetch_keyset_page(query, sort_keys, page_size, after=after)
+            seen.extend(img.id for img in rows)
+            if next_values is None:
+                return seen
+            after = decode_cursor(encode_cursor(ordering, next_values), ordering, len(sort_keys))
+
+    @pytest.mark.parametrize("date_order,order_by", [
+        ("desc", None),
+        ("asc", None),
+        ("desc", "rating"),
+        ("asc", "rating"),
+        ("desc", "image_id"),
+    ])
+    def test_cursor_pages_match_full_ordering(self, test_db: Session, test_tenant: Tenant, dated_images, date_order, order_by):
+        builder = QueryBuilder(test_db, test_tenant, date_order, order_by)
+        expected = [
+            img.id for img in test_db.query(ImageMetadata).filter(
+                ImageMetadata.tenant_id == test_tenant.id
+            ).order_by(*builder.build_order_clauses()).all()
+        ]
+
+        assert self._walk(builder, test_db, test_tenant.id, page_size=3) == expected
+
+    def test_anchor_starts_page_at_anchor(self, test_db: Session, test_tenant: Tenant, dated_images):
+        builder = QueryBuilder(test_db, test_tenant, "desc", None)
+        sort_keys = builder.build_sort_keys()
+        query = test_db.query(ImageMetadata).filter(ImageMetadata.tenant_id == test_tenant.id)
+        expected = [img.id for img in query.order_by(*builder.build_order_clauses()).all()]
+        anchor = expected[5]
+
+        rows, next_values, anchor_found = builder.fetch_keyset_page(query, sort_keys, 3, anchor_id=anchor)
+
+        assert anchor_found is True
+        assert [img.id for img in rows] == expected[5:8]
+        assert next_values is not None
+
+    def test_cursor_rejects_other_ordering(self, test_db: Session, test_tenant: Tenant):
+        cursor = encode_cursor("photo_creation:desc", [datetime(2024, 1, 1), 5])
+
+        assert decode_cursor(cursor, "photo_creation:desc", 2) == [datetime(2024, 1, 1), 5]
+        with pytest.raises(ValueError, match="ordering"):
+            decode_cursor(cursor, "rating:desc", 2)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor", "photo_creation:desc", 2)
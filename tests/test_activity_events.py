@@ -5,12 +5,18 @@ import uuid
 from datetime import datetime, timezone
 
 from starlette.requests import Request
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
-from zoltag.activity import EVENT_AUTH_LOGIN, EVENT_SEARCH_IMAGES, record_activity_event
+from zoltag.activity import (
+    EVENT_AUTH_LOGIN,
+    EVENT_SEARCH_IMAGES,
+    ActivityEventWriter,
+    record_activity_event,
+)
 from zoltag.auth.dependencies import get_current_user
 from zoltag.auth.models import UserProfile
-from zoltag.metadata import ActivityEvent, Tenant as TenantModel
+from zoltag.metadata import ActivityEvent, Base, Tenant as TenantModel
 
 
 def _build_request(path: str = "/api/v1/auth/me") -> Request:
@@ -139,3 +145,42 @@ def test_get_current_user_logs_login_once_per_hour(test_db: Session, monkeypatch
     ).order_by(ActivityEvent.created_at.asc()).all()
     assert len(rows_after_relogin) == 2
     assert rows_after_relogin[-1].client_ip == "198.51.100.16"
+
+
+def _event_values(index: int) -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "event_type": EVENT_SEARCH_IMAGES,
+        "details": {"index": index},
+        "created_at": datetime.utcnow(),
+    }
+
+
+def test_activity_event_writer_flushes_batches(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'activity.db'}")
+    Base.metadata.create_all(engine, tables=[ActivityEvent.__table__])
+    writer = ActivityEventWriter(max_buffer=100, batch_size=3, flush_interval_seconds=0.05)
+
+    for index in range(7):
+        assert writer.submit(engine, _event_values(index)) is True
+    writer.stop(timeout_seconds=5)
+
+    assert writer.pending_count() == 0
+    with Session(engine) as db:
+        assert db.query(ActivityEvent).count() == 7
+    engine.dispose()
+
+
+def test_activity_event_writer_sheds_events_when_full(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'activity.db'}")
+    Base.metadata.create_all(engine, tables=[ActivityEvent.__table__])
+    writer = ActivityEventWriter(max_buffer=2, batch_size=50, flush_interval_seconds=60)
+
+    accepted = [writer.submit(engine, _event_values(index)) for index in range(5)]
+
+    assert accepted == [True, True, False, False, False]
+    assert writer.dropped_count == 3
+    writer.stop(timeout_seconds=5)
+    with Session(engine) as db:
+        assert db.query(ActivityEvent).count() == 2
+    engine.dispose()
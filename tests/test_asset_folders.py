@@ -0,0 +1,90 @@
+"""Tests for the indexed Asset.source_folder column and folder listing."""
+
+import uuid
+
+import pytest
+from sqlalchemy.orm import Session
+
+from zoltag.metadata import Asset, ImageMetadata, source_folder_for_key
+from zoltag.routers.filtering import build_image_query_with_subqueries
+from zoltag.routers.images.dropbox_sync import list_dropbox_folders
+
+
+@pytest.mark.parametrize(
+    ("source_key", "folder"),
+    [
+        ("/Photos/2024/beach.jpg", "/Photos/2024"),
+        ("/beach.jpg", "/"),
+        ("beach.jpg", "beach.jpg"),
+        ("/Photos/2024/", "/Photos/2024/"),
+        (None, None),
+    ],
+)
+def test_source_folder_matches_sql_expression(source_key, folder):
+    assert source_folder_for_key(source_key) == folder
+
+
+@pytest.fixture
+def folder_assets(test_db: Session, test_tenant):
+    images = {}
+    for index, source_key in enumerate([
+        "/Photos/2024/beach.jpg",
+        "/Photos/2024/forest.jpg",
+        "/Photos/2024/Summer/pool.jpg",
+        "/Archive/old.jpg",
+        "/root.jpg",
+    ]):
+        asset = Asset(
+            id=uuid.uuid4(),
+            tenant_id=test_tenant.id,
+            filename=source_key.rsplit("/", 1)[-1],
+            source_provider="dropbox",
+            source_key=source_key,
+            thumbnail_key=f"thumbs/{index}.jpg",
+        )
+        test_db.add(asset)
+        test_db.flush()
+        image = ImageMetadata(
+            asset_id=asset.id,
+            tenant_id=test_tenant.id,
+            filename=asset.filename,
+            file_size=1,
+            width=1,
+            height=1,
+            format="JPEG",
+        )
+        test_db.add(image)
+        test_db.flush()
+        images[source_key] = image
+    test_db.commit()
+    return images
+
+
+def test_source_folder_follows_source_key_updates(test_db: Session, folder_assets):
+    asset = test_db.query(Asset).filter(Asset.source_key == "/Archive/old.jpg").one()
+    asset.source_key = "/Archive/2019/old.jpg"
+    test_db.commit()
+
+    assert test_db.query(Asset.source_folder).filter(Asset.id == asset.id).scalar() == "/Archive/2019"
+
+
+def test_list_dropbox_folders_reads_source_folder(test_db: Session, test_tenant, folder_assets):
+    result = list_dropbox_folders(tenant=test_tenant, q=None, limit=None, db=test_db)
+    assert result["folders"] == ["/", "/Archive", "/Photos/2024", "/Photos/2024/Summer"]
+
+    result = list_dropbox_folders(tenant=test_tenant, q="photos", limit=1, db=test_db)
+    assert result["folders"] == ["/Photos/2024"]
+
+
+def test_path_prefix_filter_includes_subfolders(test_db: Session, test_tenant, folder_assets):
+    _, subqueries, _, _ = build_image_query_with_subqueries(
+        test_db, test_tenant, current_user=None, dropbox_path_prefix="Photos/2024",
+    )
+    (subquery,) = subqueries
+    matched = {row[0] for row in test_db.query(subquery.c.id).all()}
+
+    expected = {
+        folder_assets[key].id
+        for key in ("/Photos/2024/beach.jpg", "/Photos/2024/forest.jpg", "/Photos/2024/Summer/pool.jpg")
+    }
+    assert matched == expected
@@ -0,0 +1,88 @@
+"""Lint-style guard against blocking route handlers on the event loop.
+
+FastAPI runs ``def`` endpoints and dependencies in its threadpool but awaits
+``async def`` ones directly on the event loop. With the synchronous SQLAlchemy
+session used throughout the routers, an ``async def`` handler that never
+awaits anything is almost always running blocking queries or storage IO on
+the loop, stalling every other request on that worker.
+"""
+
+import ast
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src" / "zoltag"
+ROUTE_METHODS = {"get", "post", "put", "patch", "delete", "api_route"}
+
+
+def _is_route_handler(node: ast.AsyncFunctionDef) -> bool:
+    for decorator in node.decorator_list:
+        if (
+            isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Attribute)
+            and decorator.func.attr in ROUTE_METHODS
+        ):
+            return True
+    return False
+
+
+def _awaits_anything(node: ast.AsyncFunctionDef) -> bool:
+    return any(
+        isinstance(child, (ast.Await, ast.AsyncFor, ast.AsyncWith))
+        for child in ast.walk(node)
+    )
+
+
+def _takes_sync_session(node: ast.AsyncFunctionDef) -> bool:
+    params = node.args.args + node.args.kwonlyargs
+    return any(
+        isinstance(param.annotation, ast.Name) and param.annotation.id == "Session"
+        for param in params
+    )
+
+
+def _async_functions(path: Path):
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AsyncFunctionDef):
+            yield node
+
+
+def test_async_route_handlers_await_something():
+    offenders = []
+    for path in sorted((SRC_DIR / "routers").rglob("*.py")):
+        for node in _async_functions(path):
+            if _is_route_handler(node) and not _awaits_anything(node):
+                offenders.append(f"{path.relative_to(SRC_DIR)}:{node.lineno} {node.name}")
+
+    assert not offenders, (
+        "async route handlers that never await block the event loop; "
+        "declare them with plain `def` instead:\n" + "\n".join(offenders)
+    )
+
+
+def test_session_dependencies_are_sync():
+    offenders = []
+    for path in [SRC_DIR / "dependencies.py", *sorted((SRC_DIR / "auth").glob("*.py"))]:
+        for node in _async_functions(path):
+            if _takes_sync_session(node) and not _awaits_anything(node):
+                offenders.append(f"{path.relative_to(SRC_DIR)}:{node.lineno} {node.name}")
+
+    assert not offenders, (
+        "async dependencies that only run synchronous Session queries block the "
+        "event loop; declare them with plain `def` instead:\n" + "\n".join(offenders)
+    )
+
+
+def test_async_route_handlers_take_no_sync_session():
+    offenders = []
+    for path in sorted((SRC_DIR / "routers").rglob("*.py")):
+        for node in _async_functions(path):
+            if _is_route_handler(node) and _takes_sync_session(node):
+                offenders.append(f"{path.relative_to(SRC_DIR)}:{node.lineno} {node.name}")
+
+    assert not offenders, (
+        "async route handlers must not run synchronous Session queries on the "
+        "event loop; await the async part and move the database work to a "
+        "`def` handler, a dependency, run_read_query or run_in_threadpool:\n"
+        + "\n".join(offenders)
+    )
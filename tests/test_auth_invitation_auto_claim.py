@@ -12,7 +12,7 @@ from zoltag.auth.dependencies import claim_pending_invitations_for_user
 from zoltag.auth.schemas import RegisterRequest
 from zoltag.auth.models import Invitation, UserProfile, UserTenant
 from zoltag.metadata import Tenant as TenantModel
-from zoltag.routers.auth import get_current_user_info, register
+from zoltag.routers.auth import get_current_user_info, get_registration_claims, register
 
 
 def _create_tenant(test_db: Session) -> uuid.UUID:
@@ -146,7 +146,7 @@ def test_get_current_user_info_uses_membership_role_when_tenant_role_missing(tes
     test_db.add(membership)
     test_db.commit()
 
-    response = asyncio.run(get_current_user_info(user=invited, db=test_db))
+    response = get_current_user_info(user=invited, db=test_db)
 
     assert len(response.tenants) == 1
     assert response.tenants[0].role == "admin"
@@ -156,26 +156,22 @@ def test_get_current_user_info_uses_membership_role_when_tenant_role_missing(tes
 def test_register_fails_without_pending_invitation(test_db: Session, monkeypatch):
     supabase_uid = uuid.uuid4()
 
-    async def _fake_uid_from_token(_token: str):
-        return supabase_uid
-
     async def _fake_verify_jwt(_token: str):
         return {
+            "sub": supabase_uid,
             "email": "no-invite@example.com",
             "email_confirmed_at": "2026-02-19T00:00:00Z",
         }
 
-    monkeypatch.setattr("zoltag.routers.auth.get_supabase_uid_from_token", _fake_uid_from_token)
-    monkeypatch.setattr("zoltag.auth.jwt.verify_supabase_jwt", _fake_verify_jwt)
+    monkeypatch.setattr("zoltag.routers.auth.verify_supabase_jwt", _fake_verify_jwt)
+    claims = asyncio.run(get_registration_claims(authorization="Bearer test-token"))
 
     try:
-        asyncio.run(
-            register(
-                request=_build_request(),
-                body=RegisterRequest(display_name="No Invite"),
-                db=test_db,
-                authorization="Bearer test-token",
-            )
+        register(
+            request=_build_request(),
+            body=RegisterRequest(display_name="No Invite"),
+            claims=claims,
+            db=test_db,
         )
         assert False, "Expected register() to raise HTTPException"
     except HTTPException as exc:
@@ -205,25 +201,21 @@ def test_register_succeeds_with_pending_invitation(test_db: Session, monkeypatch
     test_db.add(invitation)
     test_db.commit()
 
-    async def _fake_uid_from_token(_token: str):
-        return supabase_uid
-
     async def _fake_verify_jwt(_token: str):
         return {
+            "sub": supabase_uid,
             "email": "Invited-Register@example.com",
             "email_confirmed_at": "2026-02-19T00:00:00Z",
         }
 
-    monkeypatch.setattr("zoltag.routers.auth.get_supabase_uid_from_token", _fake_uid_from_token)
-    monkeypatch.setattr("zoltag.auth.jwt.verify_supabase_jwt", _fake_verify_jwt)
+    monkeypatch.setattr("zoltag.routers.auth.verify_supabase_jwt", _fake_verify_jwt)
+    claims = asyncio.run(get_registration_claims(authorization="Bearer test-token"))
 
-    response = asyncio.run(
-        register(
-            request=_build_request(),
-            body=RegisterRequest(display_name="Invited Register"),
-            db=test_db,
-            authorization="Bearer test-token",
-        )
+    response = register(
+        request=_build_request(),
+        body=RegisterRequest(display_name="Invited Register"),
+        claims=claims,
+        db=test_db,
     )
 
     assert response.get("status") == "pending_approval"
@@ -0,0 +1,66 @@
+"""Tests for sync/async database session helpers."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+
+from zoltag import database
+from zoltag.settings import settings
+
+
+def _select_one(db: Session, offset: int = 0) -> int:
+    return db.execute(text("SELECT 1")).scalar_one() + offset
+
+
+def test_get_async_database_url_maps_drivers(monkeypatch):
+    monkeypatch.setattr(settings, "db_connect_timeout", 7)
+
+    url, connect_args = database.get_async_database_url(
+        "postgresql://user:pw@db.example.com:5432/zoltag?sslmode=require"
+    )
+    assert url == "postgresql+asyncpg://user:pw@db.example.com:5432/zoltag"
+    assert connect_args == {"ssl": "require", "timeout": 7}
+
+    url, connect_args = database.get_async_database_url("sqlite:///./local.db")
+    assert url == "sqlite+aiosqlite:///./local.db"
+    assert connect_args == {}
+
+    with pytest.raises(ValueError, match="No async driver"):
+        database.get_async_database_url("mysql://localhost/zoltag")
+
+
+def test_run_read_query_uses_sync_session_when_async_disabled(test_db: Session, monkeypatch):
+    sessions = []
+
+    class _TrackingSession(Session):
+        def close(self):
+            sessions.append(self)
+            super().close()
+
+    monkeypatch.setattr(settings, "db_async_enabled", False)
+    monkeypatch.setattr(
+        database,
+        "SessionLocal",
+        sessionmaker(bind=test_db.get_bind(), class_=_TrackingSession),
+    )
+
+    assert asyncio.run(database.run_read_query(_select_one, offset=1)) == 2
+    assert len(sessions) == 1
+
+
+def test_run_read_query_uses_async_engine_when_enabled(tmp_path, monkeypatch):
+    pytest.importorskip("aiosqlite")
+    monkeypatch.setattr(settings, "db_async_enabled", True)
+    monkeypatch.setattr(settings, "database_url", f"sqlite:///{tmp_path / 'async.db'}")
+    monkeypatch.setattr(database, "_async_engine", None)
+    monkeypatch.setattr(database, "_async_session_factory", None)
+
+    async def _run():
+        try:
+            return await database.run_read_query(_select_one, offset=2)
+        finally:
+            await database.dispose_async_engine()
+
+    assert asyncio.run(_run()) == 3
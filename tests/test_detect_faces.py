@@ -0,0 +1,126 @@
+"""Tests for the batch face detection command."""
+
+import io
+import uuid
+
+import pytest
+from PIL import Image
+from sqlalchemy.orm import Session
+
+from zoltag.cli.commands.faces import DetectFacesCommand, _scale_bounding_box
+from zoltag.cli.introspection import build_queue_command_argv
+from zoltag.image import FaceDetector
+from zoltag.metadata import Asset, ImageMetadata
+from zoltag.settings import settings
+
+
+def _image_bytes(size, fmt="JPEG"):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (120, 80, 40)).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("fmt", ["JPEG", "PNG"])
+def test_detection_image_is_decoded_downscaled(fmt):
+    pixels, scale = FaceDetector.load_detection_image(_image_bytes((2000, 1000), fmt), max_dimension=400)
+
+    assert max(pixels.shape[:2]) <= 400
+    assert pixels.shape[2] == 3
+    assert pixels.shape[1] * scale == pytest.approx(2000)
+
+
+def test_small_detection_image_is_left_alone():
+    pixels, scale = FaceDetector.load_detection_image(_image_bytes((300, 200)), max_dimension=400)
+
+    assert pixels.shape[:2] == (200, 300)
+    assert scale == 1.0
+
+
+def test_bounding_boxes_map_to_original_size():
+    box = {"top": 10, "right": 60, "bottom": 40, "left": 20}
+
+    assert _scale_bounding_box(box, (300, 200), (3000, 1000)) == {
+        "top": 50,
+        "right": 600,
+        "bottom": 200,
+        "left": 200,
+    }
+    assert _scale_bounding_box(box, (300, 200), (None, None)) == box
+
+
+def _command(db, tenant, **overrides):
+    options = dict(tenant_id=str(tenant.id), limit=None, batch_size=10, workers=1, max_dimension=800)
+    options.update(overrides)
+    cmd = DetectFacesCommand(**options)
+    cmd.db = db
+    cmd.tenant = tenant
+    return cmd
+
+
+def test_default_worker_count_is_bounded(test_db: Session, test_tenant, monkeypatch):
+    monkeypatch.setattr(settings, "face_detection_workers", 3)
+    monkeypatch.setattr("zoltag.cli.commands.faces.os.cpu_count", lambda: 64)
+
+    assert _command(test_db, test_tenant, workers=0).workers == 3
+    assert _command(test_db, test_tenant, workers=6).workers == 6
+
+    monkeypatch.setattr("zoltag.cli.commands.faces.os.cpu_count", lambda: 2)
+    assert _command(test_db, test_tenant, workers=0).workers == 2
+
+
+def test_pending_images_and_set_based_flag_update(test_db: Session, test_tenant):
+    images = []
+    for index, detected in enumerate((False, True, None, False)):
+        asset = Asset(
+            id=uuid.uuid4(),
+            tenant_id=test_tenant.id,
+            filename=f"img-{index}.jpg",
+            source_provider="dropbox",
+            source_key=f"/img-{index}.jpg",
+            thumbnail_key=f"thumbs/img-{index}.jpg",
+        )
+        test_db.add(asset)
+        test_db.flush()
+        image = ImageMetadata(
+            asset_id=asset.id,
+            tenant_id=test_tenant.id,
+            filename=asset.filename,
+            file_size=1,
+            width=3000,
+            height=2000,
+            format="JPEG",
+            faces_detected=detected,
+        )
+        test_db.add(image)
+        test_db.flush()
+        images.append(image)
+    test_db.commit()
+    cmd = _command(test_db, test_tenant)
+
+    pending = cmd._pending_images(0, 10)
+    assert [row.id for row in pending] == [images[0].id, images[2].id, images[3].id]
+    assert [row.thumbnail_key for row in cmd._pending_images(images[0].id, 1)] == ["thumbs/img-2.jpg"]
+
+    # Undecodable thumbnails (no result) stay pending for a later run.
+    written = cmd._write_results(pending, [
+        (images[0].id, [], (300, 200)),
+        (images[2].id, None, None),
+        (images[3].id, [], (300, 200)),
+    ])
+    test_db.commit()
+
+    assert written == (2, 0)
+    assert [row.id for row in cmd._pending_images(0, 10)] == [images[2].id]
+
+
+def test_detect_faces_is_queue_eligible():
+    argv = build_queue_command_argv(
+        command_name="detect-faces",
+        tenant_id="tenant-a",
+        payload={"batch_size": 50, "workers": 4},
+        python_executable="python",
+    )
+
+    assert argv[:4] == ["python", "-m", "zoltag.cli", "detect-faces"]
+    assert argv[4:6] == ["--tenant-id", "tenant-a"]
+    assert "--batch-size" in argv and "--workers" in argv
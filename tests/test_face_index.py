@@ -0,0 +1,272 @@
+"""Tests for per-tenant face encoding matching."""
+
+import contextlib
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.orm import Session
+
+from zoltag import face_index
+from zoltag.face_index import (
+    FaceEncodingIndex,
+    find_face_matches,
+    get_face_index,
+    invalidate_face_index,
+    suggest_people_for_encoding,
+)
+from zoltag.image import FaceDetector
+from zoltag.metadata import Asset, DetectedFace, ImageMetadata, Person
+from zoltag.routers.images.people_tagging import get_image_people_suggestions
+
+
+@pytest.fixture(autouse=True)
+def clear_face_index():
+    invalidate_face_index()
+    face_index._pgvector_capability_cache.clear()
+    yield
+    invalidate_face_index()
+    face_index._pgvector_capability_cache.clear()
+
+
+def _encoding(seed, offset=0.0):
+    rng = np.random.default_rng(seed)
+    return (rng.normal(scale=0.1, size=128) + offset).tolist()
+
+
+def _image(db, tenant_id, name):
+    asset = Asset(
+        id=uuid.uuid4(),
+        tenant_id=tenant_id,
+        filename=f"{name}.jpg",
+        source_provider="dropbox",
+        source_key=f"/{name}.jpg",
+        thumbnail_key=f"thumbs/{name}.jpg",
+    )
+    db.add(asset)
+    db.flush()
+    image = ImageMetadata(
+        asset_id=asset.id,
+        tenant_id=tenant_id,
+        filename=asset.filename,
+        file_size=1,
+        width=1,
+        height=1,
+        format="JPEG",
+    )
+    db.add(image)
+    db.flush()
+    return image
+
+
+@pytest.fixture
+def known_people(test_db: Session, test_tenant):
+    alice = Person(tenant_id=test_tenant.id, name="Alice")
+    bob = Person(tenant_id=test_tenant.id, name="Bob")
+    test_db.add_all([alice, bob])
+    test_db.commit()
+    return alice, bob
+
+
+@pytest.fixture
+def load_calls(monkeypatch, known_people):
+    """Count matrix loads, serving known faces from fixed arrays."""
+    alice, bob = known_people
+    calls = []
+
+    def fake_load(db, tenant_id):
+        calls.append(tenant_id)
+        encodings = [_encoding(1), _encoding(1, offset=0.01), _encoding(2, offset=1.0)]
+        return FaceEncodingIndex([1, 2, 3], [alice.id, alice.id, bob.id], np.array(encodings))
+
+    monkeypatch.setattr(face_index, "_load_face_index", fake_load)
+    return calls
+
+
+def test_match_face_matches_linear_compare():
+    detector = FaceDetector()
+    known = [_encoding(seed) for seed in range(5)]
+    query = [value + 0.001 for value in known[3]]
+
+    assert detector.match_face(query, known) == [3]
+    assert detector.match_face(query, known, tolerance=100.0) == [0, 1, 2, 3, 4]
+    assert detector.match_face(query, []) == []
+
+
+def test_index_search_returns_nearest_within_tolerance():
+    encodings = np.array([[0.0, 0.0], [0.3, 0.0], [0.1, 0.0], [5.0, 5.0]])
+    index = FaceEncodingIndex([10, 11, 12, 13], [1, 2, 3, 4], encodings)
+
+    matches = index.search([0.0, 0.0], tolerance=0.5, limit=2)
+
+    assert [(match.face_id, match.person_id) for match in matches] == [(10, 1), (12, 3)]
+    assert matches[1].distance == pytest.approx(0.1)
+    assert index.search([0.0, 0.0, 0.0], tolerance=0.5, limit=2) == []
+
+
+def test_find_face_matches_reuses_tenant_index(test_db: Session, test_tenant, known_people, load_calls):
+    alice, bob = known_people
+    detector = FaceDetector()
+
+    matches = detector.match_tenant_faces(test_db, test_tenant.id, _encoding(1))
+    assert [match.face_id for match in matches] == [1, 2]
+    assert {match.person_id for match in matches} == {alice.id}
+
+    people = suggest_people_for_encoding(test_db, test_tenant.id, _encoding(2, offset=1.0))
+    assert [(match.person_id, match.face_id) for match in people] == [(bob.id, 3)]
+    assert len(load_calls) == 1
+
+
+def test_committed_faces_drop_cached_index(test_db: Session, test_tenant, known_people, load_calls):
+    alice, _ = known_people
+    image = _image(test_db, test_tenant.id, "new")
+    test_db.commit()
+    find_face_matches(test_db, test_tenant.id, _encoding(1))
+
+    # Other tenants' faces and rolled-back writes keep the index.
+    test_db.add(DetectedFace(image_id=image.id, tenant_id=uuid.uuid4()))
+    test_db.commit()
+    test_db.add(DetectedFace(image_id=image.id, tenant_id=test_tenant.id, person_id=alice.id))
+    test_db.flush()
+    test_db.rollback()
+    find_face_matches(test_db, test_tenant.id, _encoding(1))
+    assert len(load_calls) == 1
+
+    test_db.add(DetectedFace(image_id=image.id, tenant_id=test_tenant.id, person_id=alice.id))
+    test_db.commit()
+    find_face_matches(test_db, test_tenant.id, _encoding(1))
+    assert len(load_calls) == 2
+
+
+def test_load_skips_faces_without_person_or_encoding(test_db: Session, test_tenant, known_people):
+    alice, _ = known_people
+    image = _image(test_db, test_tenant.id, "unknown")
+    test_db.add(DetectedFace(image_id=image.id, tenant_id=test_tenant.id, person_id=alice.id))
+    test_db.add(DetectedFace(image_id=image.id, tenant_id=test_tenant.id))
+    test_db.commit()
+
+    assert len(get_face_index(test_db, test_tenant.id)) == 0
+    assert find_face_matches(test_db, test_tenant.id, _encoding(1)) == []
+
+
+def test_people_suggestions_require_tenant_image(test_db: Session, test_tenant, known_people):
+    image = _image(test_db, test_tenant.id, "plain")
+    test_db.commit()
+
+    response = get_image_people_suggestions(image.id, tolerance=0.6, limit=5, tenant=test_tenant, db=test_db)
+    assert response.suggestions == []
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_image_people_suggestions(image.id + 1, tolerance=0.6, limit=5, tenant=test_tenant, db=test_db)
+    assert exc_info.value.status_code == 404
+
+
+def test_matches_stay_within_tenant(test_db: Session, test_tenant, known_people):
+    alice, _ = known_people
+    other_tenant_id = uuid.uuid4()
+    stranger = Person(tenant_id=other_tenant_id, name="Stranger")
+    test_db.add(stranger)
+    test_db.flush()
+    image = _image(test_db, test_tenant.id, "mine")
+    other_image = _image(test_db, other_tenant_id, "theirs")
+    # The other tenant holds more, and closer, faces than the match limit.
+    for offset in (0.0, 0.001, 0.002):
+        test_db.add(DetectedFace(
+            image_id=other_image.id,
+            tenant_id=other_tenant_id,
+            person_id=stranger.id,
+            face_encoding=_encoding(1, offset=offset),
+        ))
+    mine = DetectedFace(image_id=image.id, tenant_id=test_tenant.id, person_id=alice.id, face_encoding=_encoding(1, offset=0.01))
+    test_db.add(mine)
+    test_db.commit()
+
+    matches = find_face_matches(test_db, test_tenant.id, _encoding(1), limit=2)
+
+    assert [(match.face_id, match.person_id) for match in matches] == [(mine.id, alice.id)]
+    assert [match.person_id for match in find_face_matches(test_db, other_tenant_id, _encoding(1), limit=2)] == [
+        stranger.id,
+        stranger.id,
+    ]
+
+
+class _FakePostgresSession:
+    """Records SQL run through the pgvector path; ``fail_with`` raises on the KNN query."""
+
+    def __init__(self, *, version="0.8.0", fail_with=None):
+        self.version = version
+        self.fail_with = fail_with
+        self.statements = []
+        self.savepoints = 0
+        self.rolled_back = False
+        engine = SimpleNamespace(url="postgresql://faces", dialect=SimpleNamespace(name="postgresql"))
+        self._bind = SimpleNamespace(engine=engine, dialect=engine.dialect)
+
+    def get_bind(self):
+        return self._bind
+
+    @contextlib.contextmanager
+    def begin_nested(self):
+        self.savepoints += 1
+        yield
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append((sql, params))
+        if "pg_extension" in sql:
+            rows = [{"extension_version": self.version, "has_face_encoding_vec": True}]
+        elif "detected_faces" in sql:
+            if self.fail_with is not None:
+                raise self.fail_with
+            rows = [{"id": 7, "person_id": 3, "distance": 0.1}]
+        else:
+            rows = [{}]
+        return SimpleNamespace(mappings=lambda: SimpleNamespace(all=lambda: rows, first=lambda: rows[0]))
+
+
+def _db_error(cls, pgcode):
+    return cls("SELECT", {}, SimpleNamespace(pgcode=pgcode))
+
+
+def test_pgvector_knn_widens_hnsw_scan_inside_savepoint(monkeypatch):
+    monkeypatch.setattr(face_index.settings, "face_match_hnsw_ef_search", 300)
+    db = _FakePostgresSession()
+
+    matches = find_face_matches(db, uuid.uuid4(), _encoding(1), limit=5)
+
+    assert [(match.face_id, match.person_id) for match in matches] == [(7, 3)]
+    executed = [sql for sql, _ in db.statements]
+    assert any("hnsw.ef_search" in sql for sql in executed)
+    assert any("hnsw.iterative_scan" in sql for sql in executed)
+    assert [params for sql, params in db.statements if "hnsw.ef_search" in sql] == [{"ef_search": "300"}]
+    assert db.savepoints == 2 and not db.rolled_back
+
+    older = _FakePostgresSession(version="0.7.4")
+    face_index._pgvector_capability_cache.clear()
+    find_face_matches(older, uuid.uuid4(), _encoding(1), limit=5)
+    assert not any("iterative_scan" in sql for sql, _ in older.statements)
+
+
+def _knn(db):
+    return face_index._find_face_matches_pgvector(
+        db, uuid.uuid4(), np.asarray(_encoding(1)), tolerance=0.6, limit=5, version=(0, 8, 0)
+    )
+
+
+def test_pgvector_failures_fall_back_without_touching_caller_transaction():
+    # A cancelled statement is transient: fall back now, try vectors again next time.
+    transient_db = _FakePostgresSession(fail_with=_db_error(OperationalError, "57014"))
+    assert _knn(transient_db) is None
+    assert not transient_db.rolled_back
+    assert face_index._pgvector_capability_cache == {}
+
+    missing_db = _FakePostgresSession(fail_with=_db_error(ProgrammingError, "42703"))
+    assert _knn(missing_db) is None
+    assert not missing_db.rolled_back
+    assert face_index._pgvector_capability_cache == {"postgresql://faces": None}
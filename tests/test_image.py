@@ -1,9 +1,13 @@
 """Test image processing."""
 
+import json
+import subprocess
+
 import pytest
 from PIL import Image
 
-from zoltag.image import ImageProcessor, FaceDetector
+import zoltag.image as image_module
+from zoltag.image import ImageProcessor, FaceDetector, VideoProcessor
 
 
 def test_image_processor_creation():
@@ -85,3 +89,46 @@ def test_extract_features(sample_image_data: bytes):
     
     assert features["width"] == 100
     assert features["height"] == 100
+
+
+def _fake_ffmpeg(calls: list, frame_bytes: bytes):
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs))
+        if cmd[0] == "ffprobe":
+            payload = {"streams": [{"width": 1920, "height": 1080}], "format": {"duration": "12.5", "format_name": "mov,mp4"}}
+            return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(payload), stderr="")
+        return subprocess.CompletedProcess(cmd, 0, stdout=frame_bytes, stderr=b"")
+
+    return fake_run
+
+
+def test_video_extract_features_from_url_probes_remote_source(monkeypatch, sample_image_data: bytes):
+    """Remote extraction passes the URL straight to ffprobe/ffmpeg with a network timeout."""
+    calls = []
+    monkeypatch.setattr(image_module.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(image_module.subprocess, "run", _fake_ffmpeg(calls, sample_image_data))
+
+    processor = VideoProcessor(thumbnail_size=(64, 64), remote_timeout_seconds=15)
+    features = processor.extract_features_from_url("https://example.test/clip.mp4?sig=abc", filename="clip.mp4")
+
+    assert features["frame_extracted"] is True
+    assert features["width"] == 1920
+    assert features["height"] == 1080
+    assert features["duration_ms"] == 12500
+    assert features["format"] == "MOV"
+    for cmd, kwargs in calls:
+        assert "https://example.test/clip.mp4?sig=abc" in cmd
+        assert cmd[cmd.index("-rw_timeout") + 1] == "15000000"
+        assert kwargs["timeout"] == 15
+
+
+def test_video_extract_features_without_frame_uses_placeholder(monkeypatch):
+    """Missing ffmpeg yields a placeholder thumbnail flagged as not extracted."""
+    monkeypatch.setattr(image_module.shutil, "which", lambda name: None)
+
+    processor = VideoProcessor(thumbnail_size=(64, 64))
+    features = processor.extract_features_from_chunks([b"\x00" * 16, b"\x00" * 16], filename="clip.mov")
+
+    assert features["frame_extracted"] is False
+    assert isinstance(features["thumbnail"], bytes)
+    assert features["format"] == "MOV"
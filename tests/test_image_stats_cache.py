@@ -0,0 +1,105 @@
+"""Tests for the per-tenant /images/stats snapshot cache."""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.orm import Session
+
+from zoltag.image_stats_cache import (
+    get_cached_image_stats,
+    image_stats_generation,
+    invalidate_image_stats_cache,
+    store_image_stats,
+)
+from zoltag.metadata import Asset, ImageMetadata
+from zoltag.routers.images import stats as stats_router
+from zoltag.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def clear_stats_cache():
+    invalidate_image_stats_cache()
+    yield
+    invalidate_image_stats_cache()
+
+
+def _store(tenant_id, include_ratings, stats):
+    store_image_stats(tenant_id, include_ratings, stats, image_stats_generation(tenant_id))
+
+
+def test_snapshot_with_ratings_serves_plain_requests():
+    tenant_id = str(uuid.uuid4())
+    _store(tenant_id, True, {"image_count": 3, "rating_by_category": {"Scenes": {}}})
+
+    assert get_cached_image_stats(tenant_id, False) == {"image_count": 3, "rating_by_category": {}}
+    assert get_cached_image_stats(tenant_id, True)["rating_by_category"] == {"Scenes": {}}
+
+    _store(tenant_id, False, {"image_count": 4, "rating_by_category": {}})
+    assert get_cached_image_stats(tenant_id, False)["image_count"] == 4
+
+
+def test_invalidation_during_compute_discards_result():
+    tenant_id = str(uuid.uuid4())
+    generation = image_stats_generation(tenant_id)
+
+    invalidate_image_stats_cache(tenant_id)
+    store_image_stats(tenant_id, False, {"image_count": 1}, generation)
+
+    assert get_cached_image_stats(tenant_id, False) is None
+
+
+def test_commit_touching_tenant_images_drops_snapshot(test_db: Session, test_tenant):
+    tenant_id = str(test_tenant.id)
+    other_tenant_id = str(uuid.uuid4())
+    _store(tenant_id, False, {"image_count": 0})
+    _store(other_tenant_id, False, {"image_count": 7})
+
+    asset = Asset(
+        id=uuid.uuid4(),
+        tenant_id=test_tenant.id,
+        filename="a.jpg",
+        source_provider="dropbox",
+        source_key="/a.jpg",
+        thumbnail_key="thumbs/a.jpg",
+    )
+    test_db.add(asset)
+    test_db.flush()
+    test_db.add(ImageMetadata(
+        asset_id=asset.id,
+        tenant_id=test_tenant.id,
+        filename="a.jpg",
+        file_size=1,
+        width=1,
+        height=1,
+        format="JPEG",
+    ))
+    test_db.commit()
+
+    assert get_cached_image_stats(tenant_id, False) is None
+    assert get_cached_image_stats(other_tenant_id, False) == {"image_count": 7}
+
+    # Rolled-back writes leave snapshots alone.
+    _store(tenant_id, False, {"image_count": 1})
+    image = test_db.query(ImageMetadata).one()
+    image.rating = 3
+    test_db.flush()
+    test_db.rollback()
+    assert get_cached_image_stats(tenant_id, False) == {"image_count": 1}
+
+
+def test_endpoint_reuses_snapshot(test_tenant, monkeypatch):
+    calls = []
+
+    async def fake_run_read_query(fn, tenant_id, include_ratings):
+        calls.append((tenant_id, include_ratings))
+        return {"tenant_id": tenant_id, "image_count": len(calls), "rating_by_category": {}}
+
+    monkeypatch.setattr(stats_router, "run_read_query", fake_run_read_query)
+    monkeypatch.setattr(settings, "image_stats_cache_ttl_seconds", 30)
+
+    first = asyncio.run(stats_router.get_image_stats(tenant=test_tenant, include_ratings=False))
+    second = asyncio.run(stats_router.get_image_stats(tenant=test_tenant, include_ratings=False))
+
+    assert first == second
+    assert len(calls) == 1
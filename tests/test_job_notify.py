@@ -0,0 +1,35 @@
+"""Tests for job queue wakeup notifications."""
+
+import time
+from threading import Event
+
+from sqlalchemy.orm import Session
+
+from zoltag.job_notify import JobWakeupListener, publish_job_wakeup
+
+
+def test_publish_job_wakeup_is_noop_off_postgres(test_db: Session):
+    publish_job_wakeup(test_db, reason="tenant")
+
+    assert not test_db.new
+
+
+def test_listener_falls_back_to_sleep_without_postgres(test_db: Session):
+    listener = JobWakeupListener(test_db.get_bind())
+
+    assert listener.start() is False
+    assert listener.active is False
+
+    started = time.monotonic()
+    assert listener.wait(0.05) is False
+    assert time.monotonic() - started >= 0.04
+
+
+def test_listener_wait_returns_immediately_when_stopped(test_db: Session):
+    listener = JobWakeupListener(test_db.get_bind())
+    stop = Event()
+    stop.set()
+
+    started = time.monotonic()
+    assert listener.wait(5.0, stop) is False
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,257 @@
+"""Tests for materialized keyword facet counts and their incremental refresh."""
+
+import uuid
+
+import pytest
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from zoltag.cli.commands.keyword_facets import ReconcileKeywordFacetsCommand
+from zoltag.cli.introspection import build_queue_command_argv
+from zoltag.keyword_facets import (
+    RECONCILE_JOB_KEY,
+    SOURCE_CURRENT,
+    SOURCE_PERMATAGS,
+    SOURCE_STATS_PERMATAGS,
+    SOURCE_ZERO_SHOT,
+    load_keyword_facet_counts,
+    rebuild_keyword_facets,
+)
+from zoltag.metadata import Asset, ImageMetadata, Job, JobDefinition, KeywordFacetState, MachineTag, Permatag
+from zoltag.models.config import Keyword, KeywordCategory
+from zoltag.routers.keywords import _load_available_keywords, _load_tag_stats
+from zoltag.settings import settings
+
+
+@pytest.fixture
+def facet_data(test_db: Session, test_tenant):
+    tenant_id = test_tenant.id
+    category = KeywordCategory(tenant_id=tenant_id, name="Scenes", sort_order=0)
+    test_db.add(category)
+    test_db.flush()
+    keywords = []
+    for index, name in enumerate(("beach", "forest", "city")):
+        keyword = Keyword(tenant_id=tenant_id, category_id=category.id, keyword=name, sort_order=index)
+        test_db.add(keyword)
+        keywords.append(keyword)
+    test_db.flush()
+
+    assets = []
+    for index in range(3):
+        asset = Asset(
+            id=uuid.uuid4(),
+            tenant_id=tenant_id,
+            filename=f"img-{index}.jpg",
+            source_provider="dropbox",
+            source_key=f"/img-{index}.jpg",
+            thumbnail_key=f"thumbs/img-{index}.jpg",
+        )
+        test_db.add(asset)
+        test_db.flush()
+        test_db.add(ImageMetadata(
+            asset_id=asset.id,
+            tenant_id=tenant_id,
+            filename=asset.filename,
+            file_size=1024,
+            width=100,
+            height=100,
+            format="JPEG",
+        ))
+        assets.append(asset)
+
+    beach, forest, _ = keywords
+    for asset in assets:
+        test_db.add(_machine_tag(tenant_id, asset.id, beach.id))
+    test_db.add(_machine_tag(tenant_id, assets[0].id, forest.id))
+    # Rejected machine tag must not count toward the current facet.
+    test_db.add(Permatag(asset_id=assets[1].id, tenant_id=tenant_id, keyword_id=beach.id, signum=-1))
+    test_db.add(Permatag(asset_id=assets[2].id, tenant_id=tenant_id, keyword_id=forest.id, signum=1))
+    test_db.commit()
+    test_db.add(JobDefinition(key=RECONCILE_JOB_KEY, description="Rebuild materialized keyword facet counts"))
+    test_db.commit()
+    return {"keywords": keywords, "assets": assets}
+
+
+def _machine_tag(tenant_id, asset_id, keyword_id, tag_type="siglip"):
+    return MachineTag(
+        asset_id=asset_id,
+        tenant_id=tenant_id,
+        keyword_id=keyword_id,
+        confidence=0.9,
+        tag_type=tag_type,
+        model_name="siglip-test",
+    )
+
+
+def _queued_refresh_jobs(db, tenant_id):
+    return db.query(Job).filter(Job.tenant_id == tenant_id, Job.source == "event", Job.status == "queued").all()
+
+
+def _run_queued_refresh_jobs(db, tenant):
+    """Run the tenant's queued recount jobs the way the worker would."""
+    jobs = _queued_refresh_jobs(db, tenant.id)
+    for job in jobs:
+        argv = build_queue_command_argv(
+            command_name=RECONCILE_JOB_KEY,
+            tenant_id=str(tenant.id),
+            payload=job.payload,
+            python_executable="python",
+        )
+        assert argv[3] == RECONCILE_JOB_KEY
+        cmd = ReconcileKeywordFacetsCommand(
+            tenant_id=str(tenant.id),
+            stale_only=False,
+            keyword_ids=tuple((job.payload or {}).get("keyword_ids") or ()),
+        )
+        cmd.db = db
+        cmd.tenant = tenant
+        cmd._reconcile()
+        job.status = "succeeded"
+    db.commit()
+    return jobs
+
+
+def _load_keywords(db, tenant, **overrides):
+    params = dict(
+        list_id=None,
+        rating=None,
+        rating_operator="eq",
+        hide_zero_rating=False,
+        reviewed=None,
+        source=None,
+        include_people=False,
+    )
+    params.update(overrides)
+    return _load_available_keywords(db, tenant, None, **params)
+
+
+def test_load_returns_none_until_rebuilt(test_db: Session, test_tenant, facet_data):
+    assert load_keyword_facet_counts(test_db, test_tenant.id, [SOURCE_CURRENT], active_tag_type="siglip") is None
+
+    rebuild_keyword_facets(test_db, test_tenant.id)
+    test_db.commit()
+
+    beach, forest, city = facet_data["keywords"]
+    counts = load_keyword_facet_counts(
+        test_db,
+        test_tenant.id,
+        [SOURCE_CURRENT, SOURCE_PERMATAGS, SOURCE_ZERO_SHOT],
+        active_tag_type="siglip",
+    )
+    assert counts[SOURCE_CURRENT] == {beach.id: 2, forest.id: 2}
+    assert counts[SOURCE_PERMATAGS] == {forest.id: 1}
+    assert counts[SOURCE_ZERO_SHOT] == {beach.id: 3, forest.id: 1}
+    assert load_keyword_facet_counts(test_db, test_tenant.id, [SOURCE_CURRENT], active_tag_type="clip") is None
+
+
+def test_materialized_responses_match_live_queries(test_db: Session, test_tenant, facet_data):
+    live_keywords = _load_keywords(test_db, test_tenant)
+    live_permatag_keywords = _load_keywords(test_db, test_tenant, source="permatags")
+    live_stats = _load_tag_stats(test_db, test_tenant)
+
+    rebuild_keyword_facets(test_db, test_tenant.id)
+    test_db.commit()
+
+    assert _load_keywords(test_db, test_tenant) == live_keywords
+    assert _load_keywords(test_db, test_tenant, source="permatags") == live_permatag_keywords
+    assert _load_tag_stats(test_db, test_tenant) == live_stats
+
+
+def test_commits_queue_one_recount_of_touched_keywords(test_db: Session, test_tenant, facet_data):
+    rebuild_keyword_facets(test_db, test_tenant.id)
+    test_db.commit()
+    beach, forest, city = facet_data["keywords"]
+    assets = facet_data["assets"]
+
+    test_db.add(Permatag(asset_id=assets[0].id, tenant_id=test_tenant.id, keyword_id=city.id, signum=1))
+    test_db.commit()
+
+    # The recount runs on the worker, not in the writing request.
+    counts = load_keyword_facet_counts(test_db, test_tenant.id, [SOURCE_STATS_PERMATAGS])
+    assert counts[SOURCE_STATS_PERMATAGS] == {forest.id: 1}
+
+    # Bulk deletes bypass flush events but are still picked up, and merge
+    # into the tenant's queued job.
+    test_db.query(MachineTag).filter(MachineTag.keyword_id == beach.id).delete(synchronize_session=False)
+    test_db.commit()
+    jobs = _queued_refresh_jobs(test_db, test_tenant.id)
+    assert [job.payload for job in jobs] == [{"keyword_ids": sorted([beach.id, city.id])}]
+
+    _run_queued_refresh_jobs(test_db, test_tenant)
+
+    counts = load_keyword_facet_counts(test_db, test_tenant.id, [SOURCE_STATS_PERMATAGS, SOURCE_ZERO_SHOT])
+    assert counts[SOURCE_STATS_PERMATAGS] == {forest.id: 1, city.id: 1}
+    assert counts[SOURCE_ZERO_SHOT] == {forest.id: 1}
+
+
+def test_rolled_back_writes_queue_nothing(test_db: Session, test_tenant, facet_data):
+    _, _, city = facet_data["keywords"]
+    test_db.add(Permatag(asset_id=facet_data["assets"][0].id, tenant_id=test_tenant.id, keyword_id=city.id, signum=1))
+    test_db.flush()
+    test_db.rollback()
+    test_db.commit()
+
+    assert _queued_refresh_jobs(test_db, test_tenant.id) == []
+
+
+def test_stale_tenant_is_rebuilt_by_queued_job(test_db: Session, test_tenant, facet_data, monkeypatch):
+    rebuild_keyword_facets(test_db, test_tenant.id)
+    test_db.commit()
+    monkeypatch.setattr(settings, "keyword_facet_incremental_limit", 1)
+    beach, forest, city = facet_data["keywords"]
+    asset = facet_data["assets"][1]
+
+    test_db.add(_machine_tag(test_tenant.id, asset.id, forest.id))
+    test_db.add(_machine_tag(test_tenant.id, asset.id, city.id))
+    test_db.commit()
+
+    assert load_keyword_facet_counts(test_db, test_tenant.id, [SOURCE_ZERO_SHOT]) is None
+    assert [job.payload for job in _queued_refresh_jobs(test_db, test_tenant.id)] == [{}]
+    # Readers fall back to live counts, which already include the new tags.
+    live_zero_shot = _load_tag_stats(test_db, test_tenant)["sources"]["zero_shot"]["Scenes"]
+    assert {entry["keyword"]: entry["count"] for entry in live_zero_shot} == {"beach": 3, "forest": 2, "city": 1}
+
+    # Narrow writes while stale merge into the queued full rebuild.
+    test_db.add(Permatag(asset_id=asset.id, tenant_id=test_tenant.id, keyword_id=city.id, signum=1))
+    test_db.commit()
+    assert len(_queued_refresh_jobs(test_db, test_tenant.id)) == 1
+
+    _run_queued_refresh_jobs(test_db, test_tenant)
+
+    state = test_db.query(KeywordFacetState).filter(KeywordFacetState.tenant_id == test_tenant.id).one()
+    assert state.is_stale is False
+    counts = load_keyword_facet_counts(test_db, test_tenant.id, [SOURCE_ZERO_SHOT, SOURCE_STATS_PERMATAGS])
+    assert counts[SOURCE_ZERO_SHOT] == {beach.id: 3, forest.id: 2, city.id: 1}
+    assert counts[SOURCE_STATS_PERMATAGS] == {forest.id: 1, city.id: 1}
+
+
+def test_bulk_inserts_queue_touched_keywords(test_db: Session, test_tenant, facet_data):
+    rebuild_keyword_facets(test_db, test_tenant.id)
+    test_db.commit()
+    beach, forest, city = facet_data["keywords"]
+    assets = facet_data["assets"]
+
+    test_db.execute(
+        sqlite_insert(Permatag).on_conflict_do_nothing(index_elements=[Permatag.asset_id, Permatag.keyword_id]),
+        [
+            {"asset_id": asset.id, "tenant_id": test_tenant.id, "keyword_id": city.id, "signum": 1}
+            for asset in assets
+        ],
+    )
+    test_db.commit()
+    _run_queued_refresh_jobs(test_db, test_tenant)
+
+    counts = load_keyword_facet_counts(test_db, test_tenant.id, [SOURCE_STATS_PERMATAGS])
+    assert counts[SOURCE_STATS_PERMATAGS] == {forest.id: 1, city.id: 3}
+
+
+def test_missing_job_definition_marks_tenant_stale(test_db: Session, test_tenant, facet_data):
+    rebuild_keyword_facets(test_db, test_tenant.id)
+    test_db.query(JobDefinition).delete()
+    test_db.commit()
+    _, _, city = facet_data["keywords"]
+
+    test_db.add(Permatag(asset_id=facet_data["assets"][0].id, tenant_id=test_tenant.id, keyword_id=city.id, signum=1))
+    test_db.commit()
+
+    assert load_keyword_facet_counts(test_db, test_tenant.id, [SOURCE_STATS_PERMATAGS]) is None
@@ -0,0 +1,114 @@
+"""Tests for batch keyword-model scoring of stored embeddings."""
+
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from zoltag.learning import (
+    recompute_trained_tags_for_embeddings,
+    score_embeddings_with_models,
+    score_image_with_models,
+)
+from zoltag.metadata import MachineTag
+from zoltag.models.config import Keyword, KeywordCategory
+from zoltag.routers.images import ml_training
+
+
+def _models():
+    return {
+        "beach": SimpleNamespace(positive_centroid=[1.0, 0.0, 0.0], negative_centroid=[0.0, 1.0, 0.0]),
+        "forest": SimpleNamespace(positive_centroid=[0.0, 1.0, 0.0], negative_centroid=None),
+        "night": SimpleNamespace(positive_centroid=[0.0, 0.0, 0.0], negative_centroid=None),
+    }
+
+
+def test_batch_scores_match_single_image_scores():
+    rng = np.random.default_rng(7)
+    embeddings = rng.normal(size=(5, 3)).tolist() + [[0.0, 0.0, 0.0]]
+    models = _models()
+
+    batch = score_embeddings_with_models(embeddings, models)
+
+    assert len(batch) == len(embeddings)
+    for embedding, scores in zip(embeddings, batch, strict=True):
+        expected = score_image_with_models(embedding, models)
+        assert scores.keys() == expected.keys()
+        for keyword, score in expected.items():
+            assert scores[keyword] == pytest.approx(score, abs=1e-5)
+
+
+def test_recompute_trained_tags_for_embeddings_replaces_tags(test_db: Session, test_tenant):
+    category = KeywordCategory(tenant_id=test_tenant.id, name="Scenes", sort_order=0)
+    test_db.add(category)
+    test_db.flush()
+    for name in ("beach", "forest", "night"):
+        test_db.add(Keyword(tenant_id=test_tenant.id, category_id=category.id, keyword=name, sort_order=0))
+    test_db.flush()
+    beach_asset, forest_asset = uuid.uuid4(), uuid.uuid4()
+    test_db.add(MachineTag(
+        asset_id=beach_asset,
+        tenant_id=test_tenant.id,
+        keyword_id=999,
+        confidence=0.5,
+        tag_type="trained",
+        model_name="m1",
+    ))
+    test_db.commit()
+
+    tags_by_asset = recompute_trained_tags_for_embeddings(
+        db=test_db,
+        tenant_id=test_tenant.id,
+        embeddings_by_asset={beach_asset: [1.0, 0.0, 0.0], forest_asset: [0.0, 1.0, 0.0]},
+        keyword_models=_models(),
+        keyword_to_category={"beach": "Scenes", "forest": "Scenes"},
+        model_name="m1",
+        model_version="v1",
+        threshold=0.8,
+    )
+    test_db.commit()
+
+    assert [tag["keyword"] for tag in tags_by_asset[beach_asset]] == ["beach"]
+    assert [tag["keyword"] for tag in tags_by_asset[forest_asset]] == ["forest"]
+    stored = test_db.query(MachineTag).filter(MachineTag.tag_type == "trained").all()
+    assert sorted((tag.asset_id == beach_asset, tag.model_version) for tag in stored) == [
+        (False, "v1"),
+        (True, "v1"),
+    ]
+
+
+def test_refresh_only_downloads_thumbnails_for_images_without_embeddings(test_db: Session, test_tenant, monkeypatch):
+    requested = {}
+
+    def fake_download(bucket, keys_by_image):
+        requested.update(keys_by_image)
+        return {}
+
+    monkeypatch.setattr(ml_training, "gcs_bucket", lambda bucket_name: bucket_name)
+    monkeypatch.setattr(ml_training, "download_blobs", fake_download)
+    images = [
+        SimpleNamespace(id=1, asset_id=uuid.uuid4()),
+        SimpleNamespace(id=2, asset_id=uuid.uuid4()),
+        SimpleNamespace(id=3, asset_id=None),
+    ]
+    storage_by_image = {
+        1: SimpleNamespace(thumbnail_key="thumbs/1.jpg"),
+        2: SimpleNamespace(thumbnail_key=None),
+        3: SimpleNamespace(thumbnail_key="thumbs/3.jpg"),
+    }
+
+    refreshed = ml_training._refresh_trained_tags(
+        test_db,
+        test_tenant,
+        images,
+        storage_by_image,
+        keyword_models=_models(),
+        keyword_to_category={},
+        model_name="m1",
+        model_version="v1",
+    )
+
+    assert refreshed == {}
+    assert requested == {1: "thumbs/1.jpg"}
@@ -0,0 +1,142 @@
+"""Tests for keyset-paginated and streamed list items."""
+
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy.orm import Session, sessionmaker
+
+from zoltag.metadata import Asset, ImageMetadata, Permatag
+from zoltag.models.config import Keyword, KeywordCategory, PhotoList, PhotoListItem
+from zoltag.routers import lists as lists_router
+
+
+@pytest.fixture
+def list_data(test_db: Session, test_tenant):
+    photo_list = PhotoList(tenant_id=test_tenant.id, title="Favourites")
+    test_db.add(photo_list)
+    category = KeywordCategory(tenant_id=test_tenant.id, name="Scenes", sort_order=0)
+    test_db.add(category)
+    test_db.flush()
+    keyword = Keyword(tenant_id=test_tenant.id, category_id=category.id, keyword="beach", sort_order=0)
+    test_db.add(keyword)
+    test_db.flush()
+
+    added_at = datetime(2026, 1, 1, 12, 0, 0)
+    for index in range(5):
+        asset = Asset(
+            id=uuid.uuid4(),
+            tenant_id=test_tenant.id,
+            filename=f"img-{index}.jpg",
+            source_provider="dropbox",
+            source_key=f"/img-{index}.jpg",
+            thumbnail_key=f"thumbs/img-{index}.jpg",
+        )
+        test_db.add(asset)
+        test_db.flush()
+        test_db.add(ImageMetadata(
+            asset_id=asset.id,
+            tenant_id=test_tenant.id,
+            filename=asset.filename,
+            file_size=1024,
+            width=100,
+            height=100,
+            format="JPEG",
+        ))
+        test_db.add(Permatag(asset_id=asset.id, tenant_id=test_tenant.id, keyword_id=keyword.id, signum=1))
+        # Items 1 and 2 share a timestamp so the id tiebreaker is exercised.
+        offset = index if index != 2 else 1
+        test_db.add(PhotoListItem(
+            list_id=photo_list.id,
+            asset_id=asset.id,
+            added_at=added_at + timedelta(minutes=offset),
+        ))
+    test_db.commit()
+    return photo_list
+
+
+def _call(test_db, test_tenant, photo_list, monkeypatch, **params):
+    monkeypatch.setattr(lists_router, "is_tenant_admin_user", lambda *args, **kwargs: True)
+    response = Response()
+    body = lists_router.get_list_items(
+        list_id=photo_list.id,
+        response=response,
+        ids_only=params.pop("ids_only", False),
+        limit=params.pop("limit", None),
+        cursor=params.pop("cursor", None),
+        format=params.pop("format", "json"),
+        unpaged=params.pop("unpaged", False),
+        tenant=test_tenant,
+        db=test_db,
+        current_user=None,
+    )
+    return body, response
+
+
+def test_pages_follow_added_at_then_id(test_db: Session, test_tenant, list_data, monkeypatch):
+    everything, response = _call(test_db, test_tenant, list_data, monkeypatch, ids_only=True)
+    assert "X-Next-Cursor" not in response.headers
+    assert len(everything) == 5
+
+    collected = []
+    cursor = None
+    while True:
+        page, response = _call(
+            test_db, test_tenant, list_data, monkeypatch, ids_only=True, limit=2, cursor=cursor
+        )
+        collected.extend(page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert [item["id"] for item in collected] == [item["id"] for item in everything]
+
+
+def test_default_page_size_and_unpaged_escape_hatch(test_db: Session, test_tenant, list_data, monkeypatch):
+    monkeypatch.setattr(lists_router, "LIST_ITEMS_DEFAULT_PAGE_SIZE", 2)
+
+    page, response = _call(test_db, test_tenant, list_data, monkeypatch, ids_only=True)
+    assert len(page) == 2
+    assert response.headers["X-Next-Cursor"]
+
+    everything, response = _call(test_db, test_tenant, list_data, monkeypatch, ids_only=True, unpaged=True)
+    assert len(everything) == 5
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_full_page_batches_tags(test_db: Session, test_tenant, list_data, monkeypatch):
+    page, response = _call(test_db, test_tenant, list_data, monkeypatch, limit=3)
+
+    assert len(page) == 3
+    assert response.headers["X-Next-Cursor"]
+    assert all(item["image"]["permatags"][0]["keyword"] == "beach" for item in page)
+
+
+def test_invalid_cursor_is_rejected(test_db: Session, test_tenant, list_data, monkeypatch):
+    with pytest.raises(HTTPException) as exc_info:
+        _call(test_db, test_tenant, list_data, monkeypatch, limit=2, cursor="not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+def test_ndjson_streams_in_batches(test_db: Session, test_tenant, list_data, monkeypatch):
+    opened = []
+    factory = sessionmaker(bind=test_db.get_bind())
+
+    def session_local():
+        opened.append(1)
+        return factory()
+
+    monkeypatch.setattr(lists_router, "SessionLocal", session_local)
+    monkeypatch.setattr(lists_router, "LIST_ITEMS_STREAM_BATCH_SIZE", 2)
+    expected, _ = _call(test_db, test_tenant, list_data, monkeypatch, ids_only=True)
+
+    streamed, _ = _call(test_db, test_tenant, list_data, monkeypatch, ids_only=True, format="ndjson")
+    assert streamed.media_type == "application/x-ndjson"
+
+    # Starlette drains the generator in a worker thread; iterate it here so the
+    # per-batch sessions share the in-memory sqlite connection.
+    lines = list(lists_router._stream_list_items(test_tenant, list_data.id, ids_only=True, after=None, limit=None))
+
+    assert [json.loads(line)["id"] for line in lines] == [item["id"] for item in expected]
+    assert len(opened) == 3
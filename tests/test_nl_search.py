@@ -0,0 +1,159 @@
+"""Tests for natural-language search vocabulary caching and the Gemini client."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.requests import Request
+
+from zoltag.models.config import Keyword, KeywordCategory
+from zoltag.nl_vocab_cache import invalidate_nl_vocab
+from zoltag.routers import nl_search
+from zoltag.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def clear_vocab_cache():
+    invalidate_nl_vocab()
+    nl_search.clear_translation_cache()
+    yield
+    invalidate_nl_vocab()
+    nl_search.clear_translation_cache()
+
+
+@pytest.fixture
+def vocab_data(test_db: Session, test_tenant):
+    category = KeywordCategory(tenant_id=test_tenant.id, name="Scenes", sort_order=0)
+    test_db.add(category)
+    test_db.flush()
+    test_db.add(Keyword(tenant_id=test_tenant.id, category_id=category.id, keyword="beach", sort_order=0))
+    test_db.commit()
+    return category
+
+
+@pytest.fixture
+def gemini_stub(monkeypatch):
+    """Local HTTP server answering generateContent with a fixed filter payload."""
+    seen = {"requests": 0, "clients": set()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            seen["requests"] += 1
+            seen["clients"].add(self.client_address)
+            seen["prompt"] = body["contents"][0]["parts"][0]["text"]
+            answer = {
+                "category_filters": [{"category": "Scenes", "keywords": ["beach"], "operator": "OR"}],
+                "sort": {"field": "rating", "direction": "desc"},
+                "needs_clarification": False,
+            }
+            payload = json.dumps({"candidates": [{"content": {"parts": [{"text": json.dumps(answer)}]}}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(settings, "gemini_api_mode", "generativelanguage")
+    monkeypatch.setattr(settings, "gemini_api_base_url", f"http://127.0.0.1:{server.server_address[1]}")
+    yield seen
+    server.shutdown()
+    server.server_close()
+
+
+def _http_request():
+    return Request({"type": "http", "method": "POST", "path": "/api/v1/search/nl", "headers": []})
+
+
+def test_vocab_is_cached_until_keywords_change(test_db: Session, test_tenant, vocab_data):
+    first = nl_search._load_vocab(test_db, test_tenant)
+    assert nl_search._load_vocab(test_db, test_tenant) is first
+    assert first.vocab["category_keywords"] == {"Scenes": ["beach"]}
+
+    test_db.add(Keyword(tenant_id=test_tenant.id, category_id=vocab_data.id, keyword="forest", sort_order=1))
+    test_db.commit()
+
+    second = nl_search._load_vocab(test_db, test_tenant)
+    assert second.vocab["category_keywords"] == {"Scenes": ["beach", "forest"]}
+    assert second.version != first.version
+
+
+def _run_queries(test_db, test_tenant, queries, monkeypatch):
+    user = SimpleNamespace(supabase_uid=None)
+    loads = []
+
+    async def fake_run_read_query(fn, *args, **kwargs):
+        loads.append(fn)
+        return fn(test_db, *args, **kwargs)
+
+    monkeypatch.setattr(nl_search, "run_read_query", fake_run_read_query)
+    monkeypatch.setattr(nl_search, "SessionLocal", sessionmaker(bind=test_db.get_bind()))
+
+    async def run_queries():
+        try:
+            return [
+                await nl_search.nl_search(
+                    _http_request(),
+                    nl_search.NLSearchRequest(query=query),
+                    current_user=user,
+                    tenant=test_tenant,
+                )
+                for query in queries
+            ]
+        finally:
+            await nl_search.close_gemini_client()
+
+    results = asyncio.run(run_queries())
+    # The vocabulary is built off the event loop once, then served from cache.
+    assert len(loads) <= 1
+    return results
+
+
+def test_queries_share_pooled_client(test_db: Session, test_tenant, vocab_data, gemini_stub, monkeypatch):
+    results = _run_queries(test_db, test_tenant, ["beach photos", "more beach photos"], monkeypatch)
+
+    assert results[0]["filters"]["category_filters"][0]["keywords"] == ["beach"]
+    assert gemini_stub["requests"] == 2
+    # Both requests rode the same keep-alive connection.
+    assert len(gemini_stub["clients"]) == 1
+    assert gemini_stub["prompt"].endswith("User query: more beach photos")
+
+
+def test_repeated_queries_skip_the_model(test_db: Session, test_tenant, vocab_data, gemini_stub, monkeypatch):
+    first, second = _run_queries(test_db, test_tenant, ["Best  beach photos", "best beach photos"], monkeypatch)
+
+    assert gemini_stub["requests"] == 1
+    assert first == second
+
+    # A vocabulary change yields a new version, so the phrase is translated again.
+    test_db.add(Keyword(tenant_id=test_tenant.id, category_id=vocab_data.id, keyword="forest", sort_order=1))
+    test_db.commit()
+    _run_queries(test_db, test_tenant, ["best beach photos"], monkeypatch)
+    assert gemini_stub["requests"] == 2
+
+
+def test_translation_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(settings, "nl_search_result_cache_size", 2)
+    keys = [("v1", "m", query, "", ()) for query in ("a", "b", "c")]
+
+    nl_search._store_translation("tenant", keys[0], {"query": "a"})
+    nl_search._store_translation("tenant", keys[1], {"query": "b"})
+    assert nl_search._get_cached_translation("tenant", keys[0]) == {"query": "a"}
+    nl_search._store_translation("tenant", keys[2], {"query": "c"})
+
+    assert nl_search._get_cached_translation("tenant", keys[1]) is None
+    assert nl_search._get_cached_translation("tenant", keys[0]) == {"query": "a"}
+    assert nl_search._get_cached_translation("other", keys[0]) is None
@@ -14,9 +14,10 @@ import uuid
 from sqlalchemy.orm import Session
 
 from zoltag.tenant import Tenant, TenantContext
-from zoltag.metadata import Asset, Person, MachineTag, ImageMetadata
+from zoltag.keyword_facets import rebuild_keyword_facets
+from zoltag.metadata import Asset, Person, MachineTag, ImageMetadata, Permatag
 from zoltag.models.config import Keyword, KeywordCategory
-from zoltag.routers.people import get_or_create_person_keyword
+from zoltag.routers.people import get_or_create_person_keyword, get_person_stats, list_people
 
 
 TEST_TENANT_IDENTIFIER = "test_tenant"
@@ -509,3 +510,75 @@ class TestGetOrCreatePersonKeyword:
         keyword = get_or_create_person_keyword(test_db, tenant.id, 999)
 
         assert keyword is None
+
+
+class TestListPeopleEndpoint:
+    """Tests for list_people keyset paging and rolled-up tag counts."""
+
+    @pytest.fixture
+    def people(self, test_db: Session, tenant: Tenant):
+        category = KeywordCategory(tenant_id=tenant.id, name="People", sort_order=0, is_people_category=True)
+        test_db.add(category)
+        test_db.flush()
+        people = {}
+        for index, name in enumerate(("Cara", "Alice", "Bob", "Bob")):
+            person = Person(tenant_id=tenant.id, name=name)
+            test_db.add(person)
+            test_db.flush()
+            test_db.add(Keyword(
+                tenant_id=tenant.id,
+                category_id=category.id,
+                keyword=f"{name} {index}",
+                person_id=person.id,
+                tag_type="person",
+                sort_order=0,
+            ))
+            people.setdefault(name, person)
+        test_db.flush()
+        alice_keyword = test_db.query(Keyword).filter(Keyword.person_id == people["Alice"].id).one()
+        for _ in range(2):
+            test_db.add(Permatag(
+                asset_id=uuid.uuid4(),
+                tenant_id=tenant.id,
+                keyword_id=alice_keyword.id,
+                signum=1,
+            ))
+        test_db.commit()
+        return people
+
+    def _page(self, test_db, tenant, **params):
+        params.setdefault("limit", 50)
+        params.setdefault("skip", 0)
+        params.setdefault("after_name", None)
+        params.setdefault("after_id", None)
+        return list_people(tenant=tenant, db=test_db, **params)
+
+    def test_keyset_pages_cover_everyone_once(self, test_db: Session, tenant: Tenant, people):
+        everyone = self._page(test_db, tenant)
+        assert [person.name for person in everyone] == ["Alice", "Bob", "Bob", "Cara"]
+
+        collected = []
+        after = {}
+        while True:
+            page = self._page(test_db, tenant, limit=2, **after)
+            if not page:
+                break
+            collected.extend(page)
+            after = {"after_name": page[-1].name, "after_id": page[-1].id}
+        assert [person.id for person in collected] == [person.id for person in everyone]
+
+    def test_tag_counts_match_with_and_without_rollup(self, test_db: Session, tenant: Tenant, people):
+        live = {person.id: person.tag_count for person in self._page(test_db, tenant)}
+        assert live[people["Alice"].id] == 2
+
+        rebuild_keyword_facets(test_db, tenant.id)
+        test_db.commit()
+        rolled_up = {person.id: person.tag_count for person in self._page(test_db, tenant)}
+        assert rolled_up == live
+
+        # The rollup follows new permatags, and stats read it as well.
+        alice_keyword = test_db.query(Keyword).filter(Keyword.person_id == people["Alice"].id).one()
+        test_db.add(Permatag(asset_id=uuid.uuid4(), tenant_id=tenant.id, keyword_id=alice_keyword.id, signum=1))
+        test_db.commit()
+        stats = get_person_stats(person_id=people["Alice"].id, tenant=tenant, db=test_db)
+        assert stats.total_images == 3
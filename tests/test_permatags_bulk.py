@@ -0,0 +1,164 @@
+"""Tests for set-based bulk permatag endpoints."""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import Session
+
+from zoltag import keyword_facets
+from zoltag.metadata import Asset, ImageMetadata, MachineTag, Permatag
+from zoltag.models.config import Keyword, KeywordCategory
+from zoltag.routers.images import permatags as permatags_router
+
+
+USER = SimpleNamespace(supabase_uid=None)
+
+
+@pytest.fixture
+def tag_data(test_db: Session, test_tenant):
+    category = KeywordCategory(tenant_id=test_tenant.id, name="Scenes", sort_order=0)
+    test_db.add(category)
+    test_db.flush()
+    keywords = {}
+    for index, name in enumerate(("beach", "forest", "city")):
+        keyword = Keyword(tenant_id=test_tenant.id, category_id=category.id, keyword=name, sort_order=index)
+        test_db.add(keyword)
+        keywords[name] = keyword
+    images = []
+    for index in range(2):
+        asset = Asset(
+            id=uuid.uuid4(),
+            tenant_id=test_tenant.id,
+            filename=f"img-{index}.jpg",
+            source_provider="dropbox",
+            source_key=f"/img-{index}.jpg",
+            thumbnail_key=f"thumbs/img-{index}.jpg",
+        )
+        test_db.add(asset)
+        test_db.flush()
+        image = ImageMetadata(
+            asset_id=asset.id,
+            tenant_id=test_tenant.id,
+            filename=asset.filename,
+            file_size=1,
+            width=1,
+            height=1,
+            format="JPEG",
+        )
+        test_db.add(image)
+        images.append(image)
+    test_db.flush()
+    test_db.add(MachineTag(
+        asset_id=images[0].asset_id,
+        tenant_id=test_tenant.id,
+        keyword_id=keywords["beach"].id,
+        confidence=0.9,
+        tag_type="siglip",
+        model_name="siglip-test",
+    ))
+    test_db.add(Permatag(asset_id=images[0].asset_id, tenant_id=test_tenant.id, keyword_id=keywords["forest"].id, signum=1))
+    test_db.commit()
+    return {"keywords": keywords, "images": images}
+
+
+def _signums(test_db, asset_id, keywords):
+    names = {keyword.id: name for name, keyword in keywords.items()}
+    rows = test_db.query(Permatag.keyword_id, Permatag.signum).filter(Permatag.asset_id == asset_id).all()
+    return {names[keyword_id]: signum for keyword_id, signum in rows}
+
+
+def test_bulk_permatags_upserts_in_one_pass(test_db: Session, test_tenant, tag_data):
+    first, second = tag_data["images"]
+    payload = {"operations": [
+        {"image_id": first.id, "keyword": "forest", "signum": -1},
+        {"image_id": first.id, "keyword": "city"},
+        {"image_id": second.id, "keyword": "beach"},
+        {"image_id": second.id, "keyword": "beach", "signum": -1},
+        {"image_id": second.id, "keyword": "unknown"},
+        {"image_id": 999999, "keyword": "beach"},
+    ]}
+
+    result = permatags_router.bulk_permatags(payload=payload, tenant=test_tenant, db=test_db, current_user=USER)
+
+    assert (result["created"], result["updated"], result["skipped"]) == (2, 1, 2)
+    assert _signums(test_db, first.asset_id, tag_data["keywords"]) == {"forest": -1, "city": 1}
+    assert _signums(test_db, second.asset_id, tag_data["keywords"]) == {"beach": -1}
+
+
+def test_accept_all_overwrites_vocabulary_permatags(test_db: Session, test_tenant, tag_data):
+    image = tag_data["images"][0]
+
+    result = permatags_router.accept_all_tags(image_id=image.id, tenant=test_tenant, db=test_db, current_user=USER)
+
+    assert (result["positive_permatags"], result["negative_permatags"]) == (1, 2)
+    assert _signums(test_db, image.asset_id, tag_data["keywords"]) == {"beach": 1, "forest": -1, "city": -1}
+
+
+def test_freeze_only_fills_missing_permatags(test_db: Session, test_tenant, tag_data):
+    image = tag_data["images"][0]
+
+    result = permatags_router.freeze_permatags(image_id=image.id, tenant=test_tenant, db=test_db, current_user=USER)
+
+    assert (result["positive_permatags"], result["negative_permatags"]) == (1, 1)
+    assert _signums(test_db, image.asset_id, tag_data["keywords"]) == {"beach": 1, "forest": 1, "city": -1}
+
+
+@pytest.fixture
+def queued_refreshes(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        keyword_facets,
+        "enqueue_keyword_facet_refresh",
+        lambda session, tenant_id, keyword_ids=None: calls.append(set(keyword_ids)),
+    )
+    return calls
+
+
+def test_accept_all_recounts_only_changed_keywords(test_db: Session, test_tenant, tag_data, queued_refreshes):
+    image = tag_data["images"][0]
+    keywords = tag_data["keywords"]
+    city = Permatag(asset_id=image.asset_id, tenant_id=test_tenant.id, keyword_id=keywords["city"].id, signum=-1)
+    test_db.add(city)
+    test_db.commit()
+    queued_refreshes.clear()
+    reviewer = SimpleNamespace(supabase_uid=uuid.uuid4())
+
+    result = permatags_router.accept_all_tags(image_id=image.id, tenant=test_tenant, db=test_db, current_user=reviewer)
+
+    # city was already rejected: rewritten (new reviewer) but not recounted.
+    assert (result["positive_permatags"], result["negative_permatags"]) == (1, 2)
+    assert queued_refreshes == [{keywords["beach"].id, keywords["forest"].id}]
+    test_db.refresh(city)
+    assert city.created_by == reviewer.supabase_uid
+
+    queued_refreshes.clear()
+    repeat = permatags_router.accept_all_tags(image_id=image.id, tenant=test_tenant, db=test_db, current_user=USER)
+    assert (repeat["positive_permatags"], repeat["negative_permatags"]) == (1, 2)
+    assert queued_refreshes == []
+
+
+def test_bulk_reapplied_permatags_are_counted_but_not_recounted(
+    test_db: Session, test_tenant, tag_data, queued_refreshes
+):
+    image = tag_data["images"][0]
+    keywords = tag_data["keywords"]
+    queued_refreshes.clear()
+    payload = {"operations": [
+        {"image_id": image.id, "keyword": "forest"},
+        {"image_id": image.id, "keyword": "city"},
+    ]}
+
+    result = permatags_router.bulk_permatags(payload=payload, tenant=test_tenant, db=test_db, current_user=USER)
+
+    assert (result["created"], result["updated"], result["skipped"]) == (1, 1, 0)
+    assert queued_refreshes == [{keywords["city"].id}]
+
+
+def test_freeze_recounts_only_inserted_keywords(test_db: Session, test_tenant, tag_data, queued_refreshes):
+    image = tag_data["images"][0]
+    keywords = tag_data["keywords"]
+
+    permatags_router.freeze_permatags(image_id=image.id, tenant=test_tenant, db=test_db, current_user=USER)
+
+    assert queued_refreshes == [{keywords["beach"].id, keywords["city"].id}]
@@ -0,0 +1,77 @@
+"""Tests for secret lookup caching and the local secret provider."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from zoltag import dependencies
+from zoltag.settings import settings
+
+
+@pytest.fixture(autouse=True)
+def _clear_secret_cache():
+    dependencies.invalidate_secret_cache()
+    yield
+    dependencies.invalidate_secret_cache()
+
+
+class _FakeSecretClient:
+    def __init__(self):
+        self.calls = 0
+
+    def access_secret_version(self, request):
+        self.calls += 1
+        return SimpleNamespace(payload=SimpleNamespace(data=f"value-{self.calls}".encode("utf-8")))
+
+
+def test_get_secret_caches_payload_until_invalidated(monkeypatch):
+    client = _FakeSecretClient()
+    monkeypatch.setattr(dependencies, "_secret_client", client)
+    monkeypatch.setattr(settings, "secret_provider", "gcp")
+    monkeypatch.setattr(settings, "secret_cache_ttl_seconds", 300)
+
+    assert dependencies.get_secret("dropbox-token-demo") == "value-1"
+    assert dependencies.get_secret("dropbox-token-demo") == "value-1"
+    assert client.calls == 1
+
+    dependencies.invalidate_secret_cache("dropbox-token-demo")
+    assert dependencies.get_secret("dropbox-token-demo") == "value-2"
+    assert client.calls == 2
+
+
+def test_get_secret_skips_cache_when_ttl_disabled(monkeypatch):
+    client = _FakeSecretClient()
+    monkeypatch.setattr(dependencies, "_secret_client", client)
+    monkeypatch.setattr(settings, "secret_provider", "gcp")
+    monkeypatch.setattr(settings, "secret_cache_ttl_seconds", 0)
+
+    dependencies.get_secret("dropbox-token-demo")
+    dependencies.get_secret("dropbox-token-demo")
+
+    assert client.calls == 2
+
+
+def test_local_secret_provider_reads_env_and_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "secret_provider", "local")
+    monkeypatch.setattr(settings, "secret_local_dir", str(tmp_path))
+    monkeypatch.setenv("ZOLTAG_SECRET_DROPBOX_APP_KEY", "env-key")
+
+    assert dependencies.get_secret("dropbox-app-key") == "env-key"
+
+    dependencies.store_secret("dropbox-token-demo", "refresh-1")
+    assert dependencies.get_secret("dropbox-token-demo") == "refresh-1"
+
+    dependencies.store_secret("dropbox-token-demo", "refresh-2")
+    assert dependencies.get_secret("dropbox-token-demo") == "refresh-2"
+
+    dependencies.delete_secret("dropbox-token-demo")
+    with pytest.raises(ValueError, match="not found"):
+        dependencies.get_secret("dropbox-token-demo")
+
+
+def test_local_secret_provider_rejects_path_traversal(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "secret_provider", "local")
+    monkeypatch.setattr(settings, "secret_local_dir", str(tmp_path))
+
+    with pytest.raises(ValueError, match="Invalid secret id"):
+        dependencies.get_secret("../etc/passwd")
@@ -0,0 +1,182 @@
+"""Tests for storage provider streaming and ranged reads."""
+
+import io
+
+import pytest
+from google.api_core.exceptions import NotFound
+
+from zoltag.routers.images.file_serving import _resolve_source_size
+from zoltag.storage import DropboxStorageProvider, ManagedStorageProvider, StorageProvider, download_blobs
+
+
+PAYLOAD = bytes(range(256)) * 40
+
+
+class _BufferedProvider(StorageProvider):
+    provider_name = "buffered"
+
+    def list_image_entries(self, sync_folders=None):
+        return []
+
+    def get_entry(self, source_key):
+        raise NotImplementedError
+
+    def get_media_metadata(self, source_key):
+        raise NotImplementedError
+
+    def download_file(self, source_key):
+        return PAYLOAD
+
+    def get_thumbnail(self, source_key, size="w640h480"):
+        return None
+
+
+class _FakeDropboxResponse:
+    def __init__(self, data: bytes):
+        self._data = data
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for offset in range(0, len(self._data), chunk_size):
+            yield self._data[offset:offset + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeDropboxClient:
+    def __init__(self):
+        self.response = _FakeDropboxResponse(PAYLOAD)
+
+    def files_download(self, source_key):
+        return None, self.response
+
+
+class _FakeBlobReader(io.BytesIO):
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.read_sizes = []
+
+    def read(self, size=-1):
+        self.read_sizes.append(size)
+        return super().read(size)
+
+
+class _FakeBlob:
+    def __init__(self, data: bytes):
+        self._data = data
+        self.reader = None
+
+    def open(self, mode, chunk_size=None):
+        assert mode == "rb"
+        self.reader = _FakeBlobReader(self._data)
+        return self.reader
+
+    def download_as_bytes(self, start=None, end=None):
+        start = start or 0
+        stop = len(self._data) if end is None else end + 1
+        return self._data[start:stop]
+
+
+class _FakeBucket:
+    def __init__(self, data: bytes):
+        self.blob_obj = _FakeBlob(data)
+
+    def blob(self, name):
+        return self.blob_obj
+
+
+class _FakeStorageClient:
+    def __init__(self, data: bytes):
+        self.bucket_obj = _FakeBucket(data)
+
+    def bucket(self, name):
+        return self.bucket_obj
+
+
+def test_base_open_stream_chunks_whole_file():
+    provider = _BufferedProvider()
+    chunks = list(provider.open_stream("key", chunk_size=1000))
+
+    assert b"".join(chunks) == PAYLOAD
+    assert max(len(chunk) for chunk in chunks) == 1000
+
+
+def test_base_read_range_is_inclusive():
+    provider = _BufferedProvider()
+
+    assert provider.read_range("key", 10, 19) == PAYLOAD[10:20]
+    assert provider.read_range("key", len(PAYLOAD) - 5) == PAYLOAD[-5:]
+
+
+def test_open_stream_rejects_inverted_range():
+    provider = _BufferedProvider()
+
+    with pytest.raises(ValueError):
+        list(provider.open_stream("key", start=20, end=10))
+
+
+def test_dropbox_open_stream_iterates_response_and_closes():
+    client = _FakeDropboxClient()
+    provider = DropboxStorageProvider(client=client)
+
+    chunks = list(provider.open_stream("/photos/clip.mp4", chunk_size=4096))
+
+    assert b"".join(chunks) == PAYLOAD
+    assert len(chunks) == 3
+    assert client.response.closed
+
+
+def test_dropbox_range_without_temporary_link_slices_download():
+    client = _FakeDropboxClient()
+    provider = DropboxStorageProvider(client=client)
+
+    assert provider.read_range("/photos/clip.mp4", 4000, 4199) == PAYLOAD[4000:4200]
+    assert client.response.closed
+
+
+def test_managed_open_stream_reads_range_in_chunks():
+    client = _FakeStorageClient(PAYLOAD)
+    provider = ManagedStorageProvider(bucket_name="bucket", client=client)
+
+    data = b"".join(provider.open_stream("assets/clip.mp4", start=100, end=2599, chunk_size=1024))
+
+    assert data == PAYLOAD[100:2600]
+    assert client.bucket_obj.blob_obj.reader.read_sizes == [1024, 1024, 452]
+
+
+def test_managed_read_range_uses_ranged_download():
+    provider = ManagedStorageProvider(bucket_name="bucket", client=_FakeStorageClient(PAYLOAD))
+
+    assert provider.read_range("assets/clip.mp4", 5, 9) == PAYLOAD[5:10]
+
+
+class _MissingBlob:
+    def download_as_bytes(self):
+        raise NotFound("gone")
+
+
+def test_download_blobs_keys_payloads_and_skips_missing():
+    blobs = {"thumbs/a.jpg": _FakeBlob(b"a"), "thumbs/c.jpg": _FakeBlob(b"c")}
+    bucket = type("Bucket", (), {"blob": lambda self, name: blobs.get(name, _MissingBlob())})()
+
+    fetched = download_blobs(bucket, {1: "thumbs/a.jpg", 2: "thumbs/b.jpg", 3: "thumbs/c.jpg"})
+
+    assert fetched == {1: b"a", 3: b"c"}
+    assert download_blobs(bucket, {}) == {}
+
+
+def test_playback_size_comes_only_from_the_provider():
+    class _Entries(_BufferedProvider):
+        def __init__(self, size=None, error=None):
+            self.size, self.error = size, error
+
+        def get_entry(self, source_key):
+            if self.error is not None:
+                raise self.error
+            return type("Entry", (), {"size": self.size})()
+
+    assert _resolve_source_size(_Entries(size=len(PAYLOAD)), "/video.mp4") == len(PAYLOAD)
+    # No size (or a failed lookup) means: download and measure, never stored metadata.
+    assert _resolve_source_size(_Entries(size=None), "/video.mp4") is None
+    assert _resolve_source_size(_Entries(error=RuntimeError("gone")), "/video.mp4") is None
@@ -1,6 +1,5 @@
 """Security tests for tenant resolution and membership enforcement."""
 
-import asyncio
 from datetime import datetime
 import uuid
 
@@ -69,7 +68,7 @@ def test_get_tenant_allows_member_access(test_db: Session):
     user = _create_user(test_db, email="member@example.com")
     _add_membership(test_db, user=user, tenant_id=tenant.id, accepted=True)
 
-    resolved = asyncio.run(get_tenant(x_tenant_id=str(tenant.id), user=user, db=test_db))
+    resolved = get_tenant(x_tenant_id=str(tenant.id), user=user, db=test_db)
 
     assert resolved.id == str(tenant.id)
 
@@ -79,7 +78,7 @@ def test_get_tenant_blocks_non_member(test_db: Session):
     user = _create_user(test_db, email="outsider@example.com")
 
     with pytest.raises(HTTPException) as exc:
-        asyncio.run(get_tenant(x_tenant_id=str(tenant.id), user=user, db=test_db))
+        get_tenant(x_tenant_id=str(tenant.id), user=user, db=test_db)
 
     assert exc.value.status_code == 403
     assert "No access to tenant" in str(exc.value.detail)
@@ -93,7 +92,7 @@ def test_get_tenant_allows_super_admin_without_membership(test_db: Session):
         email="superadmin@example.com",
     )
 
-    resolved = asyncio.run(get_tenant(x_tenant_id=str(tenant.id), user=admin, db=test_db))
+    resolved = get_tenant(x_tenant_id=str(tenant.id), user=admin, db=test_db)
 
     assert resolved.id == str(tenant.id)
 
@@ -106,6 +105,6 @@ def test_get_tenant_requires_existing_tenant(test_db: Session):
     )
 
     with pytest.raises(HTTPException) as exc:
-        asyncio.run(get_tenant(x_tenant_id="missing_tenant", user=admin, db=test_db))
+        get_tenant(x_tenant_id="missing_tenant", user=admin, db=test_db)
 
     assert exc.value.status_code == 404
@@ -0,0 +1,70 @@
+"""Tests for the shared per-tenant cache and its commit hooks."""
+
+import uuid
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from zoltag.metadata import Person
+from zoltag.models.config import Keyword, KeywordCategory
+from zoltag.settings import settings
+from zoltag.tenant_cache import TenantCache
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    monkeypatch.setattr(settings, "image_stats_cache_ttl_seconds", 60)
+    people = TenantCache("test_people", models=(Person,), ttl_setting="image_stats_cache_ttl_seconds")
+    keywords = TenantCache("test_keywords", models=(Keyword, KeywordCategory), ttl_setting="image_stats_cache_ttl_seconds")
+    return people, keywords
+
+
+def _prime(cache, tenant_id, value="cached"):
+    cache.store(tenant_id, value, cache.generation(tenant_id))
+
+
+def test_commit_invalidates_only_caches_tracking_written_models(test_db: Session, test_tenant, caches):
+    people, keywords = caches
+    _prime(people, test_tenant.id)
+    _prime(keywords, test_tenant.id)
+
+    test_db.add(Person(tenant_id=test_tenant.id, name="Alice"))
+    test_db.flush()
+    assert people.get(test_tenant.id) == "cached"
+    test_db.commit()
+
+    assert people.get(test_tenant.id) is None
+    assert keywords.get(test_tenant.id) == "cached"
+
+
+def test_rolled_back_writes_keep_cache(test_db: Session, test_tenant, caches):
+    people, _ = caches
+    _prime(people, test_tenant.id)
+
+    test_db.add(Person(tenant_id=test_tenant.id, name="Alice"))
+    test_db.flush()
+    test_db.rollback()
+    test_db.commit()
+
+    assert people.get(test_tenant.id) == "cached"
+
+
+def test_bulk_insert_invalidates_named_tenants_only(test_db: Session, test_tenant, caches):
+    _, keywords = caches
+    other_tenant_id = uuid.uuid4()
+    _prime(keywords, test_tenant.id)
+    _prime(keywords, other_tenant_id)
+
+    test_db.execute(insert(KeywordCategory), [{"tenant_id": test_tenant.id, "name": "Scenes", "sort_order": 0}])
+    test_db.commit()
+
+    assert keywords.get(test_tenant.id) is None
+    assert keywords.get(other_tenant_id) == "cached"
+
+    _prime(keywords, test_tenant.id)
+    test_db.query(KeywordCategory).filter(KeywordCategory.name == "Scenes").update({"sort_order": 1})
+    test_db.commit()
+
+    assert keywords.get(test_tenant.id) is None
+    assert keywords.get(other_tenant_id) is None
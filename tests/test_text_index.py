@@ -2,10 +2,17 @@
 
 import uuid
 
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 
-from zoltag.metadata import Asset, AssetTextIndex, ImageMetadata
-from zoltag.text_index import build_asset_text_document, rebuild_asset_text_index
+from zoltag.metadata import Asset, AssetTextIndex, Base, ImageMetadata
+from zoltag.models.config import Base as ConfigBase
+from zoltag.text_index import (
+    TextIndexRefreshQueue,
+    build_asset_text_document,
+    enqueue_asset_text_index_refresh,
+    rebuild_asset_text_index,
+)
 
 
 TEST_TENANT_IDENTIFIER = "test_tenant"
@@ -98,3 +105,48 @@ def test_rebuild_asset_text_index_refreshes_legacy_rows_missing_source_key(test_
     assert refreshed.components["source_key"] == source_key
     assert "source key " in refreshed.search_text
     assert source_key in refreshed.search_text
+
+
+def test_enqueue_rebuilds_inline_on_sqlite(test_db: Session):
+    asset = _create_asset_image(
+        test_db,
+        tenant_id=TEST_TENANT_ID,
+        image_id=3,
+        filename="inline.jpg",
+        source_key="/inline.jpg",
+    )
+    test_db.commit()
+
+    enqueue_asset_text_index_refresh(test_db, tenant_id=TEST_TENANT_ID, asset_ids=[asset.id, asset.id, None])
+
+    assert test_db.query(AssetTextIndex).filter(AssetTextIndex.asset_id == asset.id).count() == 1
+
+
+def test_refresh_queue_dedupes_pending_assets(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'text_index.db'}")
+    Base.metadata.create_all(engine)
+    ConfigBase.metadata.create_all(engine)
+    with Session(bind=engine) as db:
+        assets = [
+            _create_asset_image(db, TEST_TENANT_ID, image_id, f"img-{image_id}.jpg", f"/img-{image_id}.jpg")
+            for image_id in range(1, 4)
+        ]
+        db.commit()
+        asset_ids = [asset.id for asset in assets]
+
+    # Long debounce keeps the drainer idle so the test controls when it flushes.
+    queue = TextIndexRefreshQueue(batch_size=10, debounce_seconds=60)
+    try:
+        assert queue.submit(engine, TEST_TENANT_ID, asset_ids) == 3
+        assert queue.submit(engine, TEST_TENANT_ID, asset_ids[:2]) == 0
+        assert queue.pending_count() == 3
+
+        assert queue.flush() == 3
+        assert queue.pending_count() == 0
+    finally:
+        queue.stop(timeout_seconds=1)
+
+    with Session(bind=engine) as db:
+        indexed = {row.asset_id for row in db.query(AssetTextIndex.asset_id).all()}
+    assert indexed == set(asset_ids)
+    engine.dispose()
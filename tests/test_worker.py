@@ -0,0 +1,232 @@
+"""Tests for the queue worker's claiming and slot bookkeeping."""
+
+import uuid
+from datetime import datetime, timedelta
+from threading import Event
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from zoltag import worker
+from zoltag.metadata import Job, JobAttempt, JobDefinition
+
+
+@pytest.fixture
+def worker_db(test_db: Session, monkeypatch):
+    monkeypatch.setattr(worker, "SessionLocal", sessionmaker(bind=test_db.get_bind()))
+    monkeypatch.setattr(worker, "_upsert_worker_heartbeat", lambda db, **kwargs: None)
+    return test_db
+
+
+def _add_jobs(
+    db: Session,
+    queue: str,
+    count: int,
+    *,
+    priority: int = 100,
+    tenant_id: uuid.UUID | None = None,
+) -> JobDefinition:
+    definition = JobDefinition(
+        key=f"command-{uuid.uuid4().hex[:8]}",
+        description="",
+        arg_schema={},
+        timeout_seconds=60,
+        max_attempts=3,
+        queue=queue,
+    )
+    db.add(definition)
+    db.flush()
+    queued_at = datetime.utcnow() - timedelta(minutes=5)
+    for offset in range(count):
+        db.add(
+            Job(
+                tenant_id=tenant_id or uuid.uuid4(),
+                definition_id=definition.id,
+                status="queued",
+                queue=queue,
+                priority=priority,
+                payload={},
+                scheduled_for=queued_at,
+                queued_at=queued_at + timedelta(seconds=offset),
+            )
+        )
+    db.commit()
+    return definition
+
+
+def _claim(**kwargs):
+    kwargs.setdefault("queues", [])
+    return worker._claim_jobs(
+        worker_id="worker-1",
+        hostname="host",
+        version="",
+        lease_seconds=60,
+        **kwargs,
+    )
+
+
+def test_parse_queue_limits_skips_invalid_entries():
+    assert worker._parse_queue_limits("sync=2, ml = 1,bad,oops=x,") == {"sync": 2, "ml": 1}
+    assert worker._parse_queue_weights("default=4,ml=0.5,off=0") == {"default": 4.0, "ml": 0.5}
+
+
+def test_claim_jobs_claims_a_batch_with_attempts(worker_db: Session):
+    _add_jobs(worker_db, "sync", 3)
+
+    claimed = _claim(limit=2)
+
+    assert [job.queue for job in claimed] == ["sync", "sync"]
+    assert all(job.attempt_no == 1 for job in claimed)
+    assert worker_db.query(Job).filter(Job.status == "running").count() == 2
+    assert worker_db.query(JobAttempt).count() == 2
+
+
+def test_claim_jobs_respects_queue_limits(worker_db: Session):
+    _add_jobs(worker_db, "ml", 3, priority=1)
+    _add_jobs(worker_db, "sync", 2, priority=5)
+
+    claimed = _claim(limit=3, queue_limits={"ml": 1})
+    assert sorted(job.queue for job in claimed) == ["ml", "sync", "sync"]
+
+    saturated = _claim(limit=3, queue_limits={"ml": 1}, running_by_queue={"ml": 1})
+    assert saturated == []
+
+
+def test_claim_jobs_dead_letters_jobs_without_definition(worker_db: Session):
+    definition = _add_jobs(worker_db, "sync", 1)
+    orphan = Job(
+        tenant_id=uuid.uuid4(),
+        definition_id=uuid.uuid4(),
+        status="queued",
+        queue="sync",
+        priority=1,
+        payload={},
+        scheduled_for=datetime.utcnow() - timedelta(minutes=1),
+    )
+    worker_db.add(orphan)
+    worker_db.commit()
+
+    claimed = _claim(limit=2)
+
+    assert [job.definition_key for job in claimed] == [definition.key]
+    worker_db.expire_all()
+    orphan = worker_db.query(Job).filter(Job.id == orphan.id).one()
+    assert orphan.status == "dead_letter"
+    assert "Missing job definition" in orphan.last_error
+    assert _claim(limit=2) == []
+
+
+def test_slot_tracker_releases_slots_when_jobs_finish():
+    slots = worker._SlotTracker(2, {"ml": 1})
+    release = Event()
+    job = worker.ClaimedJob(
+        id=str(uuid.uuid4()),
+        tenant_id="tenant",
+        definition_key="ml",
+        payload={},
+        timeout_seconds=60,
+        max_attempts=1,
+        attempt_no=1,
+        queue="ml",
+    )
+
+    slots.start(job, lambda: release.wait(5))
+    assert slots.free_slots() == 1
+    assert slots.running_by_queue() == {"ml": 1}
+
+    release.set()
+    slots.join_all(timeout_seconds=5)
+    assert slots.free_slots() == 2
+    assert slots.slot_freed.is_set()
+
+
+def test_claim_jobs_only_takes_configured_queues(worker_db: Session):
+    _add_jobs(worker_db, "ml", 2, priority=1)
+    _add_jobs(worker_db, "default", 2, priority=5)
+
+    claimed = _claim(limit=4, queues=["default"])
+
+    assert [job.queue for job in claimed] == ["default", "default"]
+
+
+def test_claim_jobs_shares_batch_across_tenants(worker_db: Session):
+    busy_tenant = uuid.uuid4()
+    quiet_tenant = uuid.uuid4()
+    _add_jobs(worker_db, "default", 5, tenant_id=busy_tenant)
+    _add_jobs(worker_db, "default", 1, tenant_id=quiet_tenant)
+
+    claimed = _claim(limit=2)
+
+    assert sorted(job.tenant_id for job in claimed) == sorted([str(busy_tenant), str(quiet_tenant)])
+
+
+def test_pick_fair_candidates_follows_queue_weights():
+    tenant = "tenant"
+    candidates = [
+        worker._ClaimCandidate(id=uuid.uuid4(), tenant_id=tenant, queue="ml", priority=100)
+        for _ in range(4)
+    ] + [
+        worker._ClaimCandidate(id=uuid.uuid4(), tenant_id=tenant, queue="default", priority=100)
+        for _ in range(4)
+    ]
+
+    picked = worker._pick_fair_candidates(
+        candidates,
+        limit=5,
+        running_by_tenant={},
+        running_by_queue={},
+        queue_weights={"default": 4.0},
+        remaining_by_queue={},
+    )
+
+    assert [candidate.queue for candidate in picked].count("default") == 4
+
+
+def test_running_job_heartbeat_flushes_logs_renews_lease_and_detects_cancel(worker_db: Session, monkeypatch):
+    monkeypatch.setattr(worker, "engine", worker_db.get_bind())
+    _add_jobs(worker_db, "default", 1)
+    claimed = _claim(limit=1)[0]
+    job_id = uuid.UUID(claimed.id)
+    worker_db.query(Job).filter(Job.id == job_id).update({Job.lease_expires_at: None})
+    worker_db.commit()
+
+    heartbeat = worker._RunningJobHeartbeat(claimed, worker_id="worker-1", lease_seconds=60)
+    try:
+        assert heartbeat.beat("out", None) is False
+        worker_db.expire_all()
+        attempt = worker_db.query(JobAttempt).filter(JobAttempt.job_id == job_id).one()
+        assert attempt.stdout_tail == "out"
+        assert attempt.stderr_tail is None
+        assert worker_db.query(Job).filter(Job.id == job_id).one().lease_expires_at is not None
+
+        worker_db.query(Job).filter(Job.id == job_id).update({Job.status: "canceled"})
+        worker_db.commit()
+        assert heartbeat.beat(None, "err") is True
+        worker_db.expire_all()
+        assert worker_db.query(JobAttempt).filter(JobAttempt.job_id == job_id).one().stderr_tail is None
+    finally:
+        heartbeat.close()
+
+
+def test_run_loop_reconciles_workflows_on_interval(monkeypatch):
+    clock = {"now": 1000.0}
+    reconciled_at = []
+    stop = Event()
+
+    def fake_claim(**kwargs):
+        clock["now"] += 50.0
+        if clock["now"] >= 1300.0:
+            stop.set()
+        return []
+
+    monkeypatch.setenv("JOB_WORKER_LISTEN", "false")
+    monkeypatch.delenv("JOB_WORKFLOW_RECONCILE_SECONDS", raising=False)
+    monkeypatch.setattr(worker, "time", SimpleNamespace(monotonic=lambda: clock["now"]))
+    monkeypatch.setattr(worker, "_claim_jobs", fake_claim)
+    monkeypatch.setattr(worker, "_reconcile_workflows_once", lambda **kwargs: reconciled_at.append(clock["now"]))
+
+    worker.run_loop(stop_event=stop, poll_seconds=0.001, concurrency=1)
+
+    # Idle polls every 50s; stalled-run reconciliation only every 120s.
+    assert reconciled_at == [1000.0, 1150.0]
@@ -0,0 +1,149 @@
+"""Tests for workflow step validation, DAG helpers and run advancement."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from zoltag.metadata import Job, JobDefinition, WorkflowDefinition, WorkflowStepRun
+from zoltag.workflow_queue import (
+    _stalled_workflow_run_ids,
+    build_step_graph,
+    handle_workflow_job_state_change,
+    reconcile_running_workflows,
+    start_workflow_run,
+    topological_step_order,
+    validate_workflow_steps,
+)
+
+
+@pytest.fixture
+def definitions(test_db: Session):
+    for key in ("sync-dropbox", "rebuild-asset-text-index"):
+        test_db.add(JobDefinition(key=key, description="", arg_schema={}))
+    test_db.commit()
+
+
+def test_validate_workflow_steps_accepts_dag(test_db: Session, definitions):
+    steps = [
+        {"step_key": "sync", "definition_key": "sync-dropbox"},
+        {"step_key": "index", "definition_key": "rebuild-asset-text-index", "depends_on": ["sync"]},
+    ]
+
+    validated = validate_workflow_steps(test_db, steps)
+
+    assert [step["step_key"] for step in validated] == ["sync", "index"]
+    assert validated[1]["depends_on"] == ["sync"]
+
+
+def test_validate_workflow_steps_rejects_cycles(test_db: Session, definitions):
+    steps = [
+        {"step_key": "a", "definition_key": "sync-dropbox", "depends_on": ["c"]},
+        {"step_key": "b", "definition_key": "sync-dropbox", "depends_on": ["a"]},
+        {"step_key": "c", "definition_key": "sync-dropbox", "depends_on": ["b"]},
+    ]
+
+    with pytest.raises(ValueError, match="cycle"):
+        validate_workflow_steps(test_db, steps)
+
+
+def test_validate_workflow_steps_rejects_unknown_dependency(test_db: Session, definitions):
+    steps = [{"step_key": "a", "definition_key": "sync-dropbox", "depends_on": ["missing"]}]
+
+    with pytest.raises(ValueError, match="unknown step"):
+        validate_workflow_steps(test_db, steps)
+
+
+def test_build_step_graph_counts_in_degree_and_dependents():
+    steps = [
+        {"step_key": "sync", "depends_on": []},
+        {"step_key": "index", "depends_on": ["sync"]},
+        {"step_key": "train", "depends_on": ["sync", "index"]},
+    ]
+
+    dependents, in_degree = build_step_graph(steps)
+
+    assert dependents == {"sync": ["index", "train"], "index": ["train"], "train": []}
+    assert in_degree == {"sync": 0, "index": 1, "train": 2}
+    assert topological_step_order(dependents, in_degree) == ["sync", "index", "train"]
+
+
+def test_topological_step_order_handles_wide_fan_out():
+    steps = [{"step_key": "root", "depends_on": []}]
+    steps += [{"step_key": f"folder-{index:04d}", "depends_on": ["root"]} for index in range(2000)]
+    steps.append({"step_key": "zz-finish", "depends_on": [f"folder-{index:04d}" for index in range(2000)]})
+
+    order = topological_step_order(*build_step_graph(steps))
+
+    assert len(order) == len(steps)
+    assert order[0] == "root"
+    assert order[-1] == "zz-finish"
+
+
+def _start_run(db: Session):
+    workflow = db.query(WorkflowDefinition).filter(WorkflowDefinition.key == "sync-then-index").first()
+    if workflow is None:
+        workflow = WorkflowDefinition(
+            key="sync-then-index",
+            steps=[
+                {"step_key": "sync", "definition_key": "sync-dropbox"},
+                {"step_key": "index", "definition_key": "rebuild-asset-text-index", "depends_on": ["sync"]},
+            ],
+            max_parallel_steps=2,
+        )
+        db.add(workflow)
+        db.flush()
+    run = start_workflow_run(db, tenant_id=uuid.uuid4(), workflow=workflow, created_by=None, priority=100)
+    db.commit()
+    return run
+
+
+def _steps(db: Session, run):
+    return {
+        step.step_key: step
+        for step in db.query(WorkflowStepRun).filter(WorkflowStepRun.workflow_run_id == run.id).all()
+    }
+
+
+def _finish_job(db: Session, step, status="succeeded"):
+    job = db.query(Job).filter(Job.id == step.child_job_id).one()
+    job.status = status
+    job.finished_at = datetime.utcnow()
+    return job
+
+
+def test_step_completion_advances_run_without_reconcile(test_db: Session, definitions):
+    run = _start_run(test_db)
+    steps = _steps(test_db, run)
+    assert (steps["sync"].status, steps["index"].status) == ("queued", "pending")
+    assert steps["index"].child_job_id is None
+
+    job = _finish_job(test_db, steps["sync"])
+    handle_workflow_job_state_change(test_db, job=job)
+    test_db.commit()
+
+    steps = _steps(test_db, run)
+    assert steps["sync"].status == "succeeded"
+    assert steps["index"].status == "queued"
+    assert steps["index"].child_job_id is not None
+    assert _stalled_workflow_run_ids(test_db, limit_runs=10) == []
+
+
+def test_reconcile_picks_up_only_stalled_runs(test_db: Session, definitions):
+    healthy = _start_run(test_db)
+    stalled = _start_run(test_db)
+    # The stalled run's job finished but its completion callback never ran.
+    _finish_job(test_db, _steps(test_db, stalled)["sync"])
+    test_db.commit()
+
+    assert _stalled_workflow_run_ids(test_db, limit_runs=10) == [stalled.id]
+
+    assert reconcile_running_workflows(test_db, limit_runs=10) == 1
+    test_db.commit()
+
+    stalled_steps = _steps(test_db, stalled)
+    assert stalled_steps["sync"].status == "succeeded"
+    assert stalled_steps["index"].status == "queued"
+    assert _steps(test_db, healthy)["index"].status == "pending"
+    assert _stalled_workflow_run_ids(test_db, limit_runs=10) == []